@@ -17,7 +17,7 @@ from .core.Random import Uniform, DiscreteUniform, Normal, LogNormal, Gamma, Exp
 from .core.IO import save, load, load_parameter, load_parameters, save_parameters
 from .core.Utils import sparse_random_matrix
 from .core.Monitor import Monitor, raster_plot, histogram, population_rate, smoothed_rate, mean_fr
-from .core.Network import Network, parallel_run
+from .core.Network import Network, parallel_run, parallel_imap
 from .parser.report.Report import report
 from .models.Neurons import *
 from .models.Synapses import *
@@ -21,6 +21,7 @@
 #     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
 #===============================================================================
+import numbers
 import numpy as np
 
 from ANNarchy.core import Global
@@ -339,50 +340,32 @@ def connect_from_matrix(self, weights, delays=0.0, pre_post=False, storage_forma
 
     The matrix must be N*M, where N is the number of neurons in the post-synaptic population and M in the pre-synaptic one. Lists of lists must have the same size.
 
-    If a synapse should not be created, the weight value should be None.
+    If a synapse should not be created, the weight value should be None or NaN.
 
-    :param weights: a matrix or list of lists representing the weights. If a value is None, the synapse will not be created.
+    :param weights: a matrix or list of lists representing the weights. If a value is None or NaN, the synapse will not be created.
     :param delays: a matrix or list of lists representing the delays. Must represent the same synapses as weights. If the argument is omitted, delays are 0.
     :param pre_post: states which index is first. By default, the first dimension is related to the post-synaptic population. If ``pre_post`` is True, the first dimension is the pre-synaptic population.
     """
+    try:
+        weights = np.array(weights)
+    except:
+        Global._error('connect_from_matrix(): You must provide a dense 2D matrix.')
 
-    # Store the synapses
-    self.connector_name = "Connectivity matrix"
-    self.connector_description = "Connectivity matrix"
+    if weights.ndim != 2:
+        Global._error('connect_from_matrix(): You must provide a dense 2D matrix.')
 
-    if isinstance(weights, list):
-        try:
-            weights = np.array(weights)
-        except:
-            Global._error('connect_from_matrix(): You must provide a dense 2D matrix.')
-
-    self._store_connectivity(self._load_from_matrix, (weights, delays, pre_post), delays, storage_format, storage_order)
-
-    return self
-
-def _load_from_matrix(self, pre, post, weights, delays, pre_post):
-    """
-    Initializes a connectivity matrix between two populations based on a provided matrix.
-    This connector method always return a LIL-structure.
-
-    :param pre: pre-synaptic Population instance
-    :param post: post-synaptic Population instance
-    :param weights: matrix / list-in-list which contains synaptic weights
-    :param delays: matrix / list-in-list which contains synaptic delays
-    :param pre_post: needs to be set to True if the weights are not a post times pre matrix.
-    """
-    lil = LILConnectivity()
-
-    uniform_delay = not isinstance(delays, (list, np.ndarray))
-    if isinstance(delays, list):
+    uniform_delay = isinstance(delays, numbers.Number)
+    if not uniform_delay:
         try:
             delays = np.array(delays)
         except:
             Global._error('connect_from_matrix(): You must provide a dense 2D matrix.')
+        if delays.shape != weights.shape:
+            Global._error('connect_from_matrix(): the delay matrix must have the same shape as the weight matrix.')
 
     if pre_post: # if the user prefers pre as the first index...
         weights = weights.T
-        if isinstance(delays, np.ndarray):
+        if not uniform_delay:
             delays = delays.T
 
     shape = weights.shape
@@ -398,31 +381,37 @@ def _load_from_matrix(self, pre, post, weights, delays, pre_post):
             Global._print('Received:', shape)
         Global._error('Quitting...')
 
-    for i in range(self.post.size):
-        if isinstance(self.post, PopulationView):
-            rk_post = self.post.ranks[i]
-        else:
-            rk_post = i
-        r = []
-        w = []
-        d = []
-        for j in range(self.pre.size):
-            val = weights[i, j]
-            if val != None:
-                if isinstance(self.pre, PopulationView):
-                    rk_pre = self.pre.ranks[j]
-                else:
-                    rk_pre = j
-                r.append(rk_pre)
-                w.append(val)
-                if not uniform_delay:
-                    d.append(delays[i, j])
-        if uniform_delay:
-            d.append(delays)
-        if len(r) > 0:
-            lil.add(rk_post, r, w, d)
+    # Non-existing synapses are either None (object arrays) or NaN
+    if weights.dtype == object:
+        mask = np.not_equal(weights, None)
+        weights = np.where(mask, weights, np.nan)
+    try:
+        weights = weights.astype(np.float64)
+    except (TypeError, ValueError):
+        Global._error('connect_from_matrix(): the weights must be numbers or None.')
+    mask = ~np.isnan(weights)
+
+    # Row-major order: the synapses of a dendrite are sorted by pre-synaptic rank
+    indptr = np.zeros(self.post.size + 1, dtype=np.int64)
+    np.cumsum(np.count_nonzero(mask, axis=1), out=indptr[1:])
+    indices = np.nonzero(mask)[1]
+    weights = weights[mask]
+    if not uniform_delay:
+        delays = delays[mask]
+        if delays.dtype == object and np.any(np.equal(delays, None)):
+            Global._error('connect_from_matrix(): the delay matrix must define a delay for each synapse, None was found where a weight is given.')
+        try:
+            delays = delays.astype(np.float64)
+        except (TypeError, ValueError):
+            Global._error('connect_from_matrix(): the delays must be numbers.')
+        if np.any(np.isnan(delays)):
+            Global._error('connect_from_matrix(): the delay matrix must define a delay for each synapse, NaN was found where a weight is given.')
 
-    return lil
+    self.connector_name = "Connectivity matrix"
+    self.connector_description = "Connectivity matrix"
+    self._store_relative_csr(indptr, indices, weights, delays, storage_format, storage_order)
+
+    return self
 
 def connect_from_sparse(self, weights, delays=0.0, storage_format=None, storage_order=None):
     """
@@ -431,7 +420,7 @@ def connect_from_sparse(self, weights, delays=0.0, storage_format=None, storage_
     Warning: a sparse matrix has pre-synaptic ranks as first dimension.
 
     :param weights: a sparse lil_matrix object created from scipy.
-    :param delays: the value of the constant delay (default: dt).
+    :param delays: the value of the constant delay (default: dt), or a sparse matrix with the same non-zero elements as the weights.
     """
     try:
         from scipy.sparse import lil_matrix, csr_matrix, csc_matrix
@@ -441,52 +430,136 @@ def connect_from_sparse(self, weights, delays=0.0, storage_format=None, storage_
     if not isinstance(weights, (lil_matrix, csr_matrix, csc_matrix)):
         Global._error("connect_from_sparse(): only lil, csr and csc matrices are allowed for now.")
 
-    if not isinstance(delays, (int, float)):
-        Global._error("connect_from_sparse(): only constant delays are allowed for sparse matrices.")
+    if weights.shape != (self.pre.size, self.post.size):
+        Global._print("ERROR: connect_from_sparse(): the sparse matrix does not have the correct dimensions.")
+        Global._print('Expected:', (self.pre.size, self.post.size))
+        Global._print('Received:', weights.shape)
+        Global._error('Quitting...')
 
+    # The transpose of a (pre, post) matrix in CSC format is the (post, pre) CSR matrix.
     weights = csc_matrix(weights)
+    weights.sort_indices()
+    indptr, indices = weights.indptr, weights.indices
+
+    if isinstance(delays, (lil_matrix, csr_matrix, csc_matrix)):
+        delays = csc_matrix(delays)
+        delays.sort_indices()
+        if delays.shape != weights.shape or not np.array_equal(delays.indptr, indptr) or not np.array_equal(delays.indices, indices):
+            Global._error("connect_from_sparse(): the delay matrix must have the same non-zero elements as the weight matrix.")
+        delays = np.asarray(delays.data, dtype=np.float64)
 
-    # if weights[weights.nonzero()].max() == weights[weights.nonzero()].min() :
-    #     self._single_constant_weight = True
+    elif not isinstance(delays, numbers.Number):
+        Global._error("connect_from_sparse(): delays must be a constant or a sparse matrix.")
 
     # Store the synapses
     self.connector_name = "Sparse connectivity matrix"
     self.connector_description = "Sparse connectivity matrix"
-    self._store_connectivity(self._load_from_sparse, (weights, delays), delays, storage_format, storage_order)
+    self._store_relative_csr(indptr, indices, weights.data, delays, storage_format, storage_order)
 
     return self
 
-def _load_from_sparse(self, pre, post, weights, delays):
-    # Create an empty LIL object
-    lil = LILConnectivity()
+def connect_from_csr(self, indptr, indices, data, delays=0.0, storage_format=None, storage_order=None):
+    """
+    Builds a connectivity pattern from the three arrays of a compressed sparse row (CSR) matrix, e.g. the ones returned by ``Projection.to_csr()``.
 
-    # Find offsets
-    if isinstance(self.pre, PopulationView):
-        pre_ranks = self.pre.ranks
-    else:
-        pre_ranks = [i for i in range(self.pre.size)]
+    The rows correspond to the post-synaptic neurons, the columns to the pre-synaptic ones. Contrary to ``connect_from_sparse()``, the first dimension is therefore the post-synaptic population. If PopulationViews are used, the indices are relative to the views.
 
-    if isinstance(self.post, PopulationView):
-        post_ranks = self.post.ranks
+    The arrays are transferred to the C++ core in a single call, without building a list of lists in Python.
+
+    :param indptr: row pointers (size: number of post-synaptic neurons + 1).
+    :param indices: column indices, i.e. the pre-synaptic neurons (size: number of synapses).
+    :param data: weights, either a single value or one value per synapse.
+    :param delays: delays in ms, either a single value or one value per synapse (default: 0.0, i.e. no additional delay).
+    """
+    indptr = np.asarray(indptr, dtype=np.int64).reshape(-1)
+    indices = np.asarray(indices, dtype=np.intc).reshape(-1)
+    nb_synapses = indices.size
+
+    # Sanity checks
+    if indptr.size != self.post.size + 1:
+        Global._error("connect_from_csr(): indptr must have", self.post.size + 1, "elements, not", indptr.size)
+    if indptr[0] != 0 or indptr[-1] != nb_synapses or np.any(np.diff(indptr) < 0):
+        Global._error("connect_from_csr(): indptr is not a valid row pointer for", nb_synapses, "synapses.")
+    if nb_synapses > 0 and (indices.min() < 0 or indices.max() >= self.pre.size):
+        Global._error("connect_from_csr(): the column indices must be between 0 and", self.pre.size - 1)
+
+    if isinstance(data, numbers.Number):
+        # Does the projection define a single non-plastic weight?
+        self._single_constant_weight = True
+        weights = np.full(nb_synapses, data, dtype=np.float64)
     else:
-        post_ranks = [i for i in range(self.post.size)]
+        weights = np.asarray(data, dtype=np.float64).reshape(-1)
+        if weights.size != nb_synapses:
+            Global._error("connect_from_csr(): data must have one value per synapse.")
 
-    # Process the sparse matrix and fill the lil
-    weights.sort_indices()
-    (pre, post) = weights.shape
+    if not isinstance(delays, numbers.Number):
+        delays = np.asarray(delays, dtype=np.float64).reshape(-1)
+        if delays.size != nb_synapses:
+            Global._error("connect_from_csr(): delays must be a single value or have one value per synapse.")
 
-    if (pre, post) != (len(pre_ranks), len(post_ranks)):
-        Global._print("ERROR: connect_from_sparse(): the sparse matrix does not have the correct dimensions.")
-        Global._print('Expected:', (len(pre_ranks), len(post_ranks)))
-        Global._print('Received:', (pre, post))
-        Global._error('Quitting...')
+    self.connector_name = "Sparse connectivity matrix"
+    self.connector_description = "Sparse connectivity matrix (CSR)"
+    self._store_relative_csr(indptr, indices, weights, delays, storage_format, storage_order)
+
+    return self
+
+def _store_relative_csr(self, indptr, indices, weights, delays, storage_format, storage_order):
+    """
+    Stores a connectivity given as a CSR matrix whose rows and columns are the
+    indices in self.post and self.pre (which can be PopulationViews).
+    """
+    indptr = np.asarray(indptr, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.float64)
+
+    # A single delay value is stored as a uniform delay
+    if isinstance(delays, np.ndarray) and delays.size > 0 and np.all(delays == delays[0]):
+        delays = float(delays[0])
+    elif isinstance(delays, numbers.Number): # e.g. numpy scalars
+        delays = float(delays)
+
+    # Relative indices to ranks in the populations
+    post_ranks = np.array(self.post.ranks if isinstance(self.post, PopulationView) else np.arange(self.post.size), dtype=np.intc)
+    pre_ranks = np.array(self.pre.ranks if isinstance(self.pre, PopulationView) else np.arange(self.pre.size), dtype=np.intc)
+    row_sizes = np.diff(indptr)
+    rows = np.repeat(np.arange(self.post.size), row_sizes)
+    cols = pre_ranks[indices]
+
+    # The synapses of a dendrite need to be sorted by pre-synaptic rank
+    order = np.lexsort((cols, rows))
+    cols = cols[order]
+    weights = weights[order]
+    if isinstance(delays, np.ndarray):
+        delays = delays[order]
+
+    # Empty rows are not stored
+    non_empty = row_sizes > 0
+    row_ptr = np.concatenate(([0], np.cumsum(row_sizes[non_empty]))).astype(np.int64)
+
+    self._store_csr_connectivity(post_ranks[non_empty], row_ptr, cols, weights, delays, storage_format, storage_order)
+
+def _store_csr_connectivity(self, post_ranks, row_ptr, pre_ranks, weights, delays, storage_format, storage_order):
+    """
+    Stores a connectivity given as flat arrays. The ranks refer to the
+    populations, *delays* are in ms.
+    """
+    if isinstance(delays, np.ndarray):
+        # _store_connectivity() expects a list of lists
+        delay = [delays] if delays.size > 0 else []
+    else:
+        delay = delays
 
+    self._store_connectivity(self._load_from_csr, (post_ranks, row_ptr, pre_ranks, weights, delays), delay, storage_format, storage_order)
 
-    for idx_post in range(post):
-        idx_pre = weights.getcol(idx_post).indices
-        w = weights.getcol(idx_post).data
-        pr = [pre_ranks[i] for i in idx_pre]
-        lil.add(post_ranks[idx_post], pr, w, [float(delays)])
+def _load_from_csr(self, pre, post, post_ranks, row_ptr, pre_ranks, weights, delays):
+    """
+    Builds a LILConnectivity from flat arrays. Only used when the projection
+    can not be initialized with init_from_csr().
+    """
+    lil = LILConnectivity()
+    for idx, rk_post in enumerate(post_ranks):
+        begin, end = row_ptr[idx], row_ptr[idx+1]
+        d = delays[begin:end] if isinstance(delays, np.ndarray) else [delays]
+        lil.add(rk_post, pre_ranks[begin:end], weights[begin:end], d)
 
     return lil
 
@@ -513,6 +586,34 @@ def connect_from_file(self, filename, pickle_encoding=None, storage_format=None,
         Global._print(e)
         Global._error('connect_from_file(): Unable to load the data', filename, 'into the projection.')
 
+    # Newer files store the connectivity as flat arrays (see save_connectivity())
+    if 'dendrite_offsets' in data:
+        try:
+            post_ranks = np.asarray(data['post_ranks'], dtype=np.intc)
+            pre_ranks = np.asarray(data['pre_ranks'], dtype=np.intc)
+
+            # Weights
+            weights = data['w']
+            if np.ndim(weights) == 0 or np.size(weights) == 1:
+                self._single_constant_weight = True
+                weights = np.full(pre_ranks.size, float(np.asarray(weights).reshape(-1)[0]))
+
+            # Delays in ms
+            if data['uniform_delay'] == -1 and data['delay'] is not None:
+                delays = np.asarray(data['delay'], dtype=np.float64) * Global.config['dt']
+            else:
+                delays = float(data['max_delay'] * Global.config['dt'])
+
+        except Exception as e:
+            Global._print(e)
+            Global._error('Unable to load the data', filename, 'into the projection.')
+
+        self.connector_name = "From File"
+        self.connector_description = "From File"
+        self._store_csr_connectivity(post_ranks, np.asarray(data['dendrite_offsets'], dtype=np.int64), pre_ranks, weights, delays, storage_format, storage_order)
+
+        return self
+
     # Load the LIL object
     try:
         # Size
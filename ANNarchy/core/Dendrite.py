@@ -263,6 +263,10 @@ class Dendrite(object):
             Global._error('"structural_plasticity" has not been set to True in setup(), can not add the synapse.')
             return
 
+        if not self.proj._has_structural_plasticity():
+            Global._error('the projection uses a partitioned matrix, can not add the synapse.')
+            return
+
         if self.proj.cyInstance.dendrite_index(self.post_rank, rank) != -1:
             Global._error('the synapse of rank ' + str(rank) + ' already exists.')
             return
@@ -292,6 +296,10 @@ class Dendrite(object):
             Global._error('"structural_plasticity" has not been set to True in setup(), can not remove the synapse.')
             return
 
+        if not self.proj._has_structural_plasticity():
+            Global._error('the projection uses a partitioned matrix, can not remove the synapse.')
+            return
+
         if not rank in self.pre_ranks:
             Global._error('the synapse with the pre-synaptic neuron of rank ' + str(rank) + ' did not already exist.')
             return
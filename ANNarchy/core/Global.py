@@ -49,6 +49,7 @@ config = dict(
     'show_time': False,
     'suppress_warnings': False,
     'num_threads': 1,
+    'dynamic_num_threads': False,
     'visible_cores': [],
     'paradigm': "openmp",
     'method': "explicit",
@@ -59,6 +60,7 @@ config = dict(
     'structural_plasticity': False,
     'profiling': False,
     'profile_out': None,
+    'compilation_cache': False,
     'disable_parallel_rng': True,
     'use_seed_seq': True,
     'use_cpp_connectors': False,
@@ -81,6 +83,15 @@ _profiler = None
 # Minimum number of neurons to apply OMP parallel regions
 OMP_MIN_NB_NEURONS = 100
 
+# Expected mean firing rate (in Hz) of spiking populations, used to select
+# the parallelization of the spike transmission of pre_to_post CSR projections
+# (inner_loop, thread_local or outer_loop) unless Projection._parallel_pattern is set
+OMP_EXPECTED_FIRING_RATE = 10.0
+
+# Maximum number of post-synaptic neurons for which the conductances are
+# accumulated in thread-local buffers
+OMP_MAX_THREAD_LOCAL_NB_NEURONS = 100000
+
 # Authorized keywork for attributes
 authorized_keywords = [
     # Init
@@ -122,10 +133,18 @@ def setup(**keyValueArgs):
     * sparse_matrix_format: the default matrix format for projections in ANNarchy (by default: List-In-List for CPUs and Compressed Sparse Row)
     * precision: default floating precision for variables in ANNarchy. Accepted values: "float" or "double" (default: "double")
     * num_threads: number of treads used by openMP (overrides the environment variable ``OMP_NUM_THREADS`` when set, default = None).
+    * dynamic_num_threads: if True, the generated code does not depend on *num_threads*: the same library can run single-threaded or with any
+                           number of openMP threads, so changing *num_threads* (or -j) does not trigger a new code generation and compilation
+                           (default: False). If False, a sequential code is generated for a single thread. The connectivity is then not
+                           split into thread-local partitions (see *disable_split_matrix*).
     * visible_cores: allows a fine-grained control which cores are useable for the created threads (default = [] for no limitation).
                      It can be used to limit created openMP threads to a physical socket.
     * structural_plasticity: allows synapses to be dynamically added/removed during the simulation (default: False).
     * seed: the seed (integer) to be used in the random number generators (default = -1 is equivalent to time(NULL)).
+    * compilation_cache: if True, compiled libraries are stored in a cache shared by all working directories (default: False).
+                         The analysed neuron and synapse models are stored as well, so that their equations are not parsed again.
+                         Location and size limit (in MB) of the cache can be set in the "cache" entry of annarchy.json
+                         (default: {"path": "~/.cache/ANNarchy", "max_size": 2048}).
 
     The following parameters are mainly for debugging and profiling, and should be ignored by most users:
 
@@ -179,8 +198,10 @@ def _optimization_flags(**keyValueArgs):
                     the STL seed sequence to generate a list of seeds from the given master seed (*seed* argument). If set to False,
                     we use an improved version of the sequence generator proposed by M.E. O'Neill (https://www.pcg-random.org/posts/simple-portable-cpp-seed-entropy.html)
     * use_cpp_connectors:   For some of the default connectivity methods of ANNarchy we offer a CPP-side construction of the pattern to improve the
-                            initialization time (default=False). For maximum performance the disable_parallel_rng should be set to False to allow
-                            a parallel construction of the pattern.
+                            initialization time (default=False). If set to *True*, the all-to-all, one-to-one, fixed_probability, fixed_number_pre
+                            and fixed_number_post patterns as well as random weights or delays are built on the C++ side (gaussian and dog patterns
+                            with constant delays always are). The pattern is built in parallel with one random stream per row, which are derived
+                            from the *seed* argument: the result does not depend on the number of threads, but differs from the one obtained with numpy.
     * disable_split_matrix: determines if projections can use thread-local allocation. If set to *True* (default) no thread local allocation is allowed.
                             This equals the behavior of ANNarchy until 4.7. If set to *False* the code generator can use sliced versions if they
                             are available.
@@ -213,8 +234,8 @@ def _optimization_flags(**keyValueArgs):
         if key in config.keys():
             config[key] = keyValueArgs[key]
 
-            if key == "use_cpp_connectors":
-                _warning("use_cpp_connectors=True is currently disabled, will be enabled soon.")
+            if key == "use_cpp_connectors" and _check_paradigm("cuda"):
+                _warning("use_cpp_connectors=True is currently disabled on CUDA devices, will be enabled soon.")
                 config["use_cpp_connectors"] = False
 
         else:
@@ -667,6 +688,14 @@ def _check_paradigm(paradigm):
     except KeyError:
         _error("Unknown paradigm")
 
+def _check_single_thread():
+    """
+    Returns True when the sequential code should be generated, i.e. a single
+    thread is used and the library does not need to support a different number
+    of threads (see *dynamic_num_threads* in setup()).
+    """
+    return config['num_threads'] == 1 and not config['dynamic_num_threads']
+
 def _check_precision(precision):
     """
     Returns True when the provided precision is currently used.
@@ -299,6 +299,11 @@ def _save_data(filename, data):
     Internal routine to save data in a file.
 
     """
+    if _is_checkpoint(filename):
+        Global._print("Saving network in checkpoint format...")
+        _save_checkpoint(filename, data.items())
+        return
+
     # Check if the repertory exist
     (path, fname) = os.path.split(filename)
 
@@ -360,6 +365,8 @@ def save(filename, populations=True, projections=True, net_id=0):#, pure_data=Tr
 
     * If the extension ends with '.gz', the data will be pickled into a binary file and compressed using gzip.
 
+    * If the filename ends with a path separator (e.g. 'results/init/'), the network is saved as a checkpoint directory: each attribute of each population/projection is stored in its own .npy file, written one object after the other. Loading such a checkpoint memory-maps the files, so only the data which is actually used is read from disk.
+
     * Otherwise, the data will be pickled into a simple binary text file using cPickle.
 
     **Warning:** The '.mat' data will not be loadable by ANNarchy, it is only for external analysis purpose.
@@ -373,6 +380,8 @@ def save(filename, populations=True, projections=True, net_id=0):#, pure_data=Tr
 
     save('results/init.txt.gz')
 
+    save('results/checkpoint/')
+
     save('1000_trials.mat')
     ```
 
@@ -381,6 +390,12 @@ def save(filename, populations=True, projections=True, net_id=0):#, pure_data=Tr
     :param projections: if True, projection data will be saved (by default True)
 
     """
+    if _is_checkpoint(filename):
+        # The objects are gathered and written one by one
+        Global._print("Saving network in checkpoint format...")
+        _save_checkpoint(filename, _net_description_items(populations, projections, net_id))
+        return
+
     data = _net_description(populations, projections, net_id)
     _save_data(filename, data)
 
@@ -392,6 +407,14 @@ def _load_data(filename, pickle_encoding):
     :param pickle_encoding: if set to None the default is used, e.g. Python2 files ("latin1") or Python3 files ("ASCII")
     :return: A dictionary with the connectivity and synaptic variables if the file ``filename`` is available otherwise None is returned.
     """
+    if _is_checkpoint(filename):
+        try:
+            return _load_checkpoint(filename)
+        except Exception as e:
+            Global._print('Unable to read the checkpoint ' + filename)
+            Global._print(e)
+            return None
+
     (_, fname) = os.path.split(filename)
     extension = os.path.splitext(fname)[1]
 
@@ -462,6 +485,14 @@ def _load_connectivity_data(filename, pickle_encoding):
     :param filename: path to the file.
     :return: A dictionary with the connectivity and synaptic variables if the file ``filename`` is available otherwise None is returned.
     """
+    if _is_checkpoint(filename):
+        try:
+            return _load_checkpoint(filename)
+        except Exception as e:
+            Global._print('Unable to read the checkpoint ' + filename)
+            Global._print(e)
+            return None
+
     (_, fname) = os.path.split(filename)
     extension = os.path.splitext(fname)[1]
 
@@ -530,6 +561,7 @@ def load(filename, populations=True, projections=True, pickle_encoding=None, net
 
     ```python
     load('results/network.npz')
+    load('results/checkpoint/')
     ```
 
 
@@ -566,16 +598,22 @@ def _net_description(populations, projections, net_id=0):
     :param populations: if True, the population data will be saved.
     :param projections: if True, the projection data will be saved.
     """
-    network_desc = {}
-    network_desc['time_step'] = Global.get_current_step(net_id)
-    network_desc['net_id'] = net_id
+    return dict(_net_description_items(populations, projections, net_id))
+
+def _net_description_items(populations, projections, net_id=0):
+    """
+    Yields the (key, value) pairs of _net_description() one after the other,
+    so that the data of a single object is gathered at a time.
+    """
+    yield 'time_step', Global.get_current_step(net_id)
+    yield 'net_id', net_id
 
     pop_names = []
     proj_names = []
 
     if populations:
         for pop in Global._network[net_id]['populations']:
-            network_desc[pop.name] = pop._data()
+            yield pop.name, pop._data()
             pop_names.append(pop.name)
 
     if projections:
@@ -583,12 +621,115 @@ def _net_description(populations, projections, net_id=0):
             # Some specific projections are note saveable
             if not proj._saveable:
                 continue
-            network_desc[proj.name] = proj._data()
+            yield proj.name, proj._data()
             proj_names.append(proj.name)
 
-    network_desc['obj_names'] = {
+    yield 'obj_names', {
         'populations': pop_names,
         'projections': proj_names,
     }
 
-    return network_desc
+################################
+## Checkpoint directories
+################################
+
+# Name of the index file in a checkpoint directory
+_checkpoint_index = 'checkpoint.json'
+
+def _is_checkpoint(filename):
+    """
+    A filename ending with a path separator or an existing directory denotes
+    a checkpoint directory.
+    """
+    return filename.endswith(('/', os.sep)) or os.path.isdir(filename)
+
+def _save_checkpoint(dirname, items):
+    """
+    Writes the (key, value) pairs in *items* into the directory *dirname*.
+
+    Each numerical array is stored in its own .npy file, nested dictionaries
+    (e.g. one per population/projection) in sub-folders. Everything else is
+    described in the index file, which is written last.
+    """
+    if not os.path.isdir(dirname):
+        Global._print('Creating folder', dirname)
+        os.makedirs(dirname)
+
+    index = {}
+    for key, value in items:
+        index[key] = _checkpoint_entry(dirname, _checkpoint_file(key), value)
+
+    import json
+    with open(os.path.join(dirname, _checkpoint_index), 'w') as w_file:
+        json.dump({'version': 1, 'data': index}, w_file, indent=1)
+
+def _checkpoint_file(key):
+    "File name for a key, the names of objects may contain path separators."
+    return str(key).replace('/', '_').replace(os.sep, '_')
+
+def _checkpoint_entry(dirname, path, value):
+    """
+    Returns the index entry of *value*, after writing its data into
+    *dirname*/*path*.npy (or .pkl) if required.
+    """
+    if isinstance(value, dict):
+        return {'dict': {str(k): _checkpoint_entry(dirname, os.path.join(path, _checkpoint_file(k)), v) for k, v in value.items()}}
+
+    if isinstance(value, np.generic):
+        value = value.item()
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return {'value': value}
+
+    if isinstance(value, tuple) and all(isinstance(v, (bool, int, float, str)) for v in value):
+        return {'tuple': list(value)}
+
+    if isinstance(value, list) and all(isinstance(v, str) for v in value):
+        return {'value': value}
+
+    # Numerical arrays are stored in contiguous .npy files
+    try:
+        array = np.asarray(value)
+    except Exception:
+        array = None
+    if array is not None and array.dtype.kind in 'biuf':
+        if array.ndim == 0:
+            return {'value': array.item()}
+        os.makedirs(os.path.dirname(os.path.join(dirname, path)), exist_ok=True)
+        np.save(os.path.join(dirname, path + '.npy'), np.ascontiguousarray(array))
+        return {'npy': path + '.npy'}
+
+    # Anything else (e.g. ragged lists) is pickled
+    os.makedirs(os.path.dirname(os.path.join(dirname, path)), exist_ok=True)
+    with open(os.path.join(dirname, path + '.pkl'), mode='wb') as w_file:
+        pickle.dump(value, w_file, protocol=pickle.HIGHEST_PROTOCOL)
+    return {'pkl': path + '.pkl'}
+
+def _load_checkpoint(dirname):
+    """
+    Returns the data stored in the checkpoint directory *dirname*. The arrays
+    are memory-mapped (read-only), so they are only read when accessed.
+    """
+    import json
+    with open(os.path.join(dirname, _checkpoint_index), 'r') as r_file:
+        index = json.load(r_file)
+
+    return {key: _checkpoint_value(dirname, entry) for key, entry in index['data'].items()}
+
+def _checkpoint_value(dirname, entry):
+    "Inverse of _checkpoint_entry()."
+    if 'dict' in entry:
+        return {key: _checkpoint_value(dirname, e) for key, e in entry['dict'].items()}
+    if 'value' in entry:
+        return entry['value']
+    if 'tuple' in entry:
+        return tuple(entry['tuple'])
+    if 'npy' in entry:
+        array = np.load(os.path.join(dirname, entry['npy']), mmap_mode='r')
+        # 0-sized or 0-dimensional arrays can not be mapped
+        return array if isinstance(array, np.memmap) else np.asarray(array)
+    if 'pkl' in entry:
+        with open(os.path.join(dirname, entry['pkl']), mode='rb') as r_file:
+            return pickle.load(r_file)
+
+    Global._error('The checkpoint', dirname, 'is damaged.')
@@ -28,6 +28,7 @@ from .Projection import Projection
 from .Dendrite import Dendrite
 
 import numpy as np
+import os
 import re
 import sys
 from copy import copy, deepcopy
@@ -48,15 +49,44 @@ class Monitor(object):
     m = Monitor(pop, ['sum(exc)', 'r'])
     ```
 
+    For long simulations, the local variables of a population can be streamed into binary files instead of being kept in memory.
+    The values are written block-wise by a background thread during the simulation and ``get()`` returns a read-only memory-mapped array:
+
+    ```python
+    m = Monitor(pop, ['v', 'spike'], stream='recordings/')
+    ```
+
+    Spikes of large populations can be recorded as a flat list of events, ``get('spike')`` then returns the spike times (in steps) and the ranks of the emitting neurons as two arrays:
+
+    ```python
+    m = Monitor(pop, 'spike', events=True)
+    simulate(1000.0)
+    times, ranks = m.get('spike')
+    ```
+
     """
 
-    def __init__(self, obj, variables=[], period=None, period_offset=None, start=True, net_id=0):
+    # Numpy types of the recorded values in the streamed files
+    _stream_dtypes = {
+        'double': np.float64,
+        'float': np.float32,
+        'int': np.int32,
+        'long': np.int64,
+        'long int': np.int64,
+        'bool': np.bool_,
+        'char': np.int8,
+    }
+
+    def __init__(self, obj, variables=[], period=None, period_offset=None, start=True, stream=None, stream_block_size=1048576, events=False, net_id=0):
         """
         :param obj: object to monitor. Must be a Population, PopulationView, Dendrite or Projection object.
         :param variables: single variable name or list of variable names to record (default: []).
         :param period: delay in ms between two recording (default: dt). Not valid for the ``spike`` variable of a Population(View).
         :param period_offset: determine the moment in ms of recording within the period (default 0). Must be smaller than **period**.
         :param start: defines if the recording should start immediately (default: True). If not, you should later start the recordings with the ``start()`` method.
+        :param stream: directory in which the local variables of a population are written during the simulation instead of being kept in memory (default: None). Global variables and spikes are still recorded in memory.
+        :param stream_block_size: size in bytes of the blocks written to the stream files (default: 1 MB).
+        :param events: records the spikes of a population as a flat list of events (spike times and neuron ranks) instead of one list per neuron (default: False).
         """
         # Object to record (Population, PopulationView, Dendrite)
         self.object = obj
@@ -105,6 +135,26 @@ class Monitor(object):
         if isinstance(self.object, Projection) and self._period == Global.config['dt']:
             Global._warning('Monitor(): it is a bad idea to record synaptic variables of a projection at each time step!')
 
+        # Streaming into files
+        self._stream = stream
+        self._stream_block_size = int(stream_block_size)
+        self._streams = {}
+        if self._stream is not None:
+            if not isinstance(self.object, (Population, PopulationView)):
+                Global._error('Monitor(): streaming the recordings is only possible for populations.')
+            if not Global._check_paradigm("openmp"):
+                Global._error('Monitor(): streaming the recordings is only available for the openmp paradigm.')
+            if self._stream_block_size <= 0:
+                Global._error('Monitor(): stream_block_size must be positive.')
+
+        # Spikes as event list
+        self._events = events
+        if self._events:
+            if not isinstance(self.object, (Population, PopulationView)):
+                Global._error('Monitor(): the event-list mode is only possible for populations.')
+            if not Global._check_paradigm("openmp"):
+                Global._error('Monitor(): the event-list mode is only available for the openmp paradigm.')
+
         # Start
         self._start = start
         self._recorded_variables = {}
@@ -205,6 +255,12 @@ class Monitor(object):
             # Reinitializes the timings
             self._add_variable(var)
 
+    def _reserve(self, nb_steps):
+        "Preallocates the recording buffers before a simulation of nb_steps steps."
+        if hasattr(self.cyInstance, 'reserve'):
+            period = self.cyInstance.period
+            self.cyInstance.reserve(nb_steps // period + 1)
+
     def _init_monitoring(self):
         "To be called after compile() as it accesses cython objects"
         # Start recording dependent on the recorded object
@@ -230,6 +286,11 @@ class Monitor(object):
         offset = Global.get_current_step(self.net_id) % period
         self.cyInstance = getattr(Global._network[self.net_id]['instance'], 'PopRecorder'+str(self.object.id)+'_wrapper')(self.ranks, period, period_offset, offset)
 
+        if self._events:
+            for name in ['spike', 'axon_spike']:
+                if hasattr(self.cyInstance, name+'_events'):
+                    setattr(self.cyInstance, name+'_events', True)
+
         for var in self._variables:
             self._add_variable(var)
 
@@ -294,6 +355,8 @@ class Monitor(object):
             if var.startswith('sum('):
                 target = re.findall(r"\(([\w]+)\)", var)[0]
                 name = '_sum_' + target
+            if self._stream is not None and not name in self._streams:
+                self._start_stream(name)
             try:
                 setattr(self.cyInstance, 'record_'+name, True)
             except:
@@ -310,6 +373,30 @@ class Monitor(object):
                 Global._warning('Monitor: ' + var + ' can not be recorded ('+obj_desc+')')
 
 
+    def _start_stream(self, name):
+        "Redirects the recording of a local variable into a file."
+        if name.startswith('_sum_'):
+            ctype = Global.config['precision']
+        elif name in self.object.neuron_type.description['local']:
+            ctype = [var['ctype'] for var in self.object.neuron_type.description['variables'] if var['name'] == name][0]
+        else:
+            # global variables and spikes are recorded in memory
+            return
+
+        if not os.path.isdir(self._stream):
+            os.makedirs(self._stream)
+
+        filename = os.path.join(self._stream, 'net'+str(self.net_id)+'_monitor'+str(self.id)+'_'+name+'.dat')
+        if not getattr(self.cyInstance, 'stream_'+name)(filename, self._stream_block_size):
+            Global._error('Monitor: unable to open the file', filename)
+
+        self._streams[name] = {
+            'filename': filename,
+            'dtype': np.dtype(self._stream_dtypes[ctype]),
+            'width': self.cyInstance.record_width(),
+            'offset': 0, # number of time steps already returned by get()
+        }
+
     def pause(self):
         "Pauses the recordings."
         # Start recording the variables
@@ -367,6 +454,7 @@ class Monitor(object):
         try:
             self._variables = []
             self._recorded_variables = {}
+            self._streams = {}
             self.cyInstance.clear()
             self.cyInstance = None
 
@@ -389,6 +477,9 @@ class Monitor(object):
         If a list is provided or the argument left empty, a dictionary with all recorded variables is returned.
 
         The ``spike`` variable of a population will be returned as a dictionary of lists, where the spike times (in steps) for each recorded neurons are returned.
+        In the event-list mode (``events=True``), it is returned as a tuple of two arrays containing the spike times (in steps) and the ranks of the corresponding neurons.
+
+        If the monitor streams its recordings into files, the local variables are returned as read-only memory-mapped arrays which are only loaded when accessed.
 
         :param variables: (list of) variables. By default, a dictionary with all variables is returned.
         :param keep: defines if the content in memory for each variable should be kept (default: False).
@@ -448,6 +539,15 @@ class Monitor(object):
             return data
 
     def _get_population(self, pop, name, keep):
+        if name in self._streams:
+            return self._get_stream(name, keep)
+
+        if self._events and name in ['spike', 'axon_spike']:
+            data = getattr(self.cyInstance, 'get_'+name+'_events')()
+            if not keep:
+                getattr(self.cyInstance, 'clear_' + name)()
+            return data
+
         try:
             data = getattr(self.cyInstance, name)
             if not keep:
@@ -456,10 +556,31 @@ class Monitor(object):
             data = []
 
         if name not in ['spike', 'axon_spike']:
-            return np.array(data)
+            # local variables are already returned as arrays
+            return np.asarray(data)
         else:
             return data
 
+    def _get_stream(self, name, keep):
+        "Returns a memory map on the time steps written into the file since the last call."
+        stream = self._streams[name]
+        getattr(self.cyInstance, 'flush_' + name)()
+
+        row_size = stream['width'] * stream['dtype'].itemsize
+        nb_rows = os.path.getsize(stream['filename']) // row_size if row_size > 0 else 0
+        nb_new_rows = nb_rows - stream['offset']
+
+        if nb_new_rows <= 0:
+            data = np.zeros((0, stream['width']), dtype=stream['dtype'])
+        else:
+            data = np.memmap(stream['filename'], dtype=stream['dtype'], mode='r',
+                             offset=stream['offset'] * row_size, shape=(nb_new_rows, stream['width']))
+
+        if not keep:
+            stream['offset'] = nb_rows
+
+        return data
+
     def _get_dendrite(self, proj, name, keep):
         try:
             data = getattr(self.cyInstance, name)
@@ -497,6 +618,26 @@ class Monitor(object):
     ###############################
     ### Spike visualisation stuff
     ###############################
+    def _spike_data(self, spikes):
+        "Returns the recorded spikes passed to the analysis methods, calls get('spike') if None."
+        if not 'spike' in self._variables:
+            Global._error('Monitor: spike was not recorded')
+
+        if spikes is None or (isinstance(spikes, dict) and len(spikes) == 0):
+            return self.get('spike')
+
+        if isinstance(spikes, dict):
+            if 'spike' in spikes.keys():
+                return spikes['spike']
+            elif 'axon_spike' in spikes.keys():
+                return spikes['axon_spike']
+
+        return spikes
+
+    def _recorded_ranks(self):
+        "Ranks of the recorded neurons."
+        return self.object.ranks if isinstance(self.object, PopulationView) else range(self.object.size)
+
     def raster_plot(self, spikes=None):
         """
         Returns two vectors representing for each recorded spike 1) the spike times and 2) the ranks of the neurons.
@@ -520,30 +661,11 @@ class Monitor(object):
         plt.plot(spike_times, spike_ranks, '.')
         ```
 
-        :param spikes: the dictionary of spikes returned by ``get('spike')``. If left empty, ``get('spike')`` will be called. Beware: this erases the data from memory.
+        :param spikes: the dictionary of spikes (or the event list) returned by ``get('spike')``. If left empty, ``get('spike')`` will be called. Beware: this erases the data from memory.
         """
-        times = []; ranks=[]
-        if not 'spike' in self._variables:
-            Global._error('Monitor: spike was not recorded')
-
-        # Get data
-        if not spikes:
-            data = self.get('spike')
-        else:
-            if 'spike' in spikes.keys():
-                data = spikes['spike']
-            elif 'axon_spike' in spikes.keys():
-                data = spikes['axon_spike']
-            else:
-                data = spikes
-
-        # Compute raster
-        for n in data.keys():
-            for t in data[n]:
-                times.append(t)
-                ranks.append(n)
+        times, ranks = _spike_events(self._spike_data(spikes))
 
-        return Global.dt()* np.array(times), np.array(ranks)
+        return Global.dt() * times, ranks
 
     def histogram(self, spikes=None, bins=None):
         """
@@ -568,21 +690,11 @@ class Monitor(object):
         plt.plot(histo)
         ```
 
-        :param spikes: the dictionary of spikes returned by ``get('spike')``. If left empty, ``get('spike')`` will be called. Beware: this erases the data from memory.
+        :param spikes: the dictionary of spikes (or the event list) returned by ``get('spike')``. If left empty, ``get('spike')`` will be called. Beware: this erases the data from memory.
         :param bins: the bin size in ms (default: dt).
 
         """
-        if not 'spike' in self._variables:
-            Global._error('Monitor: spike was not recorded')
-
-        # Get data
-        if not spikes:
-            data = self.get('spike')
-        else:
-            if 'spike' in spikes.keys():
-                data = spikes['spike']
-            else:
-                data = spikes
+        times, _ = _spike_events(self._spike_data(spikes))
 
         if not bins:
             bins =  Global.config['dt']
@@ -594,16 +706,14 @@ class Monitor(object):
         # Number of bins
         nb_bins = int(duration*Global.config['dt']/bins)
 
-        # Initialize histogram
-        histo = [0 for t in range(nb_bins)]
+        # Spikes recorded before the last start (e.g. before a pause) are not binned
+        times = times[times >= t_start]
 
         # Compute histogram
-        neurons = self.object.ranks if isinstance(self.object, PopulationView) else range(self.object.size)
-        for neuron in neurons:
-            for t in data[neuron]:
-                histo[int((t-t_start)/float(bins/Global.config['dt']))] += 1
+        idx = ((times - t_start) / float(bins/Global.config['dt'])).astype(int)
+        histo = np.bincount(idx, minlength=nb_bins)
 
-        return np.array(histo)
+        return histo[:nb_bins]
 
     def mean_fr(self, spikes=None):
         """
@@ -626,34 +736,18 @@ class Monitor(object):
         fr = m.mean_fr(spikes)
         ```
 
-        :param spikes: the dictionary of spikes returned by ``get('spike')``. If left empty, ``get('spike')`` will be called. Beware: this erases the data from memory.
+        :param spikes: the dictionary of spikes (or the event list) returned by ``get('spike')``. If left empty, ``get('spike')`` will be called. Beware: this erases the data from memory.
 
         """
-        if not 'spike' in self._variables:
-            Global._error('Monitor: spike was not recorded')
-
-        # Get data
-        if not spikes:
-            data = self.get('spike')
-        else:
-            if 'spike' in spikes.keys():
-                data = spikes['spike']
-            else:
-                data = spikes
-
+        times, _ = _spike_events(self._spike_data(spikes))
 
         # Compute the duration of the recordings
         duration = self._last_recorded_variables['spike']['stop'][-1] - self._last_recorded_variables['spike']['start'][-1]
 
         # Number of neurons
-        neurons = self.object.ranks if isinstance(self.object, PopulationView) else range(self.object.size)
-
-        # Compute fr
-        fr = 0
-        for neuron in neurons:
-            fr += len(data[neuron])
+        nb_neurons = len(self._recorded_ranks())
 
-        return fr/float(len(neurons))/duration/Global.dt()*1000.0
+        return times.size/float(nb_neurons)/duration/Global.dt()*1000.0
 
 
 
@@ -671,21 +765,11 @@ class Monitor(object):
         r = m.smoothed_rate(smooth=100.)
         ```
 
-        :param spikes: the dictionary of spikes returned by ``get('spike')``. If left empty, ``get('spike')`` will be called. Beware: this erases the data from memory.
+        :param spikes: the dictionary of spikes (or the event list) returned by ``get('spike')``. If left empty, ``get('spike')`` will be called. Beware: this erases the data from memory.
         :param smooth: smoothing time constant. Default: 0.0 (no smoothing).
 
         """
-        if not 'spike' in self._variables:
-            Global._error('Monitor: spike was not recorded')
-
-        # Get data
-        if not spikes:
-            data = self.get('spike')
-        else:
-            if 'spike' in spikes.keys():
-                data = spikes['spike']
-            else:
-                data = spikes
+        data = _spike_dict(self._spike_data(spikes), self._recorded_ranks())
 
         import ANNarchy.core.cython_ext.Transformations as Transformations
         return Transformations.smoothed_rate(
@@ -719,17 +803,7 @@ class Monitor(object):
         :param smooth: smoothing time constant. Default: 0.0 (no smoothing).
 
         """
-        if not 'spike' in self._variables:
-            Global._error('Monitor: spike was not recorded')
-
-        # Get data
-        if not spikes:
-            data = self.get('spike')
-        else:
-            if 'spike' in spikes.keys():
-                data = spikes['spike']
-            else:
-                data = spikes
+        data = _spike_dict(self._spike_data(spikes), self._recorded_ranks())
 
         import ANNarchy.core.cython_ext.Transformations as Transformations
         return Transformations.population_rate(
@@ -809,6 +883,50 @@ class MemoryStats(object):
 ######################
 # Static methods to plot spike patterns without a Monitor (e.g. offline)
 ######################
+def _spike_events(spikes):
+    """
+    Returns the spike times and the ranks of the neurons as two flat arrays.
+
+    :param spikes: the dictionary of spikes or the event list returned by ``get('spike')``.
+    """
+    if isinstance(spikes, dict):
+        neurons = list(spikes.keys())
+        if len(neurons) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.intc)
+
+        lengths = [len(spikes[n]) for n in neurons]
+        ranks = np.repeat(np.array(neurons, dtype=np.intc), lengths)
+        times = np.concatenate([np.asarray(spikes[n], dtype=np.int64) for n in neurons])
+        return times, ranks
+
+    times, ranks = spikes
+    return np.asarray(times, dtype=np.int64), np.asarray(ranks, dtype=np.intc)
+
+def _spike_dict(spikes, neurons=None):
+    """
+    Returns the spikes as a dictionary of lists (one per neuron).
+
+    :param spikes: the dictionary of spikes or the event list returned by ``get('spike')``.
+    :param neurons: ranks of the recorded neurons (default: all neurons which emitted a spike).
+    """
+    if isinstance(spikes, dict):
+        return spikes
+
+    times, ranks = _spike_events(spikes)
+    if neurons is None:
+        neurons = np.unique(ranks)
+    data = {int(n): [] for n in neurons}
+
+    # group the spike times by neuron, the temporal order is preserved
+    order = np.argsort(ranks, kind='stable')
+    ranks = ranks[order]
+    times = times[order]
+    uniq, first = np.unique(ranks, return_index=True)
+    for n, spike_times in zip(uniq, np.split(times, first[1:])):
+        data[int(n)] = spike_times.tolist()
+
+    return data
+
 def raster_plot(spikes):
     """
     Returns two vectors representing for each recorded spike 1) the spike times and 2) the ranks of the neurons.
@@ -823,17 +941,11 @@ def raster_plot(spikes):
     plt.plot(spike_times, spike_ranks, '.')
     ```
 
-    :param spikes: the dictionary of spikes returned by ``get('spike')``.
+    :param spikes: the dictionary of spikes (or the event list) returned by ``get('spike')``.
     """
-    times = []; ranks=[]
+    times, ranks = _spike_events(spikes)
 
-    # Compute raster
-    for n in spikes.keys():
-        for t in spikes[n]:
-            times.append(t)
-            ranks.append(n)
-
-    return Global.dt()* np.array(times), np.array(ranks)
+    return Global.dt() * times, ranks
 
 
 def histogram(spikes, bins=None):
@@ -851,7 +963,7 @@ def histogram(spikes, bins=None):
     ```
 
 
-    :param spikes: the dictionary of spikes returned by ``get('spike')``.
+    :param spikes: the dictionary of spikes (or the event list) returned by ``get('spike')``.
     :param bins: the bin size in ms (default: dt).
     """
     if bins is None:
@@ -860,30 +972,18 @@ def histogram(spikes, bins=None):
     bin_step = int(bins/Global.config['dt'])
 
     # Compute the duration of the recordings
-    t_maxes = []
-    t_mines = []
-    for neuron in spikes.keys():
-        if len(spikes[neuron]) == 0 : continue
-        t_maxes.append(np.max(spikes[neuron]))
-        t_mines.append(np.min(spikes[neuron]))
-
-    t_max = np.max(t_maxes)
-    t_min = np.min(t_mines)
+    times, _ = _spike_events(spikes)
+    t_max = np.max(times)
+    t_min = np.min(times)
     duration = t_max - t_min
 
     # Number of bins
     nb_bins = int(duration/bin_step)
-    #print(t_min, t_max, duration, nb_bins)
-
-    # Initialize histogram
-    histo = [0 for t in range(nb_bins+1)]
 
     # Compute per step histogram
-    for neuron in spikes.keys():
-        for t in spikes[neuron]:
-            histo[int((t-t_min)/float(bin_step))] += 1
+    idx = ((times - t_min) / float(bin_step)).astype(int)
 
-    return np.array(histo)
+    return np.bincount(idx, minlength=nb_bins+1)
 
 def population_rate(spikes, smooth=0.0):
     """
@@ -902,24 +1002,18 @@ def population_rate(spikes, smooth=0.0):
     r = population_rate(smooth=100.)
     ```
 
-    :param spikes: the dictionary of spikes returned by ``get('spike')``.
+    :param spikes: the dictionary of spikes (or the event list) returned by ``get('spike')``. For an event list, only the neurons which emitted at least one spike are counted.
     :param smooth: smoothing time constant. Default: 0.0 (no smoothing).
     """
     # Compute the duration of the recordings
-    t_maxes = []
-    t_mines = []
-    for neuron in spikes.keys():
-        if len(spikes[neuron]) == 0 : continue
-        t_maxes.append(np.max(spikes[neuron]))
-        t_mines.append(np.min(spikes[neuron]))
-
-    t_max = np.max(t_maxes)
-    t_min = np.min(t_mines)
+    times, _ = _spike_events(spikes)
+    t_max = np.max(times)
+    t_min = np.min(times)
 
     import ANNarchy.core.cython_ext.Transformations as Transformations
     return Transformations.population_rate(
         {
-            'data': spikes,
+            'data': _spike_dict(spikes),
             'start':t_min,
             'stop': t_max
         },
@@ -942,24 +1036,18 @@ def smoothed_rate(spikes, smooth=0.):
     ```
 
 
-    :param spikes: the dictionary of spikes returned by ``get('spike')``. If left empty, ``get('spike')`` will be called. Beware: this erases the data from memory.
+    :param spikes: the dictionary of spikes (or the event list) returned by ``get('spike')``.
     :param smooth: smoothing time constant. Default: 0.0 (no smoothing).
     """
     # Compute the duration of the recordings
-    t_maxes = []
-    t_mines = []
-    for neuron in spikes.keys():
-        if len(spikes[neuron]) == 0 : continue
-        t_maxes.append(np.max(spikes[neuron]))
-        t_mines.append(np.min(spikes[neuron]))
-
-    t_max = np.max(t_maxes)
-    t_min = np.min(t_mines)
+    times, _ = _spike_events(spikes)
+    t_max = np.max(times)
+    t_min = np.min(times)
 
     import ANNarchy.core.cython_ext.Transformations as Transformations
     return Transformations.smoothed_rate(
         {
-            'data': spikes,
+            'data': _spike_dict(spikes),
             'start': t_min,
             'stop': t_max
         },
@@ -979,30 +1067,20 @@ def mean_fr(spikes, duration=None):
     fr = mean_fr(spikes)
     ```
 
-    :param spikes: the dictionary of spikes returned by ``get('spike')``.
+    :param spikes: the dictionary of spikes (or the event list) returned by ``get('spike')``. For an event list, only the neurons which emitted at least one spike are counted.
     :param duration: duration of the recordings. By default, the mean firing rate is computed between the first and last spikes of the recordings.
 
 
     """
-    if duration is None:
+    times, ranks = _spike_events(spikes)
 
+    if duration is None:
         # Compute the duration of the recordings
-        t_maxes = []
-        t_mines = []
-        for neuron in spikes.keys():
-            if len(spikes[neuron]) == 0 : continue
-            t_maxes.append(np.max(spikes[neuron]))
-            t_mines.append(np.min(spikes[neuron]))
-
-        t_max = np.max(t_maxes)
-        t_min = np.min(t_mines)
-        duration = t_max - t_min
-
-    nb_neurons = len(spikes.keys())
+        duration = np.max(times) - np.min(times)
 
-    # Compute fr
-    fr = 0
-    for neuron in spikes:
-        fr += len(spikes[neuron])
+    if isinstance(spikes, dict):
+        nb_neurons = len(spikes.keys())
+    else:
+        nb_neurons = np.unique(ranks).size
 
-    return fr/float(nb_neurons)/duration/Global.dt()*1000.0
+    return times.size/float(nb_neurons)/duration/Global.dt()*1000.0
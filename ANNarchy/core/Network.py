@@ -232,7 +232,12 @@ class Network(object):
 
             # Copy the connectivity properties if the projection is not already set
             if proj._connection_method is None:
-                proj._store_connectivity(method=obj._connection_method, args=obj._connection_args, delay=obj._connection_delay, storage_format=obj._storage_format, storage_order=obj._storage_order)
+                if obj.id in _worker_connectivity:
+                    # The connectivity was exported by the main process (see _share_connectivity())
+                    method, args = proj._load_from_csr, _load_shared_connectivity(_worker_connectivity[obj.id])
+                else:
+                    method, args = obj._connection_method, obj._connection_args
+                proj._store_connectivity(method=method, args=args, delay=obj._connection_delay, storage_format=obj._storage_format, storage_order=obj._storage_order)
 
             # Add the copy to the local network
             Global._network[self.id]['projections'].append(proj)
@@ -292,7 +297,7 @@ class Network(object):
                 except:
                     pass
             # Create a copy of the monitor
-            m = Monitor(obj=self._get_object(obj.object), variables=obj.variables, period=obj._period, period_offset=obj._period_offset, start=obj._start, net_id=self.id)
+            m = Monitor(obj=self._get_object(obj.object), variables=obj.variables, period=obj._period, period_offset=obj._period_offset, start=obj._start, stream=obj._stream, stream_block_size=obj._stream_block_size, events=obj._events, net_id=self.id)
 
             # there is a bad mismatch between object ids:
             #
@@ -579,7 +584,7 @@ class Network(object):
         """
         IO.save(filename, populations, projections, self.id)
 
-def parallel_run(method, networks=None, number=0, max_processes=-1, measure_time=False, sequential=False, same_seed=False, annarchy_json="", visible_cores=[], **args):
+def parallel_run(method, networks=None, number=0, max_processes=-1, measure_time=False, sequential=False, same_seed=False, annarchy_json="", visible_cores=[], share_connectivity=False, worker_setup=None, **args):
     """
     Allows to run multiple networks in parallel using multiprocessing.
 
@@ -622,9 +627,13 @@ def parallel_run(method, networks=None, number=0, max_processes=-1, measure_time
     :param same_seed: if True, all networks will use the same seed. If not, the seed will be randomly initialized with time(0) for each network (default). It has no influence when the ``networks`` argument is set (the seed has to be set individually for each network using ``net.set_seed()``), only when ``number`` is used.
     :param annarchy.json: path to a different configuration file if needed (default "").
     :param visible_cores: a list of CPU core ids to simulate on (must have max_processes entries and max_processes must be != -1)
+    :param share_connectivity: if True, the current connectivity of the projections in the compiled network is shared with all networks through read-only memory-mapped files, instead of being built again for each network. All networks then have the same connectivity as the compiled network (including random weights and delays). Only used together with ``number`` (default: False).
+    :param worker_setup: a function without arguments which is called once in each process before its first run. Only used together with ``number`` (default: None).
     :param args: other named arguments you want to pass to the simulation method.
     :return: a list of the values returned by ``method``.
 
+    The runs are distributed one by one to the processes. To process the results as soon as they are available, or to retry failed runs, see ``parallel_imap()``.
+
     """
     # Check inputs
     if not networks and number < 1:
@@ -641,7 +650,7 @@ def parallel_run(method, networks=None, number=0, max_processes=-1, measure_time
         Global._error('parallel_run(): the method argument must be a method.', exit=True)
 
     if not networks: # The magic network will run N times
-        return _parallel_multi(method, number, max_processes, measure_time, sequential, same_seed, annarchy_json, visible_cores, args)
+        return _parallel_multi(method, number, max_processes, measure_time, sequential, same_seed, annarchy_json, visible_cores, share_connectivity, args, worker_setup)
 
     if not isinstance(networks, list):
         Global._error('parallel_run(): the networks argument must be a list.', exit=True)
@@ -719,9 +728,8 @@ def _parallel_networks(method, networks, max_processes, measure_time, sequential
     return results
 
 
-def _parallel_multi(method, number, max_processes, measure_time, sequential, same_seed, annarchy_json, visible_cores, args):
+def _parallel_multi(method, number, max_processes, measure_time, sequential, same_seed, annarchy_json, visible_cores, share_connectivity, args, worker_setup=None):
     "Method when the same network must be simulated multiple times."
-    import multiprocessing
     from multiprocessing import Pool
 
     # Time measurement
@@ -729,9 +737,125 @@ def _parallel_multi(method, number, max_processes, measure_time, sequential, sam
     if measure_time:
         ts = time()
 
+    arguments, max_processes, shared_folder = _prepare_parallel_multi('parallel_run', method, number, max_processes, same_seed, annarchy_json, visible_cores, share_connectivity, args)
+
+    # Simulation
+    if not sequential and len(visible_cores) == 0:
+        # Runs are distributed dynamically over the processes
+        results = [None for n in range(number)]
+        for n, failed, res in _imap_multi(arguments, max_processes, 0, _worker_initargs(worker_setup)):
+            if failed:
+                _cleanup_parallel_multi(shared_folder)
+                Global._print(res)
+                Global._error('parallel_run(): running network ' + str(n) + ' failed.', exit=True)
+            results[n] = res
+
+    elif not sequential and len(visible_cores) > 0:
+        # Thread placement requires some more fine-grained control
+        # on the execution
+        results = []
+        try:
+            n_iter = int(np.ceil(number / max_processes))
+            pool = Pool(max_processes, initializer=_init_parallel_worker, initargs=_worker_initargs(worker_setup))
+            for idx in range(n_iter):
+                beg = int(idx * max_processes)
+                end = int(min((idx+1) * max_processes, number))
+                results += pool.map(_create_and_run_method, arguments[beg:end])
+            pool.close()
+            pool.join()
+        except Exception as e:
+            _cleanup_parallel_multi(shared_folder)
+            Global._print(e)
+            Global._error('parallel_run(): running ' + str(number) + ' networks failed.', exit=True)
+
+    else:
+        results = []
+        try:
+            if worker_setup is not None:
+                worker_setup()
+            for n in range(number):
+                results.append(_create_and_run_method(arguments[n]))
+        except Exception as e:
+            _cleanup_parallel_multi(shared_folder)
+            Global._print(e)
+            Global._error('parallel_run(): running ' + str(number) + ' networks failed.', exit=True)
+
+    _cleanup_parallel_multi(shared_folder)
+
+    # Time measurement
+    if measure_time:
+        msg = 'Running ' + str(number) + ' networks'
+        if not sequential:
+            msg += ' in parallel '
+        else:
+            msg += ' sequentially '
+        msg += 'took: ' + str(time()-ts)
+        Global._print(msg)
+
+    return results
+
+def parallel_imap(method, number, max_processes=-1, same_seed=False, annarchy_json="", share_connectivity=False, retries=0, worker_setup=None, **args):
+    """
+    Runs the same network ``number`` times in parallel like ``parallel_run()``, but returns an iterator which yields the results as soon as the single runs are completed.
+
+    The runs are distributed one by one to the processes, so runs of uneven duration do not leave processes idle. A failing run does not abort the others: it is started again up to ``retries`` times, and if it still fails the raised exception is yielded instead of its result.
+
+    Example:
+
+    ```python
+    def simulation(idx, net, rate):
+        net.get(pop1).rates = rate
+        net.simulate(1000.)
+        return net.get(m).raster_plot()
+
+    rates = np.linspace(1., 100., 100)
+    for idx, result in parallel_imap(simulation, number=100, rate=rates):
+        if isinstance(result, Exception):
+            print('Run', idx, 'failed:', result)
+        else:
+            t, n = result
+            ...
+    ```
+
+    :param method: a Python method which will be executed for each network. This function must accept an integer as first argument (id of the simulation) and a Network object as second argument.
+    :param number: the number of identical networks to run.
+    :param max_processes: maximal number of processes to start concurrently (default: the available number of cores on the machine).
+    :param same_seed: if True, all networks will use the same seed (see ``parallel_run()``).
+    :param annarchy_json: path to a different configuration file if needed (default "").
+    :param share_connectivity: if True, the connectivity of the compiled network is shared with all networks (see ``parallel_run()``).
+    :param retries: number of times a failed run is started again (default: 0). A run whose process died (e.g. segmentation fault) counts as failed, as well as the other runs which were executed by the terminated processes at that moment.
+    :param worker_setup: a function without arguments which is called once in each process before its first run, e.g. to load data shared by the runs. The compiled network is also loaded only once per process.
+    :param args: other named arguments you want to pass to the simulation method (one value per network).
+    :return: an iterator over tuples ``(idx, result)`` in the order of completion.
+    """
+    import types
+    if not isinstance(method, types.FunctionType):
+        Global._error('parallel_imap(): the method argument must be a method.', exit=True)
+
+    if number < 1:
+        Global._error('parallel_imap(): the number argument must be set.', exit=True)
+
+    arguments, max_processes, shared_folder = _prepare_parallel_multi('parallel_imap', method, number, max_processes, same_seed, annarchy_json, [], share_connectivity, args)
+
+    try:
+        for n, failed, res in _imap_multi(arguments, max_processes, retries, _worker_initargs(worker_setup)):
+            if failed:
+                Global._warning('parallel_imap(): the run', n, 'failed:', res)
+            yield n, res
+    finally:
+        _cleanup_parallel_multi(shared_folder)
+
+def _prepare_parallel_multi(caller, method, number, max_processes, same_seed, annarchy_json, visible_cores, share_connectivity, args):
+    """
+    Compiles the network if needed and builds the argument lists of the single
+    runs. Returns the arguments, the number of processes and the folder of the
+    shared connectivity (or None).
+    """
+    import multiprocessing
+
     # Make sure the magic network is compiled
     if not Global._network[0]['compiled']:
-        Global._warning('parallel_run(): the network is not compiled yet, doing it now...')
+        Global._warning(caller + '(): the network is not compiled yet, doing it now...')
         Compiler.compile(annarchy_json=annarchy_json)
 
     # Number of processes to create
@@ -751,18 +875,26 @@ def _parallel_multi(method, number, max_processes, measure_time, sequential, sam
         seed = np.random.get_state()[1][0]
 
     # Build arguments list for each instance with the following structure:
-    # [ net_id, arguments for method, seed ]
+    # [ net_id, arguments for method, shared connectivity, seed, visible cores ]
     arguments = [[n, method] for n in range(number)]
     if len(args) != method.__code__.co_argcount-2:  # idx, net are default
         Global._error('the method', method.__name__, 'takes', method.__code__.co_argcount-2,
-                      'arguments (in addition to idx and net) which have to be passed to parallel_run:', method.__code__.co_varnames[2:method.__code__.co_argcount])
+                      'arguments (in addition to idx and net) which have to be passed to ' + caller + ':', method.__code__.co_varnames[2:method.__code__.co_argcount])
     for arg in range(2, method.__code__.co_argcount):
         varname = method.__code__.co_varnames[arg]
         data = args[varname]
         if not len(data) == number:
-            Global._error('parallel_run(): the argument', varname, 'must be a list of values for each of the', number, 'networks.')
+            Global._error(caller + '(): the argument', varname, 'must be a list of values for each of the', number, 'networks.')
         for n in range(number):
             arguments[n].append(data[n])
+
+    # Build the connectivity once, the networks only map the stored arrays
+    shared_connectivity, shared_folder = {}, None
+    if share_connectivity:
+        shared_connectivity, shared_folder = _share_connectivity(Global._network[0]['projections'])
+
+    for n in range(number):
+        arguments[n].append(shared_connectivity)
     for n in range(number): # Add the seed at the end. Increment the seed if the seeds should be different
         arguments[n].append(seed + n if not same_seed else 0)
 
@@ -774,54 +906,148 @@ def _parallel_multi(method, number, max_processes, measure_time, sequential, sam
         for n in range(number):
             arguments[n].append([visible_cores[np.mod(n,max_processes)]])
 
-    # Simulation
-    if not sequential and len(visible_cores) == 0:
-        try:
-            pool = Pool(max_processes)
-            results = pool.map(_create_and_run_method, arguments)
-            pool.close()
-            pool.join()
-        except Exception as e:
-            Global._print(e)
-            Global._error('parallel_run(): running ' + str(number) + ' networks failed.', exit=True)
+    return arguments, max_processes, shared_folder
 
-    elif not sequential and len(visible_cores) > 0:
-        # Thread placement requires some more fine-grained control
-        # on the execution
-        try:
-            n_iter = int(np.ceil(number / max_processes))
-            pool = Pool(max_processes)
-            for idx in range(n_iter):
-                beg = int(idx * max_processes)
-                end = int(min((idx+1) * max_processes, number))
-                results = pool.map(_create_and_run_method, arguments[beg:end])
-            pool.close()
-            pool.join()
-        except Exception as e:
-            Global._print(e)
-            Global._error('parallel_run(): running ' + str(number) + ' networks failed.', exit=True)
+def _cleanup_parallel_multi(shared_folder):
+    "Removes the shared connectivity, if any."
+    if shared_folder is not None:
+        import shutil
+        shutil.rmtree(shared_folder, ignore_errors=True)
 
-    else:
-        results = []
-        try:
-            for n in range(number):
-                results.append(_create_and_run_method(arguments[0]))
-        except Exception as e:
-            Global._print(e)
-            Global._error('parallel_run(): running ' + str(number) + ' networks failed.', exit=True)
+def _imap_multi(arguments, max_processes, retries, initargs):
+    """
+    Submits the runs one by one to a pool of processes and yields tuples
+    (idx, failed, result or exception) in the order of completion. Failed
+    runs are submitted again up to *retries* times. *initargs* are passed to
+    _init_parallel_worker() (see _worker_initargs()).
+    """
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+    from concurrent.futures.process import BrokenProcessPool
+
+    def new_executor():
+        return ProcessPoolExecutor(max_workers=max_processes, initializer=_init_parallel_worker, initargs=initargs)
+
+    attempts = [0 for n in range(len(arguments))]
+    futures = {}
+    executor = new_executor()
+    try:
+        for n in range(len(arguments)):
+            futures[executor.submit(_create_and_run_method, arguments[n])] = n
+
+        while len(futures) > 0:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+            resubmit = []
+            broken = False
+            for future in done:
+                n = futures.pop(future)
+                try:
+                    res = future.result()
+                except Exception as e:
+                    # A dead process breaks the whole pool
+                    broken = broken or isinstance(e, BrokenProcessPool)
+                    if attempts[n] < retries:
+                        attempts[n] += 1
+                        resubmit.append(n)
+                    else:
+                        yield n, True, e
+                else:
+                    yield n, False, res
+
+            if broken:
+                # All pending runs are lost, start them again in a new pool
+                resubmit += list(futures.values())
+                futures = {}
+                executor.shutdown(wait=False)
+                executor = new_executor()
+
+            for n in resubmit:
+                futures[executor.submit(_create_and_run_method, arguments[n])] = n
+    finally:
+        # The iteration may have been stopped early
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+# Library loaded once by each process of parallel_run() / parallel_imap()
+_worker_library = None
+
+def _worker_initargs(worker_setup):
+    """
+    Arguments of _init_parallel_worker(): the name and path of the compiled
+    library of the network 0 are determined in the main process, as the
+    workers do not necessarily inherit its memory (e.g. with the "spawn"
+    start method).
+    """
+    return ('ANNarchyCore0', Global._network[0]['directory'] + '/ANNarchyCore0.so', worker_setup)
 
-    # Time measurement
-    if measure_time:
-        msg = 'Running ' + str(number) + ' networks'
-        if not sequential:
-            msg += ' in parallel '
-        else:
-            msg += ' sequentially '
-        msg += 'took: ' + str(time()-ts)
-        Global._print(msg)
+def _init_parallel_worker(libname, libpath, worker_setup):
+    """
+    Initializer of the processes: loads the compiled library of the network 0
+    and calls the user-defined setup function.
+    """
+    global _worker_library
+    _worker_library = Compiler.load_cython_lib(libname, libpath)
 
-    return results
+    if worker_setup is not None:
+        worker_setup()
+
+def _share_connectivity(projections):
+    """
+    Exports the connectivity of the given (compiled) projections once as flat
+    arrays (CSR) into a temporary folder. Returns a dictionary with the files
+    for each projection id and the folder.
+
+    The networks then use the synapses of the projections in the main
+    process, the connection methods are not called again. Projections using
+    a C++ connector or a specific connection method (e.g. convolutions) are
+    built by each network as usual.
+    """
+    import tempfile
+    from ANNarchy.generator.Utils import cpp_connector_available, cpp_lil_connector_available
+
+    folder = tempfile.mkdtemp(prefix='annarchy_connectivity_')
+    shared = {}
+
+    for proj in projections:
+        if type(proj)._connect is not Projection._connect or not proj._connection_method or not proj.initialized:
+            continue
+        if cpp_connector_available(proj.connector_name, proj._storage_format, proj._storage_order, proj) or cpp_lil_connector_available(proj):
+            continue
+
+        # the synapses of the dendrite post_ranks[i] are in [row_ptr[i], row_ptr[i+1])
+        post_ranks = np.array(proj.post_ranks, dtype=np.intc)
+        row_ptr, pre_ranks = proj._flat_pre_ranks()
+        _, _, weights = proj._flat_connectivity("w")
+        delays = proj._flat_delays()
+
+        files = {}
+        for name, data in [('post_ranks', post_ranks), ('row_ptr', row_ptr), ('pre_ranks', pre_ranks), ('weights', weights), ('delays', delays)]:
+            if isinstance(data, np.ndarray):
+                files[name] = os.path.join(folder, 'proj' + str(proj.id) + '_' + name + '.npy')
+                np.save(files[name], data)
+            else:
+                files[name] = data
+        shared[proj.id] = files
+
+    return shared, folder
+
+def _load_shared_connectivity(files):
+    """
+    Returns the arguments of _load_from_csr() for the files written by
+    _share_connectivity(). The files are mapped read-only: each network
+    copies the connectivity into its own C++ data structures, so plastic
+    projections can modify their weights independently.
+    """
+    args = []
+    for name in ['post_ranks', 'row_ptr', 'pre_ranks', 'weights', 'delays']:
+        data = files[name]
+        args.append(np.load(data, mmap_mode='r') if isinstance(data, str) else data)
+    return tuple(args)
 
+# Connectivity shared with the network created by _create_and_run_method(),
+# used by Network.add() instead of the connection methods of the projections
+_worker_connectivity = {}
 
 def _create_and_run_method(args):
     """
@@ -832,13 +1058,20 @@ def _create_and_run_method(args):
     method = args[1]
     visible_cores = args[-1]
     seed = args[-2]
-    # Create and instantiate the network 0, not compile it!
-    net = Network(True)
-    Compiler._instantiate(net_id=net.id, import_id=0, core_list=visible_cores)
+    shared_connectivity = args[-3]
+    # Create and instantiate the network 0, not compile it! The projections
+    # load the shared connectivity (if any) instead of building it again.
+    global _worker_connectivity
+    _worker_connectivity = shared_connectivity
+    try:
+        net = Network(True)
+    finally:
+        _worker_connectivity = {}
+    Compiler._instantiate(net_id=net.id, import_id=0, core_list=visible_cores, cython_module=_worker_library)
     # Set the seed
     net.set_seed(seed)
     # Create the arguments
-    arguments = args[:-2] # all arguments except seed and visible_cores
+    arguments = args[:-3] # all arguments except shared connectivity, seed and visible_cores
     arguments[1] = net # replace the second argument method with net
     # Call the method
     res = method(*arguments)
@@ -23,6 +23,7 @@
 #===============================================================================
 from ANNarchy.core.Global import _error, _warning, _objects, config
 from ANNarchy.parser.AnalyseNeuron import analyse_neuron
+from ANNarchy.parser import DescriptionCache
 from ANNarchy.core.PopulationView import PopulationView
 import numpy as np
 
@@ -89,7 +90,7 @@ class Neuron(object):
     def _analyse(self):
         # Analyse the neuron type
         if not self.description:
-            self.description = analyse_neuron(self)
+            self.description = DescriptionCache.analyse(self, 'neuron', analyse_neuron)
 
     def __repr__(self):
         if self.type == 'rate':
@@ -424,6 +424,44 @@ class Population(object):
         """
         return self.__getattr__(name)
 
+    def view(self, name):
+        """
+        Returns a Numpy array sharing its memory with the C++ container of a local variable or parameter.
+
+        Contrary to ``get()``, no copy is made: modifying the array directly changes the simulated
+        values, and the array reflects the current state of the simulation after each call to ``simulate()``.
+
+        Example:
+
+        ```python
+        compile()
+        v = pop.view('v') # shape = pop.geometry
+        v[:] = -65.0      # in-place, no transfer
+        simulate(100.)
+        print(v.mean())   # current value
+        ```
+
+        The view is only valid as long as the network exists: it must not be used anymore after
+        ``clear()``, after the deletion of the network (e.g. in ``parallel_run()``) or after a new
+        call to ``compile()``. Operations changing the size of the population are not possible anyway.
+
+        Views are not available on GPUs, for boolean variables and for specific populations.
+
+        :param name: name of the local variable or parameter.
+        """
+        if not self.initialized:
+            Global._error('Population.view(): the network must be compiled before accessing ' + name + '.')
+
+        if not name in self.neuron_type.description['local']:
+            Global._error('Population.view(): ' + name + ' is not a local attribute of the population ' + self.name + '.')
+
+        ctype = self._get_attribute_cpp_type(name)
+        if not hasattr(self.cyInstance, 'get_local_attribute_view') or ctype == "bool":
+            Global._error('Population.view(): zero-copy access to ' + name + ' is not available for the population ' + self.name + ', use get() instead.')
+
+        data = self.cyInstance.get_local_attribute_view(name, ctype, self.size)
+        return data.reshape(self.geometry)
+
 
 
     ################################
@@ -774,6 +812,8 @@ class Population(object):
 
         * If the file name is '.mat', the data will be saved as a Matlab 7.2 file. Scipy must be installed.
 
+        * If the file name ends with a path separator (e.g. 'checkpoint/'), the data is saved as a checkpoint directory with one .npy file per attribute (see `save()`).
+
         * Otherwise, the data will be pickled into a simple binary text file using pickle.
 
         **Warning:** The '.mat' data will not be loadable by ANNarchy, it is only for external analysis purpose.
@@ -806,13 +846,22 @@ class Population(object):
         pop.load('pop1.npz')
         pop.load('pop1.txt')
         pop.load('pop1.txt.gz')
+        pop.load('checkpoint/')
         ```
 
+        If the file is a checkpoint directory created by `save()`, only the data of this population is read.
+
         :param filename: the filename with relative or absolute path.
 
         """
-        from ANNarchy.core.IO import _load_data
-        self._load_pop_data(_load_data(filename, pickle_encoding))
+        from ANNarchy.core.IO import _load_data, _is_checkpoint
+        desc = _load_data(filename, pickle_encoding)
+
+        # In a network checkpoint, only the arrays of this population are read
+        if _is_checkpoint(filename) and desc is not None and self.name in desc.get('obj_names', {}).get('populations', []):
+            desc = desc[self.name]
+
+        self._load_pop_data(desc)
 
     def _load_pop_data(self, desc):
         """
@@ -40,7 +40,8 @@ class Profiler(object):
         "simulate": "red",
         "instantiate": "orange",
         # will be ignored in image
-        "cpp core": "black"
+        "cpp core": "black",
+        "load balance": "black"
     }
 
     def __init__(self):
@@ -104,7 +105,7 @@ class Profiler(object):
         """
         Print the content to console.
         """
-        divided = ["cpp core", "instantiate", "compile"]
+        divided = ["cpp core", "load balance", "instantiate", "compile"]
 
         for t_start, t_end, label, group in self._entries:
             if group not in divided: # Python functions
@@ -131,6 +132,9 @@ class Profiler(object):
                 else:
                     print("  -", label,":", t_start, "seconds (", t_end, "% )")
 
+            if group == "load balance": # slowest / average thread
+                print("  -", label, "load imbalance :", t_start, "(", int(t_end), "threads )")
+
     def store_cpp_time_as_csv(self):
         """
         Store the measured timings on the C++ core as .csv to
@@ -145,6 +149,11 @@ class Profiler(object):
             csv_writer = csv.writer(Datafile, delimiter=',', quotechar=' ', quoting=csv.QUOTE_MINIMAL)
 
             for t_start, t_end, label, group in self._entries:
+                # ratio between the slowest and the average thread
+                if group == "load balance":
+                    csv_writer.writerow( (label+"_imbalance", t_start,) )
+                    continue
+
                 # skip Python functions
                 if group != "cpp core":
                     continue
@@ -216,15 +216,25 @@ class Projection(object):
             else:
                 self._no_split_matrix = Global.config["disable_split_matrix"]
 
+        # Creating and pruning modify the complete matrix, the
+        # thread-local partitions are not supported.
+        if Global.config["structural_plasticity"] and self._has_rewiring():
+            self._no_split_matrix = True
+
+        # The partitions are created once for the number of threads, which
+        # can change at runtime if the code does not depend on it.
+        if Global.config["dynamic_num_threads"]:
+            self._no_split_matrix = True
+
         # In particular for spiking models, the parallelization on the
-        # inner or outer loop can make a performance difference
-        if self._no_split_matrix:
-            # LIL and CSR are parallelized on inner loop
-            # to prevent cost of atomic operations
-            self._parallel_pattern = 'inner_loop'
-        else:
-            # splitted matrices are always parallelized on outer loop!
-            self._parallel_pattern = 'outer_loop'
+        # inner or outer loop can make a performance difference. An explicitly
+        # set value ('inner_loop', 'outer_loop' or 'thread_local') is kept, None
+        # lets the code generator select it (see OpenMPGenerator._select_spike_transmission)
+        self._parallel_pattern = None
+
+        # Set by the code generator if the connectivity is split into
+        # thread-local partitions (PartitionedMatrix)
+        self._partitioned_matrix = False
 
         # For dense matrix format: do we use an optimization for population views?
         if self.synapse_type.type == "rate":
@@ -245,9 +255,11 @@ class Projection(object):
     connect_with_func = ConnectorMethods.connect_with_func
     connect_from_matrix = ConnectorMethods.connect_from_matrix
     connect_from_matrix_market = ConnectorMethods.connect_from_matrix_market
-    _load_from_matrix = ConnectorMethods._load_from_matrix
     connect_from_sparse = ConnectorMethods.connect_from_sparse
-    _load_from_sparse = ConnectorMethods._load_from_sparse
+    connect_from_csr = ConnectorMethods.connect_from_csr
+    _store_relative_csr = ConnectorMethods._store_relative_csr
+    _store_csr_connectivity = ConnectorMethods._store_csr_connectivity
+    _load_from_csr = ConnectorMethods._load_from_csr
     connect_from_file = ConnectorMethods.connect_from_file
     _load_from_lil = ConnectorMethods._load_from_lil
 
@@ -265,6 +277,7 @@ class Projection(object):
         copied_proj._storage_format = self._storage_format
         copied_proj._storage_order = self._storage_order
         copied_proj._no_split_matrix = self._no_split_matrix
+        copied_proj._parallel_pattern = self._parallel_pattern
 
         # for some projection types saving is not allowed (e. g. Convolution, Pooling)
         copied_proj._saveable = self._saveable
@@ -316,7 +329,7 @@ class Projection(object):
                     reason is that there was not enough memory available.
         """
         # Local import to prevent circular import (HD: 28th June 2021)
-        from ANNarchy.generator.Utils import cpp_connector_available
+        from ANNarchy.generator.Utils import cpp_connector_available, cpp_lil_connector_available, cpp_lil_connector_methods, cpp_pattern_values, cpp_distribution_args
 
         # Sanity check
         if not self._connection_method:
@@ -331,11 +344,40 @@ class Projection(object):
             cy_wrapper = getattr(module, 'proj'+str(self.id)+'_wrapper')
             self.cyInstance = cy_wrapper()
 
+        # Patterns built as list-in-list on the C++ side
+        if not self._lil_connectivity and cpp_lil_connector_available(self):
+            name, _ = cpp_lil_connector_methods[self.connector_name]
+            weights, delays = cpp_pattern_values(self)
+            w_dist = cpp_distribution_args(weights)
+            d_dist = cpp_distribution_args(delays)
+
+            # The random streams are derived from the global seed and the projection id, so
+            # the result does not depend on the number of threads.
+            seed = Global.config['seed'] if Global.config['seed'] != -1 else np.random.randint(2**31)
+            seed = (int(seed) * 1000003 + self.id) % 2**64
+
+            args = self._connection_args
+            if self.connector_name == "All-to-All":
+                pattern_args = (list(self.post.ranks), list(self.pre.ranks), args[2])
+            elif self.connector_name == "One-to-One":
+                pattern_args = (list(self.post.ranks), list(self.pre.ranks))
+            elif self.connector_name in ["Random", "Random Convergent", "Random Divergent"]:
+                pattern_args = (list(self.post.ranks), list(self.pre.ranks), args[0], args[3])
+            elif self.connector_name == "Gaussian":
+                pattern_args = (list(self.pre.geometry), list(self.post.geometry), args[0], args[1], args[3], args[4])
+            else:
+                pattern_args = (list(self.pre.geometry), list(self.post.geometry), args[0], args[1], args[2], args[3], args[5], args[6])
+
+            return getattr(self.cyInstance, 'connect_' + name)(*(pattern_args + (w_dist, d_dist, Global.config['dt'], seed)))
+
         # Check if there is a specialized CPP connector
-        if not cpp_connector_available(self.connector_name, self._storage_format, self._storage_order):
+        if not cpp_connector_available(self.connector_name, self._storage_format, self._storage_order, self):
             # No default connector -> initialize from LIL
             if self._lil_connectivity:
                 return self.cyInstance.init_from_lil_connectivity(self._lil_connectivity)
+            elif self._connection_method == self._load_from_csr and hasattr(self.cyInstance, 'init_from_csr'):
+                # Flat arrays are passed in one call
+                return self._init_from_csr(*self._connection_args)
             else:
                 return self.cyInstance.init_from_lil_connectivity(self._connection_method(*((self.pre, self.post,) + self._connection_args)))
 
@@ -478,6 +520,9 @@ class Projection(object):
                              apply it for dense matrices in the future. For CSR and in particular the ELL-
                              like formats the potential memory-reallocations make the structural plasticity
                              a costly operation.
+
+        Structural plasticity is now also available for CSR on CPUs, which needs to be selected explicitly
+        (storage_format="csr"). The automatic selection keeps LIL, so existing models do not change their format.
         """
         # Connection pattern / Feature specific selection
         if Global.config["structural_plasticity"]:
@@ -542,8 +587,10 @@ class Projection(object):
                 # HD (11th Nov. 2022): there is no Dense_T / CSRC_T for spiking and CUDA yet
                 storage_order = "post_to_pre"
             else:
-                # pre-to-post is not implemented for all formats
-                if self._storage_format in ["dense", "csr"]:
+                # pre-to-post is not implemented for all formats, nor for structural plasticity
+                if Global.config["structural_plasticity"]:
+                    storage_order = "post_to_pre"
+                elif self._storage_format in ["dense", "csr"]:
                     storage_order = "pre_to_post"
                 else:
                     storage_order = "post_to_pre"
@@ -551,6 +598,20 @@ class Projection(object):
         Global._info("Automatic matrix order selection for", self.name, ":", storage_order)
         return storage_order
 
+    def _has_rewiring(self):
+        "If the synapse defines creating or pruning conditions"
+        return 'creating' in self.synapse_type.description.keys() or 'pruning' in self.synapse_type.description.keys()
+
+    def _has_structural_plasticity(self):
+        "If synapses can be added or removed, partitioned matrices can not be modified"
+        if not Global.config['structural_plasticity']:
+            return False
+        if not Global._check_paradigm("openmp"):
+            return True
+        if self._storage_format == "csr" and self.synapse_type.type == "rate":
+            return True
+        return Global._check_single_thread() or self._no_split_matrix
+
     def _has_single_weight(self):
         "If a single weight should be generated instead of a LIL"
         is_cpu = Global.config['paradigm']=="openmp"
@@ -725,11 +786,17 @@ class Projection(object):
 
         * a list or 1D numpy array of the same length as the number of actual dendrites (self.size). The synapses of each postsynaptic neuron will take the same value.
 
-        **Warning:** it is not possible to set different values to each synapse using this method. One should iterate over the dendrites:
+        * a random distribution, drawn independently for each synapse.
+
+        * a list or 1D numpy array of the same length as the number of synapses (self.nb_synapses), ordered by dendrite (in the order of self.post_ranks) as returned by ``np.concatenate(proj.get('w'))``.
+
+        * a list of lists, one per dendrite.
+
+        All synapses are updated at once by the C++ core:
 
         ```python
-        for dendrite in proj.dendrites:
-            dendrite.w = np.ones(dendrite.size)
+        proj.set({'w': Uniform(0.0, 1.0)})
+        proj.set({'w': 0.5 * np.concatenate(proj.get('w'))})
         ```
 
         :param value: a dictionary with the name of the parameter/variable as key.
@@ -739,6 +806,55 @@ class Projection(object):
         for name, val in value.items():
             self.__setattr__(name, val)
 
+    def view(self, name):
+        """
+        Returns a Numpy array sharing its memory with the C++ container of a local synaptic variable or parameter.
+
+        Contrary to ``get()``, no copy is made: modifying the array directly changes the simulated
+        values and the array always reflects the current state of the simulation. The shape depends on the storage format:
+
+        * ``csr``: 1D array of size ``nb_synapses``, ordered by post-synaptic neuron (same order as ``get()``, flattened).
+
+        * ``dense``: 2D array (post.population.size, pre.population.size), unconnected entries are 0.
+
+        ```python
+        proj = Projection(pop1, pop2, 'exc').connect_all_to_all(1.0, storage_format="dense")
+        compile()
+        w = proj.view('w')
+        w *= 0.5 # scales all weights in-place
+        ```
+
+        The view is only valid as long as the network exists: it must not be used anymore after
+        ``clear()``, after the deletion of the network (e.g. in ``parallel_run()``) or after a new
+        call to ``compile()``. Views can not be used together with structural plasticity, as
+        creating or pruning synapses reallocates the containers.
+
+        Views are not available on GPUs, for boolean variables, for the other storage formats
+        (e.g. ``lil``) and for partitioned matrices (spiking ``csr`` with several threads).
+
+        :param name: name of the local variable or parameter.
+        """
+        if not self.initialized:
+            Global._error('Projection.view(): the network must be compiled before accessing ' + name + '.')
+
+        if not name in self.synapse_type.description['local'] or (name == "w" and self._has_single_weight()):
+            Global._error('Projection.view(): ' + name + ' is not a local attribute of the projection ' + self.name + '.')
+
+        if Global.config['structural_plasticity']:
+            Global._error('Projection.view(): zero-copy access is not possible with structural plasticity.')
+
+        ctype = self._get_attribute_cpp_type(name)
+        if not hasattr(self.cyInstance, 'get_local_attribute_view') or ctype == "bool":
+            Global._error('Projection.view(): zero-copy access to ' + name + ' is not available for the projection ' + self.name + ' (storage_format=' + self._storage_format + '), use get() instead.')
+
+        if self._storage_format == "dense":
+            size_post = self.post.population.size if isinstance(self.post, PopulationView) else self.post.size
+            size_pre = self.pre.population.size if isinstance(self.pre, PopulationView) else self.pre.size
+            data = self.cyInstance.get_local_attribute_view(name, ctype, size_post * size_pre)
+            return data.reshape((size_post, size_pre))
+
+        return self.cyInstance.get_local_attribute_view(name, ctype, self.nb_synapses)
+
     def __getattr__(self, name):
         # Method called when accessing an attribute.
         if name == 'initialized' or not hasattr(self, 'initialized'): # Before the end of the constructor
@@ -806,6 +922,18 @@ class Projection(object):
         Sets the value of the given attribute for all post-synaptic neurons in the projection,
         as a NumPy array having the same geometry as the population if it is local.
 
+        For local attributes, the value can be:
+
+        * a single value or a RandomDistribution, applied to all synapses.
+
+        * a flat list or 1D array of size nb_synapses, ordered as the dendrites in post_ranks.
+
+        * a list or 1D array of size len(post_ranks), one value per dendrite.
+
+        * a list of lists (one per dendrite) of the size of each dendrite.
+
+        All synapses are updated by a single call to the C++ core.
+
         :param attribute: a string representing the variables's name.
         :param value: the value it should take.
 
@@ -813,50 +941,90 @@ class Projection(object):
         # Determine C++ data type
         ctype = self._get_attribute_cpp_type(attribute=attribute)
 
-        # Convert np.arrays into lists/constants for better iteration
-        if isinstance(value, np.ndarray):
-            if np.ndim(value) == 0:
-                value = float(value)
+        # Convert 0-dimensional arrays into constants
+        if isinstance(value, np.ndarray) and np.ndim(value) == 0:
+            value = value.item()
+
+        # Single weight shared by all synapses
+        if attribute == "w" and self._has_single_weight():
+            if isinstance(value, RandomDistribution):
+                value = value.get_values(1)[0]
+            self.cyInstance.set_global_attribute(attribute, value, ctype)
+
+        # Local attributes, all synapses are updated at once
+        elif attribute in self.synapse_type.description['local']:
+            if isinstance(value, RandomDistribution):
+                self._set_local_attribute_flat(attribute, value.get_values(self.nb_synapses), ctype)
+
+            elif isinstance(value, (list, np.ndarray)):
+                self._set_local_attribute_flat(attribute, self._flatten_local_values(value), ctype)
+
+            elif hasattr(self.cyInstance, 'set_local_attribute_all_value'):
+                self.cyInstance.set_local_attribute_all_value(attribute, value, ctype)
+
             else:
-                value = list(value)
-
-        # A list is given
-        if isinstance(value, list):
-            if len(value) == len(self.post_ranks):
-                if attribute in self.synapse_type.description['local']:
-                    for idx, n in enumerate(self.post_ranks):
-                        if not len(value[idx]) == self.cyInstance.dendrite_size(idx):
-                            Global._error('The postynaptic neuron ' + str(n) + ' receives '+ str(self.cyInstance.dendrite_size(idx))+ ' synapses.')
-                        self.cyInstance.set_local_attribute_row(attribute, idx, value[idx], ctype)
-                elif attribute in self.synapse_type.description['semiglobal']:
-                    self.cyInstance.set_semiglobal_attribute_all(attribute, value, ctype)
-                else:
-                    Global._error('The parameter', attribute, 'is global to the population, cannot assign a list.')
+                self._set_local_attribute_flat(attribute, value * np.ones(self.nb_synapses), ctype)
+
+        # Semiglobal attributes: one value per dendrite
+        elif attribute in self.synapse_type.description['semiglobal']:
+            if isinstance(value, RandomDistribution):
+                value = value.get_values(len(self.post_ranks))
+            elif isinstance(value, (list, np.ndarray)):
+                if not len(value) == len(self.post_ranks):
+                    Global._error('The projection has', self.size, 'post-synaptic neurons, the list must have the same size.')
             else:
-                Global._error('The projection has', self.size, 'post-synaptic neurons, the list must have the same size.')
+                value = value * np.ones(len(self.post_ranks))
+            self.cyInstance.set_semiglobal_attribute_all(attribute, value, ctype)
 
-        # A Random Distribution is given
-        elif isinstance(value, RandomDistribution):
-            if attribute == "w" and self._has_single_weight():
-                self.cyInstance.set_global_attribute(attribute, value.get_values(1), ctype)
-            elif attribute in self.synapse_type.description['local']:
-                for idx, n in enumerate(self.post_ranks):
-                    self.cyInstance.set_local_attribute_row(attribute, idx, value.get_values(self.cyInstance.dendrite_size(idx)), ctype)
-            elif attribute in self.synapse_type.description['semiglobal']:
-                self.cyInstance.set_semiglobal_attribute_all(attribute, value.get_values(len(self.post_ranks)), ctype)
-            elif attribute in self.synapse_type.description['global']:
-                self.cyInstance.set_global_attribute(attribute, value.get_values(1), ctype)
-        # A single value is given
+        # Global attributes
         else:
-            if attribute == "w" and self._has_single_weight():
-                self.cyInstance.set_global_attribute(attribute, value, ctype)
-            elif attribute in self.synapse_type.description['local']:
-                for idx, n in enumerate(self.post_ranks):
-                    self.cyInstance.set_local_attribute_row(attribute, idx, value*np.ones(self.cyInstance.dendrite_size(idx)), ctype)
-            elif attribute in self.synapse_type.description['semiglobal']:
-                self.cyInstance.set_semiglobal_attribute_all(attribute, value*np.ones(len(self.post_ranks)), ctype)
-            else:
-                self.cyInstance.set_global_attribute(attribute, value, ctype)
+            if isinstance(value, RandomDistribution):
+                value = value.get_values(1)[0]
+            elif isinstance(value, (list, np.ndarray)):
+                Global._error('The parameter', attribute, 'is global to the population, cannot assign a list.')
+            self.cyInstance.set_global_attribute(attribute, value, ctype)
+
+    def _flatten_local_values(self, value):
+        """
+        Converts the values given for a local attribute into a flat array in
+        the storage order of the synapses (see _set_cython_attribute).
+        """
+        nb_synapses = self.nb_synapses
+        nb_dendrites = len(self.post_ranks)
+
+        # One list per dendrite
+        if len(value) > 0 and isinstance(value[0], (list, np.ndarray)):
+            if not len(value) == nb_dendrites:
+                Global._error('The projection has', self.size, 'post-synaptic neurons, the list must have the same size.')
+            for idx, n in enumerate(self.post_ranks):
+                if not len(value[idx]) == self.cyInstance.dendrite_size(idx):
+                    Global._error('The postynaptic neuron ' + str(n) + ' receives '+ str(self.cyInstance.dendrite_size(idx))+ ' synapses.')
+            return np.concatenate([np.asarray(row) for row in value])
+
+        # Flat array or one value per dendrite
+        value = np.asarray(value)
+        if value.size == nb_synapses:
+            return value
+        if value.size == nb_dendrites:
+            sizes = [self.cyInstance.dendrite_size(idx) for idx in range(nb_dendrites)]
+            return np.repeat(value, sizes)
+
+        Global._error('The projection has', self.size, 'post-synaptic neurons and', nb_synapses, 'synapses, the list must have one of these sizes.')
+
+    def _set_local_attribute_flat(self, attribute, value, ctype):
+        """
+        Sets a local attribute from a flat array in storage order.
+        """
+        if hasattr(self.cyInstance, 'set_local_attribute_all_flat'):
+            self.cyInstance.set_local_attribute_all_flat(attribute, value, ctype)
+            return
+
+        # Specific projections only provide the row-wise setters
+        offset = 0
+        for idx in range(len(self.post_ranks)):
+            size = self.cyInstance.dendrite_size(idx)
+            self.cyInstance.set_local_attribute_row(attribute, idx, value[offset:offset+size], ctype)
+            offset += size
 
     def _get_attribute_cpp_type(self, attribute):
         """
@@ -1069,6 +1237,8 @@ class Projection(object):
 
         * If the file name is '.mat', the data will be saved as a Matlab 7.2 file. Scipy must be installed.
 
+        * If the file name ends with a path separator, the data is saved as a checkpoint directory (see `save()`).
+
         * Otherwise, the data will be pickled into a simple binary text file using pickle.
 
         :param filename: file name, may contain relative or absolute path.
@@ -1089,13 +1259,27 @@ class Projection(object):
 
         extension = os.path.splitext(fname)[1]
 
-        # Gathering the data
+        # Gathering the data, the synapses of the dendrite post_ranks[i] are
+        # stored in [dendrite_offsets[i], dendrite_offsets[i+1])
+        offsets, pre_ranks = self._flat_pre_ranks()
+        if self._has_single_weight():
+            w = self.cyInstance.get_global_attribute("w", Global.config["precision"])
+        else:
+            _, _, w = self._flat_connectivity("w")
+
+        delay = None
+        if hasattr(self.cyInstance, 'get_delay'):
+            delay = self.cyInstance.get_delay()
+            if self.uniform_delay == -1:
+                delay = np.concatenate([np.asarray(row, dtype=np.intc) for row in delay]) if len(delay) > 0 else np.array([], dtype=np.intc)
+
         data = {
             'name': self.name,
-            'post_ranks': self.post_ranks,
-            'pre_ranks': np.array(self.cyInstance.pre_rank_all(), dtype=object),
-            'w': np.array(self.w, dtype=object),
-            'delay': np.array(self.cyInstance.get_delay(), dtype=object) if hasattr(self.cyInstance, 'get_delay') else None,
+            'post_ranks': np.array(self.post_ranks, dtype=np.intc),
+            'dendrite_offsets': offsets,
+            'pre_ranks': pre_ranks,
+            'w': w,
+            'delay': delay,
             'max_delay': self.max_delay,
             'uniform_delay': self.uniform_delay,
             'size': self.size,
@@ -1103,6 +1287,11 @@ class Projection(object):
         }
 
         # Save the data
+        from ANNarchy.core.IO import _is_checkpoint, _save_data
+        if _is_checkpoint(filename):
+            _save_data(filename, data)
+            return
+
         if extension == '.gz':
             Global._print("Saving connectivity in gunzipped binary format...")
             try:
@@ -1160,33 +1349,34 @@ class Projection(object):
             x_size = int( math.floor(math.sqrt(self.post.size)) )
             y_size = int( math.ceil(math.sqrt(self.post.size)) )
 
+        # One row per post-synaptic neuron, restricted to the pre-synaptic neurons
+        matrix = self.connectivity_matrix(fill=0.0, variable=variable)
+        if isinstance(self.pre, PopulationView):
+            matrix = matrix[:, self.pre.ranks]
 
-        def get_rf(rank): # TODO: IMPROVE
-            res = np.zeros( self.pre.size )
-            for n in range(len(self.post_ranks)):
-                if self.post_ranks[n] == n:
-                    pre_ranks = self.cyInstance.pre_rank(n)
-                    data = self.cyInstance.get_local_attribute_row(variable, rank, Global.config["precision"])
-                    for j in range(len(pre_ranks)):
-                        res[pre_ranks[j]] = data[j]
-            return res.reshape(self.pre.geometry)
-
-        res = np.zeros((1, x_size*self.pre.geometry[1]))
-        for y in range ( y_size ):
-            row = np.concatenate(  [ get_rf(self.post.rank_from_coordinates( (y, x) ) ) for x in range ( x_size ) ], axis = 1)
-            res = np.concatenate((res, row))
+        pre_height = self.pre.geometry[0]
+        pre_width = int(self.pre.size / pre_height)
+        res = np.zeros((y_size * pre_height, x_size * pre_width))
+        for y in range(y_size):
+            for x in range(x_size):
+                rank = self.post.rank_from_coordinates( (y, x) )
+                res[y*pre_height:(y+1)*pre_height, x*pre_width:(x+1)*pre_width] = matrix[rank].reshape((pre_height, pre_width))
 
         return res
 
-    def connectivity_matrix(self, fill=0.0):
+    def connectivity_matrix(self, fill=0.0, format="dense", variable="w"):
         """
-        Returns a dense connectivity matrix (2D Numpy array) representing the connections between the pre- and post-populations.
+        Returns a connectivity matrix representing the connections between the pre- and post-populations.
 
         The first index of the matrix represents post-synaptic neurons, the second the pre-synaptic ones.
 
         If PopulationViews were used for creating the projection, the matrix is expanded to the whole populations by default.
 
-        :param fill: value to put in the matrix when there is no connection (default: 0.0).
+        The matrix is filled in one pass from flat arrays exported by the C++ core, so the cost is linear in the number of synapses.
+
+        :param fill: value to put in the matrix when there is no connection (default: 0.0). Ignored for sparse formats.
+        :param format: "dense" for a 2D Numpy array, "csr" or "coo" for the corresponding ``scipy.sparse`` matrix (default: "dense").
+        :param variable: name of the synaptic variable to put in the matrix (default: "w").
         """
         if not self.initialized:
             Global._error('The connectivity matrix can only be accessed after compilation')
@@ -1201,27 +1391,150 @@ class Projection(object):
         else:
             size_post = self.post.size
 
-        # create empty dense matrix with default values
-        res = np.ones((size_post, size_pre)) * fill
+        rows, cols, data = self._flat_connectivity(variable)
 
-        # fill row-by-row with real values
-        for rank in self.post_ranks:
-            # row-rank
-            if self._storage_format == "dense":
-                idx = rank
-            else:
-                idx =  self.post_ranks.index(rank)
-            # pre-ranks
-            preranks = self.cyInstance.pre_rank(idx)
-            # get the values
-            if "w" in self.synapse_type.description['local'] and (not self._has_single_weight()):
-                w = self.cyInstance.get_local_attribute_row("w", idx, Global.config["precision"])
-            elif "w" in self.synapse_type.description['semiglobal']:
-                w = self.cyInstance.get_semiglobal_attribute("w", idx, Global.config["precision"])*np.ones(self.cyInstance.dendrite_size(idx))
-            else:
-                w = self.cyInstance.get_global_attribute("w", Global.config["precision"])*np.ones(self.cyInstance.dendrite_size(idx))
-            res[rank, preranks] = w
-        return res
+        if format == "dense":
+            # create dense matrix with default values and scatter all synapses at once
+            res = np.full((size_post, size_pre), fill, dtype=np.float64)
+            res[rows, cols] = data
+            return res
+
+        elif format in ["csr", "coo"]:
+            try:
+                from scipy.sparse import coo_matrix
+            except ImportError:
+                Global._error("Projection.connectivity_matrix(): the format", format, "requires scipy.")
+
+            res = coo_matrix((data, (rows, cols)), shape=(size_post, size_pre))
+            if format == "csr":
+                return res.tocsr()
+            return res
+
+        else:
+            Global._error("Projection.connectivity_matrix(): the format must be 'dense', 'csr' or 'coo', not", format)
+
+    def _flat_connectivity(self, variable="w"):
+        """
+        Returns the connectivity as three flat arrays in the storage order of the
+        synapses: the post-synaptic rank, the pre-synaptic rank and the value of
+        *variable* for each synapse.
+        """
+        offsets, cols = self._flat_pre_ranks()
+        sizes = np.diff(offsets)
+        rows = np.repeat(np.array(self.post_ranks, dtype=np.intc), sizes)
+
+        if variable in self.synapse_type.description['local'] and not (variable == "w" and self._has_single_weight()):
+            data = self._flat_local_attribute(variable, len(cols))
+        elif variable in self.synapse_type.description['semiglobal']:
+            ctype = self._get_attribute_cpp_type(variable)
+            data = np.repeat(np.asarray(self.cyInstance.get_semiglobal_attribute_all(variable, ctype)), sizes)
+        elif variable in self.synapse_type.description['global'] or variable == "w":
+            ctype = self._get_attribute_cpp_type(variable)
+            data = np.full(len(cols), self.cyInstance.get_global_attribute(variable, ctype))
+        else:
+            Global._error("Projection.connectivity_matrix(): the synapse has no attribute named", variable)
+
+        return rows, cols, data
+
+    def _flat_pre_ranks(self):
+        """
+        Returns the offsets of the dendrites (size: number of dendrites + 1) and
+        the pre-synaptic ranks of all synapses as flat arrays.
+        """
+        if hasattr(self.cyInstance, 'pre_rank_flat'):
+            return self.cyInstance.pre_rank_flat()
+
+        # Specific projections only provide the row-wise accessors
+        pre_ranks = self.cyInstance.pre_rank_all()
+        offsets = np.concatenate(([0], np.cumsum([len(row) for row in pre_ranks]))).astype(np.longlong)
+        if len(pre_ranks) == 0:
+            return offsets, np.array([], dtype=np.intc)
+        return offsets, np.concatenate(pre_ranks).astype(np.intc)
+
+    def _flat_local_attribute(self, name, nb_synapses):
+        """
+        Returns the values of a local attribute for all synapses as a flat array.
+        """
+        ctype = self._get_attribute_cpp_type(name)
+        if hasattr(self.cyInstance, 'get_local_attribute_flat'):
+            return self.cyInstance.get_local_attribute_flat(name, ctype, nb_synapses)
+
+        values = self.cyInstance.get_local_attribute_all(name, ctype)
+        if len(values) == 0:
+            return np.array([])
+        return np.concatenate([np.asarray(row) for row in values])
+
+    def _flat_delays(self):
+        """
+        Returns the delays in ms, either as a single value for uniform delays or
+        as a flat array with one value per synapse.
+        """
+        delays = self._get_delay()
+        if isinstance(delays, list):
+            if len(delays) == 0:
+                return np.array([])
+            return np.concatenate([np.asarray(row, dtype=np.float64) for row in delays])
+        return delays
+
+    def to_csr(self, variable="w"):
+        """
+        Returns the connectivity as the arrays of a compressed sparse row (CSR) matrix:
+
+        * ``indptr``: row pointers, with one row per post-synaptic neuron (size: ``post.size + 1``).
+        * ``indices``: indices of the pre-synaptic neurons.
+        * ``data``: value of *variable* for each synapse.
+        * ``delays``: delays in ms, either a single value (uniform delays) or one value per synapse.
+
+        If PopulationViews were used for creating the projection, the indices are relative to the views.
+
+        The arrays can be passed to ``connect_from_csr()`` of another projection, or to ``scipy.sparse.csr_matrix((data, indices, indptr))``:
+
+        ```python
+        indptr, indices, data, delays = proj.to_csr()
+        proj2.connect_from_csr(indptr, indices, data, delays)
+        ```
+
+        :param variable: name of the synaptic variable to export (default: "w").
+        """
+        if not self.initialized:
+            Global._error('Projection.to_csr(): the connectivity can only be accessed after compilation')
+
+        rows, cols, data = self._flat_connectivity(variable)
+        delays = self._flat_delays()
+
+        # Ranks in the populations to indices in the views
+        def to_indices(pop, ranks):
+            if not isinstance(pop, PopulationView):
+                return ranks
+            lookup = np.zeros(pop.population.size, dtype=np.intc)
+            lookup[pop.ranks] = np.arange(pop.size, dtype=np.intc)
+            return lookup[ranks]
+        rows = to_indices(self.post, rows)
+        cols = to_indices(self.pre, cols)
+
+        # Row-major order, sorted by pre-synaptic index
+        order = np.lexsort((cols, rows))
+        indices = cols[order]
+        data = data[order]
+        if isinstance(delays, np.ndarray):
+            delays = delays[order]
+
+        indptr = np.zeros(self.post.size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=self.post.size), out=indptr[1:])
+
+        return indptr, indices, data, delays
+
+    def _init_from_csr(self, post_ranks, row_ptr, pre_ranks, weights, delays):
+        """
+        (Re-)initializes the connectivity from flat arrays in one call, *delays*
+        are in ms.
+        """
+        if isinstance(delays, np.ndarray):
+            delay_steps = np.round(delays / Global.config['dt']).astype(np.intc)
+        else:
+            delay_steps = np.array([round(delays / Global.config['dt'])], dtype=np.intc)
+
+        return self.cyInstance.init_from_csr(post_ranks, row_ptr, pre_ranks, weights, delay_steps)
 
 
     ################################
@@ -1239,27 +1552,17 @@ class Projection(object):
         desc['pre'] = self.pre.name
         desc['post'] = self.post.name
         desc['target'] = self.target
-        desc['post_ranks'] = self.post_ranks
+        desc['post_ranks'] = np.array(self.post_ranks, dtype=np.intc)
         desc['attributes'] = self.attributes
         desc['parameters'] = self.parameters
         desc['variables'] = self.variables
-        desc['delays'] = self._get_delay()
 
-        # Determine if we have varying number of elements per row
-        # based on the pre-synaptic ranks
-        pre_ranks = self.cyInstance.pre_rank_all()
-        dend_size = len(pre_ranks[0])
-        ragged_list = False
-        for i in range(1, len(pre_ranks)):
-            if len(pre_ranks[i]) != dend_size:
-                ragged_list = True
-                break
-
-        # Save pre_ranks
-        if ragged_list:
-            desc['pre_ranks'] = np.array(self.cyInstance.pre_rank_all(), dtype=object)
-        else:
-            desc['pre_ranks'] = np.array(self.cyInstance.pre_rank_all())
+        # The connectivity is stored as flat arrays: the synapses of the dendrite
+        # post_ranks[i] are in [dendrite_offsets[i], dendrite_offsets[i+1])
+        offsets, pre_ranks = self._flat_pre_ranks()
+        desc['dendrite_offsets'] = offsets
+        desc['pre_ranks'] = pre_ranks
+        desc['delays'] = self._flat_delays()
 
         # Attributes to save
         attributes = self.attributes
@@ -1274,10 +1577,7 @@ class Projection(object):
                     desc[var] = self.cyInstance.get_global_attribute("w", ctype)
 
                 elif var in self.synapse_type.description['local']:
-                    if ragged_list:
-                        desc[var] = np.array(self.cyInstance.get_local_attribute_all(var, ctype), dtype=object)
-                    else:
-                        desc[var] = self.cyInstance.get_local_attribute_all(var, ctype)
+                    desc[var] = self._flat_local_attribute(var, len(pre_ranks))
                 elif var in self.synapse_type.description['semiglobal']:
                     desc[var] = self.cyInstance.get_semiglobal_attribute_all(var, ctype)
                 else:
@@ -1297,6 +1597,8 @@ class Projection(object):
 
         * If the file name is '.mat', the data will be saved as a Matlab 7.2 file. Scipy must be installed.
 
+        * If the file name ends with a path separator (e.g. 'checkpoint/'), the data is saved as a checkpoint directory with one .npy file per attribute (see `save()`).
+
         * Otherwise, the data will be pickled into a simple binary text file using pickle.
 
         :param filename: file name, may contain relative or absolute path.
@@ -1328,12 +1630,21 @@ class Projection(object):
         proj.load('proj1.npz')
         proj.load('proj1.txt')
         proj.load('proj1.txt.gz')
+        proj.load('checkpoint/')
         ```
 
+        If the file is a checkpoint directory created by `save()`, only the data of this projection is read.
+
         :param filename: the file name with relative or absolute path.
         """
-        from ANNarchy.core.IO import _load_connectivity_data
-        self._load_proj_data(_load_connectivity_data(filename, pickle_encoding))
+        from ANNarchy.core.IO import _load_connectivity_data, _is_checkpoint
+        desc = _load_connectivity_data(filename, pickle_encoding)
+
+        # In a network checkpoint, only the arrays of this projection are read
+        if _is_checkpoint(filename) and desc is not None and self.name in desc.get('obj_names', {}).get('projections', []):
+            desc = desc[self.name]
+
+        self._load_proj_data(desc)
 
 
     def _load_proj_data(self, desc):
@@ -1357,11 +1668,18 @@ class Projection(object):
             Global._error("The file was saved using a deprecated version of ANNarchy.")
             return
 
+        # Newer files store the connectivity as flat arrays (see _data())
+        flat_connectivity = 'dendrite_offsets' in desc
+
         # If the post ranks and/or pre-ranks have changed, overwrite
         connectivity_changed=False
-        if 'post_ranks' in desc and not np.all((desc['post_ranks']) == self.post_ranks):
+        if 'post_ranks' in desc and not np.array_equal(desc['post_ranks'], self.post_ranks):
             connectivity_changed=True
-        if 'pre_ranks' in desc and not np.all((desc['pre_ranks']) == np.array(self.cyInstance.pre_rank_all(), dtype=object)):
+        if flat_connectivity:
+            offsets, pre_ranks = self._flat_pre_ranks()
+            if not (np.array_equal(desc['dendrite_offsets'], offsets) and np.array_equal(desc['pre_ranks'], pre_ranks)):
+                connectivity_changed=True
+        elif 'pre_ranks' in desc and not np.all((desc['pre_ranks']) == np.array(self.cyInstance.pre_rank_all(), dtype=object)):
             connectivity_changed=True
 
         # synaptic weights
@@ -1395,7 +1713,17 @@ class Projection(object):
 
         # Some patterns like fixed_number_pre/post or fixed_probability change the
         # connectivity. If this is not the case, we can simply set the values.
-        if connectivity_changed:
+        if connectivity_changed and flat_connectivity:
+            # (re-)initialize connectivity from the flat arrays
+            if np.ndim(weights) == 0:
+                weights = np.full(len(desc['pre_ranks']), float(weights))
+
+            if hasattr(self.cyInstance, 'init_from_csr'):
+                self._init_from_csr(desc['post_ranks'], desc['dendrite_offsets'], desc['pre_ranks'], weights, delays)
+            else:
+                self.cyInstance.init_from_lil_connectivity(self._load_from_csr(self.pre, self.post, desc['post_ranks'], desc['dendrite_offsets'], desc['pre_ranks'], weights, delays))
+
+        elif connectivity_changed:
             # (re-)initialize connectivity
             if isinstance(delays, (float, int)):
                 delays = [[delays]] # wrapper expects list from list
@@ -1405,7 +1733,9 @@ class Projection(object):
             # set weights
             self._set_cython_attribute("w", weights)
 
-            # set delays if there were some
+            # set delays if there were some, non-uniform delays are set per dendrite
+            if flat_connectivity and isinstance(delays, np.ndarray):
+                delays = np.split(delays, desc['dendrite_offsets'][1:-1])
             self._set_delay(delays)
 
         # Other variables
@@ -58,6 +58,11 @@ def simulate(duration, measure_time=False, progress_bar=False, callbacks=True, n
     # Compute the number of steps
     nb_steps = ceil(float(duration) / dt())
 
+    # Preallocate the recordings
+    for monitor in _network[net_id]['monitors']:
+        if hasattr(monitor, '_reserve'):
+            monitor._reserve(nb_steps)
+
     if measure_time:
         tstart = time.time()
 
@@ -94,6 +99,11 @@ def simulate(duration, measure_time=False, progress_bar=False, callbacks=True, n
                 avg_time, std_time = Global._profiler._cpp_profiler.get_timing(proj.name, func)
                 Global._profiler.add_entry( avg_time/1000.0, (avg_time/overall_avg)*100.0, proj.name+"_"+func, "cpp core")
 
+            # the transmission is measured per thread (= per partition for sliced matrices)
+            if Global._check_paradigm("openmp") and not Global._check_single_thread():
+                imbalance = Global._profiler._cpp_profiler.get_load_imbalance(proj.name, "psp")
+                Global._profiler.add_entry( imbalance, Global.config["num_threads"], proj.name+"_psp", "load balance")
+
         monitor_avg, _ = Global._profiler._cpp_profiler.get_timing("network", "record")
         Global._profiler.add_entry( monitor_avg/1000.0, (monitor_avg/overall_avg)*100.0, "record", "cpp core")
 
@@ -46,7 +46,7 @@ class SpecificPopulation(Population):
         functions defined by the user.
         """
         if Global.config['paradigm'] == "openmp":
-            if Global.config["num_threads"] == 1:
+            if Global._check_single_thread():
                 self._generate_st()
             else:
                 self._generate_omp()
@@ -73,6 +73,220 @@ class SpecificPopulation(Population):
         """
         raise NotImplementedError
 
+class _InputStream(object):
+    """
+    Streaming mode of TimedArray and TimedPoissonPopulation: a background thread
+    reads the rows block-wise from the source and hands each block over to the
+    C++ population, where it waits in a second buffer until the current block is
+    consumed. Reading the inputs thus overlaps with the simulation and at most
+    three blocks are held in memory.
+    """
+    def __init__(self, source, size, block_size):
+        self.source = source
+        self.size = size
+        self.block_size = int(block_size)
+        self.error = None
+        self._thread = None
+
+    def start(self, cyInstance):
+        "Starts the loading thread, called after the instantiation of the population."
+        import threading
+        self._thread = threading.Thread(target=self._load, args=(cyInstance,), daemon=True)
+        self._thread.start()
+
+    def copyable(self):
+        "Arrays and functions returning an iterator can be streamed by several populations, iterators not."
+        return isinstance(self.source, np.ndarray) or callable(self.source)
+
+    def _blocks(self):
+        "Iterates over blocks of (at most) block_size rows."
+        if isinstance(self.source, np.ndarray):
+            # numpy arrays and memory-mapped files are read slice-wise
+            for beg in range(0, self.source.shape[0], self.block_size):
+                yield self.source[beg:beg+self.block_size]
+        else:
+            # iterators provide single rows or blocks of rows
+            rows = []
+            nb_rows = 0
+            source = self.source() if callable(self.source) else self.source
+            for item in source:
+                item = np.asarray(item)
+                if item.size != self.size and int(np.prod(item.shape[1:])) != self.size:
+                    raise ValueError('the streamed input of shape ' + str(item.shape) + ' does not match the population size ' + str(self.size) + '.')
+                item = np.reshape(item, (-1, self.size))
+                rows.append(item)
+                nb_rows += item.shape[0]
+                if nb_rows >= self.block_size:
+                    yield np.concatenate(rows)
+                    rows = []
+                    nb_rows = 0
+            if nb_rows > 0:
+                yield np.concatenate(rows)
+
+    def _load(self, cyInstance):
+        import time
+        try:
+            for block in self._blocks():
+                block = np.ascontiguousarray(np.reshape(block, (-1, self.size)), dtype=float)
+                if block.shape[0] == 0:
+                    continue
+
+                # Wait until the simulation took over the previous block
+                wait = 0.0001
+                while not cyInstance.next_block_free():
+                    time.sleep(wait)
+                    wait = min(2*wait, 0.01)
+
+                cyInstance.push_block(block)
+        except Exception as e:
+            self.error = e
+            Global._warning('the input stream was interrupted:', e)
+        finally:
+            cyInstance.end_stream()
+
+def _stream_interval(schedule):
+    "Number of steps between two streamed inputs."
+    return max(int(round(float(schedule) / Global.config['dt'])), 1)
+
+def _check_input_stream(class_name, rates, schedule, period, block_size, geometry):
+    """
+    Checks the arguments of a streamed input and returns the corresponding _InputStream with the geometry of the population.
+    """
+    if not isinstance(schedule, (int, float)):
+        Global._error(class_name + ': streamed inputs require a single value for the schedule.')
+
+    if period is not None and period > 0.0:
+        Global._error(class_name + ': streamed inputs cannot be cycled with a period.')
+
+    if isinstance(rates, np.ndarray):
+        if rates.ndim < 2:
+            Global._error(class_name + ': streamed inputs require one row per time step, each row providing one value per neuron.')
+        if geometry is None:
+            geometry = rates.shape[1:]
+        elif int(np.prod(rates.shape[1:])) != int(np.prod(geometry)):
+            Global._error(class_name + ': the rows of the streamed inputs have', int(np.prod(rates.shape[1:])), 'values, but the population has', int(np.prod(geometry)), 'neurons.')
+        if block_size is None:
+            block_size = rates.shape[0]
+    else:
+        if geometry is None:
+            Global._error(class_name + ': the geometry must be provided when the inputs are given as an iterator.')
+        if block_size is None:
+            block_size = 1000
+
+    if int(block_size) < 1:
+        Global._error(class_name + ': block_size must be a positive integer.')
+
+    size = int(np.prod(geometry))
+    return _InputStream(rates, size, block_size), geometry
+
+def _input_stream_templates(pop, target):
+    """
+    Fills the code templates for the streaming mode of TimedArray and TimedPoissonPopulation.
+    The rows of the current block are copied into *target* with the configured interval. Returns
+    the corresponding update code.
+    """
+    ids = {'float_prec': Global.config['precision'], 'target': target, 'id': pop.id}
+
+    pop._specific_template['include_additional'] = """#include <mutex>
+#include <condition_variable>
+"""
+    pop._specific_template['declare_additional'] = """
+    // Custom local parameters of a streamed input
+    std::vector< std::vector< %(float_prec)s > > _buffer; // block currently presented
+    std::vector< std::vector< %(float_prec)s > > _next_buffer; // next block, provided by Python
+    bool _next_ready; // _next_buffer holds a block which was not presented yet
+    bool _stream_end; // no further block will be provided
+    std::mutex _stream_mutex;
+    std::condition_variable _stream_cv;
+    int _interval; // steps between two rows
+    long int _t; // Internal time
+    int _block; // Next row in the current block
+""" % ids
+    pop._specific_template['access_additional'] = """
+    // Custom local parameters of a streamed input
+    void set_interval(int interval) { _interval = std::max(interval, 1); }
+    int get_interval() { return _interval; }
+    bool next_block_free() {
+        std::lock_guard<std::mutex> lock(_stream_mutex);
+        return !_next_ready;
+    }
+    void push_block(std::vector< std::vector< %(float_prec)s > > block) {
+        std::lock_guard<std::mutex> lock(_stream_mutex);
+        _next_buffer = std::move(block);
+        _next_ready = true;
+        _stream_cv.notify_all();
+    }
+    void end_stream() {
+        std::lock_guard<std::mutex> lock(_stream_mutex);
+        _stream_end = true;
+        _stream_cv.notify_all();
+    }
+""" % ids
+    pop._specific_template['init_additional'] = """
+        // Initialize counters
+        _t = 0;
+        _block = 0;
+        _interval = 1;
+        _next_ready = false;
+        _stream_end = false;
+"""
+    pop._specific_template['export_additional'] = """
+        # Custom local parameters of a streamed input
+        void set_interval(int)
+        int get_interval()
+        bool next_block_free()
+        void push_block(vector[vector[%(float_prec)s]])
+        void end_stream()
+""" % ids
+    pop._specific_template['wrapper_access_additional'] = """
+    # Custom local parameters of a streamed input
+    cpdef set_interval( self, interval ):
+        pop%(id)s.set_interval( interval )
+    cpdef int get_interval( self ):
+        return pop%(id)s.get_interval()
+    cpdef bool next_block_free( self ):
+        return pop%(id)s.next_block_free()
+    cpdef push_block( self, block ):
+        pop%(id)s.push_block( block )
+    cpdef end_stream( self ):
+        pop%(id)s.end_stream()
+""" % ids
+    pop._specific_template['size_in_bytes'] = """
+        // current and next block
+        size_in_bytes += (_buffer.capacity() + _next_buffer.capacity()) * sizeof(std::vector<%(float_prec)s>);
+        for( auto it = _buffer.begin(); it != _buffer.end(); it++ )
+            size_in_bytes += it->capacity() * sizeof(%(float_prec)s);
+        for( auto it = _next_buffer.begin(); it != _next_buffer.end(); it++ )
+            size_in_bytes += it->capacity() * sizeof(%(float_prec)s);
+""" % ids
+
+    return """
+            // Check if it is time to set the next row
+            if(_t %% _interval == 0){
+                // The current block is consumed, swap in the next one (wait if it is still loading)
+                if(_block == _buffer.size()){
+                    std::unique_lock<std::mutex> lock(_stream_mutex);
+                    _stream_cv.wait(lock, [this]{ return _next_ready || _stream_end; });
+                    if(_next_ready){
+                        std::swap(_buffer, _next_buffer);
+                        _next_ready = false;
+                        _block = 0;
+                    }
+                }
+                if(_block < _buffer.size()){
+                    %(target)s = _buffer[_block];
+                    _block++;
+                }
+                // After the end of the stream, the last input is kept
+                else if(!_buffer.empty()){
+                    %(target)s = _buffer.back();
+                }
+            }
+
+            // Always increment the internal time
+            _t++;
+""" % ids
+
 class PoissonPopulation(SpecificPopulation):
     """
     Population of spiking neurons following a Poisson distribution.
@@ -342,12 +556,35 @@ class TimedArray(SpecificPopulation):
     simulate(100.) # the same ten inputs are presented again.
     ```
 
+    Inputs which do not fit into memory can be streamed: with ``block_size``, only blocks of ``block_size`` rows are transferred to the simulation core. The next block is loaded in the background while the current one is presented, so ``rates`` can be a memory-mapped array (``np.load(..., mmap_mode='r')``) of arbitrary length:
+
+    ```python
+    inputs = np.load('inputs.npy', mmap_mode='r')
+    inp = TimedArray(rates=inputs, schedule=10., block_size=1000)
+    ```
+
+    ``rates`` can also be an iterator (e.g. a generator) yielding the successive inputs, either one row or several rows at a time. As its length is unknown, the ``geometry`` of the population has to be provided:
+
+    ```python
+    def inputs():
+        while True:
+            yield np.random.random(10)
+
+    inp = TimedArray(rates=inputs(), geometry=10, block_size=100)
+    ```
+
+    An iterator can only be consumed once. If the population is added to a ``Network``, pass the function itself (``rates=inputs``), so that each copy of the population streams its own iterator.
+
+    In streaming mode, ``schedule`` must be a single value and the inputs cannot be cycled (no ``period``). When the stream is exhausted, the last input is kept. ``reset()`` only resets the internal time, the stream is not rewound. Streaming is not available on CUDA devices.
+
     """
-    def __init__(self, rates, schedule=0., period= -1., name=None, copied=False):
+    def __init__(self, rates, schedule=0., period= -1., name=None, block_size=None, geometry=None, copied=False):
         """
-        :param rates: array of firing rates. The first axis corresponds to time, the others to the desired dimensions of the population.
+        :param rates: array of firing rates. The first axis corresponds to time, the others to the desired dimensions of the population. In streaming mode, an iterator over the inputs or a function returning it is also accepted.
         :param schedule: either a single value or a list of time points where inputs should be set. Default: every timestep.
         :param period: time when the timed array will be reset and start again, allowing cycling over the inputs. Default: no cycling (-1.).
+        :param block_size: number of rows transferred at once to the simulation core. If set, or if ``rates`` is not an array, the inputs are streamed (default: None).
+        :param geometry: geometry of the population, only required when ``rates`` is an iterator.
         """
         neuron = Neuron(
             parameters="",
@@ -355,6 +592,17 @@ class TimedArray(SpecificPopulation):
             name="Timed Array",
             description="Timed array source."
         )
+
+        # Streamed inputs
+        self._input_stream = None
+        if block_size is not None or not isinstance(rates, np.ndarray):
+            self._input_stream, geometry = _check_input_stream('TimedArray', rates, schedule, period, block_size, geometry)
+
+            SpecificPopulation.__init__(self, geometry=geometry, neuron=neuron, name=name, copied=copied)
+
+            self.init['schedule'] = schedule
+            return
+
         # Geometry of the population
         geometry = rates.shape[1:]
 
@@ -378,12 +626,38 @@ class TimedArray(SpecificPopulation):
 
     def _copy(self):
         "Returns a copy of the population when creating networks."
+        if self._input_stream is not None:
+            if not self._input_stream.copyable():
+                Global._error('TimedArray: an iterator can not be streamed by several networks, provide a function returning the iterator instead.')
+            return TimedArray(self._input_stream.source, self.init['schedule'], name=self.name, block_size=self._input_stream.block_size, geometry=self.geometry, copied=True)
         return TimedArray(self.init['rates'] , self.init['schedule'], self.init['period'], self.name, copied=True)
 
+    def _generate_stream(self, omp):
+        """
+        adjust code templates for streamed inputs.
+        """
+        update = _input_stream_templates(self, 'r')
+        if omp:
+            update = """
+            #pragma omp single
+            {""" + update.replace('\n', '\n    ') + """}
+"""
+        self._specific_template['update_variables'] = """
+        if(_active){""" + update + """        }
+"""
+        # the stream is not rewound, the current input is kept
+        self._specific_template['reset_additional'] ="""
+        _t = 0;
+"""
+
     def _generate_st(self):
         """
         adjust code templates for the specific population for single thread and openMP.
         """
+        if self._input_stream is not None:
+            self._generate_stream(omp=False)
+            return
+
         self._specific_template['declare_additional'] = """
     // Custom local parameters of a TimedArray
     std::vector< int > _schedule; // List of times where new inputs should be set
@@ -485,6 +759,10 @@ class TimedArray(SpecificPopulation):
         """
         adjust code templates for the specific population for single thread and openMP.
         """
+        if self._input_stream is not None:
+            self._generate_stream(omp=True)
+            return
+
         self._specific_template['declare_additional'] = """
     // Custom local parameters of a TimedArray
     std::vector< int > _schedule; // List of times where new inputs should be set
@@ -587,6 +865,9 @@ class TimedArray(SpecificPopulation):
         """
         adjust code templates for the specific population for single thread and CUDA.
         """
+        if self._input_stream is not None:
+            Global._error('TimedArray: streamed inputs are not available on CUDA devices.')
+
         # HD (18. Nov 2016)
         # I suppress the code generation for allocating the variable r on gpu, as
         # well as memory transfer codes. This is only possible as no other variables
@@ -719,12 +1000,24 @@ class TimedArray(SpecificPopulation):
         # Create the Cython instance
         self.cyInstance = getattr(module, self.class_name+'_wrapper')(self.size, self.max_delay)
 
+    def _init_attributes(self):
+        SpecificPopulation._init_attributes(self)
+
+        # Start loading the inputs once the C++ population is initialized
+        if self._input_stream is not None:
+            self._input_stream.start(self.cyInstance)
+
     def __setattr__(self, name, value):
         if name == 'schedule':
             if self.initialized:
-                self.cyInstance.set_schedule( np.array(value) / Global.config['dt'] )
+                if self._input_stream is not None:
+                    self.cyInstance.set_interval( _stream_interval(value) )
+                else:
+                    self.cyInstance.set_schedule( np.array(value) / Global.config['dt'] )
             else:
                 self.init['schedule'] = value
+        elif name in ['rates', 'period'] and self._input_stream is not None:
+            Global._error('TimedArray: the', name, 'of streamed inputs cannot be modified.')
         elif name == 'rates':
             if self.initialized:
                 if len(value.shape) > 2:
@@ -746,9 +1039,13 @@ class TimedArray(SpecificPopulation):
     def __getattr__(self, name):
         if name == 'schedule':
             if self.initialized:
+                if self._input_stream is not None:
+                    return Global.config['dt'] * self.cyInstance.get_interval()
                 return Global.config['dt'] * self.cyInstance.get_schedule()
             else:
                 return self.init['schedule']
+        elif name == 'rates' and self._input_stream is not None:
+            return self._input_stream.source
         elif name == 'rates':
             if self.initialized:
                 if len(self.geometry) > 1:
@@ -801,6 +1098,8 @@ class SpikeSourceArray(SpecificPopulation):
     # Spikes at 60/61, 70/71, etc
     simulate(50)
     ```
+
+    Internally, the spikes are grouped by time step, so that each step only costs the number of emitted spikes and not the number of neurons. Further spikes can be added while the simulation is running with ``append_spikes()``.
     """
     def __init__(self, spike_times, name=None, copied=False):
         """
@@ -875,88 +1174,124 @@ class SpikeSourceArray(SpecificPopulation):
     // Custom local parameter spike_times
     // std::vector< %(float_prec)s > r ;
     std::vector< std::vector< long int > > spike_times ;
-    std::vector< long int >  next_spike ;
-    std::vector< int > idx_next_spike;
     long int _t;
 
+    // The spike times are grouped by time step (one bucket per step where
+    // at least one neuron fires): _spike_steps[b] holds the time step of
+    // bucket b, the ranks are stored in _spike_ranks[_spike_ptr[b]:_spike_ptr[b+1]]
+    std::vector< long int > _spike_steps;
+    std::vector< long int > _spike_ptr;
+    std::vector< int > _spike_ranks;
+    std::size_t _next_bucket;
+
+    // Spikes appended during the simulation, emitted buckets are released
+    std::map< long int, std::vector< int > > _streamed_spikes;
+
     // Recompute the spike times
     void recompute_spike_times(){
-        std::fill(next_spike.begin(), next_spike.end(), -10000);
-        std::fill(idx_next_spike.begin(), idx_next_spike.end(), 0);
+        // Collect all (step, rank) events
+        std::vector< std::pair< long int, int > > events;
         for(int i=0; i< size; i++){
-            if(!spike_times[i].empty()){
-                int idx = 0;
-                // Find the first spike time which is not in the past
-                while(spike_times[i][idx] < _t){
-                    idx++;
-                }
-                // Set the next spike
-                if(idx < spike_times[i].size())
-                    next_spike[i] = spike_times[i][idx];
-                else
-                    next_spike[i] = -10000;
+            for(auto it = spike_times[i].begin(); it != spike_times[i].end(); it++)
+                events.push_back(std::make_pair(*it, i));
+        }
+        std::sort(events.begin(), events.end());
+
+        // Group them by time step
+        _spike_steps.clear();
+        _spike_ptr.clear();
+        _spike_ranks.clear();
+        for(auto it = events.begin(); it != events.end(); it++){
+            if(_spike_steps.empty() || _spike_steps.back() != it->first){
+                _spike_steps.push_back(it->first);
+                _spike_ptr.push_back(_spike_ranks.size());
             }
+            _spike_ranks.push_back(it->second);
+        }
+        _spike_ptr.push_back(_spike_ranks.size());
+
+        // Find the first bucket which is not in the past
+        seek_spike_times();
+    }
+
+    // Set the next bucket according to the internal time
+    void seek_spike_times(){
+        _next_bucket = std::distance(_spike_steps.begin(), std::lower_bound(_spike_steps.begin(), _spike_steps.end(), _t));
+    }
+
+    // Add spikes to be emitted later (steps relative to the internal time _t)
+    void append_spikes(std::vector< long int > steps, std::vector< int > ranks){
+        for(std::size_t idx = 0; idx < steps.size(); idx++){
+            if(steps[idx] >= _t)
+                _streamed_spikes[steps[idx]].push_back(ranks[idx]);
         }
     }
+
+    void clear_streamed_spikes(){
+        _streamed_spikes.clear();
+    }
+
+    // Gather the neurons firing at the current step
+    void emit_spikes(){
+        spiked.clear();
+
+        // Spikes defined by spike_times
+        if(_next_bucket < _spike_steps.size() && _spike_steps[_next_bucket] == _t){
+            spiked.insert(spiked.end(), _spike_ranks.begin()+_spike_ptr[_next_bucket], _spike_ranks.begin()+_spike_ptr[_next_bucket+1]);
+            _next_bucket++;
+        }
+
+        // Appended spikes
+        bool merged = false;
+        while(!_streamed_spikes.empty() && _streamed_spikes.begin()->first <= _t){
+            auto bucket = _streamed_spikes.begin();
+            if(bucket->first == _t){
+                merged = !spiked.empty();
+                spiked.insert(spiked.end(), bucket->second.begin(), bucket->second.end());
+            }
+            _streamed_spikes.erase(bucket);
+        }
+
+        // A neuron should not spike twice in the same step
+        if(merged){
+            std::sort(spiked.begin(), spiked.end());
+            spiked.erase(std::unique(spiked.begin(), spiked.end()), spiked.end());
+        }
+
+        for(auto it = spiked.begin(); it != spiked.end(); it++)
+            last_spike[*it] = _t;
+    }
 """% { 'float_prec': Global.config['precision'] }
 
         #self._specific_template['access_parameters_variables'] = ""
 
         self._specific_template['init_additional'] = """
         _t = 0;
-        next_spike = std::vector<long int>(size, -10000);
-        idx_next_spike = std::vector<int>(size, 0);
+        _next_bucket = 0;
         this->recompute_spike_times();
-""" 
+"""
 
         self._specific_template['reset_additional'] = """
         _t = 0;
-        this->recompute_spike_times();
+        this->seek_spike_times();
+        this->clear_streamed_spikes();
 """
 
-        if Global.config["num_threads"] == 1:
+        if Global._check_single_thread():
             self._specific_template['update_variables'] = """
         if(_active){
-            spiked.clear();
-            for(int i = 0; i < size; i++){
-                // Emit spike
-                if( _t == next_spike[i] ){
-                    last_spike[i] = _t;
-                    idx_next_spike[i]++ ;
-                    if(idx_next_spike[i] < spike_times[i].size()){
-                        next_spike[i] = spike_times[i][idx_next_spike[i]];
-                    }
-                    spiked.push_back(i);
-                }
-            }
+            emit_spikes();
             _t++;
         }
 """
         else:
+            # only the neurons firing at this step are visited, so it is not
+            # worth to distribute the work across threads.
             self._specific_template['update_variables'] = """
         if(_active){
             #pragma omp single
             {
-                spiked.clear();
-            }
-
-            #pragma omp for
-            for(int i = 0; i < size; i++){
-                // Emit spike
-                if( _t == next_spike[i] ){
-                    last_spike[i] = _t;
-                    idx_next_spike[i]++ ;
-                    if(idx_next_spike[i] < spike_times[i].size()){
-                        next_spike[i] = spike_times[i][idx_next_spike[i]];
-                    }
-
-                    #pragma omp critical
-                    spiked.push_back(i);
-                }
-            }
-
-            #pragma omp single
-            {
+                emit_spikes();
                 _t++;
             }
         }
@@ -966,6 +1301,7 @@ class SpikeSourceArray(SpecificPopulation):
         self._specific_template['export_additional'] ="""
         vector[vector[long]] spike_times
         void recompute_spike_times()
+        void append_spikes(vector[long], vector[int])
 """
 
         self._specific_template['wrapper_args'] = "size, times, delay"
@@ -981,6 +1317,10 @@ class SpikeSourceArray(SpecificPopulation):
     cpdef set_spike_times(self, value):
         pop%(id)s.spike_times = value
         pop%(id)s.recompute_spike_times()
+
+    # Spikes added during the simulation
+    cpdef append_spikes(self, steps, ranks):
+        pop%(id)s.append_spikes(steps, ranks)
 """ % {'id': self.id}
 
     def _generate_cuda(self):
@@ -1020,6 +1360,50 @@ class SpikeSourceArray(SpecificPopulation):
         # Create the Cython instance
         self.cyInstance = getattr(module, self.class_name+'_wrapper')(self.size, self.init['spike_times'], self.max_delay)
 
+    def append_spikes(self, times, ranks=None):
+        """
+        Adds spikes which will be emitted during the following simulations. Large recorded datasets can be replayed chunk-wise this way, instead of passing all spike times at once:
+
+        ```python
+        inp = SpikeSourceArray(spike_times=[[] for _ in range(1000)])
+        compile()
+
+        for times, ranks in chunks: # e.g. one second of recorded data each
+            inp.append_spikes(times, ranks)
+            simulate(1000.)
+        ```
+
+        The times have the same origin as ``spike_times`` (the start of the simulation or the last call to ``reset()``). Spikes lying in the past are ignored and emitted spikes are released. Contrary to ``spike_times``, the appended spikes are discarded by ``reset()``.
+
+        :param times: either a list of spike times (in ms) for each neuron like ``spike_times``, or a flat array of spike times when ``ranks`` is provided.
+        :param ranks: ranks of the neurons emitting the spikes given by ``times`` (default: None).
+
+        .. note::
+
+            Only available for the openmp paradigm.
+        """
+        if not Global._check_paradigm("openmp"):
+            Global._error('SpikeSourceArray.append_spikes(): appending spikes is only available for the openmp paradigm.')
+
+        if not self.initialized:
+            Global._error('SpikeSourceArray.append_spikes(): the network is not compiled yet.')
+
+        if ranks is None:
+            if not len(times) == self.size:
+                Global._error('SpikeSourceArray.append_spikes(): a list of spike times per neuron is expected if no ranks are provided.')
+            ranks = np.concatenate([np.full(len(neur_times), rk, dtype=np.int32) for rk, neur_times in enumerate(times)])
+            times = np.concatenate([np.asarray(neur_times, dtype=float) for neur_times in times])
+
+        times = np.asarray(times, dtype=float).ravel()
+        ranks = np.asarray(ranks, dtype=np.int32).ravel()
+        if times.shape != ranks.shape:
+            Global._error('SpikeSourceArray.append_spikes(): times and ranks must have the same length.')
+        if ranks.size > 0 and (ranks.min() < 0 or ranks.max() >= self.size):
+            Global._error('SpikeSourceArray.append_spikes(): the ranks must be smaller than the population size.')
+
+        steps = np.round(times / Global.config['dt']).astype(np.int64)
+        self.cyInstance.append_spikes(steps, ranks)
+
     def __setattr__(self, name, value):
         if name == 'spike_times':
             if not isinstance(value[0], list): # several neurons
@@ -1102,12 +1486,24 @@ class TimedPoissonPopulation(SpecificPopulation):
     )
     ```
 
+    As for ``TimedArray``, long sequences of rates can be streamed block-wise from a memory-mapped array or an iterator by setting ``block_size``. The rates are then set at regular intervals given by a single ``schedule`` value, and each row must provide one rate per neuron:
+
+    ```python
+    inp = TimedPoissonPopulation(
+        geometry = 100,
+        rates = np.load('rates.npy', mmap_mode='r'), # shape (100000, 100)
+        schedule = 10.,
+        block_size = 1000,
+    )
+    ```
+
     """
-    def __init__(self, geometry, rates, schedule, period= -1., name=None, copied=False):
+    def __init__(self, geometry, rates, schedule, period= -1., name=None, block_size=None, copied=False):
         """    
-        :param rates: array of firing rates. The first axis corresponds to the times where the firing rate should change. If a different rate should be used by the different neurons, the other dimensions must match the geometry of the population.
-        :param schedule: list of times (in ms) where the firing rate should change.
+        :param rates: array of firing rates. The first axis corresponds to the times where the firing rate should change. If a different rate should be used by the different neurons, the other dimensions must match the geometry of the population. In streaming mode, an iterator over the rates or a function returning it is also accepted.
+        :param schedule: list of times (in ms) where the firing rate should change. In streaming mode, the interval (in ms) between two successive rates.
         :param period: time when the timed array will be reset and start again, allowing cycling over the schedule. Default: no cycling (-1.).
+        :param block_size: number of rates transferred at once to the simulation core. If set, or if ``rates`` is an iterator, the rates are streamed (default: None).
         """
         
         neuron = Neuron(
@@ -1124,6 +1520,16 @@ class TimedPoissonPopulation(SpecificPopulation):
             description="Spiking neuron following a Poisson distribution."
         )
 
+        # Streamed rates
+        self._input_stream = None
+        if block_size is not None or not isinstance(rates, (np.ndarray, list, tuple)):
+            self._input_stream, _ = _check_input_stream('TimedPoissonPopulation', rates, schedule, period, block_size, geometry)
+
+            SpecificPopulation.__init__(self, geometry=geometry, neuron=neuron, name=name, copied=copied)
+
+            self.init['schedule'] = schedule
+            return
+
         SpecificPopulation.__init__(self, geometry=geometry, neuron=neuron, name=name, copied=copied)
 
         # Check arguments
@@ -1149,12 +1555,55 @@ class TimedPoissonPopulation(SpecificPopulation):
 
     def _copy(self):
         "Returns a copy of the population when creating networks."
+        if self._input_stream is not None:
+            if not self._input_stream.copyable():
+                Global._error('TimedPoissonPopulation: an iterator can not be streamed by several networks, provide a function returning the iterator instead.')
+            return TimedPoissonPopulation(self.geometry, self._input_stream.source, self.init['schedule'], name=self.name, block_size=self._input_stream.block_size, copied=True)
         return TimedPoissonPopulation(self.geometry, self.init['rates'] , self.init['schedule'], self.init['period'], self.name, copied=True)
 
+    def _generate_stream(self, omp):
+        """
+        adjust code templates for streamed rates.
+        """
+        update = _input_stream_templates(self, 'proba')
+        if omp:
+            update = """
+            #pragma omp single
+            {""" + update.replace('\n', '\n    ') + """}
+"""
+        self._specific_template['update_variables'] = """
+        if(_active){""" + update + """        }
+
+        if( _active ) {
+            spiked.clear();
+
+            // Updating local variables
+            %(float_prec)s step = 1000.0/dt;
+
+            #pragma omp %(simd)s
+            for(int i = 0; i < size; i++){
+
+                // p = Uniform(0.0, 1.0) * 1000.0 / dt
+                p[i] = step*rand_0[i];
+
+
+            }
+        } // active
+""" % {'float_prec': Global.config['precision'], 'simd': "for simd" if omp else "simd"}
+
+        # the stream is not rewound, the current input is kept
+        self._specific_template['reset_additional'] ="""
+        _t = 0;
+"""
+
     def _generate_st(self):
         """
         adjust code templates for the specific population for single thread.
         """
+        if self._input_stream is not None:
+            self._generate_stream(omp=False)
+            return
+
         self._specific_template['declare_additional'] = """
     // Custom local parameters of a TimedPoissonPopulation
     std::vector< int > _schedule; // List of times where new inputs should be set
@@ -1272,6 +1721,10 @@ class TimedPoissonPopulation(SpecificPopulation):
         """
         adjust code templates for the specific population for openMP.
         """
+        if self._input_stream is not None:
+            self._generate_stream(omp=True)
+            return
+
         self._specific_template['declare_additional'] = """
     // Custom local parameters of a TimedPoissonPopulation
     std::vector< int > _schedule; // List of times where new inputs should be set
@@ -1392,6 +1845,9 @@ class TimedPoissonPopulation(SpecificPopulation):
         """
         Code generation if the CUDA paradigm is set.
         """
+        if self._input_stream is not None:
+            Global._error('TimedPoissonPopulation: streamed rates are not available on CUDA devices.')
+
         # I suppress the code generation for allocating the variable r on gpu, as
         # well as memory transfer codes. This is only possible as no other variables
         # allowed in TimedArray.
@@ -1596,12 +2052,24 @@ __global__ void cuPop%(id)s_local_step( const long int t, const double dt, curan
         # Create the Cython instance
         self.cyInstance = getattr(module, self.class_name+'_wrapper')(self.size, self.max_delay)
 
+    def _init_attributes(self):
+        SpecificPopulation._init_attributes(self)
+
+        # Start loading the rates once the C++ population is initialized
+        if self._input_stream is not None:
+            self._input_stream.start(self.cyInstance)
+
     def __setattr__(self, name, value):
         if name == 'schedule':
             if self.initialized:
-                self.cyInstance.set_schedule( np.array(value) / Global.config['dt'] )
+                if self._input_stream is not None:
+                    self.cyInstance.set_interval( _stream_interval(value) )
+                else:
+                    self.cyInstance.set_schedule( np.array(value) / Global.config['dt'] )
             else:
                 self.init['schedule'] = value
+        elif name in ['rates', 'period'] and self._input_stream is not None:
+            Global._error('TimedPoissonPopulation: the', name, 'of streamed rates cannot be modified.')
         elif name == 'rates':
             if self.initialized:
                 value = np.array(value)
@@ -1635,9 +2103,13 @@ __global__ void cuPop%(id)s_local_step( const long int t, const double dt, curan
     def __getattr__(self, name):
         if name == 'schedule':
             if self.initialized:
+                if self._input_stream is not None:
+                    return Global.config['dt'] * self.cyInstance.get_interval()
                 return Global.config['dt'] * self.cyInstance.get_schedule()
             else:
                 return self.init['schedule']
+        elif name == 'rates' and self._input_stream is not None:
+            return self._input_stream.source
         elif name == 'rates':
             if self.initialized:
                 if len(self.geometry) > 1:
@@ -50,7 +50,7 @@ class SpecificProjection(Projection):
         functions defined by the user.
         """
         if Global.config['paradigm'] == "openmp":
-            if Global.config["num_threads"] == 1:
+            if Global._check_single_thread():
                 self._generate_st()
             else:
                 self._generate_omp()
@@ -135,11 +135,11 @@ class DecodingProjection(SpecificProjection):
         self._specific_template['declare_additional'] = """
     // Window
     int window = %(window)s;
-    std::deque< std::vector< %(float_prec)s > > rates_history ;
+    RingBuffer< std::vector< %(float_prec)s > > rates_history ;
 """ % { 'window': int(self.window/Global.config['dt']), 'float_prec': Global.config['precision'] }
 
         self._specific_template['init_additional'] = """
-        rates_history = std::deque< std::vector< %(float_prec)s > >(%(window)s, std::vector< %(float_prec)s >(%(post_size)s, 0.0));
+        rates_history = RingBuffer< std::vector< %(float_prec)s > >(%(window)s, std::vector< %(float_prec)s >(%(post_size)s, 0.0));
 """ % { 'window': int(self.window/Global.config['dt']),'post_size': self.post.size, 'float_prec': Global.config['precision'] }
 
         self._specific_template['psp_code'] = """
@@ -163,7 +163,6 @@ class DecodingProjection(SpecificProjection):
             }
 
             rates_history.push_front(rates);
-            rates_history.pop_back();
             for(int i=0; i<post_rank.size(); i++){
                 sum = 0.0;
                 for(int step=0; step<window; step++){
@@ -186,11 +185,11 @@ class DecodingProjection(SpecificProjection):
         self._specific_template['declare_additional'] = """
     // Window
     int window = %(window)s;
-    std::deque< std::vector< %(float_prec)s > > rates_history ;
+    RingBuffer< std::vector< %(float_prec)s > > rates_history ;
 """ % { 'window': int(self.window/Global.config['dt']), 'float_prec': Global.config['precision'] }
 
         self._specific_template['init_additional'] = """
-        rates_history = std::deque< std::vector< %(float_prec)s > >(%(window)s, std::vector< %(float_prec)s >(%(post_size)s, 0.0));
+        rates_history = RingBuffer< std::vector< %(float_prec)s > >(%(window)s, std::vector< %(float_prec)s >(%(post_size)s, 0.0));
 """ % { 'window': int(self.window/Global.config['dt']),'post_size': self.post.size, 'float_prec': Global.config['precision'] }
 
         self._specific_template['psp_code'] = """
@@ -216,7 +215,6 @@ class DecodingProjection(SpecificProjection):
                 }
 
                 rates_history.push_front(rates);
-                rates_history.pop_back();
                 for(int i=0; i<post_rank.size(); i++){
                     sum = 0.0;
                     for(int step=0; step<window; step++){
@@ -23,6 +23,7 @@
 #===============================================================================
 import ANNarchy.core.Global as Global
 from ANNarchy.parser.AnalyseSynapse import analyse_synapse
+from ANNarchy.parser import DescriptionCache
 
 class Synapse(object):
     """
@@ -102,7 +103,7 @@ class Synapse(object):
     def _analyse(self):
         # Analyse the synapse type
         if not self.description:
-            self.description = analyse_synapse(self)
+            self.description = DescriptionCache.analyse(self, 'synapse', analyse_synapse)
 
     def __add__(self, synapse):
         Global._error('adding synapse models is not implemented yet.')
@@ -539,6 +539,14 @@ class Convolution(Projection):
             conv_dict[key] = value
         self._specific_template.update(conv_dict)
 
+        # Interior and border post-synaptic neurons are computed separately
+        split_kernel = kernel and self._split_kernel_available()
+        if split_kernel:
+            split_ids = self._split_kernel_ids()
+            split_ids.update(base_ids)
+            for key in ['declare_connectivity_matrix', 'access_connectivity_matrix', 'export_connectivity', 'wrapper_init_connectivity']:
+                self._specific_template[key] += convolve_split_template_omp[key] % split_ids
+
         # Kernel-based method: specify w with the correct dimension
         if kernel:
             self._specific_template['declare_parameters_variables'] = tabify(filter_definition.strip(), 1)
@@ -546,8 +554,8 @@ class Convolution(Projection):
             self._specific_template['access_parameters_variables'] = """
     // Local parameter w
     %(type_w)s get_w() { return w; }
-    void set_w(%(type_w)s value) { w = value; }
-""" % {'type_w': filter_definition.replace(' w;', '')}
+    void set_w(%(type_w)s value) { w = value; %(flatten)s}
+""" % {'type_w': filter_definition.replace(' w;', ''), 'flatten': "flatten_w(); " if split_kernel else ""}
             self._specific_template['export_connectivity'] += """
         # Local variable w
         %(type_w)s get_w()
@@ -582,9 +590,13 @@ class Convolution(Projection):
 
         # OMP code
         omp_code = ""
-        if Global.config['num_threads'] > 1:
+        omp_interior_code = ""
+        if not Global._check_single_thread():
+            psp_schedule = "" if not 'psp_schedule' in self._omp_config.keys() else self._omp_config['psp_schedule']
             omp_code = """
-        #pragma omp for private(sum, rk_pre, coord) %(psp_schedule)s""" % {'psp_schedule': "" if not 'psp_schedule' in self._omp_config.keys() else self._omp_config['psp_schedule']}
+        #pragma omp for private(sum, rk_pre, coord) %(psp_schedule)s""" % {'psp_schedule': psp_schedule}
+            # the border neurons are distinct, no need to wait
+            omp_interior_code = "#pragma omp for private(sum) nowait " + psp_schedule
 
         # HD ( 16.10.2015 ):
         # pre-load delayed firing rate in a local array, so we
@@ -603,13 +615,30 @@ class Convolution(Projection):
         target_code = "_sum_%(target)s" if self.post.neuron_type.type=="rate" else "g_%(target)s"
         target_code %= {'target': self.target}
 
+        # Interior neurons, the others are processed by the generic kernel
+        if split_kernel:
+            split_ids.update({
+                'omp_code': omp_interior_code,
+                'pre_r': "delayed_r.data()" if self.delays > Global.config['dt'] else "pop%(id_pre)s.r.data()" % {'id_pre': self.pre.id},
+                'id_post': self.post.id,
+                'target': target_code,
+                'sum_code': sum_code,
+                'simd': "#pragma omp simd reduction(+:sum)" if not Global.config["disable_SIMD_Eq"] else ""
+            })
+            interior_code = convolve_split_template_omp['interior_psp'] % split_ids
+            post_loop = """for(int n = 0; n < border_ranks.size(); n++){
+                int i = border_ranks[n];"""
+        else:
+            interior_code = ""
+            post_loop = "for(int i = 0; i < %(size_post)s; i++){"
+
         # Compute sum
         wsum =  """
         if ( _transmission && pop%(id_pre)s._active ) {
             int* coord;
-""" + pre_load_r + """
+""" + pre_load_r + interior_code.replace('%', '%%') + """
             %(omp_code)s
-            for(int i = 0; i < %(size_post)s; i++){
+            """ + post_loop + """
                 coord = pre_coords[i].data();
 
                 // perform the convolution
@@ -661,6 +690,9 @@ class Convolution(Projection):
         // filter
         // TODO:
 """
+        if split_kernel:
+            self._specific_template['size_in_bytes'] += convolve_split_template_omp['size_in_bytes'] % base_ids
+            self._specific_template['clear'] += convolve_split_template_omp['clear']
 
     ################################
     ### Utilities
@@ -679,6 +711,77 @@ class Convolution(Projection):
         pyx += ' w'
         return cpp, pyx
 
+    def _split_kernel_available(self):
+        """
+        The interior neurons can be computed with contiguous filters if the
+        psp is linear in the pre-synaptic rate (w * pre.r) and the results are
+        summed up (sum or mean operation).
+        """
+        if self.synapse_type.operation not in ['sum', 'mean']:
+            return False
+
+        psp = self.synapse_type.description['psp']['cpp'].strip()
+        return psp in ['%(pre_prefix)sr%(pre_index)s*w%(local_index)s;', 'w%(local_index)s*%(pre_prefix)sr%(pre_index)s;']
+
+    def _split_kernel_ids(self):
+        """
+        Returns the code snippets used by the interior/border split of the
+        convolution: the test whether the receptive field of a post-synaptic
+        neuron (given by coord) lies within the pre-synaptic population, the
+        corresponding offset in the pre-synaptic population and the offsets
+        of the filter rows.
+        """
+        # Spatial dimensions of the filter
+        kernel_shape = self.weights.shape[1:] if self.multiple else self.weights.shape
+        nb_dims = len(kernel_shape)
+
+        # Strides of the pre-synaptic population (row-major)
+        geometry = self.pre.geometry
+        strides = [int(np.prod(geometry[d+1:])) for d in range(self.dim_pre)]
+
+        condition = []
+        offset = []
+        for d in range(self.dim_pre):
+            if d < nb_dims:
+                center = self._center_filter(kernel_shape[d])
+                condition.append("(coord[%(d)s] >= %(center)s) && (coord[%(d)s] <= %(max)s)" % {'d': d, 'center': center, 'max': geometry[d] - kernel_shape[d] + center})
+                offset.append("%(stride)s * (coord[%(d)s] - %(center)s)" % {'d': d, 'stride': strides[d], 'center': center})
+            else:
+                offset.append("%(stride)s * coord[%(d)s]" % {'d': d, 'stride': strides[d]})
+
+        # Each row of the filter covers its last dimension. If the filter
+        # spans the whole inner dimensions of the pre-synaptic population,
+        # consecutive rows are contiguous and can be merged.
+        row_stride = strides[nb_dims-1]
+        row_size = kernel_shape[-1]
+        row_dims = nb_dims - 1
+        while row_dims > 0 and row_stride == 1 and row_size == strides[row_dims-1]:
+            row_size *= kernel_shape[row_dims-1]
+            row_dims -= 1
+
+        row_offsets = [0]
+        for d in range(row_dims):
+            row_offsets = [o + i * strides[d] for o in row_offsets for i in range(kernel_shape[d])]
+
+        # Flatten the filter(s)
+        flatten_w = ["w_flat.clear();"]
+        container = "w"
+        for d in range(self.dim_kernel-1):
+            flatten_w.append(tabify("for (auto& w_%(d)s : %(container)s)" % {'d': d, 'container': container}, d))
+            container = "w_" + str(d)
+        flatten_w.append(tabify("w_flat.insert(w_flat.end(), %(container)s.begin(), %(container)s.end());" % {'container': container}, self.dim_kernel-1))
+
+        return {
+            'interior_condition': " && ".join(condition),
+            'pre_offset': " + ".join(offset),
+            'flatten_w': tabify("\n".join(flatten_w), 2),
+            'nb_rows': len(row_offsets),
+            'row_offsets': ", ".join([str(o) for o in row_offsets]),
+            'row_size': row_size,
+            'r_index': "k" if row_stride == 1 else "k*" + str(row_stride),
+            'filter_offset': " + pre_coords[i][%(dim)s] * %(size)s" % {'dim': self.dim_pre, 'size': int(np.prod(kernel_shape))} if self.multiple else ""
+        }
+
     def _coordinates_to_rank(self, name, geometry):
 
         dim = len(geometry)
@@ -83,4 +83,91 @@ convole_template_omp = {
         int rk_pre;
         %(float_prec)s sum=0.0;
 """
-}
\ No newline at end of file
+}
+# The post-synaptic neurons whose receptive field lies entirely within the
+# pre-synaptic population (interior) need neither bounds checks nor padding.
+# For a linear psp, they are computed row-wise on a contiguous copy of the
+# filter(s), the remaining ones (border) use the generic kernel.
+convolve_split_template_omp = {
+    'declare_connectivity_matrix': """
+    // Interior/border split of the post-synaptic neurons
+    std::vector<int> interior_ranks;
+    std::vector<int> border_ranks;
+    std::vector<int> pre_offset;
+    std::vector<%(float_prec)s> w_flat;
+""",
+
+    'access_connectivity_matrix': """
+    // Splits the post-synaptic neurons into interior and border ones
+    void init_regions() {
+        interior_ranks.clear();
+        border_ranks.clear();
+        pre_offset = std::vector<int>(pre_coords.size(), 0);
+
+        for (int i = 0; i < pre_coords.size(); i++) {
+            int* coord = pre_coords[i].data();
+            if (%(interior_condition)s) {
+                // rank of the first pre-synaptic neuron of the receptive field
+                pre_offset[i] = %(pre_offset)s;
+                interior_ranks.push_back(i);
+            } else {
+                border_ranks.push_back(i);
+            }
+        }
+    }
+
+    // Contiguous copy of the filter(s)
+    void flatten_w() {
+%(flatten_w)s
+    }
+""",
+
+    'export_connectivity': """
+        void init_regions()
+""",
+
+    'wrapper_init_connectivity': """
+        proj%(id_proj)s.init_regions()
+""",
+
+    'interior_psp': """
+            // interior: the receptive field lies within the pre-synaptic population
+            const int w_row_offset[%(nb_rows)s] = {%(row_offsets)s};
+            %(omp_code)s
+            for (int n = 0; n < interior_ranks.size(); n++) {
+                int i = interior_ranks[n];
+                const %(float_prec)s* r_rf = %(pre_r)s + pre_offset[i];
+                const %(float_prec)s* w_row = w_flat.data()%(filter_offset)s;
+
+                sum = 0.0;
+                for (int row = 0; row < %(nb_rows)s; row++, w_row += %(row_size)s) {
+                    const %(float_prec)s* r_row = r_rf + w_row_offset[row];
+                    %(simd)s
+                    for (int k = 0; k < %(row_size)s; k++) {
+                        sum += w_row[k] * r_row[%(r_index)s];
+                    }
+                }
+
+                // store result
+                pop%(id_post)s.%(target)s[i] += %(sum_code)s;
+            } // for
+""",
+
+    'size_in_bytes': """
+        // interior/border split
+        size_in_bytes += (interior_ranks.capacity() + border_ranks.capacity() + pre_offset.capacity()) * sizeof(int);
+        size_in_bytes += w_flat.capacity() * sizeof(%(float_prec)s);
+""",
+
+    'clear': """
+        // interior/border split
+        interior_ranks.clear();
+        interior_ranks.shrink_to_fit();
+        border_ranks.clear();
+        border_ranks.shrink_to_fit();
+        pre_offset.clear();
+        pre_offset.shrink_to_fit();
+        w_flat.clear();
+        w_flat.shrink_to_fit();
+"""
+}
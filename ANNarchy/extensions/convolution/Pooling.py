@@ -394,7 +394,7 @@ class Pooling(Projection):
 
         # OMP code
         omp_code = ""
-        if Global.config['num_threads'] > 1:
+        if not Global._check_single_thread():
             omp_code = """
         #pragma omp for private(sum, rk_pre, coord) %(psp_schedule)s""" % {
                 'psp_schedule': "" if not 'psp_schedule' in self._omp_config.keys() else self._omp_config[
@@ -236,7 +236,7 @@ extern ProjStruct%(fwd_id_proj)s proj%(fwd_id_proj)s;    // Forward projection
         'id_post': self.post.id,
         'fwd_id_proj': self.fwd_proj.id,
         'index': weight_index,
-        'omp_code': "" if Global.config["num_threads"] == 1 else "#pragma omp for"
+        'omp_code': "" if Global._check_single_thread() else "#pragma omp for"
 }
 
     def _generate_spiking(self):
@@ -245,7 +245,7 @@ extern ProjStruct%(fwd_id_proj)s proj%(fwd_id_proj)s;    // Forward projection
 
         TODO: openMP
         """
-        if Global.config["num_threads"] > 1:
+        if not Global._check_single_thread():
             Global._error('TransposeProjection for spiking projections is only available for single-thread yet ...')
 
         # Which projection is transposed
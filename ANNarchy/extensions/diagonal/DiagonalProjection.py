@@ -234,7 +234,7 @@ class DiagonalProjection(Projection):
 """ % {'float_prec': Global.config['precision']}
 
         # OpenMP statement
-        if Global.config['num_threads'] > 1:
+        if not Global._check_single_thread():
             wsum += """
         #pragma omp for private(sum, _idx_0, _idx_1, _idx_f, _start) firstprivate(_w, _pre_r)"""
 
@@ -353,7 +353,7 @@ class DiagonalProjection(Projection):
         wsum =  """
         std::vector<%(float_prec)s> result(%(postdim2)s*%(postdim3)s, 0.0);""" % {'float_prec': Global.config['precision']}
 
-        if Global.config['num_threads'] > 1:
+        if not Global._check_single_thread():
             wsum += """
         #pragma omp for"""
     
@@ -1012,7 +1012,7 @@ class SharedProjection(Projection):
 
         # OMP code
         omp_code = ""
-        if Global.config['num_threads'] > 1:
+        if not Global._check_single_thread():
             omp_code = """
         #pragma omp for private(sum, rk_pre, coord) %(psp_schedule)s""" % {'psp_schedule': "" if not 'psp_schedule' in self._omp_config.keys() else self._omp_config['psp_schedule']}
 
@@ -1105,7 +1105,7 @@ class SharedProjection(Projection):
         } % {'float_prec': Global.config['precision']}
 
         # OMP code
-        if Global.config['num_threads'] > 1:
+        if not Global._check_single_thread():
             omp_code = '#pragma omp for private(sum)' if self.post.size > Global.OMP_MIN_NB_NEURONS else ''
         else:
             omp_code = ""
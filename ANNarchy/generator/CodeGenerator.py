@@ -83,7 +83,7 @@ class CodeGenerator(object):
 
         # Instantiate code generator based on the target platform
         if Global.config['paradigm'] == "openmp":
-            if Global.config['num_threads'] == 1:
+            if Global._check_single_thread():
                 self._popgen = SingleThreadGenerator(self._profgen, net_id)
                 self._projgen = SingleThreadProjectionGenerator(self._profgen, net_id)
             else:
@@ -126,7 +126,7 @@ class CodeGenerator(object):
 
         if Global.config['verbose']:
             if Global.config['paradigm'] == "openmp":
-                if Global.config['num_threads'] > 1:
+                if not Global._check_single_thread():
                     Global._print('\nGenerate code for OpenMP ...')
                 else:
                     Global._print('\nGenerate sequential code ...')
@@ -500,6 +500,12 @@ void set_%(name)s(%(float_prec)s value){
             if 'post_event' in proj.keys():
                 post_event += proj['post_event']
 
+        # Resize the thread-local data
+        update_num_threads = ""
+        for desc in self._pop_desc + self._proj_desc:
+            if 'update_num_threads' in desc.keys():
+                update_num_threads += desc['update_num_threads']
+
         # Structural plasticity
         structural_plasticity = self._body_structural_plasticity()
 
@@ -538,6 +544,7 @@ void set_%(name)s(%(float_prec)s value){
                 'delay_code' : delay_code,
                 'post_event' : post_event,
                 'structural_plasticity': structural_plasticity,
+                'update_num_threads': update_num_threads,
                 'custom_constant': custom_constant,
             }
 
@@ -545,7 +552,7 @@ void set_%(name)s(%(float_prec)s value){
             base_dict.update(prof_dict)
 
             # complete code template
-            if Global.config["num_threads"] == 1:
+            if Global._check_single_thread():
                 return BaseTemplate.st_body_template % base_dict
             else:
                 return BaseTemplate.omp_body_template % base_dict
@@ -809,7 +816,7 @@ void set_%(name)s(%(float_prec)s value){
 
         # the computation kernel depends on the paradigm
         if Global._check_paradigm("openmp"):
-            if Global.config["num_threads"] == 1:
+            if Global._check_single_thread():
                 global_op_template = global_operation_templates_st
             else:
                 global_op_template = global_operation_templates_openmp
@@ -0,0 +1,237 @@
+#===============================================================================
+#
+#     CompilationCache.py
+#
+#     This file is part of ANNarchy.
+#
+#     Copyright (C) 2013-2016  Julien Vitay <julien.vitay@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchy is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#===============================================================================
+"""
+Content-addressed cache for the compiled ANNarchyCore libraries and their
+object files.
+
+The cache is shared between all working directories and runs of the same user.
+Each entry is a shared library (or an object file) stored under the hash of the
+generated sources and of the build environment (compiler, flags, precision,
+ANNarchy release). The total size of the cache is bounded, the least recently
+used entries are removed first.
+"""
+import os
+import re
+import sys
+import shutil
+import hashlib
+import platform
+
+import ANNarchy
+from ANNarchy.core import Global
+
+# Default location and size limit (in MB), can be overwritten in annarchy.json:
+#
+#   "cache": { "path": "~/.cache/ANNarchy", "max_size": 2048 }
+#
+default_cache_path = "~/.cache/ANNarchy"
+default_cache_size = 2048
+
+# Subfolder containing the analysed neuron and synapse descriptions (see parser/DescriptionCache.py)
+descriptions_folder = "descriptions"
+
+def cache_settings(user_config):
+    """
+    Returns the absolute path to the cache folder and the size limit in bytes.
+    """
+    path = default_cache_path
+    max_size = default_cache_size
+
+    if 'cache' in user_config.keys():
+        path = user_config['cache'].get('path', path)
+        max_size = user_config['cache'].get('max_size', max_size)
+
+    return os.path.abspath(os.path.expanduser(path)), int(max_size) * 1024 * 1024
+
+def compute_key(source_dir, compiler, compiler_flags, add_sources=""):
+    """
+    Computes the hash of a network: all generated files in *source_dir* (the
+    Makefile included) together with the build environment.
+
+    :param source_dir: folder containing the generated code (annarchy/generate/netX).
+    :param compiler: the C++ compiler used.
+    :param compiler_flags: the flags passed to the compiler.
+    :param add_sources: additional sources given by the user, their content is hashed if they exist.
+    """
+    sha = hashlib.sha256()
+
+    # Build environment
+    environment = [
+        ANNarchy.__release__,
+        Global.config['paradigm'],
+        Global.config['precision'],
+        str(compiler),
+        str(compiler_flags),
+        sys.version,
+        platform.machine(),
+    ]
+    for entry in environment:
+        sha.update(entry.encode('utf-8'))
+        sha.update(b'\0')
+
+    # Generated sources, sorted to be independent of the file system order
+    for file in sorted(os.listdir(source_dir)):
+        if file.endswith(".log"):
+            continue
+        sha.update(file.encode('utf-8'))
+        sha.update(b'\0')
+        with open(source_dir + '/' + file, 'rb') as rfile:
+            sha.update(rfile.read())
+        sha.update(b'\0')
+
+    # User-defined sources
+    for source in add_sources.split():
+        if os.path.isfile(source):
+            with open(source, 'rb') as rfile:
+                sha.update(rfile.read())
+
+    return sha.hexdigest()
+
+def compute_object_key(build_dir, source):
+    """
+    Computes the hash of a single translation unit: the source file, the
+    Makefile containing the compiler flags and the local headers included by
+    the source, directly or through other headers. Headers of *build_dir*
+    which are not included by the unit do not modify its key.
+
+    :param build_dir: folder where the object is compiled (annarchy/build/netX).
+    :param source: file name of the translation unit.
+    """
+    sha = hashlib.sha256()
+    sha.update(ANNarchy.__release__.encode('utf-8'))
+    sha.update(b'\0')
+
+    files = ['Makefile', source] + sorted(included_headers(build_dir, source))
+    for file in files:
+        sha.update(file.encode('utf-8'))
+        sha.update(b'\0')
+        with open(build_dir + '/' + file, 'rb') as rfile:
+            sha.update(rfile.read())
+        sha.update(b'\0')
+
+    return sha.hexdigest()
+
+# '#include "file"' in C++ sources, 'cdef extern from "file"' in Cython sources
+_include_pattern = re.compile(r'^\s*(?:#\s*include|cdef\s+extern\s+from)\s+"([^"]+)"', re.MULTILINE)
+
+def included_headers(build_dir, source):
+    """
+    Returns the set of headers located in *build_dir* which are included by
+    *source*, directly or transitively. System headers and headers of the
+    ANNarchy include folders are not considered, they are covered by the
+    release number.
+    """
+    headers = set()
+    queue = [source]
+    while len(queue) > 0:
+        with open(build_dir + '/' + queue.pop(), 'r', errors='replace') as rfile:
+            code = rfile.read()
+        for header in _include_pattern.findall(code):
+            if header in headers or not os.path.isfile(build_dir + '/' + header):
+                continue
+            headers.add(header)
+            queue.append(header)
+
+    return headers
+
+def fetch(cache_dir, key, target):
+    """
+    Copies the entry stored under *key* to *target*. The file type (library
+    or object) is given by the extension of *target*. Returns True if the
+    entry was found in the cache.
+    """
+    entry = cache_dir + '/' + key + os.path.splitext(target)[1]
+    if not os.path.isfile(entry):
+        return False
+
+    try:
+        shutil.copy(entry, target)
+    except OSError:
+        return False
+
+    # mark the entry as recently used
+    try:
+        os.utime(entry, None)
+    except OSError:
+        pass
+
+    if Global.config['verbose']:
+        Global._print('Found', os.path.basename(target), 'in cache:', entry)
+
+    return True
+
+def store(cache_dir, key, filename, max_size):
+    """
+    Adds the compiled library or object *filename* to the cache and removes the
+    least recently used entries if the cache exceeds *max_size* bytes.
+    """
+    if not os.path.isfile(filename):
+        return
+
+    entry = cache_dir + '/' + key + os.path.splitext(filename)[1]
+    if os.path.isfile(entry):
+        return
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # Several processes may write the same entry at once, so we
+        # copy into a temporary file first and rename it afterwards.
+        tmp_file = cache_dir + '/' + key + '.' + str(os.getpid()) + '.tmp'
+        shutil.copy(filename, tmp_file)
+        os.replace(tmp_file, entry)
+
+    except OSError as e:
+        Global._warning('Unable to store', os.path.basename(filename), 'in the compilation cache (' + str(e) + ')')
+        return
+
+    evict(cache_dir, max_size)
+
+def evict(cache_dir, max_size):
+    """
+    Removes the least recently used entries until the cache size is below *max_size* bytes.
+    The model descriptions stored in the subfolder *descriptions_folder* are taken into account.
+    """
+    entries = []
+    for folder, extensions in [(cache_dir, ('.so', '.o')), (cache_dir + '/' + descriptions_folder, ('.pkl',))]:
+        if not os.path.isdir(folder):
+            continue
+        for file in os.listdir(folder):
+            if not file.endswith(extensions):
+                continue
+            try:
+                stat = os.stat(folder + '/' + file)
+            except OSError: # removed in the meantime
+                continue
+            entries.append((stat.st_mtime, stat.st_size, folder + '/' + file))
+
+    total_size = sum([size for _, size, _ in entries])
+    for _, size, entry in sorted(entries):
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(entry)
+        except OSError:
+            pass
+        total_size -= size
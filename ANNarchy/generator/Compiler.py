@@ -36,6 +36,7 @@ import ANNarchy.core.Global as Global
 
 from ANNarchy.extensions.bold.NormProjection import _update_num_aff_connections
 from ANNarchy.generator.Template.MakefileTemplate import *
+from ANNarchy.generator import CompilationCache
 from ANNarchy.generator.CodeGenerator import CodeGenerator
 from ANNarchy.generator.Sanity import check_structure, check_experimental_features
 from ANNarchy.generator.Utils import check_cuda_version
@@ -209,6 +210,9 @@ def compile(
     # Clean
     clean = options.clean or clean # enforce rebuild
 
+    # A forced rebuild, debug or profile builds bypass the compilation cache
+    use_cache = Global.config['compilation_cache'] and not (clean or debug_build or profile_enabled)
+
     # Populations to compile
     if populations is None: # Default network
         populations = Global._network[net_id]['populations']
@@ -279,7 +283,8 @@ def compile(
         profile_enabled=profile_enabled,
         populations=populations,
         projections=projections,
-        net_id=net_id
+        net_id=net_id,
+        use_cache=use_cache
     )
 
     # Code Generation
@@ -298,6 +303,34 @@ def compile(
     if Global.config['verbose']:
         Global._print('OK')
 
+def load_user_config(path_to_json=""):
+    """
+    Returns the configuration stored in *path_to_json*, by default in
+    ~/.config/ANNarchy/annarchy.json. If the file does not exist, the
+    default compilers and flags are returned.
+    """
+    user_config = {
+        'openmp': {
+            'compiler': 'clang++' if sys.platform == "darwin" else 'g++',
+            'flags' : "-march=native -O2",
+        },
+        'cuda': {
+            'compiler': "nvcc",
+            'device': 0
+        }
+    }
+
+    if len(path_to_json) == 0:
+        # check homedirectory
+        if os.path.exists(os.path.expanduser('~/.config/ANNarchy/annarchy.json')):
+            with open(os.path.expanduser('~/.config/ANNarchy/annarchy.json'), 'r') as rfile:
+                user_config = json.load(rfile)
+    else:
+        with open(path_to_json, 'r') as rfile:
+            user_config = json.load(rfile)
+
+    return user_config
+
 def python_environment():
     """
     Python environment configuration, required by Compiler.generate_makefile. Contains among others the python version, library path and cython version.
@@ -368,7 +401,7 @@ class Compiler(object):
     " Main class to generate C++ code efficiently"
 
     def __init__(self, annarchy_dir, clean, compiler, compiler_flags, add_sources, extra_libs, path_to_json, silent, cuda_config, debug_build,
-                 profile_enabled, populations, projections, net_id):
+                 profile_enabled, populations, projections, net_id, use_cache=False):
 
         # Store arguments
         self.annarchy_dir = annarchy_dir
@@ -384,27 +417,10 @@ class Compiler(object):
         self.populations = populations
         self.projections = projections
         self.net_id = net_id
+        self.use_cache = use_cache
 
         # Get user-defined config
-        self.user_config = {
-            'openmp': {
-                'compiler': 'clang++' if sys.platform == "darwin" else 'g++',
-                'flags' : "-march=native -O2",
-            },
-            'cuda': {
-                'compiler': "nvcc",
-                'device': 0
-            }
-        }
-
-        if len(path_to_json) == 0:
-            # check homedirectory
-            if os.path.exists(os.path.expanduser('~/.config/ANNarchy/annarchy.json')):
-                with open(os.path.expanduser('~/.config/ANNarchy/annarchy.json'), 'r') as rfile:
-                    self.user_config = json.load(rfile)
-        else:
-            with open(path_to_json, 'r') as rfile:
-                self.user_config = json.load(rfile)
+        self.user_config = load_user_config(path_to_json)
 
         # Sanity check if the NVCC compiler is available
         if Global._check_paradigm("cuda"):
@@ -415,6 +431,10 @@ class Compiler(object):
 
             Global.config['cuda_version'] = check_cuda_version(self.user_config['cuda']['compiler'])
 
+        # Location and size limit of the compilation cache
+        if self.use_cache:
+            self.cache_dir, self.cache_size = CompilationCache.cache_settings(self.user_config)
+
     def generate(self):
         "Perform the code generation for the C++ code and create the Makefile."
         if Global._profiler or Global.config["show_time"]:
@@ -438,8 +458,29 @@ class Compiler(object):
         # Generate the Makefile
         self.generate_makefile()
 
+        # Look for an already compiled library in the global cache
+        library = self.annarchy_dir + '/ANNarchyCore' + str(self.net_id) + '.so'
+        cache_hit = False
+        if self.use_cache:
+            cache_key = CompilationCache.compute_key(
+                self.annarchy_dir + '/generate/net' + str(self.net_id),
+                self.compiler, self.compiler_flags, self.add_sources
+            )
+            cache_hit = CompilationCache.fetch(self.cache_dir, cache_key, library)
+        else:
+            cache_key = None
+
         # Copy the files if needed
-        changed = self.copy_files()
+        if not cache_hit:
+            changed = self.copy_files()
+        else:
+            # The build folder does not correspond to the library anymore,
+            # the next compilation needs to start from scratch.
+            shutil.rmtree(self.annarchy_dir + '/build/net' + str(self.net_id), True)
+            os.mkdir(self.annarchy_dir + '/build/net' + str(self.net_id))
+            with open(self.annarchy_dir + '/compilation', 'w') as wfile:
+                wfile.write("1")
+            changed = False
 
         # Code generation done
         if Global.config['verbose']:
@@ -450,9 +491,13 @@ class Compiler(object):
                 Global._print("OK (took "+str(t1-t0)+" seconds)", flush=True)
 
         # Perform compilation if something has changed
-        if changed or not os.path.isfile(self.annarchy_dir + '/ANNarchyCore' + str(self.net_id) + '.so'):
+        if changed or not os.path.isfile(library):
             self.compilation()
 
+        # Make the library available for other directories and runs
+        if cache_key is not None and not cache_hit:
+            CompilationCache.store(self.cache_dir, cache_key, library, self.cache_size)
+
         if Global.config["debug"] or Global.config["disable_shared_library_time_offset"]:
             # In case of debugging or high-throughput simulations we want to
             # disable the below trick
@@ -545,11 +590,15 @@ class Compiler(object):
         cwd = os.getcwd()
         os.chdir(self.annarchy_dir + '/build/net'+ str(self.net_id))
 
+        # Reuse the object files of unchanged translation units
+        if self.use_cache:
+            object_keys = self._fetch_objects()
+
         # Start the compilation
         verbose = "> compile_stdout.log 2> compile_stderr.log" if not Global.config["verbose"] else ""
 
-        # Start the compilation process
-        make_process = subprocess.Popen("make all -j4" + verbose, shell=True)
+        # Start the compilation process, one job per available core
+        make_process = subprocess.Popen("make all -j" + str(multiprocessing.cpu_count()) + verbose, shell=True)
 
         # Check for errors
         if make_process.wait() != 0:
@@ -567,6 +616,10 @@ class Compiler(object):
             with open(self.annarchy_dir + '/compilation', 'w') as wfile:
                 wfile.write("1")
 
+            if self.use_cache:
+                for obj, key in object_keys.items():
+                    CompilationCache.store(self.cache_dir, key, obj, self.cache_size)
+
         # Return to the current directory
         os.chdir(cwd)
 
@@ -581,6 +634,31 @@ class Compiler(object):
             if Global._profiler:
                 Global._profiler.add_entry(t0, t1, "compilation", "compile")
 
+    def _fetch_objects(self):
+        """
+        Copies the object files of translation units found in the compilation
+        cache into the build folder (the current directory). As the copies are
+        newer than their sources, make will not rebuild them.
+
+        Returns a dictionary of the object file names and their keys.
+        """
+        if Global._check_paradigm("cuda"):
+            objects = cuda_objects
+        else:
+            objects = omp_objects
+
+        object_keys = {}
+        for obj, source in objects.items():
+            obj = obj % {'net_id': self.net_id}
+            source = source % {'net_id': self.net_id}
+            if not os.path.isfile(source):
+                continue
+
+            object_keys[obj] = CompilationCache.compute_object_key('.', source)
+            CompilationCache.fetch(self.cache_dir, object_keys[obj], obj)
+
+        return object_keys
+
     def generate_makefile(self):
         """
         Generate the Makefile.
@@ -675,7 +753,7 @@ class Compiler(object):
         elif sys.platform == "darwin":   # mac os
             if self.compiler == 'clang++':
                 makefile_template = osx_clang_template
-                if Global.config['num_threads'] == 1: # clang should report that it does not support openmp
+                if Global._check_single_thread(): # clang should report that it does not support openmp
                     omp_flag = ""
             else:
                 makefile_template = osx_gcc_template
@@ -749,9 +827,10 @@ def load_cython_lib(libname, libpath):
 
     return module
 
-def _instantiate(net_id, import_id=-1, cuda_config=None, user_config=None, core_list=None):
+def _instantiate(net_id, import_id=-1, cuda_config=None, user_config=None, core_list=None, cython_module=None):
     """ After every is compiled, actually create the Cython objects and
-        bind them to the Python ones."""
+        bind them to the Python ones. An already loaded library can be
+        provided with *cython_module*."""
     if Global._profiler:
         t0 = time.time()
         Global._profiler.add_entry(t0, t0, "overall", "instantiate") # placeholder, to have the correct ordering
@@ -765,7 +844,8 @@ def _instantiate(net_id, import_id=-1, cuda_config=None, user_config=None, core_
     libname = 'ANNarchyCore' + str(import_id)
     libpath = annarchy_dir + '/' + libname + '.so'
 
-    cython_module = load_cython_lib(libname, libpath)
+    if cython_module is None:
+        cython_module = load_cython_lib(libname, libpath)
     Global._network[net_id]['instance'] = cython_module
 
     # Set the CUDA device
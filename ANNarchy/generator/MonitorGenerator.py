@@ -69,7 +69,17 @@ class MonitorGenerator(object):
         for proj in self._projections:
             record_class += self._proj_recorder_class(proj)
 
-        code = RecTemplate.record_base_class % {'record_classes': record_class}
+        # The streaming of recorded data to disk is only available for
+        # the CPU paradigm (background writer thread)
+        if Global.config['paradigm'] == "openmp":
+            include_additional = '#include "RecordingStream.hpp"'
+        else:
+            include_additional = ""
+
+        code = RecTemplate.record_base_class % {
+            'include_additional': include_additional,
+            'record_classes': record_class
+        }
 
         # The approach for default populations/projections is not
         # feasible for specific monitors, so we handle them extra
@@ -112,6 +122,7 @@ class MonitorGenerator(object):
         init_code = ""
         recording_code = ""
         recording_target_code = ""
+        reserve_code = ""
         struct_code = ""
         determine_size = ""
         clear_code = ""
@@ -140,12 +151,18 @@ class MonitorGenerator(object):
                 struct_code += template['local']['struct'] % tar_dict
                 init_code += template['local']['init'] % tar_dict
                 recording_target_code += template['local']['recording'] % tar_dict
+                clear_code += template['local']['clear'] % tar_dict
+                if 'reserve' in template['local']:
+                    reserve_code += template['local']['reserve'] % tar_dict
         else:
             for target in targets:
                 tar_dict = {'id': pop.id, 'type' : Global.config['precision'], 'name': 'g_'+target}
                 struct_code += template['local']['struct'] % tar_dict
                 init_code += template['local']['init'] % tar_dict
                 recording_target_code += template['local']['recording'] % tar_dict
+                clear_code += template['local']['clear'] % tar_dict
+                if 'reserve' in template['local']:
+                    reserve_code += template['local']['reserve'] % tar_dict
 
                 # to skip this entry in the following loop
                 target_list.append('g_'+target)
@@ -171,6 +188,8 @@ class MonitorGenerator(object):
             init_code += template[var['locality']]['init'] % ids
             recording_code += template[var['locality']]['recording'] % ids
             clear_code += template[var['locality']]['clear'] % ids
+            if 'reserve' in template[var['locality']]:
+                reserve_code += template[var['locality']]['reserve'] % ids
 
             # Memory management
             if var['locality'] == "global":
@@ -186,10 +205,7 @@ size_in_bytes += sizeof(%(type)s) * %(name)s.capacity();
             else:
                 determine_size += """
 // local variable %(name)s
-size_in_bytes += sizeof(std::vector<%(type)s>) * %(name)s.capacity();
-for(auto it=%(name)s.begin(); it!= %(name)s.end(); it++) {
-    size_in_bytes += it->capacity() * sizeof(%(type)s);
-}
+size_in_bytes += sizeof(%(type)s) * %(name)s.capacity();
 """ % ids
 
         # Record spike events
@@ -202,8 +218,10 @@ for(auto it=%(name)s.begin(); it!= %(name)s.end(); it++) {
                 'rec_target': 'spiked'
             }
 
-            struct_code += base_tpl['struct'] % rec_dict
+            struct_code += base_tpl['struct'][Global.config['paradigm']] % rec_dict
             init_code += base_tpl['init'] % rec_dict
+            if Global._check_paradigm("openmp"):
+                init_code += base_tpl['init_events'] % rec_dict
             recording_code += base_tpl['record'][Global.config['paradigm']] % rec_dict
             determine_size += base_tpl['size_in_bytes'][Global.config['paradigm']] % rec_dict
             clear_code += base_tpl['clear'][Global.config['paradigm']] % rec_dict
@@ -217,8 +235,10 @@ for(auto it=%(name)s.begin(); it!= %(name)s.end(); it++) {
                     'rec_target': 'axonal'
                 }
 
-                struct_code += base_tpl['struct'] % rec_dict
+                struct_code += base_tpl['struct'][Global.config['paradigm']] % rec_dict
                 init_code += base_tpl['init'] % rec_dict
+                if Global._check_paradigm("openmp"):
+                    init_code += base_tpl['init_events'] % rec_dict
                 recording_code += base_tpl['record'][Global.config['paradigm']] % rec_dict
 
         ids = {
@@ -227,6 +247,7 @@ for(auto it=%(name)s.begin(); it!= %(name)s.end(); it++) {
             'struct_code': struct_code,
             'recording_code': recording_code,
             'recording_target_code': recording_target_code,
+            'reserve_code': reserve_code,
             'determine_size': tabify(determine_size, 2),
             'clear_monitor_code': clear_code
         }
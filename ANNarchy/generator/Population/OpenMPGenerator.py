@@ -76,7 +76,7 @@ class OpenMPGenerator(PopulationGenerator):
         init_parameters_variables = self._init_population(pop)
 
         # Spike-specific stuff
-        reset_spike = ""; declare_spike = ""; init_spike = ""
+        reset_spike = ""; declare_spike = ""; init_spike = ""; update_num_threads = ""
         if pop.neuron_type.description['type'] == 'spike':
             spike_specific_tpl = self._templates['spike_specific']
 
@@ -84,6 +84,7 @@ class OpenMPGenerator(PopulationGenerator):
             declare_spike += spike_specific_tpl['spike']['declare'] % {'id': pop.id}
             init_spike += spike_specific_tpl['spike']['init'] % {'id': pop.id}
             reset_spike += spike_specific_tpl['spike']['reset'] % {'id': pop.id}
+            update_num_threads += spike_specific_tpl['spike']['update_num_threads'] % {'id': pop.id}
 
             # If there is a refractory period
             if pop.neuron_type.refractory or pop.refractory:
@@ -151,6 +152,7 @@ class OpenMPGenerator(PopulationGenerator):
             extern_global_operations = pop._specific_template['extern_global_operations']
         if 'declare_spike_arrays' in pop._specific_template.keys():
             declare_spike = pop._specific_template['declare_spike_arrays']
+            update_num_threads = ""
         if 'declare_parameters_variables' in pop._specific_template.keys():
             declaration_parameters_variables = pop._specific_template['declare_parameters_variables']
         if 'declare_additional' in pop._specific_template.keys():
@@ -226,6 +228,7 @@ class OpenMPGenerator(PopulationGenerator):
             'update_rng': update_rng,
             'update_delay': update_delay,
             'update_max_delay': update_max_delay,
+            'update_num_threads': update_num_threads,
             'update_global_ops': update_global_ops,
             'stop_condition': stop_condition,
             'determine_size': determine_size_in_bytes,
@@ -268,6 +271,9 @@ class OpenMPGenerator(PopulationGenerator):
         if len(pop.global_operations) > 0:
             pop_desc['gops_update'] = """\tpop%(id)s.update_global_ops(tid, nt);\n""" % {'id': pop.id}
 
+        if update_num_threads != "":
+            pop_desc['update_num_threads'] = """    pop%(id)s.update_num_threads(threads);\n""" % {'id': pop.id}
+
         return pop_desc
 
     def _clear_container(self, pop):
@@ -365,15 +371,15 @@ _spike_history.shrink_to_fit();
 
                 if attr['locality'] == "local":
                     declare_code += """
-    std::deque< std::vector< %(type)s > > _delayed_%(name)s; """ % attr_dict
+    RingBuffer< std::vector< %(type)s > > _delayed_%(name)s; """ % attr_dict
                 else:
                     declare_code += """
-    std::deque< %(type)s > _delayed_%(name)s; """ % attr_dict
+    RingBuffer< %(type)s > _delayed_%(name)s; """ % attr_dict
         else:
             # Spiking networks should only exchange spikes
             declare_code += """
     // Delays for spike population
-    std::deque< std::vector<int> > _delayed_spike;
+    RingBuffer< std::vector<int> > _delayed_spike;
 """
             for var in pop.delayed_variables:
                 attr = self._get_attr(pop, var)
@@ -381,10 +387,10 @@ _spike_history.shrink_to_fit();
 
                 if attr['locality'] == "local":
                     declare_code += """
-    std::deque< std::vector< %(type)s > > _delayed_%(name)s; """ % attr_dict
+    RingBuffer< std::vector< %(type)s > > _delayed_%(name)s; """ % attr_dict
                 else:
                     declare_code += """
-    std::deque< %(type)s > _delayed_%(name)s; """ % attr_dict
+    RingBuffer< %(type)s > _delayed_%(name)s; """ % attr_dict
 
         # Initialization
         init_code = """
@@ -407,18 +413,16 @@ _spike_history.shrink_to_fit();
         # Delaying spike events is done differently
         if pop.neuron_type.type == 'spike':
             init_code += """
-        _delayed_spike = std::deque< std::vector<int> >(max_delay, std::vector<int>());"""
+        _delayed_spike = RingBuffer< std::vector<int> >(max_delay, std::vector<int>());"""
 
             update_code += """
             #pragma omp single
             {
                 _delayed_spike.push_front(spiked);
-                _delayed_spike.pop_back();
             }
 """
             reset_code += """
-        _delayed_spike.clear();
-        _delayed_spike = std::deque< std::vector<int> >(max_delay, std::vector<int>());"""
+        _delayed_spike.fill(std::vector<int>());"""
 
             resize_code += """
         _delayed_spike.resize(max_delay, std::vector<int>());
@@ -119,6 +119,11 @@ struct PopStruct%(id)s{
 %(update_max_delay)s
     }
 
+    // Method to resize the thread-local data when the number of threads changes
+    void update_num_threads(const int nt) {
+%(update_num_threads)s
+    }
+
     // Main method to update neural variables
     void update(int tid) {
     #ifdef _TRACE_SIMULATION_STEPS
@@ -219,6 +224,12 @@ attribute_acc = {
             %(name)s[rk] = value;
             return;
         }
+""",
+    'local_get_ptr': """
+        // Local %(attr_type)s %(name)s
+        if ( name.compare("%(name)s") == 0 ) {
+            return %(name)s.data();
+        }
 """,
     'global_get': """
         // Global %(attr_type)s %(name)s
@@ -277,6 +288,17 @@ attribute_template = {
         // should not happen
         std::cerr << "PopStruct%(id)s::set_local_attribute_%(ctype_name)s: " << name << " not found" << std::endl;
     }
+""",
+    # Pointer to the first element of a local attribute, used for the zero-copy views
+    # provided by Population.view(). Not available for bool as std::vector<bool> is packed.
+    'local_ptr': """
+    %(ctype)s* get_local_attribute_ptr_%(ctype_name)s(std::string name) {
+%(local_get_ptr)s
+
+        // should not happen
+        std::cerr << "PopStruct%(id)s::get_local_attribute_ptr_%(ctype_name)s: " << name << " not found" << std::endl;
+        return nullptr;
+    }
 """,
     'global': """
     %(ctype)s get_global_attribute_%(ctype_name)s(std::string name) {
@@ -317,19 +339,16 @@ attribute_cpp_init = {
 attribute_delayed = {
     'local': {
         'init': """
-        _delayed_%(name)s = std::deque< std::vector< %(type)s > >(max_delay, std::vector< %(type)s >(size, 0.0));""",
+        _delayed_%(name)s = RingBuffer< std::vector< %(type)s > >(max_delay, std::vector< %(type)s >(size, 0.0));""",
 
         'update': """
         #pragma omp single
         {
             _delayed_%(name)s.push_front(%(name)s);
-            _delayed_%(name)s.pop_back();
         }
 """,
         'reset' : """
-        for ( int i = 0; i < _delayed_%(name)s.size(); i++ ) {
-            _delayed_%(name)s[i] = %(name)s;
-        }
+        _delayed_%(name)s.fill(%(name)s);
 """,
         'resize' : """
     _delayed_%(name)s.resize(max_delay, std::vector< %(type)s >(size, 0.0));
@@ -337,18 +356,15 @@ attribute_delayed = {
     },
     'global':{
         'init': """
-        _delayed_%(name)s = std::deque< %(type)s >(max_delay, 0.0);""",
+        _delayed_%(name)s = RingBuffer< %(type)s >(max_delay, 0.0);""",
         'update': """
         #pragma omp single
         {
             _delayed_%(name)s.push_front(%(name)s);
-            _delayed_%(name)s.pop_back();
         }
 """,
         'reset' : """
-        for ( int i = 0; i < _delayed_%(name)s.size(); i++ ) {
-            _delayed_%(name)s[i] = %(name)s;
-        }
+        _delayed_%(name)s.fill(%(name)s);
 """,
         'resize' : """
     _delayed_%(name)s.resize(max_delay, 0.0);
@@ -424,6 +440,9 @@ spike_specific = {
         spiked = std::vector<int>();
         local_spiked_sizes = std::vector<int>(global_num_threads+1, 0);
         last_spike = std::vector<long int>(size, -10000L);
+""",
+        'update_num_threads': """
+        local_spiked_sizes = std::vector<int>(nt+1, 0);
 """,
         'reset': """
         spiked.clear();
@@ -22,7 +22,7 @@
 #
 #===============================================================================
 from ANNarchy.core import Global
-from ANNarchy.generator.Utils import tabify
+from ANNarchy.generator.Utils import tabify, zero_copy_view_available
 
 class PopulationGenerator(object):
     """
@@ -475,6 +475,7 @@ cudaMalloc((void**)&_gpu_%(op)s_%(var)s, sizeof(%(type)s));
         for ctype in code_ids_per_type.keys():
             local_attribute_get1 = ""
             local_attribute_get2 = ""
+            local_attribute_get_ptr = ""
             local_attribute_set1 = ""
             local_attribute_set2 = ""
             global_attribute_get = ""
@@ -486,6 +487,8 @@ cudaMalloc((void**)&_gpu_%(op)s_%(var)s, sizeof(%(type)s));
                 if locality == "local":
                     local_attribute_get1 += self._templates["attr_acc"]["local_get_all"] % ids
                     local_attribute_get2 += self._templates["attr_acc"]["local_get_single"] % ids
+                    if "local_get_ptr" in self._templates["attr_acc"].keys():
+                        local_attribute_get_ptr += self._templates["attr_acc"]["local_get_ptr"] % ids
 
                     local_attribute_set1 += self._templates["attr_acc"]["local_set_all"] % ids
                     local_attribute_set2 += self._templates["attr_acc"]["local_set_single"] % ids
@@ -514,6 +517,15 @@ cudaMalloc((void**)&_gpu_%(op)s_%(var)s, sizeof(%(type)s));
                     'ctype_name': ctype.replace(" ", "_")
                 }
 
+            # Zero-copy access, std::vector<bool> provides no data()
+            if local_attribute_get_ptr != "" and ctype != "bool" and zero_copy_view_available(pop):
+                accessors += self._templates["accessor_template"]["local_ptr"] % {
+                    'local_get_ptr' : local_attribute_get_ptr,
+                    'id': pop.id,
+                    'ctype': ctype,
+                    'ctype_name': ctype.replace(" ", "_")
+                }
+
             if global_attribute_get != "":
                 accessors += self._templates["accessor_template"]["global"] % {
                     'global_get' : global_attribute_get,
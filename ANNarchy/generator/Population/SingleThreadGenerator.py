@@ -356,15 +356,15 @@ _spike_history.shrink_to_fit();
 
                 if attr['locality'] == "local":
                     declare_code += """
-    std::deque< std::vector< %(type)s > > _delayed_%(name)s; """ % attr_dict
+    RingBuffer< std::vector< %(type)s > > _delayed_%(name)s; """ % attr_dict
                 else:
                     declare_code += """
-    std::deque< %(type)s > _delayed_%(name)s; """ % attr_dict
+    RingBuffer< %(type)s > _delayed_%(name)s; """ % attr_dict
         else:
             # Spiking networks should only exchange spikes
             declare_code += """
     // Delays for spike population
-    std::deque< std::vector<int> > _delayed_spike;
+    RingBuffer< std::vector<int> > _delayed_spike;
 """
             for var in pop.delayed_variables:
                 attr = self._get_attr(pop, var)
@@ -372,10 +372,10 @@ _spike_history.shrink_to_fit();
 
                 if attr['locality'] == "local":
                     declare_code += """
-    std::deque< std::vector< %(type)s > > _delayed_%(name)s; """ % attr_dict
+    RingBuffer< std::vector< %(type)s > > _delayed_%(name)s; """ % attr_dict
                 else:
                     declare_code += """
-    std::deque< %(type)s > _delayed_%(name)s; """ % attr_dict
+    RingBuffer< %(type)s > _delayed_%(name)s; """ % attr_dict
 
         # Initialization
         init_code = """
@@ -398,15 +398,13 @@ _spike_history.shrink_to_fit();
         # Delaying spike events is done differently
         if pop.neuron_type.type == 'spike':
             init_code += """
-        _delayed_spike = std::deque< std::vector<int> >(max_delay, std::vector<int>());"""
+        _delayed_spike = RingBuffer< std::vector<int> >(max_delay, std::vector<int>());"""
 
             update_code += """
             _delayed_spike.push_front(spiked);
-            _delayed_spike.pop_back();
 """
             reset_code += """
-        _delayed_spike.clear();
-        _delayed_spike = std::deque< std::vector<int> >(max_delay, std::vector<int>());"""
+        _delayed_spike.fill(std::vector<int>());"""
 
             resize_code += """
         _delayed_spike.resize(max_delay, std::vector<int>());
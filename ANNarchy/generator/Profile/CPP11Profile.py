@@ -47,7 +47,7 @@ class CPP11Profile(ProfileGenerator):
         """
         Creates a dictionary, contain profile code snippets.
         """
-        if Global.config["num_threads"] == 1:
+        if Global._check_single_thread():
             body_dict = {
                 'prof_include': cpp11_profile_template['include'],
                 'prof_step_pre': cpp11_profile_template['step_pre'],
@@ -95,7 +95,7 @@ class CPP11Profile(ProfileGenerator):
         return body_dict
 
     def generate_init_network(self):
-        if Global.config["num_threads"] == 1:
+        if Global._check_single_thread():
             return cpp11_profile_template['init']
         else:
             return cpp11_omp_profile_template['init']
@@ -142,13 +142,41 @@ class CPP11Profile(ProfileGenerator):
         measure_pe = Profiling::get_instance()->register_function("proj", "%(name)s", %(id_proj)s, "post_event", "%(label)s");
 """ % {'id_proj': proj.id, 'name': proj.name, 'label': proj.pre.name+'_'+proj.post.name+'_'+target}
 
+        # The time each thread spends in the transmission reveals the load imbalance across partitions
+        if not Global._check_single_thread():
+            declare += """    std::vector<Measurement*> measure_psp_thread;
+"""
+            init += """        for (int t = 0; t < global_num_threads; t++)
+            measure_psp_thread.push_back(Profiling::get_instance()->register_function("proj", "%(name)s", %(id_proj)s, "psp_thread"+std::to_string(t), "%(label)s"));
+""" % {'id_proj': proj.id, 'name': proj.name, 'label': proj.pre.name+'_'+proj.post.name+'_'+target}
+
         return declare, init
 
+    def generate_update_num_threads_projection(self, proj):
+        """
+        Generate the code registering the measurements of additional threads,
+        if the number of threads is increased after the initialization
+        """
+        if Global._check_single_thread():
+            return ""
+
+        if isinstance(proj.target, str):
+            target = proj.target
+        else:
+            target = proj.target[0]
+            for tar in proj.target[1:]:
+                target += "_"+tar
+
+        return """        // Profiling (the measurements are registered in init_projection())
+        for (int t = static_cast<int>(measure_psp_thread.size()); !measure_psp_thread.empty() && t < nt; t++)
+            measure_psp_thread.push_back(Profiling::get_instance()->register_function("proj", "%(name)s", %(id_proj)s, "psp_thread"+std::to_string(t), "%(label)s"));
+""" % {'id_proj': proj.id, 'name': proj.name, 'label': proj.pre.name+'_'+proj.post.name+'_'+target}
+
     def annotate_computesum_rate(self, proj, code):
         """
         annotate the computesum compuation code
         """
-        if Global.config["num_threads"] == 1:
+        if Global._check_single_thread():
             prof_begin = cpp11_profile_template['compute_psp']['before']
             prof_end = cpp11_profile_template['compute_psp']['after']
         else:
@@ -172,7 +200,7 @@ class CPP11Profile(ProfileGenerator):
         """
         annotate the computesum compuation code
         """
-        if Global.config["num_threads"] == 1:
+        if Global._check_single_thread():
             prof_begin = cpp11_profile_template['compute_psp']['before'] % {'name': 'proj'+str(proj.id)}
             prof_end = cpp11_profile_template['compute_psp']['after'] % {'name': 'proj'+str(proj.id)}
         else:
@@ -194,7 +222,7 @@ class CPP11Profile(ProfileGenerator):
         """
         annotate the update synapse code, generated by ProjectionGenerator.update_synapse()
         """
-        if Global.config["num_threads"] == 1:        
+        if Global._check_single_thread():        
             prof_begin = cpp11_profile_template['update_synapse']['before']
             prof_end = cpp11_profile_template['update_synapse']['after']
         else:
@@ -217,7 +245,7 @@ class CPP11Profile(ProfileGenerator):
         """
         annotate the post-event code
         """
-        if Global.config["num_threads"] == 1:
+        if Global._check_single_thread():
             prof_begin = cpp11_profile_template['post_event']['before']
             prof_end = cpp11_profile_template['post_event']['after']
         else:
@@ -241,7 +269,7 @@ class CPP11Profile(ProfileGenerator):
         """
         annotate the update neuron code
         """
-        if Global.config["num_threads"] == 1:        
+        if Global._check_single_thread():        
             prof_begin = cpp11_profile_template['update_neuron']['before'] % {'name': pop.name}
             prof_end = cpp11_profile_template['update_neuron']['after'] % {'name': pop.name}
         else:
@@ -263,7 +291,7 @@ class CPP11Profile(ProfileGenerator):
         """
         annotate the spike condition code
         """
-        if Global.config["num_threads"] == 1:
+        if Global._check_single_thread():
             prof_begin = cpp11_profile_template['spike_gather']['before'] % {'name': pop.name}
             prof_end = cpp11_profile_template['spike_gather']['after'] % {'name': pop.name}
         else:
@@ -287,7 +315,7 @@ class CPP11Profile(ProfileGenerator):
         """
         annotate update rng kernel (only for CPUs available)
         """
-        if Global.config["num_threads"] == 1:
+        if Global._check_single_thread():
             prof_begin = cpp11_profile_template['update_rng']['before'] % {'name': pop.name}
             prof_end = cpp11_profile_template['update_rng']['after'] % {'name': pop.name}
         else:
@@ -310,7 +338,7 @@ class CPP11Profile(ProfileGenerator):
         """
         annotate update delay kernel (only for CPUs available)
         """
-        if Global.config["num_threads"] == 1:
+        if Global._check_single_thread():
             prof_begin = cpp11_profile_template['update_delay']['before'] % {'name': pop.name}
             prof_end = cpp11_profile_template['update_delay']['after'] % {'name': pop.name}
         else:
@@ -80,6 +80,10 @@ class ProfileGenerator(object):
         "Implemented by child class"
         raise NotImplementedError
 
+    def generate_update_num_threads_projection(self, proj):
+        "Implemented by child class if measurements are stored per thread"
+        return ""
+
     def annotate_computesum_rate(self, proj, code):
         "Implemented by child class"
         raise NotImplementedError
@@ -226,6 +226,29 @@ public:
         return dataset->_std;
     }
 
+    /**
+     *  @brief      Ratio between the slowest and the average thread for a function.
+     *  @details    The per-thread timings are registered as (obj, func_thread<tid>). For partitioned
+     *              connectivity each thread processes one partition, so a value of 1.0 means the
+     *              partitions are perfectly balanced. Returns 1.0 if no per-thread timings are available.
+     */
+    double get_load_imbalance(std::string obj, std::string func) {
+        double max_time = 0.0;
+        double sum_time = 0.0;
+        int num_threads = 0;
+
+        for (auto dataset = get_measurement(obj, func+"_thread0"); dataset != nullptr; dataset = get_measurement(obj, func+"_thread"+std::to_string(num_threads))) {
+            max_time = std::max(max_time, dataset->_mean);
+            sum_time += dataset->_mean;
+            num_threads++;
+        }
+
+        if (num_threads == 0 || sum_time <= 0.0)
+            return 1.0;
+
+        return max_time / (sum_time / static_cast<double>(num_threads));
+    }
+
     friend std::ostream& operator << (std::ostream& stream, const Profiling& profiling);
 };
 
@@ -710,8 +733,8 @@ std::unique_ptr<Profiling> Profiling::_instance(nullptr);
     #
     # Execute the profile in each Object (i. e. populations, projections)
     'compute_psp': {
-        'before' : "#pragma omp barrier\n#pragma omp master\nmeasure_psp->start_wall_time();",
-        'after' : "#pragma omp barrier\n#pragma omp master\nmeasure_psp->stop_wall_time();"
+        'before' : "#pragma omp barrier\n#pragma omp master\nmeasure_psp->start_wall_time();\nmeasure_psp_thread[tid]->start_wall_time();",
+        'after' : "measure_psp_thread[tid]->stop_wall_time();\n#pragma omp barrier\n#pragma omp master\nmeasure_psp->stop_wall_time();"
     },
     'update_synapse': {
         'before' : "#pragma omp barrier\n#pragma omp master\nmeasure_step->start_wall_time();",
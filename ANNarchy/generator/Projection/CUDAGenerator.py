@@ -112,7 +112,7 @@ class CUDAGenerator(ProjectionGenerator):
                 'idx_type': determine_idx_type_for_projection(proj)[0]
             }
             declare_connectivity_matrix = ""
-            access_connectivity_matrix = ""
+            access_connectivity_matrix = self._templates['flat_connectivity']
         else:
             sparse_matrix_format = "SpecificConnectivity"
             sparse_matrix_args = ""
@@ -99,6 +99,11 @@ struct ProjStruct%(id_proj)s : %(sparse_format)s {
 %(update_max_delay)s
     }
 
+    // Resizes the thread-local data when the number of threads changes
+    void update_num_threads(const int nt) {
+%(update_num_threads)s
+    }
+
     // Computes the weighted sum of inputs or updates the conductances
     void compute_psp(const int tid, const int nt) {
     #ifdef _TRACE_SIMULATION_STEPS
@@ -208,6 +213,52 @@ attribute_template = {
     void set_local_attribute_%(ctype_name)s(std::string name, int rk_post, int rk_pre, %(ctype)s value) {
 %(local_set3)s
     }
+
+    void get_local_attribute_flat_%(ctype_name)s(std::string name, %(ctype)s* value) {
+    #ifdef _DEBUG
+        std::cout << "ProjStruct%(id_proj)s::get_local_attribute_flat_%(ctype_name)s(name = "<<name<<")" << std::endl;
+    #endif
+%(local_get_flat)s
+
+        // should not happen
+        std::cerr << "ProjStruct%(id_proj)s::get_local_attribute_flat_%(ctype_name)s: " << name << " not found" << std::endl;
+    }
+
+    void set_local_attribute_all_flat_%(ctype_name)s(std::string name, const %(ctype)s* value, std::size_t size) {
+    #ifdef _DEBUG
+        std::cout << "ProjStruct%(id_proj)s::set_local_attribute_all_flat_%(ctype_name)s(name = "<<name<<", size = "<<size<<")" << std::endl;
+    #endif
+        // Position of each dendrite in the flat array
+        int nb_dendrites = get_post_rank().size();
+        std::vector<std::size_t> offsets(nb_dendrites+1, 0);
+        for (int idx = 0; idx < nb_dendrites; idx++)
+            offsets[idx+1] = offsets[idx] + dendrite_size(idx);
+
+        if (offsets[nb_dendrites] != size) {
+            std::cerr << "ProjStruct%(id_proj)s::set_local_attribute_all_flat_%(ctype_name)s: expected " << offsets[nb_dendrites] << " values, got " << size << std::endl;
+            return;
+        }
+%(local_set_flat)s
+    }
+
+    void set_local_attribute_all_value_%(ctype_name)s(std::string name, %(ctype)s value) {
+    #ifdef _DEBUG
+        std::cout << "ProjStruct%(id_proj)s::set_local_attribute_all_value_%(ctype_name)s(name = "<<name<<")" << std::endl;
+    #endif
+        int nb_dendrites = get_post_rank().size();
+%(local_set_value)s
+    }
+""",
+    # Pointer to the first element of a local attribute, only generated if the
+    # variable is stored in one contiguous array (see Projection.view()).
+    "local_ptr": """
+    %(ctype)s* get_local_attribute_ptr_%(ctype_name)s(std::string name) {
+%(local_get_ptr)s
+
+        // should not happen
+        std::cerr << "ProjStruct%(id_proj)s::get_local_attribute_ptr_%(ctype_name)s: " << name << " not found" << std::endl;
+        return nullptr;
+    }
 """,
     "semiglobal": """
     std::vector<%(ctype)s> get_semiglobal_attribute_all_%(ctype_name)s(std::string name) {
@@ -273,6 +324,26 @@ attribute_acc = {
             %(read_dirty_flag)s
             return get_matrix_variable<%(type)s>(%(name)s, rk_post, rk_pre);
         }
+""",
+    'local_get_flat': """
+        // Local %(attr_type)s %(name)s
+        if ( name.compare("%(name)s") == 0 ) {
+            %(read_dirty_flag)s
+            std::size_t offset = 0;
+            int nb_dendrites = get_post_rank().size();
+            for (int idx = 0; idx < nb_dendrites; idx++) {
+                auto row = get_matrix_variable_row<%(type)s>(%(name)s, idx);
+                std::copy(row.begin(), row.end(), value + offset);
+                offset += row.size();
+            }
+            return;
+        }
+""",
+    'local_get_ptr': """
+        // Local %(attr_type)s %(name)s
+        if ( name.compare("%(name)s") == 0 ) {
+            return %(name)s.data();
+        }
 """,
     'local_set_all': """
         // Local %(attr_type)s %(name)s
@@ -297,6 +368,30 @@ attribute_acc = {
             %(write_dirty_flag)s
             return;
         }
+""",
+    'local_set_flat': """
+        // Local %(attr_type)s %(name)s
+        if ( name.compare("%(name)s") == 0 ) {
+            // std::vector<bool> packs the rows of flat containers into shared words
+            #pragma omp parallel for num_threads(global_num_threads) schedule(dynamic, 64) if(!std::is_same<%(type)s, bool>::value)
+            for (int idx = 0; idx < nb_dendrites; idx++) {
+                update_matrix_variable_row<%(type)s>(%(name)s, idx, std::vector<%(type)s>(value+offsets[idx], value+offsets[idx+1]));
+            }
+            %(write_dirty_flag)s
+            return;
+        }
+""",
+    'local_set_value': """
+        // Local %(attr_type)s %(name)s
+        if ( name.compare("%(name)s") == 0 ) {
+            // std::vector<bool> packs the rows of flat containers into shared words
+            #pragma omp parallel for num_threads(global_num_threads) schedule(dynamic, 64) if(!std::is_same<%(type)s, bool>::value)
+            for (int idx = 0; idx < nb_dendrites; idx++) {
+                update_matrix_variable_row<%(type)s>(%(name)s, idx, std::vector<%(type)s>(dendrite_size(idx), value));
+            }
+            %(write_dirty_flag)s
+            return;
+        }
 """,
     #
     # Semiglobal attributes
@@ -482,9 +577,33 @@ if(_transmission && _update && pop%(id_post)s._active && ( (t - _update_offset)%
 """
 }
 
+# Flat (CSR-like) export of the connectivity into preallocated arrays. The
+# synapses are ordered by dendrite, i. e. in the order of post_rank.
+flat_connectivity = """
+    // Begin of each dendrite in the flat arrays (nb_dendrites+1 elements)
+    void get_dendrite_offsets(long long* offsets) {
+        int nb_dendrites = get_post_rank().size();
+        offsets[0] = 0;
+        for (int idx = 0; idx < nb_dendrites; idx++)
+            offsets[idx+1] = offsets[idx] + dendrite_size(idx);
+    }
+
+    // Pre-synaptic ranks of all synapses (nb_synapses elements)
+    void get_pre_rank_flat(int* pre_ranks) {
+        std::size_t offset = 0;
+        int nb_dendrites = get_post_rank().size();
+        for (int idx = 0; idx < nb_dendrites; idx++) {
+            auto row = get_dendrite_pre_rank(idx);
+            std::copy(row.begin(), row.end(), pre_ranks + offset);
+            offset += row.size();
+        }
+    }
+"""
+
 openmp_templates = {
     'projection_header': projection_header,
     'attr_acc': attribute_acc,
     'accessor_template': attribute_template,
+    'flat_connectivity': flat_connectivity,
     'rng': cpp_11_rng
 }
@@ -253,6 +253,50 @@ if (_transmission && %(post_prefix)s_active) {
 } // active
 """
 
+spiking_summation_fixed_delay_thread_local = """// Event-based summation
+if (_transmission && %(post_prefix)s_active) {
+#ifdef _DEBUG
+    // one buffer per thread, see update_num_threads()
+    assert( (static_cast<int>(_thread_acc_.size()) >= nt) );
+#endif
+    // Thread-local accumulation buffer
+    %(float_prec)s* _acc_g = _thread_acc_[tid].data();
+
+    // Iterate over all spiking neurons
+    for (int _idx = tid; _idx < %(pre_array)s.size(); _idx += nt) {
+        // Rank of the presynaptic neuron
+        int _pre = %(pre_array)s[_idx];
+
+        // slice in CSRC
+        int beg = row_ptr_[_pre];
+        int end = row_ptr_[_pre+1];
+
+        // Iterate over connected post neurons
+        for (int syn = beg; syn < end; syn++) {
+            // Event-driven integration
+            %(event_driven)s
+            // Update conductance
+            %(g_target)s
+            // Synaptic plasticity: pre-events
+            %(pre_event)s
+        }
+    }
+    #pragma omp barrier
+
+    // Reduce the thread-local buffers
+    int _acc_size = static_cast<int>(_thread_acc_[tid].size());
+    #pragma omp for
+    for (int i = 0; i < _acc_size; i++) {
+        %(float_prec)s _sum = 0.0;
+        for (int th = 0; th < nt; th++) {
+            _sum += _thread_acc_[th][i];
+            _thread_acc_[th][i] = 0.0;
+        }
+        %(post_prefix)sg_%(target)s[i] += _sum;
+    }
+} // active
+"""
+
 spiking_post_event =  """
 if(_transmission && %(post_prefix)s_active){
     #pragma omp for
@@ -282,7 +326,8 @@ conn_templates = {
     'rate_coded_sum': csr_summation_operation,
     'spiking_sum_fixed_delay': {
         'inner_loop': spiking_summation_fixed_delay_inner_loop,
-        'outer_loop': spiking_summation_fixed_delay_outer_loop
+        'outer_loop': spiking_summation_fixed_delay_outer_loop,
+        'thread_local': spiking_summation_fixed_delay_thread_local
     },
     'spiking_sum_variable_delay': None,
     'update_variables': update_variables,
@@ -38,6 +38,7 @@ from ANNarchy.generator.Projection.SingleThread import LIL_SingleThread
 from ANNarchy.generator.Utils import generate_equation_code, tabify, remove_trailing_spaces, check_avx_instructions, determine_idx_type_for_projection
 
 import re
+import multiprocessing
 from copy import deepcopy
 
 class OpenMPGenerator(ProjectionGenerator):
@@ -70,10 +71,15 @@ class OpenMPGenerator(ProjectionGenerator):
 
         # Select the C++ connectivity template
         sparse_matrix_include, sparse_matrix_format, sparse_matrix_args, single_matrix = self._select_sparse_matrix_format(proj)
+        proj._partitioned_matrix = not single_matrix
 
         # Update template fill elements
         self._configure_template_ids(proj, single_matrix)
 
+        # Parallelization of the spike transmission, if not set by the user
+        if proj._parallel_pattern is None:
+            proj._parallel_pattern = self._select_spike_transmission(proj, single_matrix)
+
         # Generate declarations and accessors for the variables
         decl, accessor = self._declaration_accessors(proj, single_matrix)
 
@@ -110,7 +116,7 @@ class OpenMPGenerator(ProjectionGenerator):
             reset_ring_buffer = ""
 
         # Some Connectivity implementations requires the number of threads in constructor
-        if Global.config['num_threads'] > 1:
+        if not Global._check_single_thread():
             if proj._storage_format == "lil":
                 if single_matrix or proj._no_split_matrix:
                     num_threads_acc = ""
@@ -139,7 +145,7 @@ class OpenMPGenerator(ProjectionGenerator):
                 'idx_type': self._template_ids['idx_type']
             }
             declare_connectivity_matrix = ""
-            access_connectivity_matrix = ""
+            access_connectivity_matrix = self._templates['flat_connectivity']
         else:
             sparse_matrix_format = "SpecificConnectivity"
             sparse_matrix_args = ""
@@ -180,16 +186,32 @@ class OpenMPGenerator(ProjectionGenerator):
         # HD (20th May 2022): this is probably not the best way to do it ...
         declare_additional=decl['additional']
         init_additional = ""
+        update_num_threads = ""
         if proj._storage_format == "dense" and proj._storage_order == "pre_to_post":
             declare_additional += """\t// dense matrix - static schedule
     std::vector<int> mat_slices_;
         """
-            init_additional += """\t// static distribution across threads
-    int chunk_size = static_cast<int>(ceil(static_cast<double>(this->num_rows_) / static_cast<double>(global_num_threads)));
+            slices_tpl = """\t// static distribution across threads
+    int chunk_size = static_cast<int>(ceil(static_cast<double>(this->num_rows_) / static_cast<double>(%(nt)s)));
     mat_slices_ = std::vector<int>(1, 0);
-    for (int t = 1; t <= global_num_threads; t++)
+    for (int t = 1; t <= %(nt)s; t++)
         mat_slices_.push_back(std::min<int>(t*chunk_size, this->num_rows_));
 """
+            init_additional += slices_tpl % {'nt': "global_num_threads"}
+            update_num_threads += slices_tpl % {'nt': "nt"}
+        if proj._parallel_pattern == "thread_local":
+            declare_additional += """	// thread-local accumulation of conductances
+    std::vector< std::vector<%(float_prec)s> > _thread_acc_;
+""" % {'float_prec': Global.config['precision']}
+            init_additional += """	// one buffer per thread
+    _thread_acc_ = std::vector< std::vector<%(float_prec)s> >(global_num_threads, std::vector<%(float_prec)s>(pop%(id_post)s.size, 0.0));
+""" % {'float_prec': Global.config['precision'], 'id_post': proj.post.id}
+            update_num_threads += """	// one buffer per thread
+    _thread_acc_.resize(nt, std::vector<%(float_prec)s>(pop%(id_post)s.size, 0.0));
+""" % {'float_prec': Global.config['precision'], 'id_post': proj.post.id}
+
+        if self._prof_gen:
+            update_num_threads += self._prof_gen.generate_update_num_threads_projection(proj)
 
         # Additional info (overwritten)
         include_additional = ""
@@ -238,6 +260,7 @@ class OpenMPGenerator(ProjectionGenerator):
             'update_prefix': update_prefix,
             'update_variables': update_variables,
             'update_max_delay': update_max_delay,
+            'update_num_threads': update_num_threads,
             'reset_ring_buffer': reset_ring_buffer,
             'post_event_prefix': post_event_prefix,
             'post_event': post_event,
@@ -273,6 +296,8 @@ class OpenMPGenerator(ProjectionGenerator):
         proj_desc['update'] = "" if update_variables == "" else """\tproj%(id)s.update_synapse(tid);\n""" % {'id': proj.id}
         proj_desc['rng_update'] = "" if update_rng == "" else """\tproj%(id)s.update_rng();\n""" % {'id': proj.id}
         proj_desc['post_event'] = "" if post_event == "" else """\tproj%(id)s.post_event(tid);\n""" % {'id': proj.id}
+        if update_num_threads != "":
+            proj_desc['update_num_threads'] = """    proj%(id)s.update_num_threads(threads);\n""" % {'id': proj.id}
 
         return proj_desc
 
@@ -420,8 +445,8 @@ class OpenMPGenerator(ProjectionGenerator):
         if 'creating' not in proj.synapse_type.description.keys():
             return ""
 
-        if proj._storage_format != "lil":
-            raise NotImplementedError("Structural plasticity is only available for LIL structures.")
+        if proj._storage_format not in ["lil", "csr"]:
+            raise NotImplementedError("Structural plasticity is only available for LIL and CSR structures.")
 
         creating_structure = proj.synapse_type.description['creating']
 
@@ -459,7 +484,8 @@ class OpenMPGenerator(ProjectionGenerator):
             'condition': creating_condition,
             'weights': 0.0 if not 'w' in creating_structure['bounds'].keys() else creating_structure['bounds']['w'],
             'proba' : proba, 'proba_init': proba_init,
-            'delay': delay
+            'delay': delay,
+            'inverse_update': self._inverse_update_structural_plasticity(proj)
         })
         creating = self._templates['structural_plasticity']['create'] % creation_ids
 
@@ -474,8 +500,8 @@ class OpenMPGenerator(ProjectionGenerator):
         if 'pruning' not in proj.synapse_type.description.keys():
             return ""
 
-        if proj._storage_format != "lil":
-            raise NotImplementedError("Structural plasticity is only available for LIL structures.")
+        if proj._storage_format not in ["lil", "csr"]:
+            raise NotImplementedError("Structural plasticity is only available for LIL and CSR structures.")
 
         pruning_structure = proj.synapse_type.description['pruning']
 
@@ -489,13 +515,18 @@ class OpenMPGenerator(ProjectionGenerator):
             proba_init += "\n        " +  pruning_structure['rd']['template'] + ' rd(' + pruning_structure['rd']['args'] + ');'
 
         pruning_ids = deepcopy(self._template_ids)
+        pruning_ids.update({
+            'pre_index': '[rk_pre]',
+            'post_index': '[rk_post]'
+        })
         pruning_condition = pruning_structure['cpp'] % pruning_ids
 
         pruning_ids.update({
             'eq': pruning_structure['eq'],
             'condition': pruning_condition,
             'proba' : proba,
-            'proba_init': proba_init
+            'proba_init': proba_init,
+            'inverse_update': self._inverse_update_structural_plasticity(proj)
         })
         pruning = self._templates['structural_plasticity']['prune'] % pruning_ids
 
@@ -765,7 +796,7 @@ class OpenMPGenerator(ProjectionGenerator):
         # The psp kernel sometimes use diverging indices
         # HD (10th April 2022): maybe I should remove this in future (TODO)
         if proj._storage_format == "lil":
-            if Global.config['num_threads'] == 1 or single_matrix:
+            if Global._check_single_thread() or single_matrix:
                 ids.update({
                     'pre_index': '[rk_j]',
                 })
@@ -874,7 +905,7 @@ class OpenMPGenerator(ProjectionGenerator):
                         g_target_code += """
             %(post_prefix)sg_%(target)s%(post_index)s %(operation)s %(g_target)s
 """% target_dict
-                    elif proj.disable_omp or Global.config['num_threads'] == 1:
+                    elif proj.disable_omp or Global._check_single_thread():
                         g_target_code += """
             %(post_prefix)sg_%(target)s%(post_index)s %(operation)s %(g_target)s
 """% target_dict
@@ -962,6 +993,13 @@ if (%(condition)s) {
         # finalize g_target_code
         g_target_code = g_target_code % ids
 
+        # The conductance increases are accumulated in the thread-local buffer
+        if proj._parallel_pattern == "thread_local":
+            g_target_code = g_target_code.replace(
+                '%(post_prefix)sg_%(target)s[' % ids,
+                '_acc_g['
+            )
+
         # Event-driven integration of synaptic variables
         has_exact = False
         event_driven_code = ''
@@ -1001,11 +1039,11 @@ if (%(condition)s) {
                 Global._warning('Variable delays for spiking networks is experimental and slow...')
                 template = self._templates['spiking_sum_variable_delay']
             else: # Uniform delays
-                template = self._templates['spiking_sum_fixed_delay'][proj._parallel_pattern]
+                template = self._templates['spiking_sum_fixed_delay'].get(proj._parallel_pattern)
                 pre_array = "%(pre_prefix)s_delayed_spike[delay-1]" % ids
         else:
             pre_array = "%(pre_prefix)sspiked" % ids
-            template = self._templates['spiking_sum_fixed_delay'][proj._parallel_pattern]
+            template = self._templates['spiking_sum_fixed_delay'].get(proj._parallel_pattern)
 
         if template == None:
             Global._error("Code generation error: no template available")
@@ -1061,6 +1099,65 @@ if (%(condition)s) {
 
         return psp_prefix, code
 
+    def _select_spike_transmission(self, proj, single_matrix):
+        """
+        Selects the parallelization of the spike transmission if it was not set
+        explicitly with Projection._parallel_pattern. By default, LIL and CSR are
+        parallelized on the inner loop to prevent the cost of atomic operations,
+        the partitioned matrices on the outer loop.
+
+        For spiking projections using the pre_to_post CSR format, the pattern is
+        chosen based on the population sizes and the expected number of spikes
+        per step (see Global.OMP_EXPECTED_FIRING_RATE):
+
+            * inner_loop: the synapses of each spiking neuron are distributed across the
+              threads. Each spike costs an implicit barrier, so this is only efficient if
+              there are fewer spikes per step than threads.
+
+            * thread_local: the spiking neurons are distributed across the threads which
+              accumulate the conductances in private buffers. The buffers are then reduced,
+              which costs one pass over the post-synaptic population per step.
+
+            * outer_loop: the spiking neurons are distributed across the threads which
+              update the conductances with atomic operations. Used if the post-synaptic
+              population is too large for thread-local buffers.
+
+        Projections with several targets or bounded conductances keep the inner loop.
+        Note that the default of this format is therefore not always the inner loop.
+        """
+        default = 'inner_loop' if proj._no_split_matrix else 'outer_loop'
+        if not (proj.synapse_type.type == "spike" and proj._storage_format == "csr" and proj._storage_order == "pre_to_post" and single_matrix):
+            return default
+
+        # The number of threads is only known at runtime if the code is not
+        # specialized on it, we then assume that all cores are used
+        if Global.config['dynamic_num_threads']:
+            num_threads = multiprocessing.cpu_count()
+        else:
+            num_threads = Global.config['num_threads']
+
+        # Nothing to choose
+        if Global._check_single_thread() or 'psp' in proj.synapse_type.description.keys():
+            return default
+
+        # The outer loop variants are only possible for a single target
+        # without bounds on g_target
+        if not isinstance(proj.target, str):
+            return default
+        for eq in proj.synapse_type.description['pre_spike']:
+            if eq['name'] == 'g_target' and ('min' in eq['bounds'] or 'max' in eq['bounds']):
+                return default
+
+        expected_spikes = proj.pre.size * Global.OMP_EXPECTED_FIRING_RATE * Global.config['dt'] / 1000.0
+        if expected_spikes < num_threads:
+            return "inner_loop"
+
+        post_size = proj.post.population.size if isinstance(proj.post, PopulationView) else proj.post.size
+        if post_size <= Global.OMP_MAX_THREAD_LOCAL_NB_NEURONS:
+            return "thread_local"
+
+        return "outer_loop"
+
     def _header_structural_plasticity(self, proj):
         """
         Generate extension code for C header_struct: variable declaration, add and remove synapses.
@@ -1085,6 +1182,8 @@ if (%(condition)s) {
         extra_args = ""
         add_var_code = ""
         add_var_remove = ""
+        add_var_merge = ""
+        add_var_compact = ""
         for var in proj.synapse_type.description['parameters'] + proj.synapse_type.description['variables']:
             if not var['name'] in ['w', 'delay'] and  var['name'] in proj.synapse_type.description['local']:
 
@@ -1092,16 +1191,27 @@ if (%(condition)s) {
                     init = var['init']
                 else:
                     init = proj.init[var['name']]
+                if isinstance(init, bool):
+                    init = str(init).lower()
                 extra_args += ', ' + var['ctype'] + ' _' +  var['name'] +'='+str(init)
-                add_var_code += ' '*8 + var['name'] + '[post].insert('+var['name']+'[post].begin() + idx, _' + var['name'] + ');\n'
-                add_var_remove += ' '*8 + var['name'] + '[post].erase(' + var['name'] + '[post].begin() + idx);\n'
+                attr_ids = {'name': var['name'], 'value': '_' + var['name']}
+                add_var_code += header_tpl['attribute_add'] % attr_ids
+                add_var_remove += header_tpl['attribute_remove'] % attr_ids
+                add_var_compact += header_tpl['attribute_compact'] % attr_ids
+                attr_ids['value'] = 'static_cast<' + var['ctype'] + '>(' + str(init) + ')'
+                add_var_merge += header_tpl['attribute_merge'] % attr_ids
 
         # Delays
         delay_code = ""
         delay_remove= ""
+        delay_merge = ""
+        delay_compact = ""
         if proj.max_delay > 1 and proj.uniform_delay == -1:
-            delay_code = ' '*8 + "delay[post].insert(delay[post].begin() + idx, _delay);"
-            delay_remove = ' '*8 + "delay[post].erase(delay[post].begin() + idx);"
+            attr_ids = {'name': 'delay', 'value': '_delay'}
+            delay_code = header_tpl['attribute_add'] % attr_ids
+            delay_remove = header_tpl['attribute_remove'] % attr_ids
+            delay_merge = header_tpl['attribute_merge'] % attr_ids
+            delay_compact = header_tpl['attribute_compact'] % attr_ids
 
         # Spiking networks must update the inv_pre_rank array
         spiking_addcode = "" if proj.synapse_type.type == 'rate' else header_tpl['spiking_addcode']
@@ -1110,14 +1220,14 @@ if (%(condition)s) {
         # Randomdistributions
         rd_addcode = ""
         rd_removecode = ""
+        rd_mergecode = ""
+        rd_compactcode = ""
         for rd in proj.synapse_type.description['random_distributions']:
-            rd_addcode += """
-        %(name)s[post].insert(%(name)s[post].begin() + idx, 0.0);
-""" % {'name': rd['name']}
-
-            rd_removecode += """
-        %(name)s[post].erase(%(name)s[post].begin() + idx);
-""" % {'name': rd['name']}
+            attr_ids = {'name': rd['name'], 'value': '0.0'}
+            rd_addcode += header_tpl['attribute_add'] % attr_ids
+            rd_removecode += header_tpl['attribute_remove'] % attr_ids
+            rd_mergecode += header_tpl['attribute_merge'] % attr_ids
+            rd_compactcode += header_tpl['attribute_compact'] % attr_ids
 
         # Generate the code
         code += header_tpl['header'] % {
@@ -1125,11 +1235,24 @@ if (%(condition)s) {
             'delay_code': delay_code, 'delay_remove': delay_remove,
             'add_code': add_var_code, 'add_remove': add_var_remove,
             'spike_add': spiking_addcode, 'spike_remove': spiking_removecode,
-            'rd_add': rd_addcode, 'rd_remove': rd_removecode
+            'rd_add': rd_addcode, 'rd_remove': rd_removecode,
+            'delay_merge': delay_merge, 'delay_compact': delay_compact,
+            'add_merge': add_var_merge, 'add_compact': add_var_compact,
+            'rd_merge': rd_mergecode, 'rd_compact': rd_compactcode
         }
 
         return code
 
+    def _inverse_update_structural_plasticity(self, proj):
+        """
+        The backward view of spiking projections is rebuilt once all rows were changed by
+        creating() or pruning().
+        """
+        if proj.synapse_type.type == 'rate':
+            return ""
+
+        return self._templates['structural_plasticity']['inverse_update']
+
     def _init_random_distributions(self, proj):
         # Is it a specific population?
         if 'init_rng' in proj._specific_template.keys():
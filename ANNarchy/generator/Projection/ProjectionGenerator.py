@@ -27,7 +27,7 @@ from ANNarchy.core import Random as ANNRandom
 from ANNarchy.extensions.convolution import Transpose
 
 # Useful functions
-from ANNarchy.generator.Utils import tabify, determine_idx_type_for_projection, cpp_connector_available
+from ANNarchy.generator.Utils import tabify, determine_idx_type_for_projection, cpp_connector_available, cpp_lil_connector_available, cpp_lil_connector_methods, zero_copy_view_available
 
 class ProjectionGenerator(object):
     """
@@ -103,8 +103,14 @@ class ProjectionGenerator(object):
             * str2:     sparse matrix format arguments if needed (e. g. sizes)
             * bool:     if the matrix is a complete (True) or sliced matrix (False)
         """
-        if Global.config["structural_plasticity"] and proj._storage_format != "lil":
-            raise Global.InvalidConfiguration("Structural plasticity is only allowed for LIL format.")
+        if Global.config["structural_plasticity"]:
+            if proj._storage_format == "csr":
+                if not Global._check_paradigm("openmp"):
+                    raise Global.InvalidConfiguration("Structural plasticity is only allowed for CSR format on CPUs.")
+                if proj._storage_order == "pre_to_post":
+                    raise Global.InvalidConfiguration("Structural plasticity is only allowed for CSR format in post_to_pre order.")
+            elif proj._storage_format != "lil":
+                raise Global.InvalidConfiguration("Structural plasticity is only allowed for LIL and CSR format.")
 
         # get preferred index type
         idx_type, _, size_type, _ = determine_idx_type_for_projection(proj)
@@ -127,7 +133,7 @@ class ProjectionGenerator(object):
             # Check for the provided format + paradigm combination if a suitable implementation is available.
             if proj._storage_format == "lil":
                 if Global._check_paradigm("openmp"):
-                    if Global.config['num_threads'] == 1:
+                    if Global._check_single_thread():
                         sparse_matrix_format = "LILMatrix<"+idx_type+", "+size_type+">"
                         sparse_matrix_include = "#include \"LILMatrix.hpp\"\n"
                         single_matrix = True
@@ -263,7 +269,7 @@ class ProjectionGenerator(object):
                     Global.CodeGeneratorException("    The storage_order 'pre_to_post' is invalid for LIL representations (Projection: "+proj.name+")")
 
                 if Global._check_paradigm("openmp"):
-                    if Global.config['num_threads'] == 1 or proj._no_split_matrix:
+                    if Global._check_single_thread() or proj._no_split_matrix:
                         sparse_matrix_format = "LILInvMatrix<"+idx_type+", "+size_type+">"
                         sparse_matrix_include = "#include \"LILInvMatrix.hpp\"\n"
                         single_matrix = True
@@ -278,7 +284,7 @@ class ProjectionGenerator(object):
             elif proj._storage_format == "csr":
                 if proj._storage_order == "post_to_pre":
                     if Global._check_paradigm("openmp"):
-                        if Global.config['num_threads'] == 1 or proj._no_split_matrix:
+                        if Global._check_single_thread() or proj._no_split_matrix:
                             sparse_matrix_format = "CSRCMatrix<"+idx_type+", "+size_type+">"
                             sparse_matrix_include = "#include \"CSRCMatrix.hpp\"\n"
                             single_matrix = True
@@ -297,7 +303,7 @@ class ProjectionGenerator(object):
 
                 else:
                     if Global._check_paradigm("openmp"):
-                        if Global.config['num_threads'] == 1 or proj._no_split_matrix:
+                        if Global._check_single_thread() or proj._no_split_matrix:
                             sparse_matrix_format = "CSRCMatrixT<"+idx_type+", "+size_type+">"
                             sparse_matrix_include = "#include \"CSRCMatrixT.hpp\"\n"
                             single_matrix = True
@@ -314,7 +320,7 @@ class ProjectionGenerator(object):
             elif proj._storage_format == "dense":
                 if proj._storage_order == "post_to_pre":
                     if Global._check_paradigm("openmp"):
-                        if proj._has_pop_view and Global.config["num_threads"] == 1:
+                        if proj._has_pop_view and Global._check_single_thread():
                             sparse_matrix_format = "DenseMatrixOffsets<"+idx_type+", "+size_type+", char, false>"
                             sparse_matrix_include = "#include \"DenseMatrixOffsets.hpp\"\n"
                             single_matrix = True
@@ -331,7 +337,7 @@ class ProjectionGenerator(object):
 
                 else:
                     if Global._check_paradigm("openmp"):
-                        if proj._has_pop_view and Global.config["num_threads"] == 1:
+                        if proj._has_pop_view and Global._check_single_thread():
                             sparse_matrix_format = "DenseMatrixOffsets<"+idx_type+", "+size_type+", char, false>"
                             sparse_matrix_include = "#include \"DenseMatrixOffsets.hpp\"\n"
                             single_matrix = True
@@ -380,7 +386,7 @@ class ProjectionGenerator(object):
                     block_size = 32
                 sparse_matrix_args += ", " + str(block_size)
 
-        elif proj._storage_format == "dense" and proj._has_pop_view and Global.config["num_threads"] == 1:
+        elif proj._storage_format == "dense" and proj._has_pop_view and Global._check_single_thread():
             # We use a dense matrix where we try to cut off not needed parts but then we need to provide
             # begin and end of the matrix.
             sparse_matrix_args = ""
@@ -394,6 +400,10 @@ class ProjectionGenerator(object):
             else:
                 sparse_matrix_args += "0, " + str(proj.pre.size)
 
+        # The connectivity pattern is built on the C++ side
+        if cpp_lil_connector_available(proj):
+            sparse_matrix_include += "#include \"ConnectivityPatterns.hpp\"\n"
+
         if Global.config['verbose']:
             print("Selected", sparse_matrix_format, "(", sparse_matrix_args, ")", "for projection ", proj.name, "and single_matrix =", single_matrix )
 
@@ -408,7 +418,7 @@ class ProjectionGenerator(object):
         #
         # Define the correct projection init code. Not all patterns have specialized
         # implementations.
-        if proj.connector_name == "Random" and cpp_connector_available("Random", proj._storage_format, proj._storage_order):
+        if proj.connector_name == "Random" and cpp_connector_available("Random", proj._storage_format, proj._storage_order, proj):
             connector_call = """
     bool fixed_probability_pattern(std::vector<%(idx_type)s> post_ranks, std::vector<%(idx_type)s> pre_ranks, %(float_prec)s p, %(float_prec)s w_dist_arg1, %(float_prec)s w_dist_arg2, %(float_prec)s d_dist_arg1, %(float_prec)s d_dist_arg2, bool allow_self_connections) {
         static_cast<%(sparse_format)s*>(this)->fixed_probability_pattern(post_ranks, pre_ranks, p, allow_self_connections, rng%(rng_idx)s%(num_threads)s);
@@ -419,7 +429,7 @@ class ProjectionGenerator(object):
         return true;
     }
 """
-        elif proj.connector_name == "Random Convergent" and cpp_connector_available("Random Convergent", proj._storage_format, proj._storage_order):
+        elif proj.connector_name == "Random Convergent" and cpp_connector_available("Random Convergent", proj._storage_format, proj._storage_order, proj):
             connector_call = """
     bool fixed_number_pre_pattern(std::vector<%(idx_type)s> post_ranks, std::vector<%(idx_type)s> pre_ranks, unsigned int nnz_per_row, %(float_prec)s w_dist_arg1, %(float_prec)s w_dist_arg2, %(float_prec)s d_dist_arg1, %(float_prec)s d_dist_arg2) {
         static_cast<%(sparse_format)s*>(this)->fixed_number_pre_pattern(post_ranks, pre_ranks, nnz_per_row, rng%(rng_idx)s%(num_threads)s);
@@ -454,9 +464,154 @@ class ProjectionGenerator(object):
         return true;
     }
 """
+            connector_call += self._csr_connector(proj, sparse_matrix_format)
+            connector_call += self._cpp_lil_connector(proj)
 
         return connector_call
 
+    def _csr_connector(self, proj, sparse_matrix_format):
+        """
+        Same as init_from_lil(), but the data is provided as flat arrays: row i
+        spans [row_ptr[i], row_ptr[i+1]) in column_indices, values and delays.
+        A single delay denotes an uniform delay.
+
+        The CSRMatrix is filled directly from the arrays, as its weights are
+        stored in the same order. For the other formats, the arrays are
+        converted into a LIL and passed to init_from_lil().
+        """
+        if not sparse_matrix_format.startswith("CSRMatrix<"):
+            return """
+    bool init_from_csr( std::vector<%(idx_type)s> row_indices,
+                        const long long* row_ptr,
+                        const int* column_indices,
+                        const %(float_prec)s* values,
+                        const int* delay_steps,
+                        std::size_t nb_delays) {
+        std::size_t nb_rows = row_indices.size();
+        std::vector< std::vector<%(idx_type)s> > row_columns(nb_rows);
+        std::vector< std::vector<%(float_prec)s> > row_values(nb_rows);
+
+        for (std::size_t i = 0; i < nb_rows; i++) {
+            row_columns[i] = std::vector<%(idx_type)s>(column_indices + row_ptr[i], column_indices + row_ptr[i+1]);
+            row_values[i] = std::vector<%(float_prec)s>(values + row_ptr[i], values + row_ptr[i+1]);
+        }
+
+        return init_from_lil(row_indices, row_columns, row_values, lil_delays(row_indices, row_ptr, delay_steps, nb_delays));
+    }
+""" + self._csr_delays_to_lil()
+
+        # The weights are copied as a whole, a single weight is taken from the first synapse
+        weight_code = ""
+        for var in proj.synapse_type.description['parameters'] + proj.synapse_type.description['variables']:
+            if var['name'] != 'w':
+                continue
+            if var['locality'] == "global" or proj._has_single_weight():
+                weight_code = """
+        // Single weight
+        if (nb_synapses > 0)
+            w = values[0];
+"""
+            else:
+                weight_code = """
+        // Local weights, stored in the same order as the column indices
+        w = std::vector<%(float_prec)s>(values, values + nb_synapses);
+"""
+            break
+
+        return """
+    bool init_from_csr( std::vector<%(idx_type)s> row_indices,
+                        const long long* row_ptr,
+                        const int* column_indices,
+                        const %(float_prec)s* values,
+                        const int* delay_steps,
+                        std::size_t nb_delays) {
+        bool success = static_cast<%(sparse_format)s*>(this)->init_matrix_from_csr(row_indices, row_ptr, column_indices);
+        if (!success)
+            return false;
+
+        std::size_t nb_synapses = row_ptr[row_indices.size()];
+""" + weight_code + """
+        std::vector< std::vector<int> > delays = lil_delays(row_indices, row_ptr, delay_steps, nb_delays);
+%(init_delays)s
+
+        // init other variables than 'w' or delay
+        if (!init_attributes()){
+            return false;
+        }
+
+    #ifdef _DEBUG_CONN
+        static_cast<%(sparse_format)s*>(this)->print_data_representation();
+    #endif
+        return true;
+    }
+""" + self._csr_delays_to_lil()
+
+    @staticmethod
+    def _csr_delays_to_lil():
+        """
+        The delay initialization expects a list-in-list, a single delay is
+        stored as [[delay]].
+        """
+        return """
+    std::vector< std::vector<int> > lil_delays(const std::vector<%(idx_type)s> &row_indices, const long long* row_ptr, const int* delay_steps, std::size_t nb_delays) {
+        if (nb_delays == 1)
+            return std::vector< std::vector<int> >(1, std::vector<int>(1, delay_steps[0]));
+
+        std::vector< std::vector<int> > delays(row_indices.size());
+        for (std::size_t i = 0; i < row_indices.size(); i++)
+            delays[i] = std::vector<int>(delay_steps + row_ptr[i], delay_steps + row_ptr[i+1]);
+        return delays;
+    }
+"""
+
+    def _cpp_lil_connector(self, proj):
+        """
+        Connection patterns built as list-in-list on the C++ side (see
+        ConnectivityPatterns.hpp), the result is stored with init_from_lil().
+        The weights and delays are described by the vectors returned by
+        cpp_distribution_args(), an empty w_dist denotes computed weights.
+        The time step is passed explicitly, as the projections are connected
+        before pyx_create() sets dt.
+        """
+        if not cpp_lil_connector_available(proj):
+            return ""
+
+        # call of the pattern function, the arguments are listed in cpp_lil_connector_methods
+        calls = {
+            "All-to-All": "::all_to_all_pattern<%(idx_type)s>(post_ranks, pre_ranks, allow_self_connections, num_threads, row_indices, column_indices);",
+            "One-to-One": "::one_to_one_pattern<%(idx_type)s>(post_ranks, pre_ranks, row_indices, column_indices);",
+            "Random": "::fixed_probability_pattern<%(idx_type)s>(post_ranks, pre_ranks, p, allow_self_connections, seed, num_threads, row_indices, column_indices);",
+            "Random Convergent": "::fixed_number_pre_pattern<%(idx_type)s>(post_ranks, pre_ranks, number, allow_self_connections, seed, num_threads, row_indices, column_indices);",
+            "Random Divergent": "::fixed_number_post_pattern<%(idx_type)s>(post_ranks, pre_ranks, number, allow_self_connections, seed, num_threads, row_indices, column_indices);",
+            "Gaussian": "::gaussian_pattern<%(idx_type)s, %(float_prec)s>(pre_geometry, post_geometry, amp, sigma, limit, allow_self_connections, num_threads, row_indices, column_indices, values);",
+            "Difference-of-Gaussian": "::dog_pattern<%(idx_type)s, %(float_prec)s>(pre_geometry, post_geometry, amp_pos, sigma_pos, amp_neg, sigma_neg, limit, allow_self_connections, num_threads, row_indices, column_indices, values);",
+        }
+        name, args = cpp_lil_connector_methods[proj.connector_name]
+        call = calls[proj.connector_name]
+
+        code = """
+    // %(connector)s pattern, built in parallel on the C++ side
+    bool connect_%(name)s(%(args)s, std::vector<double> w_dist, std::vector<double> d_dist, double dt_, unsigned long long seed) {
+        int num_threads = %(num_threads)s;
+        std::vector<%%(idx_type)s> row_indices;
+        std::vector< std::vector<%%(idx_type)s> > column_indices;
+        std::vector< std::vector<%%(float_prec)s> > values;
+        %(call)s
+
+        if (!w_dist.empty())
+            values = pattern_values<%%(idx_type)s, %%(float_prec)s>(row_indices, column_indices, w_dist, seed, WEIGHT_STREAM, num_threads);
+
+        return init_from_lil(row_indices, column_indices, values, pattern_delays<%%(idx_type)s>(row_indices, column_indices, d_dist, seed, dt_, num_threads));
+    }
+"""
+        return code % {
+            'connector': proj.connector_name,
+            'name': name,
+            'args': ", ".join([arg_type + " " + arg_name for arg_type, arg_name in args]),
+            'call': call,
+            'num_threads': "1" if Global._check_single_thread() else "global_num_threads"
+        }
+
     def _declaration_accessors(self, proj, single_matrix):
         """
         Generate declaration and accessor code for variables/parameters of the projection.
@@ -517,7 +672,7 @@ class ProjectionGenerator(object):
                 }
 
         # Structural plasticity
-        if Global.config['structural_plasticity']:
+        if proj._has_structural_plasticity():
             declare_parameters_variables += self._header_structural_plasticity(proj)
 
         # Specific projections can overwrite
@@ -609,9 +764,13 @@ class ProjectionGenerator(object):
             local_attribute_get1 = ""
             local_attribute_get2 = ""
             local_attribute_get3 = ""
+            local_attribute_get_ptr = ""
+            local_attribute_get_flat = ""
             local_attribute_set1 = ""
             local_attribute_set2 = ""
             local_attribute_set3 = ""
+            local_attribute_set_flat = ""
+            local_attribute_set_value = ""
             semiglobal_attribute_get1 = ""
             semiglobal_attribute_get2 = ""
             semiglobal_attribute_set1 = ""
@@ -637,6 +796,13 @@ class ProjectionGenerator(object):
                     local_attribute_get3 += self._templates["attr_acc"]["local_get_single"] % ids
                     local_attribute_set3 += self._templates["attr_acc"]["local_set_single"] % ids
 
+                    local_attribute_get_flat += self._templates["attr_acc"]["local_get_flat"] % ids
+                    local_attribute_set_flat += self._templates["attr_acc"]["local_set_flat"] % ids
+                    local_attribute_set_value += self._templates["attr_acc"]["local_set_value"] % ids
+
+                    if "local_get_ptr" in self._templates["attr_acc"].keys():
+                        local_attribute_get_ptr += self._templates["attr_acc"]["local_get_ptr"] % ids
+
                 #
                 # Semiglobal variables can be vec[d] or d
                 elif locality == "semiglobal":
@@ -667,6 +833,18 @@ class ProjectionGenerator(object):
                     'local_set1' : local_attribute_set1,
                     'local_set2' : local_attribute_set2,
                     'local_set3' : local_attribute_set3,
+                    'local_get_flat' : local_attribute_get_flat,
+                    'local_set_flat' : local_attribute_set_flat,
+                    'local_set_value' : local_attribute_set_value,
+                    'id_proj': proj.id,
+                    'ctype': ctype,
+                    'ctype_name': ctype.replace(" ", "_")
+                }
+
+            # Zero-copy access, std::vector<bool> provides no data()
+            if local_attribute_get_ptr != "" and ctype != "bool" and zero_copy_view_available(proj):
+                final_code += self._templates["accessor_template"]["local_ptr"] % {
+                    'local_get_ptr' : local_attribute_get_ptr,
                     'id_proj': proj.id,
                     'ctype': ctype,
                     'ctype_name': ctype.replace(" ", "_")
@@ -764,13 +942,13 @@ class ProjectionGenerator(object):
             # The synaptic weight
             if var['name'] == 'w':
                 if var['locality'] == "global" or proj._has_single_weight():
-                    if cpp_connector_available(proj.connector_name, proj._storage_format, proj._storage_order):
+                    if cpp_connector_available(proj.connector_name, proj._storage_format, proj._storage_order, proj):
                         weight_code = tabify("w = w_dist_arg1;", 2)
                     else:
                         weight_code = tabify("w = values[0][0];", 2)
                     
                 elif var['locality'] == "local":
-                    if cpp_connector_available(proj.connector_name, proj._storage_format, proj._storage_order):   # Init weights in CPP
+                    if cpp_connector_available(proj.connector_name, proj._storage_format, proj._storage_order, proj):   # Init weights in CPP
                         if proj.connector_weight_dist == None:
                             init_code = self._templates['attribute_cpp_init']['local'] % {
                                 'init': 'w_dist_arg1',
@@ -868,7 +1046,7 @@ class ProjectionGenerator(object):
             #
             # uniform delay
             elif proj.connector_delay_dist == None:
-                if cpp_connector_available(proj.connector_name, proj._storage_format, proj._storage_order):
+                if cpp_connector_available(proj.connector_name, proj._storage_format, proj._storage_order, proj):
                     delay_code = tabify("delay = d_dist_arg1;", 2)
                 else:
                     delay_code = self._templates['delay']['uniform']['init'] % self._template_ids
@@ -876,7 +1054,7 @@ class ProjectionGenerator(object):
             #
             # non-uniform delay drawn from distribution
             elif isinstance(proj.connector_delay_dist, ANNRandom.RandomDistribution):
-                if cpp_connector_available(proj.connector_name, proj._storage_format, proj._storage_order):
+                if cpp_connector_available(proj.connector_name, proj._storage_format, proj._storage_order, proj):
                     rng_init = "rng[0]" if single_spmv_matrix else "rng"
                     delay_code = tabify("""
 delay = init_matrix_variable_discrete_uniform<int>(d_dist_arg1, d_dist_arg2, %(rng_init)s);
@@ -989,6 +989,288 @@ if(_transmission && %(post_prefix)s_active){
 }
 """
 
+###############################################################################
+# Structural plasticity
+###############################################################################
+# The synapses are inserted into (or removed from) the compact arrays, so the
+# transmission uses the same layout as a static CSR. The changes of a simulation
+# step are collected for each dendrite and the arrays are rebuilt only once.
+structural_plasticity = {
+    'header_struct': {
+        'header': """
+    // Structural plasticity, the rows are sorted by pre-synaptic rank
+    int dendrite_index(int post, int pre){
+        auto beg = col_idx_.begin() + row_begin_[post_ranks_[post]];
+        auto end = col_idx_.begin() + row_begin_[post_ranks_[post]+1];
+        auto it = std::lower_bound(beg, end, pre);
+        if ((it == end) || (*it != pre))
+            return -1;
+        return it - beg;
+    }
+    void addSynapse(int post, int pre, double weight, int _delay=0%(extra_args)s){
+        // Find where to put the synapse
+        int row = post_ranks_[post];
+        auto idx = std::upper_bound(col_idx_.begin() + row_begin_[row], col_idx_.begin() + row_begin_[row+1], pre) - col_idx_.begin();
+
+        // Update connectivity
+        col_idx_.insert(col_idx_.begin() + idx, pre);
+        w.insert(w.begin() + idx, weight);
+        for (int r = row + 1; r < row_begin_.size(); r++)
+            row_begin_[r]++;
+        num_non_zeros_++;
+
+        // Update additional fields
+%(delay_code)s
+%(add_code)s
+%(rd_add)s
+%(spike_add)s
+    };
+    void removeSynapse(int post, int idx){
+        int row = post_ranks_[post];
+        idx += row_begin_[row];
+
+        col_idx_.erase(col_idx_.begin() + idx);
+        w.erase(w.begin() + idx);
+        for (int r = row + 1; r < row_begin_.size(); r++)
+            row_begin_[r]--;
+        num_non_zeros_--;
+%(delay_remove)s
+%(add_remove)s
+%(rd_remove)s
+%(spike_remove)s
+    };
+    // Row pointers after inserting (or removing) the given positions of each dendrite
+    decltype(row_begin_) shifted_row_begin(const std::vector< std::vector<int> > &positions, bool insert) {
+        auto new_row_begin = row_begin_;
+        long long shift = 0;
+        int lil = 0;
+        for (int r = 0; r < row_begin_.size() - 1; r++) {
+            new_row_begin[r] = static_cast<long long>(row_begin_[r]) + shift;
+            if ((lil < post_ranks_.size()) && (post_ranks_[lil] == r)) {
+                shift += insert ? static_cast<long long>(positions[lil].size()) : -static_cast<long long>(positions[lil].size());
+                lil++;
+            }
+        }
+        new_row_begin.back() = static_cast<long long>(row_begin_.back()) + shift;
+        return new_row_begin;
+    }
+    // Merge the values into the rows of a variable, the positions are the sorted indices in the merged rows
+    template<typename T, typename V>
+    void merge_rows(std::vector<T> &variable, const decltype(row_begin_) &new_row_begin, const std::vector< std::vector<int> > &positions, const std::vector< std::vector<V> > &values) {
+        std::vector<T> merged(new_row_begin.back());
+        for (int lil = 0; lil < post_ranks_.size(); lil++) {
+            auto src = row_begin_[post_ranks_[lil]];
+            auto dst = new_row_begin[post_ranks_[lil]];
+            auto size = new_row_begin[post_ranks_[lil]+1] - dst;
+            int k = 0;
+            for (int j = 0; j < size; j++) {
+                if ((k < positions[lil].size()) && (positions[lil][k] == j))
+                    merged[dst + j] = static_cast<T>(values[lil][k++]);
+                else
+                    merged[dst + j] = variable[src++];
+            }
+        }
+        variable.swap(merged);
+    }
+    template<typename T>
+    void merge_rows(std::vector<T> &variable, const decltype(row_begin_) &new_row_begin, const std::vector< std::vector<int> > &positions, T value) {
+        std::vector< std::vector<T> > values(positions.size());
+        for (int lil = 0; lil < positions.size(); lil++)
+            values[lil].assign(positions[lil].size(), value);
+        merge_rows(variable, new_row_begin, positions, values);
+    }
+    // Remove the elements at the sorted positions of each row, the rows are moved in place
+    template<typename T>
+    void compact_rows(std::vector<T> &variable, const decltype(row_begin_) &new_row_begin, const std::vector< std::vector<int> > &positions) {
+        for (int lil = 0; lil < post_ranks_.size(); lil++) {
+            auto beg = row_begin_[post_ranks_[lil]];
+            auto end = row_begin_[post_ranks_[lil]+1];
+            auto dst = new_row_begin[post_ranks_[lil]];
+            int k = 0;
+            for (auto j = beg; j < end; j++) {
+                if ((k < positions[lil].size()) && (positions[lil][k] == j - beg))
+                    k++;
+                else
+                    variable[dst++] = variable[j];
+            }
+        }
+        variable.resize(new_row_begin.back());
+    }
+    // Insert the synapses collected for each dendrite, the pre-synaptic ranks are sorted and not yet connected
+    void addSynapses(const std::vector< std::vector<int> > &pre, const std::vector< std::vector<double> > &weights, int _delay=0){
+        // Indices of the new synapses in the merged rows
+        std::vector< std::vector<int> > positions(pre.size());
+        for (int lil = 0; lil < pre.size(); lil++) {
+            auto beg = col_idx_.begin() + row_begin_[post_ranks_[lil]];
+            auto end = col_idx_.begin() + row_begin_[post_ranks_[lil]+1];
+            auto it = beg;
+            for (int k = 0; k < pre[lil].size(); k++) {
+                it = std::lower_bound(it, end, pre[lil][k]);
+                positions[lil].push_back((it - beg) + k);
+            }
+        }
+
+        auto new_row_begin = shifted_row_begin(positions, true);
+        merge_rows(col_idx_, new_row_begin, positions, pre);
+        merge_rows(w, new_row_begin, positions, weights);
+%(delay_merge)s
+%(add_merge)s
+%(rd_merge)s
+        row_begin_ = new_row_begin;
+        num_non_zeros_ = col_idx_.size();
+    };
+    // Remove the synapses collected for each dendrite, given by their sorted indices
+    void removeSynapses(const std::vector< std::vector<int> > &positions){
+        auto new_row_begin = shifted_row_begin(positions, false);
+        compact_rows(col_idx_, new_row_begin, positions);
+        compact_rows(w, new_row_begin, positions);
+%(delay_compact)s
+%(add_compact)s
+%(rd_compact)s
+        row_begin_ = new_row_begin;
+        num_non_zeros_ = col_idx_.size();
+    };
+""",
+        'pruning': """
+    // Pruning
+    bool _pruning;
+    int _pruning_period;
+    long int _pruning_offset;
+""",
+        'creating': """
+    // Creating
+    bool _creating;
+    int _creating_period;
+    long int _creating_offset;
+""",
+        # Changes applied to each additional field (delay, local attributes, random distributions)
+        'attribute_add': "        %(name)s.insert(%(name)s.begin() + idx, %(value)s);\n",
+        'attribute_remove': "        %(name)s.erase(%(name)s.begin() + idx);\n",
+        'attribute_merge': "        merge_rows(%(name)s, new_row_begin, positions, %(value)s);\n",
+        'attribute_compact': "        compact_rows(%(name)s, new_row_begin, positions);\n",
+        'spiking_addcode': """
+        // Update the backward view
+        inverse_connectivity_matrix();
+""",
+        'spiking_removecode': """
+        // Update the backward view
+        inverse_connectivity_matrix();
+"""
+    },
+    'pyx_struct': {
+        'pruning':
+"""
+        # Pruning
+        bool _pruning
+        int _pruning_period
+        long _pruning_offset
+""",
+        'creating':
+"""
+        # Creating
+        bool _creating
+        int _creating_period
+        long _creating_offset
+""",
+        'func':
+"""
+        # Structural plasticity
+        int dendrite_index(int post, int pre)
+        void addSynapse(int post, int pre, double weight, int _delay%(extra_args)s)
+        void removeSynapse(int post, int pre)
+"""
+    },
+    'pyx_wrapper': {
+        'pruning':
+"""
+    # Pruning
+    def start_pruning(self, int period, long offset):
+        proj%(id)s._pruning = True
+        proj%(id)s._pruning_period = period
+        proj%(id)s._pruning_offset = offset
+    def stop_pruning(self):
+        proj%(id)s._pruning = False
+""",
+        'creating':
+"""
+    # Creating
+    def start_creating(self, int period, long offset):
+        proj%(id)s._creating = True
+        proj%(id)s._creating_period = period
+        proj%(id)s._creating_offset = offset
+    def stop_creating(self):
+        proj%(id)s._creating = False
+""",
+        'func':
+"""
+    # Structural plasticity
+    def dendrite_index(self, int post_rank, int pre_rank):
+        return proj%(id)s.dendrite_index(post_rank, pre_rank)
+    def add_synapse(self, int post_rank, int pre_rank, double weight, int delay%(extra_args)s):
+        proj%(id)s.addSynapse(post_rank, pre_rank, weight, delay%(extra_values)s)
+    def remove_synapse(self, int post_rank, int pre_rank):
+        cdef int idx = proj%(id)s.dendrite_index(post_rank, pre_rank)
+        if idx != -1:
+            proj%(id)s.removeSynapse(post_rank, idx)
+"""
+    },
+
+    # Structural plasticity during the simulate() call. The changes of all dendrites
+    # are collected first, the arrays are then rebuilt once.
+    'create': """
+        // proj%(id_proj)s creating: %(eq)s
+        void creating() {
+            if((_creating)&&((t - _creating_offset) %% _creating_period == 0)){
+                %(proba_init)s
+                std::vector< std::vector<int> > _new_pre(post_ranks_.size());
+                std::vector< std::vector<double> > _new_w(post_ranks_.size());
+                for(int i = 0; i < post_ranks_.size(); i++){
+                    int rk_post = post_ranks_[i];
+                    auto _end = col_idx_.begin() + row_begin_[rk_post+1];
+                    auto _it = col_idx_.begin() + row_begin_[rk_post];
+                    for(int rk_pre = 0; rk_pre < %(pre_prefix)ssize; rk_pre++){
+                        if(%(condition)s){
+                            // Check if the synapse exists
+                            _it = std::lower_bound(_it, _end, rk_pre);
+                            bool _exists = (_it != _end) && (*_it == rk_pre);
+                            if((!_exists)%(proba)s){
+                                _new_pre[i].push_back(rk_pre);
+                                _new_w[i].push_back(%(weights)s);
+                            }
+                        }
+                    }
+                }
+                addSynapses(_new_pre, _new_w%(delay)s);
+%(inverse_update)s
+            }
+        }
+    """,
+    'prune': """
+        // proj%(id_proj)s pruning: %(eq)s
+        void pruning() {
+            if((_pruning)&&((t - _pruning_offset) %% _pruning_period == 0)){
+                %(proba_init)s
+                std::vector< std::vector<int> > _removed(post_ranks_.size());
+                for(int i = 0; i < post_ranks_.size(); i++){
+                    int rk_post = post_ranks_[i];
+                    for(int j = row_begin_[rk_post]; j < row_begin_[rk_post+1]; j++){
+                        int rk_pre = col_idx_[j];
+                        if((%(condition)s)%(proba)s){
+                            _removed[i].push_back(j - row_begin_[rk_post]);
+                        }
+                    }
+                }
+                removeSynapses(_removed);
+%(inverse_update)s
+            }
+        }
+    """,
+    # Spiking projections: update the backward view once the arrays are rebuilt
+    'inverse_update': """
+                inverse_connectivity_matrix();
+"""
+}
+
 conn_templates = {
     # accessors
     'attribute_decl': attribute_decl,
@@ -1017,7 +1299,8 @@ conn_templates = {
     'update_variables': update_variables,
     'spiking_sum_fixed_delay': spiking_summation_fixed_delay_csr,
     'spiking_sum_variable_delay': None,
-    'post_event': spiking_post_event
+    'post_event': spiking_post_event,
+    'structural_plasticity': structural_plasticity
 }
 
 conn_ids = {
@@ -1049,26 +1049,16 @@ structural_plasticity = {
     # All code templates needed for structural plasticity.
     'header_struct': {
         'header': """
-    // Structural plasticity
+    // Structural plasticity, the rows are sorted by pre-synaptic rank
     int dendrite_index(int post, int pre){
-        int idx = -1;
-        for(int i=0; i<pre_rank[post].size(); i++){
-            if(pre_rank[post][i] == pre){
-                idx = i;
-                break;
-            }
-        }
-        return idx;
+        auto it = std::lower_bound(pre_rank[post].begin(), pre_rank[post].end(), pre);
+        if ((it == pre_rank[post].end()) || (*it != pre))
+            return -1;
+        return it - pre_rank[post].begin();
     }
     void addSynapse(int post, int pre, double weight, int _delay=0%(extra_args)s) {
         // Find where to put the synapse
-        int idx = pre_rank[post].size();
-        for(int i=0; i<pre_rank[post].size(); i++){
-            if(pre_rank[post][i] > pre){
-                idx = i;
-                break;
-            }
-        }
+        int idx = std::upper_bound(pre_rank[post].begin(), pre_rank[post].end(), pre) - pre_rank[post].begin();
 
         // Update connectivty
         pre_rank[post].insert(pre_rank[post].begin() + idx, pre);
@@ -1088,6 +1078,59 @@ structural_plasticity = {
 %(spike_remove)s
 %(rd_remove)s
     };
+    // Merge the values into a row, the positions are the sorted indices in the merged row
+    template<typename T, typename V>
+    void merge_row(std::vector<T> &row, const std::vector<int> &positions, const std::vector<V> &values) {
+        std::vector<T> merged(row.size() + positions.size());
+        int k = 0, src = 0;
+        for (int dst = 0; dst < merged.size(); dst++) {
+            if ((k < positions.size()) && (positions[k] == dst))
+                merged[dst] = static_cast<T>(values[k++]);
+            else
+                merged[dst] = row[src++];
+        }
+        row.swap(merged);
+    }
+    template<typename T>
+    void merge_row(std::vector<T> &row, const std::vector<int> &positions, T value) {
+        merge_row(row, positions, std::vector<T>(positions.size(), value));
+    }
+    // Remove the elements at the sorted positions of a row
+    template<typename T>
+    void compact_row(std::vector<T> &row, const std::vector<int> &positions) {
+        int k = 0, dst = 0;
+        for (int src = 0; src < row.size(); src++) {
+            if ((k < positions.size()) && (positions[k] == src))
+                k++;
+            else
+                row[dst++] = row[src];
+        }
+        row.resize(dst);
+    }
+    // Insert a batch of synapses into a row, the pre-synaptic ranks are sorted and not yet connected
+    void addSynapses(int post, const std::vector<int> &pre, const std::vector<double> &weights, int _delay=0){
+        // Indices of the new synapses in the merged row
+        std::vector<int> positions(pre.size());
+        auto it = pre_rank[post].begin();
+        for (int k = 0; k < pre.size(); k++) {
+            it = std::lower_bound(it, pre_rank[post].end(), pre[k]);
+            positions[k] = (it - pre_rank[post].begin()) + k;
+        }
+
+        merge_row(pre_rank[post], positions, pre);
+        merge_row(w[post], positions, weights);
+%(delay_merge)s
+%(add_merge)s
+%(rd_merge)s
+    };
+    // Remove a batch of synapses from a row, given by their sorted indices
+    void removeSynapses(int post, const std::vector<int> &positions){
+        compact_row(pre_rank[post], positions);
+        compact_row(w[post], positions);
+%(delay_compact)s
+%(add_compact)s
+%(rd_compact)s
+    };
 """,
         'pruning': """
     // Pruning
@@ -1101,6 +1144,11 @@ structural_plasticity = {
     int _creating_period;
     long int _creating_offset;
 """,
+        # Changes applied to each additional field (delay, local attributes, random distributions)
+        'attribute_add': "        %(name)s[post].insert(%(name)s[post].begin() + idx, %(value)s);\n",
+        'attribute_remove': "        %(name)s[post].erase(%(name)s[post].begin() + idx);\n",
+        'attribute_merge': "        merge_row(%(name)s[post], positions, %(value)s);\n",
+        'attribute_compact': "        compact_row(%(name)s[post], positions);\n",
         'spiking_addcode': """
         // Add the corresponding pair in inv_pre_rank
         int idx_post = 0;
@@ -1175,11 +1223,14 @@ structural_plasticity = {
     def add_synapse(self, int post_rank, int pre_rank, double weight, int delay%(extra_args)s):
         proj%(id)s.addSynapse(post_rank, pre_rank, weight, delay%(extra_values)s)
     def remove_synapse(self, int post_rank, int pre_rank):
-        proj%(id)s.removeSynapse(post_rank, proj%(id)s.dendrite_index(post_rank, pre_rank))
+        cdef int idx = proj%(id)s.dendrite_index(post_rank, pre_rank)
+        if idx != -1:
+            proj%(id)s.removeSynapse(post_rank, idx)
 """
     },
 
-    # Structural plasticity during the simulate() call
+    # Structural plasticity during the simulate() call. The changes of a row are
+    # collected first and merged at once, the backward view is rebuilt afterwards.
     'create': """
         // proj%(id_proj)s creating: %(eq)s
         void creating() {
@@ -1187,23 +1238,24 @@ structural_plasticity = {
                 %(proba_init)s
                 for(int i = 0; i < post_rank.size(); i++){
                     int rk_post = post_rank[i];
+                    std::vector<int> _new_pre;
+                    std::vector<double> _new_w;
+                    auto _it = pre_rank[i].begin();
                     for(int rk_pre = 0; rk_pre < %(pre_prefix)ssize; rk_pre++){
                         if(%(condition)s){
                             // Check if the synapse exists
-                            bool _exists = false;
-                            for(int k=0; k<pre_rank[i].size(); k++){
-                                if(pre_rank[i][k] == rk_pre){
-                                    _exists = true;
-                                    break;
-                                }
-                            }
+                            _it = std::lower_bound(_it, pre_rank[i].end(), rk_pre);
+                            bool _exists = (_it != pre_rank[i].end()) && (*_it == rk_pre);
                             if((!_exists)%(proba)s){
-                                //std::cout << "Creating synapse between " << rk_pre << " and " << rk_post << std::endl;
-                                addSynapse(i, rk_pre, %(weights)s%(delay)s);
+                                _new_pre.push_back(rk_pre);
+                                _new_w.push_back(%(weights)s);
                             }
                         }
                     }
+                    if (!_new_pre.empty())
+                        addSynapses(i, _new_pre, _new_w%(delay)s);
                 }
+%(inverse_update)s
             }
         }
     """,
@@ -1214,16 +1266,24 @@ structural_plasticity = {
                 %(proba_init)s
                 for(int i = 0; i < post_rank.size(); i++){
                     int rk_post = post_rank[i];
+                    std::vector<int> _removed;
                     for(int j = 0; j < pre_rank[i].size(); j++){
                         int rk_pre = pre_rank[i][j];
                         if((%(condition)s)%(proba)s){
-                            removeSynapse(i, j);
+                            _removed.push_back(j);
                         }
                     }
+                    if (!_removed.empty())
+                        removeSynapses(i, _removed);
                 }
+%(inverse_update)s
             }
         }
-    """
+    """,
+    # Spiking projections: update the backward view once all rows are changed
+    'inverse_update': """
+                inverse_connectivity_matrix();
+"""
 }
 
 conn_templates = {
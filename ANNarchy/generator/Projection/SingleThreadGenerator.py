@@ -133,7 +133,7 @@ class SingleThreadGenerator(ProjectionGenerator):
                 'idx_type': determine_idx_type_for_projection(proj)[0]
             }
             declare_connectivity_matrix = ""
-            access_connectivity_matrix = ""
+            access_connectivity_matrix = self._templates['flat_connectivity']
         else:
             # The user is responsible to define the connectivity related variables
             sparse_matrix_format = "SpecificConnectivity"
@@ -377,8 +377,8 @@ class SingleThreadGenerator(ProjectionGenerator):
         if 'creating' not in proj.synapse_type.description.keys():
             return ""
 
-        if proj._storage_format != "lil":
-            raise NotImplementedError("Structural plasticity is only available for LIL structures.")
+        if proj._storage_format not in ["lil", "csr"]:
+            raise NotImplementedError("Structural plasticity is only available for LIL and CSR structures.")
 
         creating_structure = proj.synapse_type.description['creating']
 
@@ -413,7 +413,8 @@ class SingleThreadGenerator(ProjectionGenerator):
             'condition': creating_condition,
             'weights': 0.0 if not 'w' in creating_structure['bounds'].keys() else creating_structure['bounds']['w'],
             'proba' : proba, 'proba_init': proba_init,
-            'delay': delay
+            'delay': delay,
+            'inverse_update': self._inverse_update_structural_plasticity(proj)
         })
         creating = self._templates['structural_plasticity']['create'] % creation_ids
 
@@ -428,8 +429,8 @@ class SingleThreadGenerator(ProjectionGenerator):
         if 'pruning' not in proj.synapse_type.description.keys():
             return ""
 
-        if proj._storage_format != "lil":
-            raise NotImplementedError("Structural plasticity is only available for LIL structures.")
+        if proj._storage_format not in ["lil", "csr"]:
+            raise NotImplementedError("Structural plasticity is only available for LIL and CSR structures.")
 
         pruning_structure = proj.synapse_type.description['pruning']
 
@@ -449,7 +450,8 @@ class SingleThreadGenerator(ProjectionGenerator):
             'eq': pruning_structure['eq'],
             'condition': pruning_condition,
             'proba' : proba,
-            'proba_init': proba_init
+            'proba_init': proba_init,
+            'inverse_update': self._inverse_update_structural_plasticity(proj)
         })
         pruning = self._templates['structural_plasticity']['prune'] % pruning_ids
 
@@ -1054,6 +1056,8 @@ if (%(condition)s) {
         extra_args = ""
         add_var_code = ""
         add_var_remove = ""
+        add_var_merge = ""
+        add_var_compact = ""
         for var in proj.synapse_type.description['parameters'] + proj.synapse_type.description['variables']:
             if not var['name'] in ['w', 'delay'] and  var['name'] in proj.synapse_type.description['local']:
 
@@ -1061,16 +1065,27 @@ if (%(condition)s) {
                     init = var['init']
                 else:
                     init = proj.init[var['name']]
+                if isinstance(init, bool):
+                    init = str(init).lower()
                 extra_args += ', ' + var['ctype'] + ' _' +  var['name'] +'='+str(init)
-                add_var_code += ' '*8 + var['name'] + '[post].insert('+var['name']+'[post].begin() + idx, _' + var['name'] + ');\n'
-                add_var_remove += ' '*8 + var['name'] + '[post].erase(' + var['name'] + '[post].begin() + idx);\n'
+                attr_ids = {'name': var['name'], 'value': '_' + var['name']}
+                add_var_code += header_tpl['attribute_add'] % attr_ids
+                add_var_remove += header_tpl['attribute_remove'] % attr_ids
+                add_var_compact += header_tpl['attribute_compact'] % attr_ids
+                attr_ids['value'] = 'static_cast<' + var['ctype'] + '>(' + str(init) + ')'
+                add_var_merge += header_tpl['attribute_merge'] % attr_ids
 
         # Delays
         delay_code = ""
         delay_remove= ""
+        delay_merge = ""
+        delay_compact = ""
         if proj.max_delay > 1 and proj.uniform_delay == -1:
-            delay_code = ' '*8 + "delay[post].insert(delay[post].begin() + idx, _delay);"
-            delay_remove = ' '*8 + "delay[post].erase(delay[post].begin() + idx);"
+            attr_ids = {'name': 'delay', 'value': '_delay'}
+            delay_code = header_tpl['attribute_add'] % attr_ids
+            delay_remove = header_tpl['attribute_remove'] % attr_ids
+            delay_merge = header_tpl['attribute_merge'] % attr_ids
+            delay_compact = header_tpl['attribute_compact'] % attr_ids
 
         # Spiking networks must update the inv_pre_rank array
         spiking_addcode = "" if proj.synapse_type.type == 'rate' else header_tpl['spiking_addcode']
@@ -1079,14 +1094,14 @@ if (%(condition)s) {
         # Randomdistributions
         rd_addcode = ""
         rd_removecode = ""
+        rd_mergecode = ""
+        rd_compactcode = ""
         for rd in proj.synapse_type.description['random_distributions']:
-            rd_addcode += """
-        %(name)s[post].insert(%(name)s[post].begin() + idx, 0.0);
-""" % {'name': rd['name']}
-
-            rd_removecode += """
-        %(name)s[post].erase(%(name)s[post].begin() + idx);
-""" % {'name': rd['name']}
+            attr_ids = {'name': rd['name'], 'value': '0.0'}
+            rd_addcode += header_tpl['attribute_add'] % attr_ids
+            rd_removecode += header_tpl['attribute_remove'] % attr_ids
+            rd_mergecode += header_tpl['attribute_merge'] % attr_ids
+            rd_compactcode += header_tpl['attribute_compact'] % attr_ids
 
         # Generate the code
         code += header_tpl['header'] % {
@@ -1094,11 +1109,24 @@ if (%(condition)s) {
             'delay_code': delay_code, 'delay_remove': delay_remove,
             'add_code': add_var_code, 'add_remove': add_var_remove,
             'spike_add': spiking_addcode, 'spike_remove': spiking_removecode,
-            'rd_add': rd_addcode, 'rd_remove': rd_removecode
+            'rd_add': rd_addcode, 'rd_remove': rd_removecode,
+            'delay_merge': delay_merge, 'delay_compact': delay_compact,
+            'add_merge': add_var_merge, 'add_compact': add_var_compact,
+            'rd_merge': rd_mergecode, 'rd_compact': rd_compactcode
         }
 
         return code
 
+    def _inverse_update_structural_plasticity(self, proj):
+        """
+        The backward view of spiking projections is rebuilt once all rows were changed by
+        creating() or pruning().
+        """
+        if proj.synapse_type.type == 'rate':
+            return ""
+
+        return self._templates['structural_plasticity']['inverse_update']
+
     def _init_random_distributions(self, proj):
         # Is it a specific population?
         if 'init_rng' in proj._specific_template.keys():
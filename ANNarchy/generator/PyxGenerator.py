@@ -29,6 +29,7 @@ from ANNarchy.extensions.bold import BoldMonitor
 from ANNarchy.extensions.convolution import Transpose
 
 from ANNarchy.generator.Template import PyxTemplate
+from ANNarchy.generator.Utils import zero_copy_view_available
 
 from ANNarchy.generator.Population import OpenMPTemplates as omp_templates
 from ANNarchy.generator.Population import CUDATemplates as cuda_templates
@@ -38,7 +39,15 @@ from ANNarchy.generator.Projection.OpenMP import BaseTemplates as proj_omp_templ
 from ANNarchy.generator.Projection.SingleThread import *
 from ANNarchy.generator.Projection.OpenMP import *
 from ANNarchy.generator.Projection.CUDA import *
-from ANNarchy.generator.Utils import tabify, determine_idx_type_for_projection, cpp_connector_available
+from ANNarchy.generator.Utils import tabify, determine_idx_type_for_projection, cpp_connector_available, cpp_lil_connector_available, cpp_lil_connector_methods
+
+# Numpy data types matching the C++ types of parameters and variables
+_ctype_to_numpy = {
+    'double': 'np.float64',
+    'float': 'np.float32',
+    'int': 'np.intc',
+    'bool': 'np.bool_'
+}
 
 class PyxGenerator(object):
     """
@@ -188,7 +197,7 @@ class PyxGenerator(object):
         """
         if Global.config['paradigm'] == "openmp":
             if proj._storage_format == "lil":
-                if Global.config['num_threads'] == 1:
+                if Global._check_single_thread():
                     return LIL_SingleThread.conn_templates
                 else:
                     if proj._no_split_matrix:
@@ -197,49 +206,49 @@ class PyxGenerator(object):
                         return LIL_Sliced_OpenMP.conn_templates
 
             elif proj._storage_format == "coo":
-                if Global.config['num_threads'] == 1:
+                if Global._check_single_thread():
                     return COO_SingleThread.conn_templates
                 else:
                     return COO_OpenMP.conn_templates
 
             elif proj._storage_format == "bsr":
-                if Global.config['num_threads'] == 1:
+                if Global._check_single_thread():
                     return BSR_SingleThread.conn_templates
                 else:
                     return BSR_OpenMP.conn_templates
 
             elif proj._storage_format == "csr":
-                if Global.config['num_threads'] == 1:
+                if Global._check_single_thread():
                     return CSR_SingleThread.conn_templates
                 else:
                     return CSR_OpenMP.conn_templates
 
             elif proj._storage_format == "ellr":
-                if Global.config['num_threads'] == 1:
+                if Global._check_single_thread():
                     return ELLR_SingleThread.conn_templates
                 else:
                     return ELLR_OpenMP.conn_templates
 
             elif proj._storage_format == "sell":
-                if Global.config['num_threads'] == 1:
+                if Global._check_single_thread():
                     return SELL_SingleThread.conn_templates
                 else:
                     return SELL_OpenMP.conn_templates
 
             elif proj._storage_format == "ell":
-                if Global.config['num_threads'] == 1:
+                if Global._check_single_thread():
                     return ELL_SingleThread.conn_templates
                 else:
                     return ELL_OpenMP.conn_templates
 
             elif proj._storage_format == "hyb":
-                if Global.config['num_threads'] == 1:
+                if Global._check_single_thread():
                     return HYB_SingleThread.conn_templates
                 else:
                     raise NotImplementedError
 
             elif proj._storage_format == "dense":
-                if Global.config['num_threads'] == 1:
+                if Global._check_single_thread():
                     return Dense_SingleThread.conn_templates
                 else:
                     return Dense_OpenMP.conn_templates
@@ -397,6 +406,11 @@ def _set_%(name)s(%(float_prec)s value):
                 'ctype': ctype,
                 'ctype_name': ctype.replace(" ", "_")
             }
+            if ctype != "bool" and zero_copy_view_available(pop):
+                export_parameters_variables += PyxTemplate.pyx_default_pop_attribute_export["local_ptr"] % {
+                    'ctype': ctype,
+                    'ctype_name': ctype.replace(" ", "_")
+                }
 
         # Global parameters and variables
         for ctype in datatypes["global"]:
@@ -507,6 +521,7 @@ def _set_%(name)s(%(float_prec)s value):
         set_local_all = ""
         get_local = ""
         set_local = ""
+        get_local_view = ""
         get_global = ""
         set_global = ""
 
@@ -538,6 +553,13 @@ def _set_%(name)s(%(float_prec)s value):
             pop%(id)s.set_local_attribute_%(ctype_name)s(cpp_string, rk, value)
 """ % ids
 
+            # Zero-copy view, the memory remains owned by the C++ container
+            if ctype != "bool" and zero_copy_view_available(pop):
+                get_local_view += """
+        if ctype == "%(ctype)s":
+            return np.asarray(<%(ctype)s[:size]> pop%(id)s.get_local_attribute_ptr_%(ctype_name)s(cpp_string))
+""" % ids
+
         # Global parameters/variables
         for ctype in datatypes["global"]:
             ids = {
@@ -567,6 +589,11 @@ def _set_%(name)s(%(float_prec)s value):
                 'set_local': set_local
             }
 
+        if get_local_view != "":
+            wrapper_code += PyxTemplate.pyx_default_pop_attribute_wrapper["local_view"] % {
+                'get_local_view': get_local_view
+            }
+
         if get_global != "":
             wrapper_code += PyxTemplate.pyx_default_pop_attribute_wrapper["global"] % {
                 'get_global': get_global,
@@ -653,6 +680,11 @@ def _set_%(name)s(%(float_prec)s value):
                     'ctype': ctype,
                     'ctype_name': ctype.replace(" ", "_")
                 }
+                if ctype != "bool" and zero_copy_view_available(proj):
+                    export_parameters_variables += PyxTemplate.pyx_proj_attribute_export["local_ptr"] % {
+                        'ctype': ctype,
+                        'ctype_name': ctype.replace(" ", "_")
+                    }
 
             # Semiglobal parameters and variables
             for ctype in datatypes["semiglobal"]:
@@ -673,7 +705,7 @@ def _set_%(name)s(%(float_prec)s value):
 
         # Structural plasticity
         structural_plasticity = ""
-        if Global.config['structural_plasticity']:
+        if proj._has_structural_plasticity():
             sp_tpl = template_dict['structural_plasticity']['pyx_struct']
 
             # Pruning in the synapse
@@ -692,12 +724,17 @@ def _set_%(name)s(%(float_prec)s value):
 
         # Check if either a custom definition or a CPP side init
         # is available otherwise fall back to init from LIL
-        if proj.connector_name == "Random" and cpp_connector_available("Random", proj._storage_format, proj._storage_order):
+        if proj.connector_name == "Random" and cpp_connector_available("Random", proj._storage_format, proj._storage_order, proj):
             export_connector = tabify("void fixed_probability_pattern(vector[%(idx_type)s], vector[%(idx_type)s], %(float_prec)s, %(float_prec)s, %(float_prec)s, %(float_prec)s, %(float_prec)s, bool)", 2)
-        elif proj.connector_name == "Random Convergent" and cpp_connector_available("Random Convergent", proj._storage_format, proj._storage_order):
+        elif proj.connector_name == "Random Convergent" and cpp_connector_available("Random Convergent", proj._storage_format, proj._storage_order, proj):
             export_connector = tabify("void fixed_number_pre_pattern(vector[%(idx_type)s], vector[%(idx_type)s], %(idx_type)s, %(float_prec)s, %(float_prec)s, %(float_prec)s, %(float_prec)s)", 2)
         else:
             export_connector = tabify("bool init_from_lil(vector[%(idx_type)s], vector[vector[%(idx_type)s]], vector[vector[%(float_prec)s]], vector[vector[int]])", 2)
+            export_connector += "\n" + tabify("bool init_from_csr(vector[%(idx_type)s], long long*, int*, %(float_prec)s*, int*, size_t)", 2)
+            if cpp_lil_connector_available(proj):
+                name, args = cpp_lil_connector_methods[proj.connector_name]
+                arg_types = [arg_type.replace("std::vector<int>", "vector[int]") for arg_type, _ in args]
+                export_connector += "\n" + tabify("bool connect_%(name)s(%(args)s, vector[double], vector[double], double, unsigned long long)" % {'name': name, 'args': ", ".join(arg_types)}, 2)
 
         # Data types, only of interest if Global.config["only_int_idx_type"] is false
         idx_types = determine_idx_type_for_projection(proj)
@@ -713,6 +750,11 @@ def _set_%(name)s(%(float_prec)s value):
         if proj.synapse_type.type == "spike":
             default_conn_export += """
         map[%(idx_type)s, %(idx_type)s] nb_efferent_synapses()
+"""
+        if proj._partitioned_matrix:   # distribution of the synapses across the threads
+            default_conn_export += """
+        vector[%(size_type)s] nb_synapses_per_partition()
+        double load_imbalance()
 """
         export_connector = export_connector % idx_type_dict
         export_connector_access = default_conn_export % idx_type_dict
@@ -810,7 +852,7 @@ def _set_%(name)s(%(float_prec)s value):
 
         # Structural plasticity
         structural_plasticity = ""
-        if Global.config['structural_plasticity']:
+        if proj._has_structural_plasticity():
             if Global.config['paradigm'] == "openmp":
                 sp_tpl = template_dict['structural_plasticity']['pyx_wrapper']
             else:
@@ -837,12 +879,12 @@ def _set_%(name)s(%(float_prec)s value):
 
         # Check if either a custom definition or a CPP side init
         # is available otherwise fall back to init from LIL
-        if proj.connector_name == "Random" and cpp_connector_available("Random", proj._storage_format, proj._storage_order):
+        if proj.connector_name == "Random" and cpp_connector_available("Random", proj._storage_format, proj._storage_order, proj):
             wrapper_connector_call = """
     def fixed_probability(self, post_ranks, pre_ranks, p, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2, allow_self_connections):
         proj%(id_proj)s.fixed_probability_pattern(post_ranks, pre_ranks, p, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2, allow_self_connections)
 """ % {'id_proj': proj.id}
-        elif proj.connector_name == "Random Convergent" and cpp_connector_available("Random Convergent", proj._storage_format, proj._storage_order):
+        elif proj.connector_name == "Random Convergent" and cpp_connector_available("Random Convergent", proj._storage_format, proj._storage_order, proj):
             wrapper_connector_call = """
     def fixed_number_pre(self, post_ranks, pre_ranks, number_synapses_per_row, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2):
         proj%(id_proj)s.fixed_number_pre_pattern(post_ranks, pre_ranks, number_synapses_per_row, w_dist_arg1, w_dist_arg2, d_dist_arg1, d_dist_arg2)
@@ -855,7 +897,22 @@ def _set_%(name)s(%(float_prec)s value):
 
     def init_from_lil(self, post_rank, pre_rank, w, delay):
         return proj%(id_proj)s.init_from_lil(post_rank, pre_rank, w, delay)
-""" % {'id_proj': proj.id}
+
+    def init_from_csr(self, post_rank, row_ptr, pre_rank, w, delay):
+        " row_ptr, pre_rank, w and delay (in steps) are flat arrays, a single delay is uniform "
+        cdef np.ndarray offsets = np.ascontiguousarray(row_ptr, dtype=np.longlong)
+        cdef np.ndarray indices = np.ascontiguousarray(pre_rank, dtype=np.intc)
+        cdef np.ndarray values = np.ascontiguousarray(w, dtype=%(np_float_prec)s)
+        cdef np.ndarray delay_steps = np.ascontiguousarray(delay, dtype=np.intc).reshape(-1)
+        return proj%(id_proj)s.init_from_csr(post_rank, <long long*> np.PyArray_DATA(offsets), <int*> np.PyArray_DATA(indices), <%(float_prec)s*> np.PyArray_DATA(values), <int*> np.PyArray_DATA(delay_steps), delay_steps.size)
+""" % {'id_proj': proj.id, 'float_prec': Global.config['precision'], 'np_float_prec': _ctype_to_numpy[Global.config['precision']]}
+            if cpp_lil_connector_available(proj):
+                name, args = cpp_lil_connector_methods[proj.connector_name]
+                arg_names = ", ".join([arg_name for _, arg_name in args] + ["w_dist", "d_dist", "dt_", "seed"])
+                wrapper_connector_call += """
+    def connect_%(name)s(self, %(args)s):
+        return proj%(id_proj)s.connect_%(name)s(%(args)s)
+""" % {'id_proj': proj.id, 'name': name, 'args': arg_names}
 
         wrapper_args = ""
         wrapper_init = tabify("pass",3)
@@ -864,6 +921,13 @@ def _set_%(name)s(%(float_prec)s value):
             wrapper_access_connectivity += """
     def nb_efferent_synapses(self):
         return proj%(id_proj)s.nb_efferent_synapses()
+"""
+        if proj._partitioned_matrix:
+            wrapper_access_connectivity += """
+    def nb_synapses_per_partition(self):
+        return proj%(id_proj)s.nb_synapses_per_partition()
+    def load_imbalance(self):
+        return proj%(id_proj)s.load_imbalance()
 """
         wrapper_access_connectivity = wrapper_access_connectivity % {'id_proj': proj.id}
 
@@ -926,6 +990,10 @@ def _set_%(name)s(%(float_prec)s value):
         set_local_row = ""
         get_local = ""
         set_local = ""
+        get_local_view = ""
+        get_local_all_flat = ""
+        set_local_all_flat = ""
+        set_local_all_value = ""
         get_semiglobal_all = ""
         set_semiglobal_all = ""
         get_semiglobal = ""
@@ -966,6 +1034,30 @@ def _set_%(name)s(%(float_prec)s value):
             proj%(id_proj)s.set_local_attribute_%(ctype_name)s(cpp_string, rk_post, rk_pre, value)
 """ % ids
 
+            # Bulk accessors, the Numpy array is directly filled/read by C++
+            get_local_all_flat += """
+        if ctype == "%(ctype)s":
+            flat = np.empty(size, dtype=%(np_type)s)
+            proj%(id_proj)s.get_local_attribute_flat_%(ctype_name)s(cpp_string, <%(ctype)s*> np.PyArray_DATA(flat))
+            return flat
+""" % {'id_proj': proj.id, 'ctype': ctype, 'ctype_name': ctype.replace(" ", "_"), 'np_type': _ctype_to_numpy[ctype]}
+            set_local_all_flat += """
+        if ctype == "%(ctype)s":
+            flat = np.ascontiguousarray(value, dtype=%(np_type)s).reshape(-1)
+            proj%(id_proj)s.set_local_attribute_all_flat_%(ctype_name)s(cpp_string, <%(ctype)s*> np.PyArray_DATA(flat), flat.size)
+""" % {'id_proj': proj.id, 'ctype': ctype, 'ctype_name': ctype.replace(" ", "_"), 'np_type': _ctype_to_numpy[ctype]}
+            set_local_all_value += """
+        if ctype == "%(ctype)s":
+            proj%(id_proj)s.set_local_attribute_all_value_%(ctype_name)s(cpp_string, value)
+""" % ids
+
+            # Zero-copy view, the memory remains owned by the C++ container
+            if ctype != "bool" and zero_copy_view_available(proj):
+                get_local_view += """
+        if ctype == "%(ctype)s":
+            return np.asarray(<%(ctype)s[:size]> proj%(id_proj)s.get_local_attribute_ptr_%(ctype_name)s(cpp_string))
+""" % ids
+
         for ctype in datatypes["semiglobal"]:
             ids = {
                 'id_proj': proj.id,
@@ -1017,9 +1109,17 @@ def _set_%(name)s(%(float_prec)s value):
                 'set_local_row': set_local_row,
                 'get_local': get_local,
                 'set_local': set_local,
+                'get_local_all_flat': get_local_all_flat,
+                'set_local_all_flat': set_local_all_flat,
+                'set_local_all_value': set_local_all_value,
                 'id_proj': proj.id
             }
 
+        if get_local_view != "":
+            wrapper_code += PyxTemplate.pyx_proj_attribute_wrapper["local_view"] % {
+                'get_local_view': get_local_view
+            }
+
         if get_semiglobal_all != "":
             wrapper_code += PyxTemplate.pyx_proj_attribute_wrapper["semiglobal"] % {
                 'get_semiglobal_all': get_semiglobal_all,
@@ -1055,6 +1155,11 @@ def _set_%(name)s(%(float_prec)s value):
         PopRecorder%(id)s* get_instance(int)
         long int size_in_bytes()
         void clear()
+"""
+        if Global._check_paradigm("openmp"):
+            tpl_code += """
+        long int record_width()
+        void reserve(long int)
 """
         attributes = []
         for var in pop.neuron_type.description['variables']:
@@ -1064,7 +1169,16 @@ def _set_%(name)s(%(float_prec)s value):
             attributes.append(var['name'])
 
             if var['name'] in pop.neuron_type.description['local']:
-                tpl_code += """
+                if Global._check_paradigm("openmp"):
+                    tpl_code += """
+        vector[%(type)s] %(name)s
+        bool record_%(name)s
+        void copy_%(name)s(%(type)s*)
+        bool stream_%(name)s(string, long)
+        void flush_%(name)s()
+""" % {'name': var['name'], 'type': var['ctype']}
+                else:
+                    tpl_code += """
         vector[vector[%(type)s]] %(name)s
         bool record_%(name)s
 """ % {'name': var['name'], 'type': var['ctype']}
@@ -1075,24 +1189,35 @@ def _set_%(name)s(%(float_prec)s value):
 """ % {'name': var['name'], 'type': var['ctype']}
 
         if pop.neuron_type.type == 'spike':
-            tpl_code += """
-        map[int, vector[long]] spike
-        bool record_spike
-        void clear_spike()
-"""
-            if pop.neuron_type.axon_spike:
+            spike_names = ['spike', 'axon_spike'] if pop.neuron_type.axon_spike else ['spike']
+            for name in spike_names:
                 tpl_code += """
-        map[int, vector[long]] axon_spike
-        bool record_axon_spike
-        void clear_axon_spike()
-"""
+        map[int, vector[long]] %(name)s
+        bool record_%(name)s
+        void clear_%(name)s()
+""" % {'name': name}
+                if Global._check_paradigm("openmp"):
+                    tpl_code += """
+        bool %(name)s_events
+        long int nb_%(name)s_events()
+        void copy_%(name)s_events(long long*, int*)
+""" % {'name': name}
 
         # Arrays for the presynaptic sums
         if pop.neuron_type.type == 'rate':
             tpl_code += """
         # Targets"""
             for target in sorted(list(set(pop.neuron_type.description['targets'] + pop.targets))):
-                tpl_code += """
+                if Global._check_paradigm("openmp"):
+                    tpl_code += """
+        vector[%(float_prec)s] _sum_%(target)s
+        bool record__sum_%(target)s
+        void copy__sum_%(target)s(%(float_prec)s*)
+        bool stream__sum_%(target)s(string, long)
+        void flush__sum_%(target)s()
+""" % {'target': target, 'float_prec': Global.config['precision']}
+                else:
+                    tpl_code += """
         vector[vector[%(float_prec)s]] _sum_%(target)s
         bool record__sum_%(target)s
 """ % {'target': target, 'float_prec': Global.config['precision']}
@@ -1125,6 +1250,33 @@ cdef class PopRecorder%(id)s_wrapper:
     property period_offset:
         def __get__(self): return (PopRecorder%(id)s.get_instance(self.id)).period_offset_
         def __set__(self, val): (PopRecorder%(id)s.get_instance(self.id)).period_offset_ = val
+"""
+        if Global._check_paradigm("openmp"):
+            tpl_code += """
+    def record_width(self):
+        return (PopRecorder%(id)s.get_instance(self.id)).record_width()
+
+    def reserve(self, long nb_records):
+        (PopRecorder%(id)s.get_instance(self.id)).reserve(nb_records)
+"""
+
+        # Local variables are stored contiguously and returned as
+        # (steps x neurons) array (openmp only)
+        local_tpl = """
+    property %(name)s:
+        def __get__(self):
+            cdef PopRecorder%(id)s* rec = PopRecorder%(id)s.get_instance(self.id)
+            cdef np.ndarray data = np.empty(rec.%(name)s.size(), dtype=%(np_type)s)
+            rec.copy_%(name)s(<%(type)s*> np.PyArray_DATA(data))
+            return data.reshape((-1, rec.record_width()))
+        def __set__(self, val): (PopRecorder%(id)s.get_instance(self.id)).%(name)s = np.ravel(val)
+"""
+        # Streaming of local variables into a file (openmp only)
+        stream_tpl = """
+    def stream_%(name)s(self, filename, long block_size):
+        return (PopRecorder%(id)s.get_instance(self.id)).stream_%(name)s(filename.encode('utf-8'), block_size)
+    def flush_%(name)s(self):
+        (PopRecorder%(id)s.get_instance(self.id)).flush_%(name)s()
 """
         attributes = []
         for var in pop.neuron_type.description['variables']:
@@ -1132,18 +1284,42 @@ cdef class PopRecorder%(id)s_wrapper:
             if var['name'] in attributes:
                 continue
             attributes.append(var['name'])
-            tpl_code += """
+            if var['name'] in pop.neuron_type.description['local'] and Global._check_paradigm("openmp"):
+                tpl_code += local_tpl % {'id' : pop.id, 'name': var['name'], 'type': var['ctype'], 'np_type': _ctype_to_numpy[var['ctype']]}
+            else:
+                tpl_code += """
     property %(name)s:
         def __get__(self): return (PopRecorder%(id)s.get_instance(self.id)).%(name)s
         def __set__(self, val): (PopRecorder%(id)s.get_instance(self.id)).%(name)s = val
+""" % {'id' : pop.id, 'name': var['name']}
+            tpl_code += """
     property record_%(name)s:
         def __get__(self): return (PopRecorder%(id)s.get_instance(self.id)).record_%(name)s
         def __set__(self, val): (PopRecorder%(id)s.get_instance(self.id)).record_%(name)s = val
     def clear_%(name)s(self):
         (PopRecorder%(id)s.get_instance(self.id)).%(name)s.clear()
 """ % {'id' : pop.id, 'name': var['name']}
-
+            if var['name'] in pop.neuron_type.description['local'] and Global._check_paradigm("openmp"):
+                tpl_code += stream_tpl % {'id' : pop.id, 'name': var['name']}
+
+        # Spikes recorded as flat event list (openmp only)
+        events_tpl = """
+    property %(name)s_events:
+        def __get__(self): return (PopRecorder%(id)s.get_instance(self.id)).%(name)s_events
+        def __set__(self, val): (PopRecorder%(id)s.get_instance(self.id)).%(name)s_events = val
+    def get_%(name)s_events(self):
+        cdef PopRecorder%(id)s* rec = PopRecorder%(id)s.get_instance(self.id)
+        cdef np.ndarray times = np.empty(rec.nb_%(name)s_events(), dtype=np.int64)
+        cdef np.ndarray ranks = np.empty(rec.nb_%(name)s_events(), dtype=np.intc)
+        rec.copy_%(name)s_events(<long long*> np.PyArray_DATA(times), <int*> np.PyArray_DATA(ranks))
+        return times, ranks
+"""
         if pop.neuron_type.type == 'spike':
+            if Global._check_paradigm("openmp"):
+                tpl_code += events_tpl % {'id' : pop.id, 'name': 'spike'}
+                if pop.neuron_type.axon_spike:
+                    tpl_code += events_tpl % {'id' : pop.id, 'name': 'axon_spike'}
+
             tpl_code += """
     property spike:
         def __get__(self): return (PopRecorder%(id)s.get_instance(self.id)).spike
@@ -1172,16 +1348,23 @@ cdef class PopRecorder%(id)s_wrapper:
             tpl_code += """
     # Targets"""
             for target in sorted(list(set(pop.neuron_type.description['targets'] + pop.targets))):
-                tpl_code += """
+                if Global._check_paradigm("openmp"):
+                    tpl_code += local_tpl % {'id' : pop.id, 'name': '_sum_'+target, 'type': Global.config['precision'], 'np_type': _ctype_to_numpy[Global.config['precision']]}
+                else:
+                    tpl_code += """
     property %(name)s:
         def __get__(self): return (PopRecorder%(id)s.get_instance(self.id)).%(name)s
         def __set__(self, val): (PopRecorder%(id)s.get_instance(self.id)).%(name)s = val
+""" % {'id' : pop.id, 'name': '_sum_'+target}
+                tpl_code += """
     property record_%(name)s:
         def __get__(self): return (PopRecorder%(id)s.get_instance(self.id)).record_%(name)s
         def __set__(self, val): (PopRecorder%(id)s.get_instance(self.id)).record_%(name)s = val
     def clear_%(name)s(self):
         (PopRecorder%(id)s.get_instance(self.id)).%(name)s.clear()
 """ % {'id' : pop.id, 'name': '_sum_'+target}
+                if Global._check_paradigm("openmp"):
+                    tpl_code += stream_tpl % {'id' : pop.id, 'name': '_sum_'+target}
 
         return tpl_code % {'id' : pop.id, 'name': pop.name}
 
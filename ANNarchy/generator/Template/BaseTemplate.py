@@ -15,6 +15,9 @@ omp_header_template = """#pragma once
 #include <cmath>
 #include <random>
 #include <cassert>
+
+#include "RingBuffer.hpp"
+
 // only included if compiled with -fopenmp
 #ifdef _OPENMP
     #include <omp.h>
@@ -612,12 +615,19 @@ void singleStep(const int tid, const int nt)
 // called from python
 void run(const int nbSteps) {
 %(prof_run_pre)s
-    #pragma omp parallel num_threads(global_num_threads)
-    {
-        int tid = omp_get_thread_num();
-
+    if (global_num_threads == 1) {
+        // no need to open a parallel region for a single thread
         for (int i=0; i<nbSteps; i++) {
-            singleStep(tid, global_num_threads);
+            singleStep(0, 1);
+        }
+    } else {
+        #pragma omp parallel num_threads(global_num_threads)
+        {
+            int tid = omp_get_thread_num();
+
+            for (int i=0; i<nbSteps; i++) {
+                singleStep(tid, global_num_threads);
+            }
         }
     }
 
@@ -628,11 +638,15 @@ void run(const int nbSteps) {
 // called from python
 void step() {
 %(prof_run_pre)s
-    #pragma omp parallel num_threads(global_num_threads)
-    {
-        int tid = omp_get_thread_num();
+    if (global_num_threads == 1) {
+        singleStep(0, 1);
+    } else {
+        #pragma omp parallel num_threads(global_num_threads)
+        {
+            int tid = omp_get_thread_num();
 
-        singleStep(tid, global_num_threads);
+            singleStep(tid, global_num_threads);
+        }
     }
 %(prof_run_post)s
 }
@@ -682,6 +696,10 @@ void setSeed(const long int seed, const int num_sources, const bool use_seed_seq
         }
     }
 
+    // each thread needs a source if the number of threads was increased after compile()
+    while (static_cast<int>(rng.size()) < global_num_threads)
+        rng.push_back(std::mt19937(rng.back()()));
+
     rng.shrink_to_fit();
 }
 
@@ -702,6 +720,16 @@ void setNumberThreads(const int threads, const std::vector<int> core_list)
     // set worker set size
     global_num_threads = threads;
 
+    // each thread needs its own random number generator, the additional
+    // ones are seeded from the existing ones (see also setSeed())
+    if (!rng.empty()) {
+        while (static_cast<int>(rng.size()) < threads)
+            rng.push_back(std::mt19937(rng.back()()));
+    }
+
+    // resize the thread-local data of populations and projections
+%(update_num_threads)s
+
 #ifdef __linux__
     // set a cpu mask to prevent moving of threads
     cpu_set_t mask;
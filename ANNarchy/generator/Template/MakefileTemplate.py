@@ -1,14 +1,30 @@
+# Each translation unit is compiled into its own object file, so that only
+# the modified parts need to be rebuilt. The objects depend on all generated
+# headers and on the Makefile itself (i. e. compiler flags). In the compilation
+# cache, only the headers included by a unit are part of its key (see
+# CompilationCache.compute_object_key).
+
 # Linux, Seq or OMP
 linux_omp_template = """# Makefile generated by ANNarchy
-all:
+HEADERS = $(wildcard *.h *.hpp)
+INCLUDES = %(python_include)s -I%(numpy_include)s -I%(annarchy_include)s -I%(thirdparty_include)s %(cython_ext)s
+
+all: ANNarchyCore%(net_id)s.so
+\tcp ANNarchyCore%(net_id)s.so ../..
+
+ANNarchy.o: ANNarchy.cpp $(HEADERS) Makefile
+\t%(compiler)s %(cpu_flags)s -std=c++14 -fPIC %(openmp)s -c ANNarchy.cpp -o ANNarchy.o $(INCLUDES)
+
+ANNarchyCore%(net_id)s.o: ANNarchyCore%(net_id)s.pyx $(HEADERS) Makefile
 \t%(cython)s -%(py_major)s --cplus %(cython_ext)s -D ANNarchyCore%(net_id)s.pyx
+\t%(compiler)s %(cpu_flags)s -std=c++14 -fPIC %(openmp)s -c ANNarchyCore%(net_id)s.cpp -o ANNarchyCore%(net_id)s.o $(INCLUDES)
+
+ANNarchyCore%(net_id)s.so: ANNarchy.o ANNarchyCore%(net_id)s.o
 \t%(compiler)s %(cpu_flags)s -std=c++14 -fPIC -shared %(openmp)s \\
-        *.cpp  %(add_sources)s -o ANNarchyCore%(net_id)s.so \\
-        %(python_include)s -I%(numpy_include)s -I%(annarchy_include)s -I%(thirdparty_include)s \\
-        %(cython_ext)s \\
+        ANNarchy.o ANNarchyCore%(net_id)s.o %(add_sources)s -o ANNarchyCore%(net_id)s.so \\
+        $(INCLUDES) \\
         %(python_lib)s \\
         %(python_libpath)s %(extra_libs)s
-\tmv ANNarchyCore%(net_id)s.so ../..
 
 clean:
 \trm -rf *.o
@@ -17,17 +33,31 @@ clean:
 
 # Linux, CUDA
 linux_cuda_template = """# Makefile generated by ANNarchy
-all:
-\t%(cython)s -%(py_major)s --cplus %(cython_ext)s -D ANNarchyCore%(net_id)s.pyx
+HEADERS = $(wildcard *.h *.hpp)
+INCLUDES = %(python_include)s -I%(numpy_include)s -I%(annarchy_include)s %(cython_ext)s
+
+all: ANNarchyCore%(net_id)s.so
+\tcp ANNarchyCore%(net_id)s.so ../..
+
+ANNarchyDevice.o: ANNarchyDevice.cu $(HEADERS) Makefile
 \t%(gpu_compiler)s %(gpu_flags)s -std=c++14 -c -Xcompiler -std=c++14,-fPIC, ANNarchyDevice.cu -o ANNarchyDevice.o
+
+ANNarchyHost.o: ANNarchyHost.cu $(HEADERS) Makefile
+\t%(gpu_compiler)s %(cuda_gen)s %(gpu_flags)s -std=c++14 -c -Xcompiler %(cpu_flags)s-std=c++14,-fPIC \\
+        ANNarchyHost.cu -o ANNarchyHost.o $(INCLUDES)
+
+ANNarchyCore%(net_id)s.o: ANNarchyCore%(net_id)s.pyx $(HEADERS) Makefile
+\t%(cython)s -%(py_major)s --cplus %(cython_ext)s -D ANNarchyCore%(net_id)s.pyx
+\t%(gpu_compiler)s %(cuda_gen)s %(gpu_flags)s -std=c++14 -c -Xcompiler %(cpu_flags)s-std=c++14,-fPIC \\
+        ANNarchyCore%(net_id)s.cpp -o ANNarchyCore%(net_id)s.o $(INCLUDES)
+
+ANNarchyCore%(net_id)s.so: ANNarchyHost.o ANNarchyDevice.o ANNarchyCore%(net_id)s.o
 \t%(gpu_compiler)s %(cuda_gen)s %(gpu_flags)s -Xcompiler %(cpu_flags)s-std=c++14,-fPIC,-shared \\
-        ANNarchyHost.cu *.cpp ANNarchyDevice.o -o ANNarchyCore%(net_id)s.so \\
-        %(python_include)s -I%(numpy_include)s -I%(annarchy_include)s \\
-        %(cython_ext)s \\
+        ANNarchyHost.o ANNarchyCore%(net_id)s.o ANNarchyDevice.o -o ANNarchyCore%(net_id)s.so \\
+        $(INCLUDES) \\
         %(python_lib)s \\
         %(gpu_ldpath)s \\
         %(python_libpath)s %(extra_libs)s
-\tmv ANNarchyCore%(net_id)s.so ../..
 
 clean:
 \trm -rf *.o
@@ -36,15 +66,25 @@ clean:
 
 # OSX, with clang, Seq only
 osx_clang_template = """# Makefile generated by ANNarchy
-all:
+HEADERS = $(wildcard *.h *.hpp)
+INCLUDES = %(python_include)s -I%(numpy_include)s -I%(annarchy_include)s %(cython_ext)s
+
+all: ANNarchyCore%(net_id)s.so
+\tcp ANNarchyCore%(net_id)s.so ../..
+
+ANNarchy.o: ANNarchy.cpp $(HEADERS) Makefile
+\t%(compiler)s -stdlib=libc++ -std=c++14 %(cpu_flags)s -fpermissive %(openmp)s -c ANNarchy.cpp -o ANNarchy.o $(INCLUDES)
+
+ANNarchyCore%(net_id)s.o: ANNarchyCore%(net_id)s.pyx $(HEADERS) Makefile
 \t%(cython)s -%(py_major)s --cplus %(cython_ext)s -D ANNarchyCore%(net_id)s.pyx
+\t%(compiler)s -stdlib=libc++ -std=c++14 %(cpu_flags)s -fpermissive %(openmp)s -c ANNarchyCore%(net_id)s.cpp -o ANNarchyCore%(net_id)s.o $(INCLUDES)
+
+ANNarchyCore%(net_id)s.so: ANNarchy.o ANNarchyCore%(net_id)s.o
 \t%(compiler)s -stdlib=libc++ -std=c++14 -dynamiclib -flat_namespace %(cpu_flags)s -fpermissive %(openmp)s \\
-        *.cpp -o ANNarchyCore%(net_id)s.so \\
-        %(python_include)s -I%(numpy_include)s -I%(annarchy_include)s \\
-        %(cython_ext)s \\
+        ANNarchy.o ANNarchyCore%(net_id)s.o -o ANNarchyCore%(net_id)s.so \\
+        $(INCLUDES) \\
         %(python_lib)s \\
         %(python_libpath)s  %(extra_libs)s
-\tmv ANNarchyCore%(net_id)s.so ../..
 
 clean:
 \trm -rf *.o
@@ -53,17 +93,38 @@ clean:
 
 # OSX, with gcc, OpenMP
 osx_gcc_template = """# Makefile generated by ANNarchy
-all:
+HEADERS = $(wildcard *.h *.hpp)
+INCLUDES = %(python_include)s -I%(numpy_include)s -I%(annarchy_include)s -I%(thirdparty_include)s %(cython_ext)s
+
+all: ANNarchyCore%(net_id)s.so
+\tcp ANNarchyCore%(net_id)s.so ../..
+
+ANNarchy.o: ANNarchy.cpp $(HEADERS) Makefile
+\t%(compiler)s -std=c++14 %(cpu_flags)s -fpermissive %(openmp)s -c ANNarchy.cpp -o ANNarchy.o $(INCLUDES)
+
+ANNarchyCore%(net_id)s.o: ANNarchyCore%(net_id)s.pyx $(HEADERS) Makefile
 \t%(cython)s -%(py_major)s --cplus %(cython_ext)s -D ANNarchyCore%(net_id)s.pyx
+\t%(compiler)s -std=c++14 %(cpu_flags)s -fpermissive %(openmp)s -c ANNarchyCore%(net_id)s.cpp -o ANNarchyCore%(net_id)s.o $(INCLUDES)
+
+ANNarchyCore%(net_id)s.so: ANNarchy.o ANNarchyCore%(net_id)s.o
 \t%(compiler)s -std=c++14 -dynamiclib -flat_namespace %(cpu_flags)s -fpermissive %(openmp)s \\
-        *.cpp -o ANNarchyCore%(net_id)s.so \\
-        %(python_include)s -I%(numpy_include)s -I%(annarchy_include)s  -I%(thirdparty_include)s \\
-        %(cython_ext)s \\
+        ANNarchy.o ANNarchyCore%(net_id)s.o -o ANNarchyCore%(net_id)s.so \\
+        $(INCLUDES) \\
         %(python_lib)s \\
         %(python_libpath)s  %(extra_libs)s
-\tmv ANNarchyCore%(net_id)s.so ../..
 
 clean:
 \trm -rf *.o
 \trm -rf *.so
 """
+
+# Translation units compiled by the above Makefiles (object: source)
+omp_objects = {
+    'ANNarchy.o': 'ANNarchy.cpp',
+    'ANNarchyCore%(net_id)s.o': 'ANNarchyCore%(net_id)s.pyx',
+}
+cuda_objects = {
+    'ANNarchyDevice.o': 'ANNarchyDevice.cu',
+    'ANNarchyHost.o': 'ANNarchyHost.cu',
+    'ANNarchyCore%(net_id)s.o': 'ANNarchyCore%(net_id)s.pyx',
+}
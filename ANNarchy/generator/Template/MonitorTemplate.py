@@ -22,6 +22,8 @@
 #
 #===============================================================================
 record_base_class = """#pragma once
+#include <algorithm>
+%(include_additional)s
 extern long int t;
 
 int addRecorder(class Monitor* recorder);
@@ -59,6 +61,14 @@ public:
     int period_;
     int period_offset_;
     long int offset_;
+
+protected:
+    // Grows the capacity geometrically, repeated short simulations must not copy the buffer each time
+    template<typename T>
+    static void reserve_buffer(std::vector<T> &buffer, std::size_t needed) {
+        if (buffer.capacity() < buffer.size() + needed)
+            buffer.reserve(std::max(2 * buffer.capacity(), buffer.size() + needed));
+    }
 };
 %(record_classes)s
 """
@@ -103,6 +113,17 @@ public:
 %(recording_target_code)s
     }
 
+    // Number of values recorded per step for local variables
+    long int record_width() {
+        return this->partial ? this->ranks.size() : pop%(id)s.size;
+    }
+
+    // Preallocates the buffers for the given number of recordings
+    void reserve(long int nb_records) {
+        long int width = record_width();
+%(reserve_code)s
+    }
+
     long int size_in_bytes() {
         long int size_in_bytes = 0;
 %(determine_size)s
@@ -124,36 +145,59 @@ public:
 """,
     'local': {
     'struct': """
-    // Local variable %(name)s
-    std::vector< std::vector< %(type)s > > %(name)s ;
-    bool record_%(name)s ; """,
+    // Local variable %(name)s (recorded steps are stored contiguously)
+    std::vector< %(type)s > %(name)s ;
+    bool record_%(name)s ;
+    RecordingStream* %(name)s_stream = nullptr;
+    void copy_%(name)s(%(type)s* dst) {
+        std::copy(this->%(name)s.begin(), this->%(name)s.end(), dst);
+    }
+    bool stream_%(name)s(std::string filename, long int block_size) {
+        if (this->%(name)s_stream != nullptr)
+            delete this->%(name)s_stream;
+        this->%(name)s_stream = new RecordingStream(filename, block_size);
+        return this->%(name)s_stream->is_open();
+    }
+    void flush_%(name)s() {
+        if (this->%(name)s_stream != nullptr)
+            this->%(name)s_stream->flush();
+    } """,
     'init': """
-        this->%(name)s = std::vector< std::vector< %(type)s > >();
+        this->%(name)s = std::vector< %(type)s >();
         this->record_%(name)s = false; """,
     'recording': """
         if(this->record_%(name)s && ( (t - this->offset_) %% this->period_ == this->period_offset_ )){
-            if(!this->partial)
-                this->%(name)s.push_back(pop%(id)s.%(name)s);
+            if(this->%(name)s_stream != nullptr) {
+                if(!this->partial)
+                    this->%(name)s_stream->append(pop%(id)s.%(name)s);
+                else
+                    this->%(name)s_stream->append(pop%(id)s.%(name)s, this->ranks);
+            }
+            else if(!this->partial)
+                this->%(name)s.insert(this->%(name)s.end(), pop%(id)s.%(name)s.begin(), pop%(id)s.%(name)s.end());
             else{
-                std::vector<%(type)s> tmp = std::vector<%(type)s>();
                 for (unsigned int i=0; i<this->ranks.size(); i++){
-                    tmp.push_back(pop%(id)s.%(name)s[this->ranks[i]]);
+                    this->%(name)s.push_back(pop%(id)s.%(name)s[this->ranks[i]]);
                 }
-                this->%(name)s.push_back(tmp);
             }
         }""",
+    'reserve': """
+        if(this->record_%(name)s && this->%(name)s_stream == nullptr)
+            reserve_buffer(this->%(name)s, nb_records * width);""",
     'clear': """
-        for(auto it = this->%(name)s.begin(); it != this->%(name)s.end(); it++) {
-            it->clear();
-            it->shrink_to_fit();
-        }
         this->%(name)s.clear();
+        this->%(name)s.shrink_to_fit();
+        if (this->%(name)s_stream != nullptr) {
+            delete this->%(name)s_stream;
+            this->%(name)s_stream = nullptr;
+        }
     """
     },
     'semiglobal': { # Does not exist for populations
         'struct': "",
         'init': "",
         'recording': "",
+        'reserve': "",
         'clear': ""
     },
     'global': {
@@ -168,6 +212,9 @@ public:
         if(this->record_%(name)s && ( (t - this->offset_) %% this->period_ == this->period_offset_ )){
             this->%(name)s.push_back(pop%(id)s.%(name)s);
         } """,
+        'reserve': """
+        if(this->record_%(name)s)
+            reserve_buffer(this->%(name)s, nb_records);""",
         'clear': """
         this->%(name)s.clear();
     """
@@ -528,17 +575,44 @@ public:
 }
 
 recording_spike_tpl= {
-    'struct': """
+    'struct': {
+        'openmp': """
     // Local variable %(name)s
     std::map<int, std::vector< %(type)s > > %(name)s ;
     bool record_%(name)s ;
+    // Event-list mode: spike times and ranks are stored in two flat arrays
+    bool %(name)s_events ;
+    std::vector< %(type)s > %(name)s_times ;
+    std::vector< int > %(name)s_ranks ;
+    std::vector< bool > %(name)s_mask ;
     void clear_%(name)s() {
         for ( auto it = %(name)s.begin(); it != %(name)s.end(); it++ ) {
             it->second.clear();
             it->second.shrink_to_fit();
         }
+        %(name)s_times.clear();
+        %(name)s_ranks.clear();
+    }
+    long int nb_%(name)s_events() {
+        return %(name)s_times.size();
+    }
+    void copy_%(name)s_events(long long* times, int* ranks) {
+        std::copy(%(name)s_times.begin(), %(name)s_times.end(), times);
+        std::copy(%(name)s_ranks.begin(), %(name)s_ranks.end(), ranks);
     }
 """,
+        'cuda': """
+    // Local variable %(name)s
+    std::map<int, std::vector< %(type)s > > %(name)s ;
+    bool record_%(name)s ;
+    void clear_%(name)s() {
+        for ( auto it = %(name)s.begin(); it != %(name)s.end(); it++ ) {
+            it->second.clear();
+            it->second.shrink_to_fit();
+        }
+    }
+"""
+    },
     'init' : """
         this->%(name)s = std::map<int,  std::vector< %(type)s > >();
         if(!this->partial){
@@ -552,18 +626,30 @@ recording_spike_tpl= {
             }
         }
         this->record_%(name)s = false; 
+""",
+    'init_events' : """
+        this->%(name)s_events = false;
+        this->%(name)s_mask = std::vector<bool>(pop%(id)s.size, !this->partial);
+        if(this->partial){
+            for(int i=0; i<this->ranks.size(); i++) {
+                this->%(name)s_mask[this->ranks[i]] = true;
+            }
+        }
 """,
     'record' : {
         'openmp' : """
         if(this->record_%(name)s){
             for(int i=0; i<pop%(id)s.%(rec_target)s.size(); i++){
-                if(!this->partial){
-                    this->%(name)s[pop%(id)s.%(rec_target)s[i]].push_back(t);
+                int rk = pop%(id)s.%(rec_target)s[i];
+                if(!this->%(name)s_mask[rk])
+                    continue;
+
+                if(this->%(name)s_events){
+                    this->%(name)s_times.push_back(t);
+                    this->%(name)s_ranks.push_back(rk);
                 }
                 else{
-                    if( std::find(this->ranks.begin(), this->ranks.end(), pop%(id)s.%(rec_target)s[i])!=this->ranks.end() ){
-                        this->%(name)s[pop%(id)s.%(rec_target)s[i]].push_back(t);
-                    }
+                    this->%(name)s[rk].push_back(t);
                 }
             }
         } """,
@@ -588,6 +674,9 @@ for ( auto it = %(name)s.begin(); it != %(name)s.end(); it++ ) {
     size_in_bytes += sizeof(int); // key
     size_in_bytes += sizeof(%(type)s) * (it->second).capacity(); // value
 }
+// event-list mode
+size_in_bytes += sizeof(%(type)s) * %(name)s_times.capacity();
+size_in_bytes += sizeof(int) * %(name)s_ranks.capacity();
         """,
         'cuda': """
         // TODO:
@@ -595,11 +684,15 @@ for ( auto it = %(name)s.begin(); it != %(name)s.end(); it++ ) {
     },
     'clear': {
         'openmp' : """
-            for (auto it = this->spike.begin(); it != this->spike.end(); it++) {
+            for (auto it = this->%(name)s.begin(); it != this->%(name)s.end(); it++) {
                 it->second.clear();
                 it->second.shrink_to_fit();
             }
-            this->spike.clear();
+            this->%(name)s.clear();
+            this->%(name)s_times.clear();
+            this->%(name)s_times.shrink_to_fit();
+            this->%(name)s_ranks.clear();
+            this->%(name)s_ranks.shrink_to_fit();
         """,
         'cuda': """
         // TODO:
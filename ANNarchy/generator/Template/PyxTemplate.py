@@ -72,8 +72,8 @@ cdef extern from "ANNarchy.h":
     void initialize(%(float_prec)s)
     void setSeed(long, int, bool)
     void run(int nbSteps) nogil
-    int run_until(int steps, vector[int] populations, bool or_and)
-    void step()
+    int run_until(int steps, vector[int] populations, bool or_and) nogil
+    void step() nogil
 
     # Time
     long getTime()
@@ -143,7 +143,8 @@ def pyx_run(int nb_steps, progress_bar):
             if nb > 1 and progress_bar:
                 progress(i+1, nb, 'simulate()')
         if rest > 0:
-            run(rest)
+            with nogil:
+                run(rest)
 
         if (progress_bar):
             print('\\n')
@@ -151,12 +152,16 @@ def pyx_run(int nb_steps, progress_bar):
 # Simulation for the given number of steps except if a criterion is reached
 def pyx_run_until(int nb_steps, list populations, bool mode):
     cdef int nb
-    nb = run_until(nb_steps, populations, mode)
+    cdef vector[int] pop_ids = populations
+    cdef bool or_and = mode
+    with nogil:
+        nb = run_until(nb_steps, pop_ids, or_and)
     return nb
 
 # Simulate for one step
 def pyx_step():
-    step()
+    with nogil:
+        step()
 
 # Access time
 def set_time(t):
@@ -209,6 +214,9 @@ pyx_default_pop_attribute_export = {
         %(ctype)s get_local_attribute_%(ctype_name)s(string, int)
         void set_local_attribute_all_%(ctype_name)s(string, vector[%(ctype)s])
         void set_local_attribute_%(ctype_name)s(string, int, %(ctype)s)
+""",
+    'local_ptr': """
+        %(ctype)s* get_local_attribute_ptr_%(ctype_name)s(string)
 """,
     'global': """
         # Global attributes
@@ -235,6 +243,12 @@ pyx_default_pop_attribute_wrapper = {
     def set_local_attribute(self, name, rk, value, ctype):
         cpp_string = name.encode('utf-8')
 %(set_local)s
+""",
+    'local_view': """
+    # Numpy array sharing the memory of the C++ container (no copy)
+    def get_local_attribute_view(self, name, ctype, int size):
+        cpp_string = name.encode('utf-8')
+%(get_local_view)s
 """,
     'global': """
     def get_global_attribute(self, name, ctype):
@@ -415,6 +429,8 @@ pyx_default_conn_export = """
         %(size_type)s nb_synapses()
         %(idx_type)s nb_dendrites()
         %(idx_type)s dendrite_size(%(idx_type)s)
+        void get_dendrite_offsets(long long*)
+        void get_pre_rank_flat(int*)
 """
 
 pyx_default_conn_wrapper = """
@@ -430,6 +446,14 @@ pyx_default_conn_wrapper = """
         return proj%(id_proj)s.nb_synapses()
     def dendrite_size(self, int n):
         return proj%(id_proj)s.dendrite_size(n)
+
+    # Flat connectivity: begin of each dendrite and pre-synaptic ranks
+    def pre_rank_flat(self):
+        cdef np.ndarray offsets = np.zeros(proj%(id_proj)s.get_post_rank().size()+1, dtype=np.longlong)
+        proj%(id_proj)s.get_dendrite_offsets(<long long*> np.PyArray_DATA(offsets))
+        cdef np.ndarray pre_ranks = np.zeros(offsets[-1], dtype=np.intc)
+        proj%(id_proj)s.get_pre_rank_flat(<int*> np.PyArray_DATA(pre_ranks))
+        return offsets, pre_ranks
 """
 
 # The additional _%(ctype_name)s is required to resolve ambiguity for getter-methods.
@@ -442,6 +466,12 @@ pyx_proj_attribute_export = {
         void set_local_attribute_all_%(ctype_name)s(string, vector[vector[%(ctype)s]])
         void set_local_attribute_row_%(ctype_name)s(string, int, vector[%(ctype)s])
         void set_local_attribute_%(ctype_name)s(string, int, int, %(ctype)s)
+        void get_local_attribute_flat_%(ctype_name)s(string, %(ctype)s*)
+        void set_local_attribute_all_flat_%(ctype_name)s(string, %(ctype)s*, size_t)
+        void set_local_attribute_all_value_%(ctype_name)s(string, %(ctype)s)
+""",
+    'local_ptr': """
+        %(ctype)s* get_local_attribute_ptr_%(ctype_name)s(string)
 """,
     'semiglobal': """
         # Semiglobal Attributes
@@ -483,6 +513,28 @@ pyx_proj_attribute_wrapper = {
     def set_local_attribute(self, name, rk_post, rk_pre, value, ctype):
         cpp_string = name.encode('utf-8')
 %(set_local)s
+
+    # Flat array of all values, ordered by dendrite
+    def get_local_attribute_flat(self, name, ctype, size):
+        cpp_string = name.encode('utf-8')
+        cdef np.ndarray flat
+%(get_local_all_flat)s
+
+    # Bulk setters: one value for all synapses or a flat array in storage order
+    def set_local_attribute_all_flat(self, name, value, ctype):
+        cpp_string = name.encode('utf-8')
+        cdef np.ndarray flat
+%(set_local_all_flat)s
+
+    def set_local_attribute_all_value(self, name, value, ctype):
+        cpp_string = name.encode('utf-8')
+%(set_local_all_value)s
+""",
+    'local_view': """
+    # Numpy array sharing the memory of the C++ container (no copy)
+    def get_local_attribute_view(self, name, ctype, int size):
+        cpp_string = name.encode('utf-8')
+%(get_local_view)s
 """,
     'semiglobal': """
     # Semiglobal Attributes
@@ -523,6 +575,7 @@ cdef extern from "Profiling.h":
 
         double get_avg_time(string, string)
         double get_std_time(string, string)
+        double get_load_imbalance(string, string)
 
 cdef class Profiling_wrapper:
 
@@ -533,4 +586,10 @@ cdef class Profiling_wrapper:
         mean = (Profiling.get_instance()).get_avg_time(cpp_string1, cpp_string2)
         std = (Profiling.get_instance()).get_std_time(cpp_string1, cpp_string2)
         return mean, std
+
+    def get_load_imbalance(self, obj_name, func_name):
+        cpp_string1 = obj_name.encode('utf-8')
+        cpp_string2 = func_name.encode('utf-8')
+
+        return (Profiling.get_instance()).get_load_imbalance(cpp_string1, cpp_string2)
 """
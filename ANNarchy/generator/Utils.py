@@ -22,6 +22,7 @@
 #
 #===============================================================================
 from ANNarchy.core import Global
+from ANNarchy.core import Random as ANNRandom
 from ANNarchy.core.PopulationView import PopulationView
 
 import re
@@ -243,7 +244,7 @@ def determine_idx_type_for_projection(proj):
     if Global._check_paradigm("cuda"):
         return "int", "int", "int", "int"
 
-    if proj._storage_format != "lil" and Global.config["num_threads"]>1:
+    if proj._storage_format != "lil" and not Global._check_single_thread():
         return "int", "int", "int", "int"
 
     # max_size is related to the population sizes. As we use one type for
@@ -299,16 +300,22 @@ def determine_idx_type_for_projection(proj):
 
     return cpp_idx_type, cython_idx_type, cpp_size_type, cython_size_type
 
-def cpp_connector_available(connector_name, desired_format, storage_order):
+def cpp_connector_available(connector_name, desired_format, storage_order, proj=None):
     """
     Checks if a CPP implementation is available for the desired connection pattern
     (*connector_name*) and the target sparse matrix format (*desired_format*). Please
     note that not all formats are available for *pre_to_post* storage order.
+
+    If the projection *proj* is given, the patterns built independently of the storage
+    format (see cpp_lil_connector_available()) take precedence over these implementations.
     """
     # The user disabled this feature
     if not Global.config["use_cpp_connectors"]:
         return False
 
+    if proj is not None and cpp_lil_connector_available(proj):
+        return False
+
     cpp_patterns = {
         'st': {
             'post_to_pre': {
@@ -340,7 +347,7 @@ def cpp_connector_available(connector_name, desired_format, storage_order):
     }
 
     if Global._check_paradigm("openmp"):
-        paradigm = "st" if Global.config["num_threads"] == 1 else "omp"
+        paradigm = "st" if Global._check_single_thread() else "omp"
     else:
         paradigm = "cuda"
 
@@ -351,6 +358,149 @@ def cpp_connector_available(connector_name, desired_format, storage_order):
         # Fall back to Python construction
         return False
 
+# Connection patterns which can be built on the C++ side (see ConnectivityPatterns.hpp),
+# with the position of the weights and delays in Projection._connection_args.
+_cpp_lil_patterns = {
+    "All-to-All": (0, 1),
+    "One-to-One": (0, 1),
+    "Random": (1, 2),
+    "Random Convergent": (1, 2),
+    "Random Divergent": (1, 2),
+    "Gaussian": (None, 2),
+    "Difference-of-Gaussian": (None, 4),
+}
+
+# Name and arguments of the connect_*() method generated for these patterns (see
+# ProjectionGenerator._cpp_lil_connector). The descriptions of the weight and delay
+# distributions, the time step and the seed are appended to these arguments.
+cpp_lil_connector_methods = {
+    "All-to-All": ("all_to_all", [("std::vector<int>", "post_ranks"), ("std::vector<int>", "pre_ranks"), ("bool", "allow_self_connections")]),
+    "One-to-One": ("one_to_one", [("std::vector<int>", "post_ranks"), ("std::vector<int>", "pre_ranks")]),
+    "Random": ("fixed_probability", [("std::vector<int>", "post_ranks"), ("std::vector<int>", "pre_ranks"), ("double", "p"), ("bool", "allow_self_connections")]),
+    "Random Convergent": ("fixed_number_pre", [("std::vector<int>", "post_ranks"), ("std::vector<int>", "pre_ranks"), ("int", "number"), ("bool", "allow_self_connections")]),
+    "Random Divergent": ("fixed_number_post", [("std::vector<int>", "post_ranks"), ("std::vector<int>", "pre_ranks"), ("int", "number"), ("bool", "allow_self_connections")]),
+    "Gaussian": ("gaussian", [("std::vector<int>", "pre_geometry"), ("std::vector<int>", "post_geometry"), ("double", "amp"), ("double", "sigma"), ("double", "limit"), ("bool", "allow_self_connections")]),
+    "Difference-of-Gaussian": ("dog", [("std::vector<int>", "pre_geometry"), ("std::vector<int>", "post_geometry"), ("double", "amp_pos"), ("double", "sigma_pos"), ("double", "amp_neg"), ("double", "sigma_neg"), ("double", "limit"), ("bool", "allow_self_connections")]),
+}
+
+def cpp_pattern_values(proj):
+    """
+    Returns the weights and delays of a connection pattern listed in _cpp_lil_patterns. The
+    weights of the gaussian patterns are computed, None is returned instead.
+    """
+    w_idx, d_idx = _cpp_lil_patterns[proj.connector_name]
+    weights = proj._connection_args[w_idx] if w_idx is not None else None
+    delays = proj._connection_args[d_idx]
+    return weights, delays
+
+def cpp_distribution_args(value):
+    """
+    Returns the description [type, arg1, arg2, min, max] of a constant or random distribution
+    as expected by ConnectivityPatterns.hpp, None if the distribution is not available on the
+    C++ side. A None value (computed weights) is described by an empty list.
+    """
+    if value is None:
+        return []
+
+    if isinstance(value, (int, float)):
+        return [0, float(value), 0.0, -float('inf'), float('inf')]
+
+    def _bound(bound, default):
+        return float(default) if bound is None else float(bound)
+
+    if isinstance(value, ANNRandom.Uniform):
+        return [1, float(value.min), float(value.max), -float('inf'), float('inf')]
+    elif isinstance(value, ANNRandom.DiscreteUniform):
+        return [2, float(value.min), float(value.max), -float('inf'), float('inf')]
+    elif isinstance(value, ANNRandom.Normal):
+        return [3, float(value.mu), float(value.sigma), _bound(value.min, -float('inf')), _bound(value.max, float('inf'))]
+    elif isinstance(value, ANNRandom.LogNormal):
+        return [4, float(value.mu), float(value.sigma), _bound(value.min, -float('inf')), _bound(value.max, float('inf'))]
+
+    return None
+
+def cpp_lil_connector_available(proj):
+    """
+    Checks if the connection pattern of *proj* can be built on the C++ side as list-in-list
+    (see ConnectivityPatterns.hpp) instead of using the Cython LILConnectivity. Contrary to
+    cpp_connector_available(), the result is passed to init_from_lil() and is therefore
+    available for all storage formats.
+
+    The gaussian and dog patterns with constant delays are always built on the C++ side,
+    the other patterns and random weights or delays only if enabled with
+    _optimization_flags(use_cpp_connectors=True).
+    """
+    if not Global._check_paradigm("openmp"):
+        return False
+
+    # Specific projections define their own connectivity
+    if 'declare_connectivity_matrix' in proj._specific_template.keys():
+        return False
+
+    if proj.connector_name not in _cpp_lil_patterns.keys():
+        return False
+
+    # The distributions need to be available in C++
+    weights, delays = cpp_pattern_values(proj)
+    if cpp_distribution_args(weights) is None or cpp_distribution_args(delays) is None:
+        return False
+
+    geometric_pattern = proj.connector_name in ["Gaussian", "Difference-of-Gaussian"]
+    random_values = isinstance(weights, ANNRandom.RandomDistribution) or isinstance(delays, ANNRandom.RandomDistribution)
+    if (random_values or not geometric_pattern) and not Global.config["use_cpp_connectors"]:
+        return False
+
+    if proj.connector_name in ["Gaussian", "Difference-of-Gaussian"]:
+        # The distance is only defined between populations of same dimension
+        if len(proj.pre.geometry) != len(proj.post.geometry):
+            return False
+
+        # The sigma values must be positive
+        if proj.connector_name == "Gaussian":
+            sigmas = [proj._connection_args[1]]
+        else:
+            sigmas = [proj._connection_args[1], proj._connection_args[3]]
+
+        return all([sigma > 0.0 for sigma in sigmas])
+
+    return True
+
+def zero_copy_view_available(obj):
+    """
+    Checks if the local attributes of a population or projection are stored in a
+    single contiguous C++ array, which can be exposed as Numpy array without copy
+    (see Population.view() and Projection.view()).
+
+    This is the case for all populations, and for projections using a non-partitioned
+    CSR or dense (row-major) matrix. On GPUs, the host-side containers are not necessarily
+    up-to-date, so no views are provided.
+    """
+    if not Global._check_paradigm("openmp"):
+        return False
+
+    # Specific populations/projections define their own containers
+    if len(obj._specific_template) > 0:
+        return False
+
+    # Populations store local attributes as std::vector
+    if not hasattr(obj, 'synapse_type'):
+        return True
+
+    single_matrix = Global._check_single_thread() or obj._no_split_matrix
+
+    if obj._storage_format == "csr":
+        if obj.synapse_type.type == "rate":
+            return True
+        return obj._storage_order == "post_to_pre" and single_matrix
+
+    if obj._storage_format == "dense":
+        if obj.synapse_type.type == "rate":
+            return True
+        # DenseMatrixOffsets and the column-major variant use a different layout
+        return obj._storage_order == "post_to_pre" and not (obj._has_pop_view and Global._check_single_thread())
+
+    return False
+
 #####################################################################
 #   Code formatting
 #####################################################################
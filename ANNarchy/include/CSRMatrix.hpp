@@ -144,6 +144,10 @@ class CSRMatrix {
         assert( (row_indices.size() < std::numeric_limits<IT>::max()) );
         assert( (row_indices.size() <= num_rows_) );
 
+        // the matrix might be re-initialized, e.g. by Projection.load()
+        col_idx_.clear();
+        num_non_zeros_ = 0;
+
         post_ranks_ = row_indices;
         IT lil_row_idx = 0;
         for (IT r = 0; r < num_rows_; r++) {
@@ -183,6 +187,47 @@ class CSRMatrix {
         return true;
     }
 
+    /**
+     *  @brief      Initialize CSR from flat arrays, without building a LIL first.
+     *  @details    The i-th entry of row_indices spans [row_ptr[i], row_ptr[i+1]) in column_indices. As for
+     *              init_matrix_from_lil(), the row indices need to be sorted in ascending order.
+     */
+    bool init_matrix_from_csr(std::vector<IT> row_indices, const long long* row_ptr, const int* column_indices) {
+    #ifdef _DEBUG
+        std::cout << "CSRMatrix::init_matrix_from_csr()" << std::endl;
+    #endif
+        // sanity check of inputs
+        assert( (row_indices.size() < std::numeric_limits<IT>::max()) );
+        assert( (row_indices.size() <= num_rows_) );
+
+        post_ranks_ = row_indices;
+        num_non_zeros_ = static_cast<ST>(row_ptr[row_indices.size()]);
+        col_idx_ = std::vector<IT>(column_indices, column_indices + num_non_zeros_);
+
+        // empty rows start where the next stored row begins
+        IT lil_row_idx = 0;
+        for (IT r = 0; r < num_rows_; r++) {
+            row_begin_[r] = static_cast<ST>(row_ptr[lil_row_idx]);
+
+            if (lil_row_idx < row_indices.size() && r == row_indices[lil_row_idx])
+                lil_row_idx++;
+        }
+        row_begin_[num_rows_] = num_non_zeros_;
+
+        // sanity check after transformation
+        if (lil_row_idx != row_indices.size()) {
+            std::cerr << "CSRMatrix::init_matrix_from_csr(): the row indices are not sorted or out of range." << std::endl;
+            return false;
+        }
+
+    #ifdef _DEBUG
+        std::cout << "init completed" << std::endl;
+        std::cout << "  #nnz: " << num_non_zeros_ << std::endl;
+        std::cout << "  #empty rows: " << num_rows_ - post_ranks_.size() << std::endl;
+    #endif
+        return true;
+    }
+
     /**
      *  @brief      reads in a .csv file which contains the matrix stored as COO.
      *  @see        LILMatrix::init_matrix_from_lil()
@@ -0,0 +1,457 @@
+/*
+ *
+ *    ConnectivityPatterns.hpp
+ *
+ *    This file is part of ANNarchy.
+ *
+ *    Copyright (C) 2022  Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>,
+ *    Julien Vitay <julien.vitay@gmail.com>
+ *
+ *    This program is free software: you can redistribute it and/or modify
+ *    it under the terms of the GNU General Public License as published by
+ *    the Free Software Foundation, either version 3 of the License, or
+ *    (at your option) any later version.
+ *
+ *    ANNarchy is distributed in the hope that it will be useful,
+ *    but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *    GNU General Public License for more details.
+ *
+ *    You should have received a copy of the GNU General Public License
+ *    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ *
+ */
+#pragma once
+
+#include <vector>
+#include <cmath>
+#include <cstdint>
+#include <random>
+#include <algorithm>
+#include <unordered_set>
+
+/**
+ *  @brief      Construction of the default connectivity patterns on the C++ side.
+ *  @details    The patterns are built as list-in-list (row indices, and for each row the column indices and values) which is
+ *              then passed to the init_from_lil() method of the projection. Contrary to the *_pattern() methods of the sparse
+ *              matrix classes, the construction is therefore independent of the storage format. The rows are computed in
+ *              parallel, empty rows are not stored.
+ *
+ *              Random numbers are not drawn from the generators of the threads: each row (or column for fixed_number_post)
+ *              uses its own generator, seeded from the seed of the projection, the row index and the kind of values drawn
+ *              (structure, weights or delays). The result is therefore the same for any number of threads.
+ */
+
+// Streams of random numbers used for a pattern
+enum PatternStream { STRUCTURE_STREAM = 0, WEIGHT_STREAM = 1, DELAY_STREAM = 2 };
+
+/**
+ *  @brief      generator for the given row (or column) of a pattern.
+ *  @details    The seed is computed with the finalizer of splitmix64, so neighbouring rows get uncorrelated generators.
+ */
+inline std::mt19937_64 pattern_generator(unsigned long long seed, int stream, long row) {
+    std::uint64_t x = seed + 0x9E3779B97F4A7C15ULL * (static_cast<std::uint64_t>(row) * 3 + stream + 1);
+    x = (x ^ (x >> 30)) * 0xBF58476D1CE4E5B9ULL;
+    x = (x ^ (x >> 27)) * 0x94D049BB133111EBULL;
+    x = x ^ (x >> 31);
+    return std::mt19937_64(x);
+}
+
+/**
+ *  @brief      description of the weights or delays of a pattern.
+ *  @details    The values are provided by Python (see generator.Utils.cpp_distribution_args()) as [type, arg1, arg2, min, max],
+ *              where type is one of the following and the values are clipped to [min, max].
+ */
+enum PatternDistribution { CONSTANT = 0, UNIFORM = 1, DISCRETE_UNIFORM = 2, NORMAL = 3, LOG_NORMAL = 4 };
+
+template<typename VT, typename RNG>
+std::vector<VT> draw_pattern_values(const std::vector<double> &dist, std::size_t n, RNG &rng) {
+    std::vector<VT> values(n);
+    switch (static_cast<int>(dist[0])) {
+        case UNIFORM: {
+            std::uniform_real_distribution<double> dis(dist[1], dist[2]);
+            std::generate(values.begin(), values.end(), [&]{ return static_cast<VT>(dis(rng)); });
+            break;
+        }
+        case DISCRETE_UNIFORM: {
+            std::uniform_int_distribution<long> dis(static_cast<long>(dist[1]), static_cast<long>(dist[2]));
+            std::generate(values.begin(), values.end(), [&]{ return static_cast<VT>(dis(rng)); });
+            break;
+        }
+        case NORMAL: {
+            std::normal_distribution<double> dis(dist[1], dist[2]);
+            std::generate(values.begin(), values.end(), [&]{ return static_cast<VT>(std::min(std::max(dis(rng), dist[3]), dist[4])); });
+            break;
+        }
+        case LOG_NORMAL: {
+            std::lognormal_distribution<double> dis(dist[1], dist[2]);
+            std::generate(values.begin(), values.end(), [&]{ return static_cast<VT>(std::min(std::max(dis(rng), dist[3]), dist[4])); });
+            break;
+        }
+        default:
+            std::fill(values.begin(), values.end(), static_cast<VT>(dist[1]));
+    }
+    return values;
+}
+
+/**
+ *  @brief      values (e.g. weights) of all synapses of a pattern, drawn row by row.
+ *  @param[in]  dist        distribution of the values (see PatternDistribution).
+ *  @param[in]  seed        seed of the projection.
+ *  @param[in]  stream      kind of values (see PatternStream).
+ */
+template<typename IT, typename VT>
+std::vector<std::vector<VT>> pattern_values(const std::vector<IT> &row_indices, const std::vector<std::vector<IT>> &column_indices,
+                                            const std::vector<double> &dist, unsigned long long seed, int stream, int num_threads) {
+    std::vector<std::vector<VT>> values(row_indices.size());
+
+    #pragma omp parallel for num_threads(num_threads) schedule(dynamic, 16)
+    for (long i = 0; i < static_cast<long>(row_indices.size()); i++) {
+        auto rng = pattern_generator(seed, stream, row_indices[i]);
+        values[i] = draw_pattern_values<VT>(dist, column_indices[i].size(), rng);
+    }
+
+    return values;
+}
+
+/**
+ *  @brief      delays (in steps) of all synapses of a pattern, a single value if the delay is constant.
+ */
+template<typename IT>
+std::vector<std::vector<int>> pattern_delays(const std::vector<IT> &row_indices, const std::vector<std::vector<IT>> &column_indices,
+                                             const std::vector<double> &dist, unsigned long long seed, double dt, int num_threads) {
+    if (static_cast<int>(dist[0]) == CONSTANT)
+        return std::vector<std::vector<int>>(1, std::vector<int>(1, static_cast<int>(std::round(dist[1] / dt))));
+
+    auto values = pattern_values<IT, double>(row_indices, column_indices, dist, seed, DELAY_STREAM, num_threads);
+
+    std::vector<std::vector<int>> delays(values.size());
+    for (std::size_t i = 0; i < values.size(); i++) {
+        delays[i].reserve(values[i].size());
+        for (auto d : values[i])
+            delays[i].push_back(static_cast<int>(std::round(d / dt)));
+    }
+    return delays;
+}
+
+/**
+ *  @brief      removes the empty rows of a pattern computed for all post-synaptic neurons.
+ */
+template<typename IT>
+void compress_pattern_rows(const std::vector<int> &post_ranks, std::vector<std::vector<IT>> &row_columns,
+                           std::vector<IT> &row_indices, std::vector<std::vector<IT>> &column_indices) {
+    for (std::size_t i = 0; i < post_ranks.size(); i++) {
+        if (row_columns[i].empty())
+            continue;
+
+        row_indices.push_back(static_cast<IT>(post_ranks[i]));
+        column_indices.push_back(std::move(row_columns[i]));
+    }
+}
+
+/**
+ *  @brief      selects k distinct elements out of n (Floyd's algorithm), the positions are returned sorted.
+ */
+template<typename RNG>
+std::vector<int> sample_positions(int n, int k, RNG &rng) {
+    std::unordered_set<int> selected;
+    selected.reserve(2*k);
+    for (int j = n - k; j < n; j++) {
+        int t = std::uniform_int_distribution<int>(0, j)(rng);
+        if (!selected.insert(t).second)
+            selected.insert(j);
+    }
+
+    std::vector<int> positions(selected.begin(), selected.end());
+    std::sort(positions.begin(), positions.end());
+    return positions;
+}
+
+/**
+ *  @brief      initialize connectivity using an all-to-all pattern
+ *  @details    The pre-synaptic ranks keep the order of *pre_ranks*.
+ */
+template<typename IT>
+void all_to_all_pattern(const std::vector<int> &post_ranks, const std::vector<int> &pre_ranks, bool allow_self_connections,
+                        int num_threads, std::vector<IT> &row_indices, std::vector<std::vector<IT>> &column_indices) {
+    std::vector<std::vector<IT>> row_columns(post_ranks.size());
+
+    #pragma omp parallel for num_threads(num_threads) schedule(dynamic, 16)
+    for (long i = 0; i < static_cast<long>(post_ranks.size()); i++) {
+        row_columns[i].reserve(pre_ranks.size());
+        for (auto pre : pre_ranks) {
+            if (allow_self_connections || pre != post_ranks[i])
+                row_columns[i].push_back(static_cast<IT>(pre));
+        }
+    }
+
+    compress_pattern_rows<IT>(post_ranks, row_columns, row_indices, column_indices);
+}
+
+/**
+ *  @brief      initialize connectivity using an one-to-one pattern
+ */
+template<typename IT>
+void one_to_one_pattern(const std::vector<int> &post_ranks, const std::vector<int> &pre_ranks,
+                        std::vector<IT> &row_indices, std::vector<std::vector<IT>> &column_indices) {
+    std::size_t size = std::min(post_ranks.size(), pre_ranks.size());
+    for (std::size_t i = 0; i < size; i++) {
+        row_indices.push_back(static_cast<IT>(post_ranks[i]));
+        column_indices.push_back(std::vector<IT>(1, static_cast<IT>(pre_ranks[i])));
+    }
+}
+
+/**
+ *  @brief      initialize connectivity using a fixed_probability pattern
+ *  @details    Instead of drawing a number for each pair of neurons, the distance to the next created synapse is drawn from
+ *              a geometric distribution. The pre-synaptic ranks are sorted.
+ */
+template<typename IT>
+void fixed_probability_pattern(const std::vector<int> &post_ranks, const std::vector<int> &pre_ranks, double p, bool allow_self_connections,
+                               unsigned long long seed, int num_threads, std::vector<IT> &row_indices, std::vector<std::vector<IT>> &column_indices) {
+    std::vector<std::vector<IT>> row_columns(post_ranks.size());
+    const long nb_pre = pre_ranks.size();
+
+    if (p > 0.0) {
+        #pragma omp parallel for num_threads(num_threads) schedule(dynamic, 16)
+        for (long i = 0; i < static_cast<long>(post_ranks.size()); i++) {
+            auto rng = pattern_generator(seed, STRUCTURE_STREAM, post_ranks[i]);
+            const bool all = p >= 1.0;
+            std::geometric_distribution<long> gap(all ? 0.5 : p);
+
+            // number of skipped neurons before the next synapse
+            long j = all ? 0 : gap(rng);
+            while (j < nb_pre) {
+                if (allow_self_connections || pre_ranks[j] != post_ranks[i])
+                    row_columns[i].push_back(static_cast<IT>(pre_ranks[j]));
+
+                long skip = all ? 0 : gap(rng);
+                if (skip >= nb_pre)
+                    break;
+                j += skip + 1;
+            }
+            std::sort(row_columns[i].begin(), row_columns[i].end());
+        }
+    }
+
+    compress_pattern_rows<IT>(post_ranks, row_columns, row_indices, column_indices);
+}
+
+/**
+ *  @brief      initialize connectivity using a fixed_number_pre pattern
+ *  @details    Each post-synaptic neuron receives synapses from *number* distinct pre-synaptic neurons (sorted).
+ */
+template<typename IT>
+void fixed_number_pre_pattern(const std::vector<int> &post_ranks, const std::vector<int> &pre_ranks, int number, bool allow_self_connections,
+                              unsigned long long seed, int num_threads, std::vector<IT> &row_indices, std::vector<std::vector<IT>> &column_indices) {
+    std::vector<std::vector<IT>> row_columns(post_ranks.size());
+
+    #pragma omp parallel for num_threads(num_threads) schedule(dynamic, 16)
+    for (long i = 0; i < static_cast<long>(post_ranks.size()); i++) {
+        auto rng = pattern_generator(seed, STRUCTURE_STREAM, post_ranks[i]);
+
+        // candidates
+        std::vector<int> candidates;
+        if (allow_self_connections) {
+            candidates = pre_ranks;
+        } else {
+            candidates.reserve(pre_ranks.size());
+            for (auto pre : pre_ranks)
+                if (pre != post_ranks[i])
+                    candidates.push_back(pre);
+        }
+
+        int k = std::min(number, static_cast<int>(candidates.size()));
+        for (auto pos : sample_positions(candidates.size(), k, rng))
+            row_columns[i].push_back(static_cast<IT>(candidates[pos]));
+        std::sort(row_columns[i].begin(), row_columns[i].end());
+    }
+
+    compress_pattern_rows<IT>(post_ranks, row_columns, row_indices, column_indices);
+}
+
+/**
+ *  @brief      initialize connectivity using a fixed_number_post pattern
+ *  @details    Each pre-synaptic neuron sends synapses to *number* distinct post-synaptic neurons. The columns are drawn in
+ *              parallel and transposed afterwards, the pre-synaptic ranks of a row keep the order of *pre_ranks*.
+ */
+template<typename IT>
+void fixed_number_post_pattern(const std::vector<int> &post_ranks, const std::vector<int> &pre_ranks, int number, bool allow_self_connections,
+                               unsigned long long seed, int num_threads, std::vector<IT> &row_indices, std::vector<std::vector<IT>> &column_indices) {
+    // positions in post_ranks for each pre-synaptic neuron
+    std::vector<std::vector<int>> targets(pre_ranks.size());
+    const int nb_post = post_ranks.size();
+
+    #pragma omp parallel for num_threads(num_threads) schedule(dynamic, 16)
+    for (long j = 0; j < static_cast<long>(pre_ranks.size()); j++) {
+        auto rng = pattern_generator(seed, STRUCTURE_STREAM, pre_ranks[j]);
+
+        // position of the same neuron in post_ranks, if any
+        int self_pos = -1;
+        if (!allow_self_connections) {
+            auto it = std::find(post_ranks.begin(), post_ranks.end(), pre_ranks[j]);
+            if (it != post_ranks.end())
+                self_pos = it - post_ranks.begin();
+        }
+
+        int n = (self_pos == -1) ? nb_post : nb_post - 1;
+        int k = std::min(number, n);
+        for (auto pos : sample_positions(n, k, rng))
+            targets[j].push_back((self_pos != -1 && pos >= self_pos) ? pos + 1 : pos);
+    }
+
+    // transpose
+    std::vector<std::vector<IT>> row_columns(post_ranks.size());
+    for (std::size_t j = 0; j < pre_ranks.size(); j++) {
+        for (auto pos : targets[j])
+            row_columns[pos].push_back(static_cast<IT>(pre_ranks[j]));
+    }
+
+    compress_pattern_rows<IT>(post_ranks, row_columns, row_indices, column_indices);
+}
+
+/**
+ *  @brief      builds a connectivity pattern depending on the distance between the normalized coordinates of the neurons.
+ *  @details    The normalized coordinates are the same as in Coordinates.get_normalized_coord(). Only the pre-synaptic neurons
+ *              within *radius* of the post-synaptic one on the grid are visited, a negative radius means that all neurons
+ *              are visited.
+ *  @param[in]  pre_geometry    geometry of the pre-synaptic population.
+ *  @param[in]  post_geometry   geometry of the post-synaptic population (same number of dimensions).
+ *  @param[in]  radius          normalized distance beyond which no synapse is created.
+ *  @param[in]  allow_self_connections  if false, the neurons with the same rank are not connected.
+ *  @param[in]  profile         function called with the squared distance and a reference to the value, returns true if the synapse is created.
+ *  @param[in]  num_threads     number of threads used for the construction.
+ *  @param[out] row_indices     rows containing at least one synapse.
+ *  @param[out] column_indices  for each row the ranks of the pre-synaptic neurons (sorted).
+ *  @param[out] values          for each row the values computed by *profile*.
+ */
+template<typename IT, typename VT, typename Profile>
+void distance_based_pattern(const std::vector<int> &pre_geometry, const std::vector<int> &post_geometry, double radius, bool allow_self_connections,
+                            Profile profile, int num_threads, std::vector<IT> &row_indices, std::vector<std::vector<IT>> &column_indices,
+                            std::vector<std::vector<VT>> &values) {
+    const int dim = pre_geometry.size();
+
+    // row-major strides
+    std::vector<long> pre_stride(dim, 1), post_stride(dim, 1);
+    for (int k = dim-2; k >= 0; k--) {
+        pre_stride[k] = pre_stride[k+1] * pre_geometry[k+1];
+        post_stride[k] = post_stride[k+1] * post_geometry[k+1];
+    }
+    const long post_size = dim > 0 ? post_stride[0] * post_geometry[0] : 1;
+
+    std::vector<std::vector<IT>> row_columns(post_size);
+    std::vector<std::vector<VT>> row_values(post_size);
+
+    #pragma omp parallel for num_threads(num_threads) schedule(dynamic, 16)
+    for (long post = 0; post < post_size; post++) {
+        std::vector<double> post_coord(dim);
+        std::vector<int> lower(dim), upper(dim), idx(dim);
+        bool empty = false;
+
+        for (int k = 0; k < dim; k++) {
+            int x = (post / post_stride[k]) % post_geometry[k];
+            post_coord[k] = post_geometry[k] > 1 ? x / static_cast<double>(post_geometry[k]-1) : 0.0;
+
+            // bounding box of the pre-synaptic neurons within the radius
+            double scale = pre_geometry[k] - 1;
+            if (radius < 0.0 || scale == 0.0) {
+                lower[k] = 0;
+                upper[k] = pre_geometry[k] - 1;
+            } else {
+                lower[k] = std::max(0, static_cast<int>(std::ceil((post_coord[k] - radius) * scale - 1e-9)));
+                upper[k] = std::min(pre_geometry[k] - 1, static_cast<int>(std::floor((post_coord[k] + radius) * scale + 1e-9)));
+            }
+            if (lower[k] > upper[k])
+                empty = true;
+        }
+        if (empty)
+            continue;
+
+        // visit the box in row-major order, so the ranks are sorted
+        idx = lower;
+        while (true) {
+            long pre = 0;
+            double distance = 0.0;
+            for (int k = 0; k < dim; k++) {
+                pre += idx[k] * pre_stride[k];
+                double pre_coord = pre_geometry[k] > 1 ? idx[k] / static_cast<double>(pre_geometry[k]-1) : 0.0;
+                distance += (pre_coord - post_coord[k]) * (pre_coord - post_coord[k]);
+            }
+
+            VT value;
+            if ((allow_self_connections || pre != post) && profile(distance, value)) {
+                row_columns[post].push_back(static_cast<IT>(pre));
+                row_values[post].push_back(value);
+            }
+
+            // next coordinate, the last dimension is the fastest
+            int k = dim - 1;
+            while (k >= 0 && idx[k] == upper[k]) {
+                idx[k] = lower[k];
+                k--;
+            }
+            if (k < 0)
+                break;
+            idx[k]++;
+        }
+    }
+
+    // remove the empty rows
+    for (long post = 0; post < post_size; post++) {
+        if (row_columns[post].empty())
+            continue;
+
+        row_indices.push_back(static_cast<IT>(post));
+        column_indices.push_back(std::move(row_columns[post]));
+        values.push_back(std::move(row_values[post]));
+    }
+}
+
+/**
+ *  @brief      initialize connectivity using a gaussian pattern
+ *  @details    A synapse is created if amp * exp(-d^2 / (2 sigma^2)) > limit * amp, where d is the distance between the
+ *              normalized coordinates. For a positive amplitude, this condition defines the radius sigma * sqrt(-2 ln(limit)).
+ */
+template<typename IT, typename VT>
+void gaussian_pattern(const std::vector<int> &pre_geometry, const std::vector<int> &post_geometry, double amp, double sigma, double limit,
+                      bool allow_self_connections, int num_threads, std::vector<IT> &row_indices, std::vector<std::vector<IT>> &column_indices,
+                      std::vector<std::vector<VT>> &values) {
+    double radius = -1.0;
+    if (amp > 0.0 && limit > 0.0)
+        radius = limit < 1.0 ? sigma * std::sqrt(-2.0 * std::log(limit)) : 0.0;
+
+    auto profile = [=](double distance, VT &value) {
+        double w = amp * std::exp(-distance / (2.0 * sigma * sigma));
+        value = static_cast<VT>(w);
+        return w > limit * amp;
+    };
+
+    distance_based_pattern<IT, VT>(pre_geometry, post_geometry, radius, allow_self_connections, profile, num_threads, row_indices, column_indices, values);
+}
+
+/**
+ *  @brief      initialize connectivity using a difference-of-gaussians pattern
+ *  @details    A synapse is created if |amp_pos * exp(-d^2 / (2 sigma_pos^2)) - amp_neg * exp(-d^2 / (2 sigma_neg^2))| > limit * |amp_pos - amp_neg|.
+ *              As the left-hand side is bounded by (|amp_pos| + |amp_neg|) * exp(-d^2 / (2 max(sigma_pos, sigma_neg)^2)), no synapse
+ *              is created beyond the distance at which this bound reaches the threshold.
+ */
+template<typename IT, typename VT>
+void dog_pattern(const std::vector<int> &pre_geometry, const std::vector<int> &post_geometry, double amp_pos, double sigma_pos, double amp_neg,
+                 double sigma_neg, double limit, bool allow_self_connections, int num_threads, std::vector<IT> &row_indices,
+                 std::vector<std::vector<IT>> &column_indices, std::vector<std::vector<VT>> &values) {
+    double threshold = limit * std::fabs(amp_pos - amp_neg);
+    double radius = -1.0;
+    if (threshold > 0.0) {
+        double ratio = (std::fabs(amp_pos) + std::fabs(amp_neg)) / threshold;
+        double sigma = std::max(sigma_pos, sigma_neg);
+        radius = ratio > 1.0 ? sigma * std::sqrt(2.0 * std::log(ratio)) : 0.0;
+    }
+
+    auto profile = [=](double distance, VT &value) {
+        double w = amp_pos * std::exp(-distance / (2.0 * sigma_pos * sigma_pos)) - amp_neg * std::exp(-distance / (2.0 * sigma_neg * sigma_neg));
+        value = static_cast<VT>(w);
+        return std::fabs(w) > threshold;
+    };
+
+    distance_based_pattern<IT, VT>(pre_geometry, post_geometry, radius, allow_self_connections, profile, num_threads, row_indices, column_indices, values);
+}
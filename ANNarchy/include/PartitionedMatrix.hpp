@@ -21,6 +21,8 @@
  */
 #pragma once
 
+#include <numeric>
+
 /**
  *  @brief      Wrapper class for handling multiple instances of LIL.
  *  @details    In order to support the parallel evaluation of expecially spiking networks
@@ -38,32 +40,51 @@ protected:
     IT chunk_size_;             ///< number of rows computed by each thread
 
     /**
-     *  @brief      Divide the matrix across rows in equally large partitions.
-     *  @details    Sets the chunk_size_ as well as the slices_ attribute.
+     *  @brief      Divide the matrix across rows in partitions holding a similar number of nonzeros.
+     *  @details    Sets the chunk_size_ as well as the slices_ attribute. The rows are assigned in their order,
+     *              a partition ends where the prefix sum of the row lengths reaches its share of the total number
+     *              of nonzeros. If no row lengths are provided (e. g. the rows are filled afterwards by a
+     *              connectivity pattern) each row is weighted equally.
+     *  @param[in]  row_indices     post-synaptic ranks of the rows (sorted ascending)
+     *  @param[in]  num_partitions  number of partitions, usually the number of threads
+     *  @param[in]  row_lengths     number of nonzeros in each row (optional)
      */
-    void divide_post_ranks(std::vector<IT> &row_indices, int num_partitions) {
+    void divide_post_ranks(std::vector<IT> &row_indices, int num_partitions, const std::vector<ST> &row_lengths = std::vector<ST>()) {
+        assert ( (row_lengths.empty() || (row_lengths.size() == row_indices.size())) );
         clear();
 
         num_partitions_ = num_partitions;
-        chunk_size_ = static_cast<int>(ceil(static_cast<double>(num_rows_)/static_cast<double>(num_partitions)));
+        IT num_lil_rows = static_cast<IT>(row_indices.size());
+        chunk_size_ = static_cast<IT>(ceil(static_cast<double>(num_lil_rows)/static_cast<double>(num_partitions)));
 
         for(int i = 0; i < num_partitions_; i++) {
-            int beg = i * chunk_size_;
-            int end = std::min(static_cast<int>((i+1) * chunk_size_), static_cast<int>(num_rows_));
-
             sub_matrices_.push_back(new SPARSE_MATRIX_TYPE(num_rows_, num_columns_));
         }
 
-        // ATTENTION: this assumes that row_indices are sorted ascending
-        int lower_bound = 0;
-        for(int part_idx = 0; part_idx < num_partitions_; part_idx++) {
-            int part_border = (part_idx+1) * chunk_size_;
+        // prefix sum over the row lengths
+        auto prefix_sum = std::vector<ST>(num_lil_rows+1, 0);
+        for(IT r = 0; r < num_lil_rows; r++) {
+            prefix_sum[r+1] = prefix_sum[r] + (row_lengths.empty() ? 1 : row_lengths[r]);
+        }
 
-            auto it = std::partition(row_indices.begin(), row_indices.end(), [&part_border](int i){return i < part_border;});
-            int size = std::distance(row_indices.begin(), it);
+        IT lower_bound = 0;
+        for(int part_idx = 0; part_idx < num_partitions_; part_idx++) {
+            IT upper_bound = num_lil_rows;
+
+            if (part_idx < num_partitions_-1) {
+                // first row border where the partition reaches its share of nonzeros ...
+                // (computed in 64 bit, the product may exceed ST)
+                ST share = static_cast<ST>((static_cast<unsigned long long>(prefix_sum.back()) * (part_idx+1)) / num_partitions_);
+                auto it = std::lower_bound(prefix_sum.begin()+lower_bound, prefix_sum.end(), share);
+                upper_bound = static_cast<IT>(std::distance(prefix_sum.begin(), it));
+
+                // ... or the previous one, if it is closer to the share
+                if ((upper_bound > lower_bound) && (prefix_sum[upper_bound] - share > share - prefix_sum[upper_bound-1]))
+                    upper_bound--;
+            }
 
-            slices_.push_back(std::pair<int,int>(lower_bound, size));
-            lower_bound = size;
+            slices_.push_back(std::pair<IT, IT>(lower_bound, upper_bound));
+            lower_bound = upper_bound;
         }
     }
 
@@ -155,6 +176,29 @@ public:
         return size;
     }
 
+    // Number of synapses stored in each partition
+    std::vector<ST> nb_synapses_per_partition() {
+        auto sizes = std::vector<ST>();
+        for(auto it = sub_matrices_.begin(); it != sub_matrices_.end(); it++) {
+            sizes.push_back((*it)->nb_synapses());
+        }
+        return sizes;
+    }
+
+    // Ratio between the largest and the average partition (1.0 means perfectly balanced)
+    double load_imbalance() {
+        auto sizes = nb_synapses_per_partition();
+        if (sizes.empty())
+            return 1.0;
+
+        double max_size = static_cast<double>(*std::max_element(sizes.begin(), sizes.end()));
+        double avg_size = static_cast<double>(std::accumulate(sizes.begin(), sizes.end(), static_cast<ST>(0))) / static_cast<double>(sizes.size());
+        if (avg_size == 0.0)
+            return 1.0;
+
+        return max_size / avg_size;
+    }
+
     std::map<IT, IT> nb_efferent_synapses() {
         std::map<IT, IT> efferents;
         for(auto it = sub_matrices_.begin(); it != sub_matrices_.end(); it++) {
@@ -169,15 +213,18 @@ public:
     #ifdef _DEBUG
         std::cout << "ParallelLIL::init_matrix_from_lil():" << std::endl;
     #endif
-        // determine partitions
-        divide_post_ranks(post_ranks, num_partitions);
+        // determine partitions based on the number of synapses per row
+        auto row_lengths = std::vector<ST>(pre_ranks.size());
+        for (std::size_t r = 0; r < pre_ranks.size(); r++)
+            row_lengths[r] = pre_ranks[r].size();
+        divide_post_ranks(post_ranks, num_partitions, row_lengths);
 
     #ifdef _DEBUG
         std::cout << "partitions per thread:" << std::endl;
         for (int t = 0; t < num_partitions; t++) {
             std::cout << "tid = " << t << ": " << std::distance(post_ranks.begin(), post_ranks.begin()+slices_[t].first) <<
             " to " << std::distance(post_ranks.begin(), post_ranks.begin()+slices_[t].second) << 
-            " ( " << slices_[t].second - slices_[t].first << " items )" << std::endl;
+            " ( " << slices_[t].second - slices_[t].first << " items, " << std::accumulate(row_lengths.begin()+slices_[t].first, row_lengths.begin()+slices_[t].second, 0) << " synapses )" << std::endl;
         }
     #endif
         auto slice_it = slices_.begin();
@@ -554,10 +601,11 @@ public:
         std::cout << "   post_rank.size(): " << post_ranks.size() << std::endl;
         std::cout << "   number threads(): " << num_partitions_ << std::endl;
         std::cout << "divided into:" << std::endl;
-        for(auto it = slices_.begin(); it != slices_.end(); it++) {
-            std::cout << "   (" << it->first << ", " << it->second << ")" << std::endl;
+        auto sizes = nb_synapses_per_partition();
+        for(std::size_t part_idx = 0; part_idx < slices_.size(); part_idx++) {
+            std::cout << "   (" << slices_[part_idx].first << ", " << slices_[part_idx].second << ") with " << sizes[part_idx] << " synapses" << std::endl;
         }
-        std::cout << "using chunk_size = " << chunk_size_ << std::endl;
+        std::cout << "average chunk_size = " << chunk_size_ << ", load imbalance = " << load_imbalance() << std::endl;
 
         std::cout << "Partitioned matrices ..." << std::endl;
         for (auto it = sub_matrices_.begin(); it != sub_matrices_.end(); it++)
@@ -0,0 +1,196 @@
+/*
+ *    RecordingStream.hpp
+ *
+ *    This file is part of ANNarchy.
+ *
+ *    Copyright (C) 2022  Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>,
+ *    Julien Vitay <julien.vitay@gmail.com>
+ *
+ *    This program is free software: you can redistribute it and/or modify
+ *    it under the terms of the GNU General Public License as published by
+ *    the Free Software Foundation, either version 3 of the License, or
+ *    (at your option) any later version.
+ *
+ *    ANNarchy is distributed in the hope that it will be useful,
+ *    but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *    GNU General Public License for more details.
+ *
+ *    You should have received a copy of the GNU General Public License
+ *    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#pragma once
+
+#include <algorithm>
+#include <cstdio>
+#include <cstring>
+#include <deque>
+#include <mutex>
+#include <condition_variable>
+#include <thread>
+#include <vector>
+#include <string>
+#include <iostream>
+
+/*
+ *  Spills the recorded values of a monitor into a raw binary file.
+ *
+ *  The values are gathered into blocks of fixed size (in bytes). Full blocks
+ *  are handed over to a background thread which writes them to the file, so
+ *  the simulation loop does not wait for the disk. The file contains the
+ *  recorded time steps in row-major order and can be read back with a memory
+ *  map.
+ */
+class RecordingStream
+{
+public:
+    RecordingStream(std::string filename, long int block_size) {
+    #ifdef _DEBUG
+        std::cout << "RecordingStream (" << this << ") writes to " << filename << std::endl;
+    #endif
+        block_size_ = (block_size > 0) ? static_cast<std::size_t>(block_size) : 1;
+        file_ = fopen(filename.c_str(), "wb");
+        if (file_ == nullptr) {
+            std::cerr << "RecordingStream: unable to open " << filename << std::endl;
+            return;
+        }
+
+        block_.reserve(block_size_);
+        stop_ = false;
+        busy_ = false;
+        writer_ = std::thread(&RecordingStream::write_blocks, this);
+    }
+
+    ~RecordingStream() {
+        close();
+    }
+
+    bool is_open() {
+        return file_ != nullptr;
+    }
+
+    // Append one recorded time step
+    template<typename T>
+    void append(const std::vector<T>& values) {
+        append_bytes(reinterpret_cast<const char*>(values.data()), values.size() * sizeof(T));
+    }
+
+    // Append one recorded time step for a subset of neurons
+    template<typename T>
+    void append(const std::vector<T>& values, const std::vector<int>& ranks) {
+        for (auto it = ranks.begin(); it != ranks.end(); it++) {
+            append_bytes(reinterpret_cast<const char*>(&values[*it]), sizeof(T));
+        }
+    }
+
+    // std::vector<bool> has no contiguous storage, we write one byte per value.
+    void append(const std::vector<bool>& values) {
+        for (auto it = values.begin(); it != values.end(); it++) {
+            char tmp = *it;
+            append_bytes(&tmp, 1);
+        }
+    }
+
+    void append(const std::vector<bool>& values, const std::vector<int>& ranks) {
+        for (auto it = ranks.begin(); it != ranks.end(); it++) {
+            char tmp = values[*it];
+            append_bytes(&tmp, 1);
+        }
+    }
+
+    // Write all pending data to the file and wait until it is done
+    void flush() {
+        if (file_ == nullptr)
+            return;
+
+        submit();
+
+        std::unique_lock<std::mutex> lock(mutex_);
+        done_.wait(lock, [this]{ return queue_.empty() && !busy_; });
+        fflush(file_);
+    }
+
+    void close() {
+        if (file_ == nullptr)
+            return;
+
+        submit();
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            stop_ = true;
+        }
+        pending_.notify_one();
+        writer_.join();
+
+        fclose(file_);
+        file_ = nullptr;
+    }
+
+    long int size_in_bytes() {
+        std::lock_guard<std::mutex> lock(mutex_);
+        return (queue_.size() + 1) * block_size_;
+    }
+
+private:
+    void append_bytes(const char* data, std::size_t nb_bytes) {
+        while (nb_bytes > 0) {
+            std::size_t count = std::min(nb_bytes, block_size_ - block_.size());
+            block_.insert(block_.end(), data, data + count);
+            data += count;
+            nb_bytes -= count;
+
+            if (block_.size() == block_size_)
+                submit();
+        }
+    }
+
+    // Hand the current block over to the writer thread
+    void submit() {
+        if (block_.empty())
+            return;
+
+        {
+            std::lock_guard<std::mutex> lock(mutex_);
+            queue_.push_back(std::move(block_));
+        }
+        pending_.notify_one();
+
+        block_ = std::vector<char>();
+        block_.reserve(block_size_);
+    }
+
+    void write_blocks() {
+        std::unique_lock<std::mutex> lock(mutex_);
+        while (true) {
+            pending_.wait(lock, [this]{ return stop_ || !queue_.empty(); });
+
+            while (!queue_.empty()) {
+                auto block = std::move(queue_.front());
+                queue_.pop_front();
+                busy_ = true;
+
+                // the disk access is performed without holding the lock
+                lock.unlock();
+                fwrite(block.data(), 1, block.size(), file_);
+                lock.lock();
+                busy_ = false;
+            }
+            done_.notify_all();
+
+            if (stop_)
+                break;
+        }
+    }
+
+    FILE* file_ = nullptr;
+    std::size_t block_size_;
+    std::vector<char> block_;
+
+    std::thread writer_;
+    std::mutex mutex_;
+    std::condition_variable pending_;
+    std::condition_variable done_;
+    std::deque< std::vector<char> > queue_;
+    bool stop_;
+    bool busy_;
+};
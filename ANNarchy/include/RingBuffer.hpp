@@ -0,0 +1,99 @@
+/*
+ *    RingBuffer.hpp
+ *
+ *    This file is part of ANNarchy.
+ *
+ *    Copyright (C) 2022  Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>,
+ *    Julien Vitay <julien.vitay@gmail.com>
+ *
+ *    This program is free software: you can redistribute it and/or modify
+ *    it under the terms of the GNU General Public License as published by
+ *    the Free Software Foundation, either version 3 of the License, or
+ *    (at your option) any later version.
+ *
+ *    ANNarchy is distributed in the hope that it will be useful,
+ *    but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *    GNU General Public License for more details.
+ *
+ *    You should have received a copy of the GNU General Public License
+ *    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+#pragma once
+
+#include <algorithm>
+#include <vector>
+
+/*
+ *  Fixed-size history of the last values of a variable, e.g. the delayed
+ *  firing rates or spike events of a population.
+ *
+ *  The elements are preallocated and a head index moves backwards through
+ *  them: push_front() overwrites the oldest element in place (re-using its
+ *  memory) instead of allocating a new one, like std::deque::push_front()
+ *  followed by pop_back() would do. The element pushed d steps ago is
+ *  accessed with [d], so the buffer can be indexed like the deque it
+ *  replaces.
+ */
+template<typename T>
+class RingBuffer
+{
+public:
+    RingBuffer() : head_(0) {}
+
+    RingBuffer(std::size_t size, const T& value) : buffer_(size, value), head_(0) {}
+
+    // Element which was pushed d steps ago (0 is the latest)
+    inline T& operator[](std::size_t d) {
+        std::size_t idx = head_ + d;
+        if (idx >= buffer_.size())
+            idx -= buffer_.size();
+        return buffer_[idx];
+    }
+
+    inline const T& operator[](std::size_t d) const {
+        std::size_t idx = head_ + d;
+        if (idx >= buffer_.size())
+            idx -= buffer_.size();
+        return buffer_[idx];
+    }
+
+    inline std::size_t size() const {
+        return buffer_.size();
+    }
+
+    inline bool empty() const {
+        return buffer_.empty();
+    }
+
+    // Stores the latest value, the oldest one is dropped.
+    inline void push_front(const T& value) {
+        if (buffer_.empty())
+            return;
+
+        head_ = (head_ == 0) ? buffer_.size() - 1 : head_ - 1;
+        buffer_[head_] = value;
+    }
+
+    // Sets all elements to the given value
+    void fill(const T& value) {
+        std::fill(buffer_.begin(), buffer_.end(), value);
+        head_ = 0;
+    }
+
+    // Changes the length of the history, new elements are appended as the oldest ones.
+    void resize(std::size_t size, const T& value) {
+        std::rotate(buffer_.begin(), buffer_.begin() + head_, buffer_.end());
+        head_ = 0;
+        buffer_.resize(size, value);
+    }
+
+    void clear() {
+        buffer_.clear();
+        head_ = 0;
+    }
+
+private:
+    std::vector<T> buffer_;
+    std::size_t head_;
+};
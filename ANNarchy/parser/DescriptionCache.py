@@ -0,0 +1,245 @@
+#===============================================================================
+#
+#     DescriptionCache.py
+#
+#     This file is part of ANNarchy.
+#
+#     Copyright (C) 2013-2016  Julien Vitay <julien.vitay@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchy is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#===============================================================================
+"""
+Cache for the descriptions returned by analyse_neuron() and analyse_synapse().
+
+The analysis of a neuron or synapse type (parsing of the equations with sympy,
+numerical methods...) only depends on the text of its fields and on a few
+global settings. The resulting descriptions are kept in memory, so that the
+same model is analysed only once per process. If the compilation cache is
+enabled (setup(compilation_cache=True)), they are additionally stored on disk
+in the "descriptions" subfolder of the cache, so a new process can skip the
+analysis entirely.
+"""
+import os
+import pickle
+import hashlib
+from copy import deepcopy
+
+import numpy as np
+
+import ANNarchy
+from ANNarchy.core import Global
+
+# Fields of the neuron and synapse types the analysis depends on
+_key_attributes = {
+    'neuron': ['type', 'parameters', 'equations', 'functions', 'spike', 'axon_spike',
+               'reset', 'axon_reset', 'refractory', 'extra_values'],
+    'synapse': ['type', 'parameters', 'equations', 'functions', 'psp', 'operation',
+                'pre_spike', 'post_spike', 'pre_axon_spike', 'pruning', 'creating',
+                'extra_values']
+}
+
+# Descriptions already analysed in this process
+_descriptions = {}
+
+# Location and size limit of the cache on disk, read once from annarchy.json
+_cache_settings = None
+
+def analyse(obj, kind, analyse_function):
+    """
+    Returns the description of the neuron or synapse type *obj*. The
+    description is taken from the cache if the same model was already
+    analysed, otherwise *analyse_function* is called and its result stored.
+
+    :param obj: the Neuron or Synapse instance.
+    :param kind: either 'neuron' or 'synapse'.
+    :param analyse_function: analyse_neuron() or analyse_synapse().
+    """
+    key = compute_key(obj, kind)
+
+    # Some values of the model can not be hashed reliably
+    if key is None:
+        return analyse_function(obj)
+
+    # Already analysed in this process. The descriptions are modified later
+    # on (e.g. by the specific populations), so we always return a copy.
+    if key in _descriptions:
+        return deepcopy(_descriptions[key])
+
+    description = None
+    if Global.config['compilation_cache']:
+        description = _load(key)
+    from_disk = description is not None
+
+    if not from_disk:
+        description = analyse_function(obj)
+
+    try:
+        _descriptions[key] = deepcopy(description)
+    except TypeError:
+        # Descriptions referring to Constant objects can be neither copied
+        # nor unpickled, the model will be analysed again next time.
+        return description
+
+    if Global.config['compilation_cache'] and not from_disk:
+        _store(key, description)
+
+    return description
+
+def compute_key(obj, kind):
+    """
+    Computes the hash of the neuron or synapse type *obj*: the normalized text
+    of its fields together with the global settings influencing the analysis.
+    Returns None if one of the values has no stable representation.
+    """
+    sha = hashlib.sha256()
+
+    environment = [
+        ANNarchy.__release__,
+        kind,
+        Global.config['paradigm'],
+        Global.config['precision'],
+        Global.config['method'],
+    ]
+
+    # Global constants and functions can be used in the equations
+    environment += sorted([obj_c.name + '=' + str(obj_c.value) for obj_c in Global._objects['constants']])
+    environment += [function for _, function in Global._objects['functions']]
+
+    for attribute in _key_attributes[kind]:
+        value = getattr(obj, attribute, None)
+        if isinstance(value, str):
+            value = _normalize(value)
+        else:
+            value = _value_key(value)
+            if value is None:
+                return None
+        environment.append(attribute + ':' + value)
+
+    for entry in environment:
+        sha.update(entry.encode('utf-8'))
+        sha.update(b'\0')
+
+    return sha.hexdigest()
+
+def _value_key(value):
+    """
+    Returns a representation of *value* which only depends on its content, e.g.
+    of the objects passed in extra_values. None is returned for objects which
+    are only identified by their address.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return type(value).__name__ + ':' + repr(value)
+
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return _value_key(value.tolist())
+        content = hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest()
+        return 'ndarray:' + str(value.dtype) + str(value.shape) + ':' + content
+
+    if isinstance(value, (list, tuple)):
+        items = [_value_key(item) for item in value]
+        if None in items:
+            return None
+        return type(value).__name__ + '[' + ','.join(items) + ']'
+
+    if isinstance(value, dict):
+        items = [(_value_key(k), _value_key(v)) for k, v in value.items()]
+        if any([k is None or v is None for k, v in items]):
+            return None
+        return 'dict{' + ','.join(sorted([k + '=' + v for k, v in items])) + '}'
+
+    # Other objects (e.g. random distributions) are described by their attributes,
+    # functions or classes can not be compared this way
+    if hasattr(value, '__dict__') and not callable(value):
+        attributes = _value_key(vars(value))
+        if attributes is None:
+            return None
+        return type(value).__module__ + '.' + type(value).__qualname__ + attributes
+
+    return None
+
+def _normalize(text):
+    """
+    Removes the leading/trailing whitespaces, empty lines and repeated spaces
+    which do not change the meaning of an equation.
+    """
+    lines = [' '.join(line.split()) for line in text.split('\n')]
+    return '\n'.join([line for line in lines if line != ''])
+
+def _settings():
+    "Returns the location of the compilation cache and its size limit in bytes."
+    global _cache_settings
+    if _cache_settings is None:
+        from ANNarchy.generator.Compiler import load_user_config
+        from ANNarchy.generator.CompilationCache import cache_settings
+
+        try:
+            user_config = load_user_config()
+        except (OSError, ValueError):
+            user_config = {}
+        _cache_settings = cache_settings(user_config)
+    return _cache_settings
+
+def _folder():
+    "Returns the folder where the descriptions are stored."
+    from ANNarchy.generator.CompilationCache import descriptions_folder
+    return _settings()[0] + '/' + descriptions_folder
+
+def _load(key):
+    "Returns the description stored on disk under *key*, None if not found."
+    entry = _folder() + '/' + key + '.pkl'
+    if not os.path.isfile(entry):
+        return None
+
+    try:
+        with open(entry, 'rb') as rfile:
+            description = pickle.load(rfile)
+    except Exception:
+        # incomplete or from an incompatible python version
+        return None
+
+    # mark the entry as recently used
+    try:
+        os.utime(entry, None)
+    except OSError:
+        pass
+
+    return description
+
+def _store(key, description):
+    "Stores the description on disk under *key*."
+    from ANNarchy.generator.CompilationCache import evict
+
+    try:
+        data = pickle.dumps(description, protocol=pickle.HIGHEST_PROTOCOL)
+    except (TypeError, pickle.PicklingError):
+        return
+
+    try:
+        os.makedirs(_folder(), exist_ok=True)
+
+        # Several processes may write the same entry at once
+        tmp_file = _folder() + '/' + key + '.' + str(os.getpid()) + '.tmp'
+        with open(tmp_file, 'wb') as wfile:
+            wfile.write(data)
+        os.replace(tmp_file, _folder() + '/' + key + '.pkl')
+
+    except OSError as e:
+        Global._warning('Unable to store the model description in the cache (' + str(e) + ')')
+        return
+
+    cache_dir, max_size = _settings()
+    evict(cache_dir, max_size)
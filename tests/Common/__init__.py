@@ -8,3 +8,5 @@ from .test_NumericalMethod import (test_Explicit, test_Exponential,
                                    test_Precision)
 from .test_BuiltinFunctions import test_BuiltinFunctions
 from .test_CustomFunc import test_CustomFunc
+from .test_DescriptionCache import test_DescriptionCache
+from .test_CompilationCache import test_CompilationCache
@@ -0,0 +1,92 @@
+"""
+
+    test_CompilationCache.py
+
+    This file is part of ANNarchy.
+
+    Copyright (C) 2013-2020 Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>,
+    Julien Vitay <julien.vitay@gmail.com>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import shutil
+import tempfile
+import unittest
+
+from ANNarchy.generator import CompilationCache
+
+class test_CompilationCache(unittest.TestCase):
+    """
+    Tests the keys of the object files stored in the compilation cache.
+    """
+    def setUp(self):
+        """
+        Build folder with two translation units sharing a header.
+        """
+        self.build_dir = tempfile.mkdtemp()
+        self._write('Makefile', 'all: ANNarchy.o ANNarchyCore0.o\n')
+        self._write('ANNarchy.h', '#pragma once\n#include "pop0.hpp"\n#include <vector>\n')
+        self._write('pop0.hpp', '#pragma once\nstruct PopStruct0 { int size; };\n')
+        self._write('proj0.hpp', '#pragma once\nstruct ProjStruct0 { int size; };\n')
+        self._write('ANNarchy.cpp', '#include "ANNarchy.h"\nPopStruct0 pop0;\n')
+        self._write('ANNarchyCore0.pyx', 'cdef extern from "ANNarchy.h":\n    pass\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.build_dir, ignore_errors=True)
+
+    def _write(self, file, code):
+        with open(self.build_dir + '/' + file, 'w') as wfile:
+            wfile.write(code)
+
+    def _keys(self):
+        return [CompilationCache.compute_object_key(self.build_dir, source) for source in ['ANNarchy.cpp', 'ANNarchyCore0.pyx']]
+
+    def test_included_headers(self):
+        """
+        Local headers are followed transitively, in C++ and Cython sources.
+        """
+        self.assertEqual(CompilationCache.included_headers(self.build_dir, 'ANNarchy.cpp'), {'ANNarchy.h', 'pop0.hpp'})
+        self.assertEqual(CompilationCache.included_headers(self.build_dir, 'ANNarchyCore0.pyx'), {'ANNarchy.h', 'pop0.hpp'})
+
+    def test_included_header_changed(self):
+        """
+        Modifying an included header changes the key of the units.
+        """
+        keys = self._keys()
+        self.assertEqual(self._keys(), keys)
+
+        self._write('pop0.hpp', '#pragma once\nstruct PopStruct0 { int size; double r; };\n')
+        new_keys = self._keys()
+        self.assertNotEqual(new_keys[0], keys[0])
+        self.assertNotEqual(new_keys[1], keys[1])
+
+    def test_other_header_changed(self):
+        """
+        Modifying or adding a header which is not included keeps the keys.
+        """
+        keys = self._keys()
+        self._write('proj0.hpp', '#pragma once\nstruct ProjStruct0 { int size; double w; };\n')
+        self._write('proj1.hpp', '#pragma once\nstruct ProjStruct1 { int size; };\n')
+        self.assertEqual(self._keys(), keys)
+
+    def test_source_changed(self):
+        """
+        Each unit only depends on its own source.
+        """
+        keys = self._keys()
+        self._write('ANNarchy.cpp', '#include "ANNarchy.h"\nPopStruct0 pop0;\nint t;\n')
+        new_keys = self._keys()
+        self.assertNotEqual(new_keys[0], keys[0])
+        self.assertEqual(new_keys[1], keys[1])
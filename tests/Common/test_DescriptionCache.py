@@ -0,0 +1,160 @@
+"""
+
+    test_DescriptionCache.py
+
+    This file is part of ANNarchy.
+
+    Copyright (C) 2013-2020 Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>,
+    Julien Vitay <julien.vitay@gmail.com>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from ANNarchy import Constant, Neuron, Uniform
+from ANNarchy.core import Global
+from ANNarchy.generator import CompilationCache
+from ANNarchy.parser import DescriptionCache
+from ANNarchy.parser.AnalyseNeuron import analyse_neuron
+
+class test_DescriptionCache(unittest.TestCase):
+    """
+    Tests the cache of the analysed neuron and synapse descriptions, in
+    memory and on disk (the "descriptions" folder of the compilation cache).
+    """
+    def setUp(self):
+        """
+        Empty cache located in a temporary folder.
+        """
+        self.descriptions = dict(DescriptionCache._descriptions)
+        self.settings = DescriptionCache._cache_settings
+        self.compilation_cache = Global.config['compilation_cache']
+
+        self.cache_dir = tempfile.mkdtemp()
+        DescriptionCache._descriptions.clear()
+        DescriptionCache._cache_settings = (self.cache_dir, 1024 * 1024 * 1024)
+        Global.config['compilation_cache'] = True
+
+        self.nb_analysed = 0
+
+    def tearDown(self):
+        """
+        Restore the previous cache.
+        """
+        DescriptionCache._descriptions.clear()
+        DescriptionCache._descriptions.update(self.descriptions)
+        DescriptionCache._cache_settings = self.settings
+        Global.config['compilation_cache'] = self.compilation_cache
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _analyse(self, neuron):
+        "Analyses the neuron through the cache, counting the actual analyses."
+        def analyse_function(obj):
+            self.nb_analysed += 1
+            return analyse_neuron(obj)
+        return DescriptionCache.analyse(neuron, 'neuron', analyse_function)
+
+    def _neuron(self, **args):
+        return Neuron(parameters="tau = 10.0", equations="tau * dr/dt + r = 1.0", **args)
+
+    def test_hit_and_miss(self):
+        """
+        The same model is analysed once, also with different whitespaces.
+        """
+        first = self._analyse(self._neuron())
+        second = self._analyse(Neuron(parameters="  tau =  10.0 ", equations="tau * dr/dt + r = 1.0\n"))
+        self.assertEqual(self.nb_analysed, 1)
+        self.assertEqual(first, second)
+
+        self._analyse(Neuron(parameters="tau = 20.0", equations="tau * dr/dt + r = 1.0"))
+        self.assertEqual(self.nb_analysed, 2)
+
+    def test_hit_returns_copy(self):
+        """
+        Modifying a returned description does not modify the cached one.
+        """
+        first = self._analyse(self._neuron())
+        first['parameters'].clear()
+        second = self._analyse(self._neuron())
+        self.assertNotEqual(second['parameters'], [])
+
+    def test_invalidation(self):
+        """
+        The key depends on the global constants and functions and on the
+        floating point precision.
+        """
+        neuron = self._neuron()
+        key = DescriptionCache.compute_key(neuron, 'neuron')
+
+        Global._objects['functions'].append(('glob', 'glob(x) = 2*x'))
+        try:
+            self.assertNotEqual(DescriptionCache.compute_key(neuron, 'neuron'), key)
+        finally:
+            Global._objects['functions'].pop()
+
+        constant = Constant('cache_test_constant', 1.0)
+        try:
+            self.assertNotEqual(DescriptionCache.compute_key(neuron, 'neuron'), key)
+            with_constant = DescriptionCache.compute_key(neuron, 'neuron')
+            constant.value = 2.0
+            self.assertNotEqual(DescriptionCache.compute_key(neuron, 'neuron'), with_constant)
+        finally:
+            Global._objects['constants'].remove(constant)
+
+        precision = Global.config['precision']
+        Global.config['precision'] = "float" if precision == "double" else "double"
+        try:
+            self.assertNotEqual(DescriptionCache.compute_key(neuron, 'neuron'), key)
+        finally:
+            Global.config['precision'] = precision
+
+        self.assertEqual(DescriptionCache.compute_key(neuron, 'neuron'), key)
+
+    def test_extra_values(self):
+        """
+        Objects passed in extra_values are compared by their content.
+        """
+        key = DescriptionCache.compute_key(self._neuron(extra_values={'init': Uniform(0.0, 1.0)}), 'neuron')
+        self.assertEqual(DescriptionCache.compute_key(self._neuron(extra_values={'init': Uniform(0.0, 1.0)}), 'neuron'), key)
+        self.assertNotEqual(DescriptionCache.compute_key(self._neuron(extra_values={'init': Uniform(0.0, 2.0)}), 'neuron'), key)
+
+        # objects only identified by their address are not cached
+        self.assertIsNone(DescriptionCache.compute_key(self._neuron(extra_values={'init': lambda x: x}), 'neuron'))
+
+    def test_disk_round_trip(self):
+        """
+        A description stored on disk is used by a new process (simulated by
+        clearing the memory), without analysing the model again.
+        """
+        description = self._analyse(self._neuron())
+        self.assertEqual(len(os.listdir(self.cache_dir + '/' + CompilationCache.descriptions_folder)), 1)
+
+        DescriptionCache._descriptions.clear()
+        self.assertEqual(self._analyse(self._neuron()), description)
+        self.assertEqual(self.nb_analysed, 1)
+
+    def test_eviction(self):
+        """
+        The stored descriptions count towards the size limit of the cache.
+        """
+        self._analyse(self._neuron())
+        folder = self.cache_dir + '/' + CompilationCache.descriptions_folder
+        self.assertEqual(len(os.listdir(folder)), 1)
+
+        CompilationCache.evict(self.cache_dir, 0)
+        self.assertEqual(os.listdir(folder), [])
@@ -1,5 +1,7 @@
 import unittest
 from .test_IO import test_IO_Rate, test_IO_Spiking
-from .test_Record import test_Record
+from .test_Record import test_Record, test_RecordStream
 from .test_Report import test_Report_Rate, test_Report_Spiking
-from .test_TimedArray import test_TimedArray
+from .test_TimedArray import test_TimedArray, test_TimedArrayStream, test_TimedPoissonPopulationStream
+from .test_SpikeSourceArray import test_SpikeSourceArray
+from .test_Parallel import test_Parallel, test_ShareConnectivity
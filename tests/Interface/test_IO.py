@@ -70,7 +70,7 @@ class test_IO_Rate(unittest.TestCase):
         cls.isparam = [True, False, True, False, True]
         cls.savefolder = '_networksave/'
         os.mkdir(cls.savefolder)
-        cls.save_extensions = ['.data', '.npz', '.txt.gz']
+        cls.save_extensions = ['.data', '.npz', '.txt.gz', '/']
 
     @classmethod
     def tearDownClass(cls):
@@ -171,7 +171,7 @@ class test_IO_Spiking(unittest.TestCase):
         cls.isparam = [True, False, True, True, False]
         cls.savefolder = '_networksave/'
         os.mkdir(cls.savefolder)
-        cls.save_extensions = ['.data', '.npz', '.txt.gz']
+        cls.save_extensions = ['.data', '.npz', '.txt.gz', '/']
 
     def setUp(self):
         """ Clear the network before every test. """
@@ -0,0 +1,186 @@
+"""
+
+    test_Parallel.py
+
+    This file is part of ANNarchy.
+
+    Copyright (C) 2022 Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import os
+import unittest
+import numpy
+
+from ANNarchy import clear, compile, Neuron, parallel_imap, parallel_run, Population, \
+    Projection, Uniform
+
+# number of calls of worker_setup() in the current process
+_setup_calls = 0
+
+def worker_setup():
+    global _setup_calls
+    _setup_calls += 1
+
+def simulation(idx, net, value):
+    """
+    Single run: returns its index, the process, the number of calls to
+    worker_setup() and the firing rate.
+    """
+    pop = net.get_population('parallel_pop')
+    pop.I = value
+    net.simulate(20.0)
+    return idx, os.getpid(), _setup_calls, float(pop.r[0])
+
+def connectivity(idx, net):
+    """
+    Returns the connectivity of the projection. The first run sets its
+    weights to zero afterwards.
+    """
+    proj = net.get_projection('parallel_proj')
+    post_ranks = proj.post_ranks
+    pre_ranks = [proj.dendrite(rk).pre_ranks for rk in post_ranks]
+    weights = [numpy.array(proj.dendrite(rk).w) for rk in post_ranks]
+    if idx == 0:
+        proj.w = 0.0
+    return post_ranks, pre_ranks, weights
+
+class test_Parallel(unittest.TestCase):
+    """
+    Tests *parallel_run()* and *parallel_imap()* with more runs than
+    processes, so that each process simulates a batch of networks.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network 0 for this test
+        """
+        clear()
+        neuron = Neuron(
+            parameters = """
+                tau = 10.0 : population
+                I = 0.0
+            """,
+            equations = "tau * dr/dt + r = I",
+        )
+        Population(1, neuron, name='parallel_pop')
+        compile(silent=True)
+
+        cls.number = 6
+        cls.values = numpy.linspace(1.0, 6.0, cls.number)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        All tests of this class are done. We can destroy the network.
+        """
+        clear()
+
+    def assertRun(self, idx, result):
+        """
+        The result belongs to the run *idx*.
+        """
+        self.assertEqual(result[0], idx)
+        # explicit Euler, 20 steps from r = 0
+        self.assertAlmostEqual(result[3], self.values[idx] * (1.0 - 0.9**20))
+
+    def test_parallel_run_order(self):
+        """
+        parallel_run() returns the results in the order of the runs.
+        """
+        results = parallel_run(simulation, number=self.number, max_processes=2, value=self.values)
+
+        self.assertEqual(len(results), self.number)
+        for idx, result in enumerate(results):
+            self.assertRun(idx, result)
+
+    def test_parallel_imap_order(self):
+        """
+        parallel_imap() yields each run once, together with its index.
+        """
+        results = list(parallel_imap(simulation, number=self.number, max_processes=2, value=self.values))
+
+        self.assertEqual(sorted([idx for idx, _ in results]), list(range(self.number)))
+        for idx, result in results:
+            self.assertRun(idx, result)
+
+    def test_batch(self):
+        """
+        Each process runs several networks, it is set up only once.
+        """
+        results = list(parallel_imap(simulation, number=self.number, max_processes=2, worker_setup=worker_setup, value=self.values))
+
+        self.assertLessEqual(len(set([result[1] for _, result in results])), 2)
+        self.assertNotIn(os.getpid(), [result[1] for _, result in results])
+        for idx, result in results:
+            self.assertRun(idx, result)
+            self.assertEqual(result[2], 1)
+
+class test_ShareConnectivity(unittest.TestCase):
+    """
+    Tests the connectivity shared by the networks of *parallel_run()* with
+    *share_connectivity*: it is built once, but each network owns its copy.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network 0 for this test
+        """
+        clear()
+        neuron = Neuron(parameters = "r = 0.0")
+        pop = Population(20, neuron)
+        cls.proj = Projection(pop, pop, 'exc', name='parallel_proj')
+        cls.proj.connect_fixed_probability(probability=0.3, weights=Uniform(0.5, 1.0))
+        compile(silent=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        All tests of this class are done. We can destroy the network.
+        """
+        clear()
+
+    def assertSameConnectivity(self, first, second):
+        self.assertEqual(first[0], second[0])
+        self.assertEqual(first[1], second[1])
+        for w1, w2 in zip(first[2], second[2]):
+            numpy.testing.assert_array_equal(w1, w2)
+
+    def test_identical_networks(self):
+        """
+        The networks simulated by different processes have the same ranks and
+        (random) weights as the network 0.
+        """
+        results = parallel_run(connectivity, number=2, max_processes=2, share_connectivity=True)
+
+        self.assertGreater(sum([len(ranks) for ranks in results[0][1]]), 0)
+        self.assertSameConnectivity(results[0], results[1])
+
+        post_ranks = self.proj.post_ranks
+        self.assertSameConnectivity(results[0], (post_ranks,
+            [self.proj.dendrite(rk).pre_ranks for rk in post_ranks],
+            [numpy.array(self.proj.dendrite(rk).w) for rk in post_ranks]))
+
+    def test_independent_weights(self):
+        """
+        Setting the weights of the first network does not modify the ones of
+        the second network, although both are loaded from the same files in
+        the same process.
+        """
+        results = parallel_run(connectivity, number=2, sequential=True, share_connectivity=True)
+
+        self.assertSameConnectivity(results[0], results[1])
+        for w in results[1][2]:
+            self.assertTrue(numpy.all(w >= 0.5))
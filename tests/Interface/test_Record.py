@@ -21,6 +21,8 @@
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
+import shutil
+import tempfile
 import unittest
 import numpy
 
@@ -80,6 +82,7 @@ q = Monitor(pop1[0] + pop1[2], 'r')
 r = Monitor(pop2[:2] + pop2.neuron(4), 'r')
 s = Monitor(pop3, ['v', 'spike'])
 t = Monitor(pop4, ['v', 'spike'])
+v = Monitor(pop3, 'spike', events=True)
 
 class test_Record(unittest.TestCase):
     """
@@ -93,10 +96,10 @@ class test_Record(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """
-        Compile the network for this test
+        Compile the network for this test.
         """
         cls.test_net = Network()
-        cls.test_net.add([pop1, pop2, pop3, pop4, proj, m, n, o, p, q, r, s, t])
+        cls.test_net.add([pop1, pop2, pop3, pop4, proj, m, n, o, p, q, r, s, t, v])
         cls.test_net.compile(silent=True)
 
     @classmethod
@@ -126,6 +129,7 @@ class test_Record(unittest.TestCase):
         self.test_net.get(r).get()
         self.test_net.get(s).get()
         self.test_net.get(t).get()
+        self.test_net.get(v).get()
 
     def test_r_sim_10(self):
         """
@@ -299,3 +303,91 @@ class test_Record(unittest.TestCase):
         self.test_net.simulate(10)
         data_t = self.test_net.get(t).get('spike')
         self.assertEqual(data_t[1], [2, 7])
+
+    def test_spike_events(self):
+        """
+        Tests if the *spikes* recorded as event list are identical to the
+        spikes recorded per neuron.
+        """
+        self.test_net.simulate(10)
+        times, ranks = self.test_net.get(v).get('spike')
+        numpy.testing.assert_equal(times[ranks == 0], [4, 6, 8])
+
+        spike_times, spike_ranks = self.test_net.get(s).raster_plot()
+        self.assertEqual(sorted(zip(spike_times, spike_ranks)),
+                         sorted(zip(times * 1.0, ranks)))
+
+    def test_spike_histogram_pause(self):
+        """
+        Tests if the *histogram()* only counts the spikes recorded after the
+        last *resume()*.
+        """
+        self.test_net.simulate(5)
+        self.test_net.get(s).pause()
+        self.test_net.simulate(2)
+        self.test_net.get(s).resume()
+        self.test_net.simulate(5)
+
+        # the spikes at t=4 were recorded before the pause
+        histo = self.test_net.get(s).histogram()
+        numpy.testing.assert_equal(histo, [0, 3, 0, 3, 0])
+
+class test_RecordStream(unittest.TestCase):
+    """
+    This class tests the streaming of recorded variables into files. The
+    network has its own population and monitors, so the results do not
+    depend on the other tests.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test. The streamed recordings are
+        written into a temporary folder.
+        """
+        cls.stream_dir = tempfile.mkdtemp()
+
+        pop = Population(3, neuron)
+        cls.m = Monitor(pop, 'r')
+        cls.u = Monitor(pop, 'r', stream=cls.stream_dir)
+
+        cls.test_net = Network()
+        cls.test_net.add([pop, cls.m, cls.u])
+        cls.test_net.compile(silent=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        All tests of this class are done. We can destroy the network and the
+        streamed files.
+        """
+        del cls.test_net
+        clear()
+        shutil.rmtree(cls.stream_dir, ignore_errors=True)
+
+    def setUp(self):
+        """
+        In our *setUp()* function we call *reset()* to reset the network.
+        """
+        self.test_net.reset()
+
+    def tearDown(self):
+        """
+        Clear the recordings after every test.
+        """
+        self.test_net.get(self.m).get()
+        self.test_net.get(self.u).get()
+
+    def test_r_stream(self):
+        """
+        Tests if the variable *r* streamed into a file is returned as a
+        memory-mapped array and is identical to the recording in memory.
+        """
+        self.test_net.simulate(10)
+        data_u = self.test_net.get(self.u).get('r', keep=True)
+        self.assertIsInstance(data_u, numpy.memmap)
+        numpy.testing.assert_allclose(data_u, self.test_net.get(self.m).get('r'))
+
+        # the kept data is returned again together with the new steps
+        self.test_net.simulate(5)
+        self.assertEqual(self.test_net.get(self.u).get('r').shape, (15, 3))
+        self.assertEqual(self.test_net.get(self.u).get('r').shape, (0, 3))
@@ -0,0 +1,96 @@
+"""
+
+    test_SpikeSourceArray.py
+
+    This file is part of ANNarchy.
+
+    Copyright (C) 2022 Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import unittest
+import numpy
+
+from ANNarchy import clear, Monitor, Network, SpikeSourceArray
+
+inp = SpikeSourceArray(spike_times=[[1., 3., 5.], [2., 3.], [], [0., 4.]])
+m = Monitor(inp, 'spike')
+
+class test_SpikeSourceArray(unittest.TestCase):
+    """
+    Tests the emission of spikes by a *SpikeSourceArray*, either given by the
+    *spike_times* or appended during the simulation.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test
+        """
+        cls.test_net = Network()
+        cls.test_net.add([inp, m])
+        cls.test_net.compile(silent=True)
+
+        cls.net_inp = cls.test_net.get(inp)
+        cls.net_m = cls.test_net.get(m)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        All tests of this class are done. We can destroy the network.
+        """
+        del cls.test_net
+        clear()
+
+    def setUp(self):
+        """
+        In our *setUp()* function we call *reset()* to reset the network.
+        """
+        self.test_net.reset()
+        self.net_m.get()
+
+    def test_spike_times(self):
+        """
+        Tests the emission of the spikes given by *spike_times*.
+        """
+        self.test_net.simulate(10)
+        spikes = self.net_m.get('spike')
+
+        self.assertEqual(spikes[0], [1, 3, 5])
+        self.assertEqual(spikes[1], [2, 3])
+        self.assertEqual(spikes[2], [])
+        self.assertEqual(spikes[3], [0, 4])
+
+    def test_append_spikes(self):
+        """
+        Tests the spikes added with *append_spikes()*, which are merged
+        with the *spike_times* and discarded by *reset()*.
+        """
+        self.test_net.simulate(2)
+        self.net_inp.append_spikes([[6.], [3., 7.], [1., 8.], []])
+        self.net_inp.append_spikes(numpy.array([9.0]), numpy.array([2]))
+        self.test_net.simulate(8)
+        spikes = self.net_m.get('spike')
+
+        self.assertEqual(spikes[0], [1, 3, 5, 6])
+        self.assertEqual(spikes[1], [2, 3, 7])
+        self.assertEqual(spikes[2], [8, 9])
+        self.assertEqual(spikes[3], [0, 4])
+
+        # not yet emitted spikes are discarded
+        self.net_inp.append_spikes(numpy.array([12.0]), numpy.array([0]))
+        self.test_net.reset()
+        self.net_m.get()
+        self.test_net.simulate(15)
+        self.assertEqual(self.net_m.get('spike')[0], [1, 3, 5])
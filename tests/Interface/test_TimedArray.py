@@ -146,3 +146,127 @@ class test_TimedArray(object):
 
         np.testing.assert_allclose(self.output.r4, [0, 1, 0, 0, 0, 0, 0, 0, 0, 0])
 
+
+class test_TimedArrayStream(unittest.TestCase):
+    """
+    Test the streaming of the inputs of a TimedArray, either from an array
+    in blocks of *block_size* rows or from a function returning an iterator.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test. The streamed inputs are compared
+        to the same inputs held entirely by a TimedArray.
+        """
+        cls.inputs = np.random.random((20, 3, 2))
+
+        def rows():
+            for row in cls.inputs:
+                yield row
+
+        inp = TimedArray(rates=cls.inputs, schedule=2.)
+        inp2 = TimedArray(rates=cls.inputs, schedule=2., block_size=3)
+        inp3 = TimedArray(rates=rows, geometry=(3, 2), schedule=2., block_size=7)
+
+        m = Monitor(inp, 'r')
+        m2 = Monitor(inp2, 'r')
+        m3 = Monitor(inp3, 'r')
+
+        cls.test_net = Network()
+        cls.test_net.add([inp, inp2, inp3, m, m2, m3])
+        cls.test_net.compile(silent=True)
+
+        cls.monitors = [cls.test_net.get(m), cls.test_net.get(m2), cls.test_net.get(m3)]
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        All tests of this class are done. We can destroy the network.
+        """
+        del cls.test_net
+        clear()
+
+    def test_stream(self):
+        """
+        The streamed inputs are set with the same schedule as the stored ones.
+        After the end of the stream, the last input is kept.
+        """
+        self.test_net.simulate(50)
+        r, r2, r3 = [m.get('r') for m in self.monitors]
+
+        np.testing.assert_allclose(r2, r)
+        np.testing.assert_allclose(r3, r)
+        np.testing.assert_allclose(r2[-1], self.inputs[-1].ravel())
+
+    def test_iterator_copy(self):
+        """
+        An iterator can not be streamed by the copies of a population.
+        """
+        inp = TimedArray(rates=iter(self.inputs), geometry=(3, 2), schedule=2., block_size=5)
+        with self.assertRaises(ANNarchyException):
+            Network().add(inp)
+
+    def test_row_size(self):
+        """
+        The rows of a streamed array must provide one value per neuron.
+        """
+        with self.assertRaises(ANNarchyException):
+            TimedArray(rates=self.inputs, geometry=5, schedule=2., block_size=5)
+
+
+class test_TimedPoissonPopulationStream(unittest.TestCase):
+    """
+    Test the streaming of the rates of a TimedPoissonPopulation. The rates
+    are either 0 or 1000 Hz, so the spikes are deterministic for dt = 1 ms.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test. The streamed rates are compared
+        to the same rates held entirely by a TimedPoissonPopulation.
+        """
+        cls.rates = np.array([[1000.0 * ((i + t) % 3 == 0) for i in range(4)] for t in range(10)])
+
+        def rows():
+            for row in cls.rates:
+                yield row
+
+        inp = TimedPoissonPopulation(4, rates=cls.rates, schedule=[float(t) for t in range(10)])
+        inp2 = TimedPoissonPopulation(4, rates=cls.rates, schedule=1., block_size=3)
+        inp3 = TimedPoissonPopulation(4, rates=rows, schedule=1., block_size=4)
+
+        m = Monitor(inp, 'spike')
+        m2 = Monitor(inp2, 'spike')
+        m3 = Monitor(inp3, 'spike')
+
+        cls.test_net = Network()
+        cls.test_net.add([inp, inp2, inp3, m, m2, m3])
+        cls.test_net.compile(silent=True)
+
+        cls.monitors = [cls.test_net.get(m), cls.test_net.get(m2), cls.test_net.get(m3)]
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        All tests of this class are done. We can destroy the network.
+        """
+        del cls.test_net
+        clear()
+
+    def test_stream(self):
+        """
+        The streamed rates are set with the same schedule as the stored ones.
+        """
+        self.test_net.simulate(10)
+        spikes, spikes2, spikes3 = [m.get('spike') for m in self.monitors]
+
+        self.assertEqual(sum(len(times) for times in spikes.values()), 14)
+        self.assertEqual(spikes2, spikes)
+        self.assertEqual(spikes3, spikes)
+
+    def test_row_size(self):
+        """
+        The rows of the streamed rates must provide one rate per neuron.
+        """
+        with self.assertRaises(ANNarchyException):
+            TimedPoissonPopulation(4, rates=np.zeros((10, 3)), schedule=1., block_size=2)
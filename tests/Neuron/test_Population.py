@@ -25,6 +25,7 @@ import unittest
 from numpy.testing import assert_allclose
 
 from ANNarchy import clear, Network, Neuron, Population, Uniform
+from ANNarchy.core.Global import _check_paradigm
 
 neuron = Neuron(
     parameters = """tau = 10""",
@@ -239,6 +240,18 @@ class test_Population1D(unittest.TestCase):
         self.net_pop1.set({'r': 1.0})
         assert_allclose(self.net_pop1.r, [1.0, 1.0, 1.0])
 
+    @unittest.skipUnless(_check_paradigm("openmp"), "zero-copy views are not available on GPUs")
+    def test_view_r(self):
+        """
+        Tests that the array returned by *view()* shares the memory of the
+        variable *r*, in both directions.
+        """
+        r = self.net_pop1.view('r')
+        r[1] = 3.0
+        assert_allclose(self.net_pop1.r, [0.0, 3.0, 0.0])
+        self.net_pop1.r = 2.0
+        assert_allclose(r, [2.0, 2.0, 2.0])
+
     #
     # Reset-Test
     #
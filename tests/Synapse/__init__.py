@@ -14,7 +14,9 @@ from .test_RateDelays import (test_NoDelay, test_SynapseOperations,
                               test_SynapticAccess, test_UniformDelay)
 
 from .test_SpikingSynapse import test_PreSpike, test_PostSpike, test_TimeDependentUpdate
-from .test_SpikingTransmission import test_SpikeTransmissionNoDelay, test_SpikeTransmissionUniformDelay
+from .test_SpikingTransmission import (test_SpikeTransmissionNoDelay,
+                                       test_SpikeTransmissionUniformDelay,
+                                       test_SpikeTransmissionDelayBuffer)
 from .test_ContinuousUpdate import test_RateCodedContinuousUpdate, test_SpikingContinuousUpdate
 
 # Other specific obects
@@ -24,10 +26,14 @@ from .test_SpecificProjections import test_CurrentInjection
 if _check_paradigm('openmp'):
     from .test_RateDelays import test_NonuniformDelay
     from .test_RateTransmission import test_CustomConnectivityNonUniformDelay
-    from .test_SpikingTransmission import test_SpikeTransmissionNonUniformDelay
-    from .test_StructuralPlasticity import test_StructuralPlasticityEnvironment, test_StructuralPlasticityModel
+    from .test_Projection import test_ConnectFromMatrix, test_ConnectFromCSR
+    from .test_Connectivity import test_GeometricConnectivity, test_CppConnectivity, test_CppConnectivityThreads
+    from .test_SpikingTransmission import test_SpikeTransmissionNonUniformDelay, test_SpikeTransmissionThreadLocal
+    from .test_StructuralPlasticity import test_StructuralPlasticityEnvironment, test_StructuralPlasticityModel, test_StructuralPlasticityRewiring
     from .test_Convolution import test_Convolution
     from .test_Pooling import test_Pooling
+    from .test_PartitionedMatrix import test_PartitionedMatrix, test_LoadImbalanceProfile
+    from .test_DynamicThreads import test_DynamicThreads
 
 # Contains mapping which formats are allowed for which operation
 from .storage_formats import single_thread, open_mp, cuda, p2p
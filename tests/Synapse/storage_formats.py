@@ -33,6 +33,16 @@ single_thread = {
     "test_CustomConnectivityUniformDelay":      ["lil", "csr", "ell"],
     "test_CustomConnectivityNonUniformDelay":   ["lil", "csr", "ell"],
     "test_Projection":                          ["lil", "csr"],
+    "test_ConnectFromMatrix":                   ["lil", "csr"],
+    "test_ConnectFromCSR":                      ["lil", "csr"],
+    "test_GeometricConnectivity":               ["lil", "csr", "ell", "dense"],
+    "test_CppConnectivity":                     ["lil", "csr", "ell", "dense"],
+    "test_CppConnectivityThreads":              ["lil", "csr"],
+    "test_PartitionedMatrix":                   ["lil"],
+    "test_DynamicThreads":                      ["lil", "csr"],
+    "test_LoadImbalanceProfile":                ["lil"],
+    # test_StructuralPlasticity.py
+    "test_StructuralPlasticityRewiring":        ["lil", "csr"],
     # test_ContinuousUpdate.py
     "test_RateCodedContinuousUpdate":           ["lil", "csr"],
     "test_SpikingContinuousUpdate":             ["lil", "csr"],
@@ -46,7 +56,7 @@ single_thread = {
     # from test_RateDelays
     "test_NoDelay":                             ["lil", "csr", "ell"],
     "test_UniformDelay":                        ["lil", "csr"],
-    "test_NonUniformDelay":                     ["lil", "csr"],
+    "test_NonuniformDelay":                     ["lil", "csr"],
     "test_SynapseOperations":                   ["lil"],
     "test_SynapticAccess":                      ["lil", "csr"],
     # from test_SpikingSynapse
@@ -56,6 +66,7 @@ single_thread = {
     # from test_SpikingTransmission
     "test_SpikeTransmissionNoDelay":            ["lil", "csr"],
     "test_SpikeTransmissionUniformDelay":       ["lil", "csr"],
+    "test_SpikeTransmissionDelayBuffer":        ["lil", "csr"],
     "test_SpikeTransmissionNonUniformDelay":    ["lil"],
     # SpecificProjections
     # "test_Convolution":         ["lil", "csr", "ell"],
@@ -70,6 +81,16 @@ open_mp = {
     "test_CustomConnectivityUniformDelay":      ["lil", "csr", "ell"],
     "test_CustomConnectivityNonUniformDelay":   ["lil", "csr", "ell"],
     "test_Projection":                          ["lil", "csr"],
+    "test_ConnectFromMatrix":                   ["lil", "csr"],
+    "test_ConnectFromCSR":                      ["lil", "csr"],
+    "test_GeometricConnectivity":               ["lil", "csr", "ell", "dense"],
+    "test_CppConnectivity":                     ["lil", "csr", "ell", "dense"],
+    "test_CppConnectivityThreads":              ["lil", "csr"],
+    "test_PartitionedMatrix":                   ["lil"],
+    "test_DynamicThreads":                      ["lil", "csr"],
+    "test_LoadImbalanceProfile":                ["lil"],
+    # test_StructuralPlasticity.py
+    "test_StructuralPlasticityRewiring":        ["lil", "csr"],
     # from test_ContinuousUpdate.py
     "test_RateCodedContinuousUpdate":           ["lil", "csr"],
     "test_SpikingContinuousUpdate":             ["lil", "csr"],
@@ -83,7 +104,7 @@ open_mp = {
     # from test_RateDelays
     "test_NoDelay":                             ["lil", "csr", "ell"],
     "test_UniformDelay":                        ["lil", "csr"],
-    "test_NonUniformDelay":                     ["lil", "csr"],
+    "test_NonuniformDelay":                     ["lil", "csr"],
     "test_SynapseOperations":                   ["lil"],
     "test_SynapticAccess":                      ["lil", "csr"],
     # from test_SpikingSynapse
@@ -93,7 +114,9 @@ open_mp = {
     # from test_SpikingTransmission
     "test_SpikeTransmissionNoDelay":            ["lil", "csr"],
     "test_SpikeTransmissionUniformDelay":       ["lil", "csr"],
+    "test_SpikeTransmissionDelayBuffer":        ["lil", "csr"],
     "test_SpikeTransmissionNonUniformDelay":    ["lil"],
+    "test_SpikeTransmissionThreadLocal":        ["csr"],
     # SpecificProjections
     # "test_Convolution":         ["lil", "csr", "ell"],
     # "test_Pooling":             ["lil", "csr", "ell"],
@@ -128,6 +151,7 @@ cuda = {
     # from test_SpikingTransmission
     "test_SpikeTransmissionNoDelay":        ["csr"],
     "test_SpikeTransmissionUniformDelay":   ["csr"],
+    "test_SpikeTransmissionDelayBuffer":    ["csr"],
     # SpecificProjections
     # "test_Convolution":                     ["csr", "ellr"],
     # "test_Pooling":                         ["csr", "ellr"],
@@ -0,0 +1,268 @@
+"""
+
+    test_Connectivity.py
+
+    This file is part of ANNarchy.
+
+    Copyright (C) 2022 Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import numpy
+
+from ANNarchy import Neuron, Population, Projection, Network, Normal, Uniform, setup
+from ANNarchy.core.Global import _optimization_flags, config
+from ANNarchy.core.cython_ext.Connector import all_to_all, one_to_one, gaussian, dog
+
+class test_GeometricConnectivity():
+    """
+    Compares the connectivity built on the C++ side by *connect_gaussian()*
+    and *connect_dog()* with the one of the Cython LILConnectivity.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test
+        """
+        neuron = Neuron(
+            parameters = "r=0",
+        )
+
+        pop1 = Population((8, 7), neuron)
+        pop2 = Population((5, 6), neuron)
+        pop3 = Population(40, neuron)
+
+        proj1 = Projection(pre=pop1, post=pop2, target="exc")
+        proj1.connect_gaussian(amp=1.0, sigma=0.3, limit=0.1, storage_format=cls.storage_format)
+
+        proj2 = Projection(pre=pop1, post=pop1, target="exc")
+        proj2.connect_gaussian(amp=2.0, sigma=0.2, limit=0.05, allow_self_connections=False, storage_format=cls.storage_format)
+
+        proj3 = Projection(pre=pop3, post=pop3, target="inh")
+        proj3.connect_dog(amp_pos=1.0, sigma_pos=0.1, amp_neg=0.4, sigma_neg=0.3, limit=0.05, storage_format=cls.storage_format)
+
+        cls.references = [
+            gaussian(pop1, pop2, 1.0, 0.3, 0.0, 0.1, True, None, None),
+            gaussian(pop1, pop1, 2.0, 0.2, 0.0, 0.05, False, None, None),
+            dog(pop3, pop3, 1.0, 0.1, 0.4, 0.3, 0.0, 0.05, False, None, None),
+        ]
+
+        cls.test_net = Network()
+        cls.test_net.add([pop1, pop2, pop3, proj1, proj2, proj3])
+        cls.test_net.compile(silent=True)
+
+        cls.net_projs = [cls.test_net.get(proj) for proj in [proj1, proj2, proj3]]
+
+    def _compare(self, idx):
+        proj = self.net_projs[idx]
+        reference = self.references[idx]
+
+        self.assertEqual(proj.post_ranks, list(reference.post_rank))
+        for rk_post, pre_ranks, w in zip(reference.post_rank, reference.pre_rank, reference.w):
+            self.assertEqual(proj.dendrite(rk_post).pre_ranks, list(pre_ranks))
+            numpy.testing.assert_allclose(proj.dendrite(rk_post).w, w, rtol=1e-5)
+
+    def test_gaussian(self):
+        """
+        Gaussian pattern between two 2D populations.
+        """
+        self._compare(0)
+
+    def test_gaussian_self_connections(self):
+        """
+        Gaussian pattern within a population without self-connections.
+        """
+        self._compare(1)
+
+    def test_dog(self):
+        """
+        Difference-of-Gaussians pattern within a 1D population.
+        """
+        self._compare(2)
+
+class test_CppConnectivity():
+    """
+    Tests the default connection patterns built on the C++ side. The
+    deterministic patterns are compared with the Cython LILConnectivity,
+    for the random ones (*use_cpp_connectors=True*) only the properties
+    of the pattern are verified.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test
+        """
+        neuron = Neuron(
+            parameters = "r=0",
+        )
+
+        pop1 = Population(30, neuron)
+        pop2 = Population(20, neuron)
+
+        proj1 = Projection(pre=pop1, post=pop1, target="exc")
+        proj1.connect_all_to_all(weights=0.5, allow_self_connections=False, storage_format=cls.storage_format)
+
+        # The dense format is not allowed for the one-to-one pattern and
+        # does not support non-uniform delays, LIL is used instead.
+        sparse_format = "lil" if cls.storage_format == "dense" else cls.storage_format
+
+        proj2 = Projection(pre=pop1[5:25], post=pop2, target="exc")
+        proj2.connect_one_to_one(weights=1.5, storage_format=sparse_format)
+
+        proj3 = Projection(pre=pop1, post=pop1, target="inh")
+        proj3.connect_fixed_number_pre(number=5, weights=Uniform(0.0, 1.0), allow_self_connections=False, storage_format=cls.storage_format)
+
+        proj4 = Projection(pre=pop1, post=pop2, target="inh")
+        proj4.connect_fixed_number_post(number=4, weights=0.25, delays=Uniform(1.0, 5.0), storage_format=sparse_format)
+
+        proj5 = Projection(pre=pop1, post=pop1, target="exc2")
+        proj5.connect_fixed_probability(probability=0.3, weights=Uniform(1.0, 2.0), allow_self_connections=False, storage_format=cls.storage_format)
+
+        cls.references = [
+            all_to_all(pop1, pop1, 0.5, 0.0, False, None, None),
+            one_to_one(pop1[5:25], pop2, 1.5, 0.0, None, None),
+        ]
+
+        _optimization_flags(use_cpp_connectors=True)
+        cls.test_net = Network()
+        cls.test_net.add([pop1, pop2, proj1, proj2, proj3, proj4, proj5])
+        cls.test_net.compile(silent=True)
+        _optimization_flags(use_cpp_connectors=False)
+
+        cls.net_projs = [cls.test_net.get(proj) for proj in [proj1, proj2, proj3, proj4, proj5]]
+
+    def _compare(self, idx):
+        proj = self.net_projs[idx]
+        reference = self.references[idx]
+
+        self.assertEqual(proj.post_ranks, list(reference.post_rank))
+        for rk_post, pre_ranks, w in zip(reference.post_rank, reference.pre_rank, reference.w):
+            self.assertEqual(proj.dendrite(rk_post).pre_ranks, list(pre_ranks))
+            numpy.testing.assert_allclose(proj.dendrite(rk_post).w, w, rtol=1e-5)
+
+    def test_all_to_all(self):
+        """
+        All-to-all pattern without self-connections.
+        """
+        self._compare(0)
+
+    def test_one_to_one(self):
+        """
+        One-to-one pattern from a population view.
+        """
+        self._compare(1)
+
+    def test_fixed_number_pre(self):
+        """
+        Each post-synaptic neuron receives exactly *number* distinct inputs.
+        """
+        proj = self.net_projs[2]
+        self.assertEqual(proj.post_ranks, list(range(30)))
+        for rk_post in proj.post_ranks:
+            pre_ranks = proj.dendrite(rk_post).pre_ranks
+            self.assertEqual(len(pre_ranks), 5)
+            self.assertEqual(pre_ranks, sorted(set(pre_ranks)))
+            self.assertNotIn(rk_post, pre_ranks)
+
+            w = numpy.array(proj.dendrite(rk_post).w)
+            self.assertTrue(numpy.all((w >= 0.0) & (w <= 1.0)))
+
+    def test_fixed_number_post(self):
+        """
+        Each pre-synaptic neuron sends exactly *number* outputs, the delays
+        are drawn on the C++ side.
+        """
+        proj = self.net_projs[3]
+        counts = numpy.zeros(30, dtype=int)
+        for rk_post in proj.post_ranks:
+            pre_ranks = proj.dendrite(rk_post).pre_ranks
+            self.assertEqual(pre_ranks, sorted(set(pre_ranks)))
+            counts[pre_ranks] += 1
+            numpy.testing.assert_allclose(proj.dendrite(rk_post).w, 0.25)
+
+            d = numpy.array(proj.dendrite(rk_post).delay)
+            self.assertTrue(numpy.all((d >= 1.0) & (d <= 5.0)))
+
+        numpy.testing.assert_equal(counts, 4)
+
+    def test_fixed_probability(self):
+        """
+        Random pattern without self-connections.
+        """
+        proj = self.net_projs[4]
+        for rk_post in proj.post_ranks:
+            pre_ranks = proj.dendrite(rk_post).pre_ranks
+            self.assertEqual(pre_ranks, sorted(set(pre_ranks)))
+            self.assertNotIn(rk_post, pre_ranks)
+
+            w = numpy.array(proj.dendrite(rk_post).w)
+            self.assertTrue(numpy.all((w >= 1.0) & (w <= 2.0)))
+
+class test_CppConnectivityThreads():
+    """
+    The patterns built on the C++ side use one random stream per row, so the
+    same seed leads to the same connectivity for any number of threads.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the same network with one and several threads
+        """
+        neuron = Neuron(
+            parameters = "r=0",
+        )
+
+        pop1 = Population(50, neuron)
+        pop2 = Population(30, neuron)
+
+        proj1 = Projection(pre=pop1, post=pop1, target="exc")
+        proj1.connect_fixed_probability(probability=0.2, weights=Uniform(0.0, 1.0), allow_self_connections=False, storage_format=cls.storage_format)
+
+        proj2 = Projection(pre=pop1, post=pop2, target="exc")
+        proj2.connect_fixed_number_pre(number=8, weights=Normal(1.0, 0.2), storage_format=cls.storage_format)
+
+        proj3 = Projection(pre=pop2, post=pop1, target="inh")
+        proj3.connect_fixed_number_post(number=6, weights=Uniform(0.5, 1.5), storage_format=cls.storage_format)
+
+        num_threads = config['num_threads']
+        seed = config['seed']
+
+        setup(seed=42)
+        _optimization_flags(use_cpp_connectors=True)
+        cls.test_nets = []
+        for nb_threads in [1, max(2, num_threads)]:
+            setup(num_threads=nb_threads)
+            net = Network()
+            net.add([pop1, pop2, proj1, proj2, proj3])
+            net.compile(silent=True)
+            cls.test_nets.append(net)
+        _optimization_flags(use_cpp_connectors=False)
+        setup(num_threads=num_threads)
+        config['seed'] = seed
+
+        cls.projs = [proj1, proj2, proj3]
+
+    def test_ranks_and_weights(self):
+        """
+        The post-synaptic ranks, pre-synaptic ranks and weights are identical.
+        """
+        for proj in self.projs:
+            single, multi = [net.get(proj) for net in self.test_nets]
+
+            self.assertGreater(single.nb_synapses, 0)
+            self.assertEqual(single.post_ranks, multi.post_ranks)
+            for rk_post in single.post_ranks:
+                self.assertEqual(single.dendrite(rk_post).pre_ranks, multi.dendrite(rk_post).pre_ranks)
+                numpy.testing.assert_array_equal(single.dendrite(rk_post).w, multi.dendrite(rk_post).w)
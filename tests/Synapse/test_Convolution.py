@@ -33,6 +33,7 @@ bo_filters = numpy.array([[[[1, 0, 0], [0,  1,  1], [0, 0, 1]],
                           [[[1, 0, 0], [0, -1, -1], [0, 0, 1]],
                            [[0, 0, 1], [0,  1,  1], [1, 0, 0]]]])
 bo_filters = numpy.moveaxis(bo_filters, 1, -1)
+large_filter = numpy.reshape(numpy.arange(-12.0, 13.0), (5, 5)) / 10.
 
 
 class test_Convolution(unittest.TestCase):
@@ -63,6 +64,8 @@ class test_Convolution(unittest.TestCase):
         pop1 = Population((3, 4), neuron2)
         pop2 = Population((3, 4, 2), neuron)
         pop3 = Population((3, 4, 2), neuron2)
+        pop4 = Population((8, 7), neuron)
+        pop5 = Population((8, 7), neuron2)
 
         proj0 = Convolution(pre=pop0, post=pop1, target="exc")
         proj0.connect_filter(conv_filter)
@@ -84,15 +87,20 @@ class test_Convolution(unittest.TestCase):
         proj5 = Convolution(pre=pop2, post=pop3, target="exc")
         proj5.connect_filters(bo_filters, padding=0.0, subsampling=ssList)
 
+        proj6 = Convolution(pre=pop4, post=pop5, target="exc")
+        proj6.connect_filter(large_filter, padding='border')
+
         cls.test_net = Network()
-        cls.test_net.add([pop0, pop1, pop2, pop3, proj0, proj1, proj2, proj3,
-                          proj4, proj5])
+        cls.test_net.add([pop0, pop1, pop2, pop3, pop4, pop5, proj0, proj1,
+                          proj2, proj3, proj4, proj5, proj6])
         cls.test_net.compile(silent=True)
         # compile()
         cls.pop0 = cls.test_net.get(pop0)
         cls.pop1 = cls.test_net.get(pop1)
         cls.pop2 = cls.test_net.get(pop2)
         cls.pop3 = cls.test_net.get(pop3)
+        cls.pop4 = cls.test_net.get(pop4)
+        cls.pop5 = cls.test_net.get(pop5)
         cls.proj0 = cls.test_net.get(proj0)
 
     @classmethod
@@ -112,6 +120,7 @@ class test_Convolution(unittest.TestCase):
         baseline2 = numpy.moveaxis(numpy.array([baseline, baseline + 2]), 0, 2)
         self.pop0.baseline = baseline
         self.pop2.baseline = baseline2
+        self.pop4.baseline = numpy.reshape(numpy.arange(0.0, 5.6, 0.1), (8, 7))
         self.test_net.simulate(2)
 
     def test_get_weights(self):
@@ -199,6 +208,16 @@ class test_Convolution(unittest.TestCase):
         r = numpy.rollaxis(self.pop3.get('r'), 2)
         numpy.testing.assert_allclose(r, comb)
 
+    def test_interior_and_border(self):
+        """
+        Tests a convolution where most post-synaptic neurons receive inputs
+        only from within the pre-synaptic population, while the others
+        repeat the border values.
+        """
+        padded = numpy.pad(numpy.reshape(numpy.arange(0.0, 5.6, 0.1), (8, 7)), 2, mode='edge')
+        comb = numpy.array([[numpy.sum(padded[i:i+5, j:j+5] * large_filter) for j in range(7)] for i in range(8)])
+        numpy.testing.assert_allclose(self.pop5.get('r'), comb)
+
 
 if __name__ == "__main__":
     unittest.main()
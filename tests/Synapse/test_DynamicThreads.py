@@ -0,0 +1,133 @@
+"""
+
+    test_DynamicThreads.py
+
+    This file is part of ANNarchy.
+
+    Copyright (C) 2022 Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import numpy
+
+from ANNarchy import clear, Neuron, Population, Projection, Network, setup
+from ANNarchy.core import Global
+from ANNarchy.core.Global import config
+
+class test_DynamicThreads():
+    """
+    With setup(dynamic_num_threads=True), the generated library does not
+    depend on the number of threads, which can be changed at runtime
+    through set_number_threads(). The thread-local data (spike gathering,
+    thread-local conductances, random number generators) follows the
+    number of threads and the results do not depend on it.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile two identical networks with a rate-coded and a spiking part.
+        The populations are large enough to be updated in parallel.
+        """
+        input_neuron = Neuron(
+            parameters = "baseline = 0.0",
+            equations = "r = baseline * (1.0 + sin(0.1 * t))"
+        )
+        rate_neuron = Neuron(
+            parameters = "tau = 10.0",
+            equations = "tau * dr/dt + r = sum(exc)"
+        )
+        spiking_neuron = Neuron(
+            parameters = """
+                tau = 10.0
+                i_offset = 0.0
+            """,
+            equations = """
+                tau * dv/dt = -v + i_offset + g_exc + g_inh
+                g_exc = 0.0
+                g_inh = 0.0
+            """,
+            spike = "v > 1.0",
+            reset = "v = 0.0"
+        )
+        noisy_neuron = Neuron(
+            equations = "r = Uniform(0.0, 1.0)"
+        )
+
+        size = Global.OMP_MIN_NB_NEURONS * 2
+        weights = numpy.array([[(i * size + j) % 7 * 0.001 for j in range(size)] for i in range(size)])
+
+        cls.num_threads = config['num_threads']
+        cls.dynamic_num_threads = config['dynamic_num_threads']
+        setup(num_threads=2, dynamic_num_threads=True)
+
+        cls.networks = []
+        for _ in range(2):
+            inp = Population(size, input_neuron)
+            inp.baseline = numpy.linspace(0.0, 1.0, size)
+            rate = Population(size, rate_neuron)
+            spiking = Population(size, spiking_neuron)
+            spiking.i_offset = numpy.linspace(0.5, 1.5, size)
+            noisy = Population(size, noisy_neuron)
+
+            rate_proj = Projection(pre=inp, post=rate, target="exc")
+            rate_proj.connect_from_matrix(weights, storage_format=cls.storage_format, storage_order=cls.storage_order)
+
+            # The weights are powers of 2, so the conductances do not depend
+            # on the order of the summation.
+            spike_projs = []
+            for target in ["exc", "inh"]:
+                proj = Projection(pre=spiking, post=spiking, target=target)
+                proj.connect_all_to_all(weights=2.0**-7, storage_format="csr", storage_order="pre_to_post")
+                spike_projs.append(proj)
+            # thread-local accumulation of the conductances
+            spike_projs[0]._parallel_pattern = "thread_local"
+
+            net = Network()
+            net.add([inp, rate, spiking, noisy, rate_proj] + spike_projs)
+            net.compile(silent=True)
+            cls.networks.append((net, net.get(rate), net.get(spiking), net.get(noisy)))
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        All tests of this class are done. We can destroy the networks and
+        restore the thread configuration of the other tests.
+        """
+        del cls.networks
+        clear()
+        setup(num_threads=cls.num_threads, dynamic_num_threads=cls.dynamic_num_threads)
+
+    def test_change_num_threads(self):
+        """
+        The first network runs single-threaded, the second one uses more
+        threads than at compilation, then a single thread and three threads.
+        """
+        reference, changed = self.networks
+
+        Global._network[reference[0].id]['instance'].set_number_threads(1, [])
+        reference[0].simulate(400.0)
+
+        for num_threads in [4, 1, 3]:
+            Global._network[changed[0].id]['instance'].set_number_threads(num_threads, [])
+            changed[0].simulate(100.0)
+            self.assertTrue(numpy.all((changed[3].r >= 0.0) & (changed[3].r < 1.0)))
+
+        # the last 100 ms were simulated with two threads
+        Global._network[changed[0].id]['instance'].set_number_threads(2, [])
+        changed[0].simulate(100.0)
+
+        self.assertGreater(numpy.sum(changed[2].v), 0.0)
+        numpy.testing.assert_allclose(changed[1].r, reference[1].r)
+        numpy.testing.assert_allclose(changed[2].v, reference[2].v)
@@ -0,0 +1,132 @@
+"""
+
+    test_PartitionedMatrix.py
+
+    This file is part of ANNarchy.
+
+    Copyright (C) 2022 Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    ANNarchy is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import unittest
+import numpy
+
+from ANNarchy import Neuron, Population, Projection, Network, setup
+from ANNarchy.core import Global
+from ANNarchy.core.Global import _optimization_flags, config
+
+def partitioned_network(size, storage_format, storage_order, profile_enabled=False):
+    """
+    Compiles and simulates a network with three threads and split matrices.
+    The n-th post-synaptic neuron receives n+1 synapses, so partitions with
+    the same number of rows would be unbalanced.
+    """
+    neuron = Neuron(
+        equations = "r = sum(exc)",
+    )
+
+    pop1 = Population(size, neuron)
+    pop2 = Population(size, neuron)
+
+    weights = numpy.tril(numpy.ones((size, size)))
+    weights[weights == 0.0] = numpy.nan
+
+    num_threads = config['num_threads']
+
+    setup(num_threads=3)
+    _optimization_flags(disable_split_matrix=False)
+    proj = Projection(pre=pop1, post=pop2, target="exc")
+    proj.connect_from_matrix(weights, storage_format=storage_format, storage_order=storage_order)
+
+    net = Network()
+    net.add([pop1, pop2, proj])
+    net.compile(silent=True, profile_enabled=profile_enabled)
+    net.simulate(10.0)
+    _optimization_flags(disable_split_matrix=True)
+    setup(num_threads=num_threads)
+
+    return net.get(proj)
+
+class test_PartitionedMatrix():
+    """
+    With several threads, the connectivity can be split into thread-local
+    partitions (PartitionedMatrix). The partitions should hold a similar
+    number of synapses, even if the rows have very different lengths.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test
+        """
+        cls.size = 120
+        cls.net_proj = partitioned_network(cls.size, cls.storage_format, cls.storage_order)
+
+    def test_partition_balance(self):
+        """
+        The partitions end where the prefix sum over the row lengths reaches
+        their share of the synapses.
+        """
+        sizes = self.net_proj.cyInstance.nb_synapses_per_partition()
+
+        self.assertEqual(len(sizes), 3)
+        self.assertEqual(sum(sizes), self.size * (self.size + 1) // 2)
+        # the rows are not split, so the shares differ by about one row length
+        self.assertLess(max(sizes) - min(sizes), self.size)
+        self.assertLess(self.net_proj.cyInstance.load_imbalance(), 1.1)
+        self.assertAlmostEqual(self.net_proj.cyInstance.load_imbalance(), max(sizes) / numpy.mean(sizes))
+
+class test_LoadImbalanceProfile():
+    """
+    With profiling enabled, the time spent by each thread in compute_psp()
+    is measured and the load imbalance is reported.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test with profiling enabled.
+        """
+        try:
+            import matplotlib
+        except ImportError:
+            raise unittest.SkipTest("the profiler requires matplotlib")
+
+        cls.net_proj = partitioned_network(120, cls.storage_format, cls.storage_order, profile_enabled=True)
+        cls.profiler = Global._profiler
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Remove the profiler, the results should not be printed.
+        """
+        Global._profiler = None
+        config['profiling'] = False
+        config['profile_out'] = None
+
+    def test_load_imbalance(self):
+        """
+        The profiler reports the ratio between the slowest and the average
+        thread for the computation of the weighted sums.
+        """
+        imbalance = self.profiler._cpp_profiler.get_load_imbalance(self.net_proj.name, "psp")
+        self.assertGreaterEqual(imbalance, 1.0)
+        self.assertLessEqual(imbalance, 3.0)
+
+        # no per-thread timings for other functions
+        self.assertEqual(self.profiler._cpp_profiler.get_load_imbalance(self.net_proj.name, "step"), 1.0)
+
+        entries = [entry for entry in self.profiler._entries if entry[3] == "load balance"]
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0][2], self.net_proj.name + "_psp")
+        self.assertAlmostEqual(entries[0][0], imbalance)
@@ -25,6 +25,7 @@ import numpy
 from scipy import sparse
 
 from ANNarchy import Neuron, Synapse, Population, Projection, Network
+from ANNarchy.core.Global import _check_paradigm
 
 class test_Projection():
     """
@@ -154,3 +155,223 @@ class test_Projection():
         neurons recieving synapses.
         """
         self.assertEqual(self.net_proj.post_ranks, [1, 3])
+
+    def test_connectivity_matrix(self):
+        """
+        Tests the dense and sparse export of the connectivity matrix.
+        """
+        expected = self.weight_matrix.T.toarray()
+        numpy.testing.assert_allclose(self.net_proj.connectivity_matrix(), expected)
+
+        csr = self.net_proj.connectivity_matrix(format="csr")
+        self.assertEqual(csr.nnz, 12)
+        numpy.testing.assert_allclose(csr.toarray(), expected)
+
+    def test_to_csr(self):
+        """
+        Tests the export of the connectivity as flat CSR arrays.
+        """
+        expected = sparse.csr_matrix(self.weight_matrix.T)
+        indptr, indices, data, _ = self.net_proj.to_csr()
+
+        numpy.testing.assert_equal(indptr, expected.indptr)
+        numpy.testing.assert_equal(indices, expected.indices)
+        numpy.testing.assert_allclose(data, expected.data)
+
+    def test_set_w_flat(self):
+        """
+        Tests the setting of all synaptic weights with a flat array ordered by
+        dendrites.
+        """
+        values = numpy.arange(12, dtype=float)
+        self.net_proj.w = values
+        numpy.testing.assert_allclose(self.net_proj.dendrite(1).w, values[:8])
+        numpy.testing.assert_allclose(self.net_proj.dendrite(3).w, values[8:])
+
+        # restore the initial weights
+        self.net_proj.w = [0.2, 0.5]
+        numpy.testing.assert_allclose(self.net_proj.w[0], 0.2)
+        numpy.testing.assert_allclose(self.net_proj.w[1], 0.5)
+
+    def test_view_w(self):
+        """
+        Tests the zero-copy access to the synaptic weights, which is only
+        available for the CSR format.
+        """
+        if self.storage_format != "csr" or not _check_paradigm("openmp"):
+            self.skipTest("no zero-copy view for this storage format")
+
+        w = self.net_proj.view('w')
+        self.assertEqual(w.size, 12)
+        numpy.testing.assert_allclose(w, numpy.concatenate(self.net_proj.w))
+
+        w[:] = 1.0
+        numpy.testing.assert_allclose(self.net_proj.dendrite(3).w, 1.0)
+
+class test_ConnectFromMatrix():
+    """
+    Tests the connectivity built by *connect_from_matrix()*: missing synapses
+    are marked by None or NaN and the delays are given as a matrix.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test
+        """
+        simple = Neuron(
+            parameters = "r=0",
+        )
+
+        pop1 = Population((5), neuron=simple)
+        pop2 = Population((4), neuron=simple)
+
+        cls.weights = [
+            [None, 0.1, None, 0.2, None],
+            [None, None, None, None, None],
+            [0.3, 0.4, 0.5, None, 0.6],
+            [float('nan'), 0.7, 0.0, None, None],
+        ]
+        cls.delays = [
+            [None, 1.0, None, 2.0, None],
+            [None, None, None, None, None],
+            [3.0, 1.0, 2.0, None, 4.0],
+            [None, 5.0, 1.0, None, None],
+        ]
+
+        proj = Projection(pre=pop1, post=pop2, target="exc")
+        proj.connect_from_matrix(cls.weights, delays=cls.delays,
+                                 storage_format=cls.storage_format,
+                                 storage_order=cls.storage_order)
+
+        cls.test_net = Network()
+        cls.test_net.add([pop1, pop2, proj])
+        cls.test_net.compile(silent=True)
+
+        cls.pop1 = pop1
+        cls.pop2 = pop2
+        cls.net_proj = cls.test_net.get(proj)
+
+    def test_post_ranks(self):
+        """
+        Post-synaptic neurons without synapses are not stored.
+        """
+        self.assertEqual(self.net_proj.post_ranks, [0, 2, 3])
+
+    def test_pre_ranks(self):
+        """
+        Only the defined synapses are created, including the one with a zero
+        weight.
+        """
+        self.assertEqual(self.net_proj.dendrite(0).pre_ranks, [1, 3])
+        self.assertEqual(self.net_proj.dendrite(2).pre_ranks, [0, 1, 2, 4])
+        self.assertEqual(self.net_proj.dendrite(3).pre_ranks, [1, 2])
+
+    def test_weights(self):
+        """
+        Tests the weights of the created synapses.
+        """
+        numpy.testing.assert_allclose(self.net_proj.dendrite(0).w, [0.1, 0.2])
+        numpy.testing.assert_allclose(self.net_proj.dendrite(2).w, [0.3, 0.4, 0.5, 0.6])
+        numpy.testing.assert_allclose(self.net_proj.dendrite(3).w, [0.7, 0.0])
+
+    def test_delays(self):
+        """
+        Tests the non-uniform delays of the created synapses.
+        """
+        self.assertEqual(self.net_proj.max_delay, 5)
+        numpy.testing.assert_allclose(self.net_proj.dendrite(0).delay, [1.0, 2.0])
+        numpy.testing.assert_allclose(self.net_proj.dendrite(2).delay, [3.0, 1.0, 2.0, 4.0])
+        numpy.testing.assert_allclose(self.net_proj.dendrite(3).delay, [5.0, 1.0])
+
+    def test_numpy_scalar_delay(self):
+        """
+        A numpy scalar is accepted as uniform delay.
+        """
+        proj = Projection(pre=self.pop1, post=self.pop2, target="exc")
+        proj.connect_from_matrix(self.weights, delays=numpy.int32(2),
+                                 storage_format=self.storage_format,
+                                 storage_order=self.storage_order)
+        self.assertEqual(proj.uniform_delay, 2)
+
+    def test_missing_delay(self):
+        """
+        A synapse with a weight but without delay is rejected.
+        """
+        from ANNarchy.core.Global import ANNarchyException
+        delays = [list(d) for d in self.delays]
+        delays[2][0] = None
+
+        proj = Projection(pre=self.pop1, post=self.pop2, target="exc")
+        with self.assertRaises(ANNarchyException) as cm:
+            proj.connect_from_matrix(self.weights, delays=delays,
+                                     storage_format=self.storage_format,
+                                     storage_order=self.storage_order)
+        self.assertIn("delay for each synapse", str(cm.exception))
+
+class test_ConnectFromCSR():
+    """
+    Tests the connectivity built by *connect_from_csr()*, which is passed to
+    the C++ core as flat arrays.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test
+        """
+        simple = Neuron(
+            parameters = "r=0",
+        )
+
+        pop1 = Population((5), neuron=simple)
+        pop2 = Population((4), neuron=simple)
+
+        # second post-synaptic neuron without synapses
+        cls.matrix = sparse.csr_matrix(numpy.array([
+            [0.0, 0.1, 0.0, 0.2, 0.0],
+            [0.0, 0.0, 0.0, 0.0, 0.0],
+            [0.3, 0.4, 0.5, 0.0, 0.6],
+            [0.0, 0.7, 0.0, 0.0, 0.8],
+        ]))
+        delays = numpy.arange(1, cls.matrix.nnz + 1, dtype=float)
+
+        proj1 = Projection(pre=pop1, post=pop2, target="exc")
+        proj1.connect_from_csr(cls.matrix.indptr, cls.matrix.indices, cls.matrix.data, delays=delays,
+                               storage_format=cls.storage_format,
+                               storage_order=cls.storage_order)
+
+        proj2 = Projection(pre=pop1, post=pop2, target="inh")
+        proj2.connect_from_csr(cls.matrix.indptr, cls.matrix.indices, 0.5, delays=2.0,
+                               storage_format=cls.storage_format,
+                               storage_order=cls.storage_order)
+
+        cls.test_net = Network()
+        cls.test_net.add([pop1, pop2, proj1, proj2])
+        cls.test_net.compile(silent=True)
+
+        cls.net_proj1 = cls.test_net.get(proj1)
+        cls.net_proj2 = cls.test_net.get(proj2)
+
+    def test_ranks(self):
+        """
+        Post-synaptic neurons without synapses are not stored.
+        """
+        self.assertEqual(self.net_proj1.post_ranks, [0, 2, 3])
+        self.assertEqual(self.net_proj1.dendrite(2).pre_ranks, [0, 1, 2, 4])
+        self.assertEqual(self.net_proj2.post_ranks, [0, 2, 3])
+        self.assertEqual(self.net_proj2.dendrite(3).pre_ranks, [1, 4])
+
+    def test_weights(self):
+        """
+        Weights given per synapse or as a single value.
+        """
+        numpy.testing.assert_allclose(self.net_proj1.connectivity_matrix(format="csr").toarray(), self.matrix.toarray())
+        numpy.testing.assert_allclose(self.net_proj2.dendrite(2).w, 0.5)
+
+    def test_delays(self):
+        """
+        Non-uniform and uniform delays.
+        """
+        numpy.testing.assert_allclose(self.net_proj1.dendrite(0).delay, [1.0, 2.0])
+        numpy.testing.assert_allclose(self.net_proj1.dendrite(2).delay, [3.0, 4.0, 5.0, 6.0])
+        numpy.testing.assert_allclose(self.net_proj1.dendrite(3).delay, [7.0, 8.0])
+        self.assertEqual(self.net_proj2.uniform_delay, 2)
@@ -387,6 +387,35 @@ class test_NonuniformDelay():
         # should access (t-3)th element
         numpy.testing.assert_allclose(self.net_pop2.sum("ff"), [20.0, 20.0, 20.0])
 
+    def test_wrap_around(self):
+        """
+        tests the delay functionality after the history of the pre-synaptic
+        rates was overwritten several times.
+        """
+        # run 23 ms, the history holds the last 5 steps
+        self.test_net.simulate(23)
+
+        # r_t = t*(t+1)/2 - 1, should access r_19, r_17 and r_20
+        numpy.testing.assert_allclose(self.net_pop2.sum("ff"), [189.0, 152.0, 209.0])
+
+    def test_increased_nonuniform_delay(self):
+        """
+        tests the delay functionality when the maximal delay is increased
+        after some steps, the recorded history is kept.
+        """
+        self.test_net.simulate(23)
+
+        # the history of the pre-synaptic rates becomes longer
+        self.net_proj.delay = [[8], [5], [1]]
+
+        # run 1 ms, r_18 and r_22 were recorded before the change
+        self.test_net.simulate(1)
+        numpy.testing.assert_allclose(self.net_pop2.sum("ff")[1:], [170.0, 252.0])
+
+        # run 9 ms, should access r_24, r_27 and r_31
+        self.test_net.simulate(9)
+        numpy.testing.assert_allclose(self.net_pop2.sum("ff"), [299.0, 377.0, 495.0])
+
 class test_SynapseOperations():
     """
     Next to the weighted sum across inputs we allow the application of global
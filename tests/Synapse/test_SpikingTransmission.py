@@ -22,7 +22,7 @@
 """
 import numpy
 from ANNarchy import (clear, DiscreteUniform, Monitor, Network, Neuron,
-                      Population, Projection)
+                      Population, Projection, SpikeSourceArray)
 
 class test_SpikeTransmissionNoDelay():
     """
@@ -237,3 +237,164 @@ class test_SpikeTransmissionNonUniformDelay():
         # 1st neuron gets 2 events at t==2, 2 events at t==3 and 1 event at t==4
         # 2nd neuron gets 1 event at t==2, 2 events at t==3, and 2 evets at t==4
         numpy.testing.assert_allclose(g_exc_data, [[0., 0.], [0., 0.], [2., 1.], [2., 2.], [1., 2.]])
+
+class test_SpikeTransmissionDelayBuffer():
+    """
+    With uniform delays, the spike events of the pre-synaptic population are
+    stored in a ring buffer. The events must arrive in time after the buffer
+    was overwritten several times and after the delay was increased.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Build up the network
+        """
+        simple_recv = Neuron(
+            equations = """
+                g_exc = 0
+            """,
+            spike = "g_exc>30"
+        )
+
+        # no spikes between 6 and 8 ms, these events would be lost when
+        # the delay is increased at t == 12.
+        cls.spike_times = [1, 2, 5, 9, 11, 14, 15, 20, 26]
+
+        in_pop = SpikeSourceArray(spike_times=cls.spike_times)
+        out_pop = Population(2, neuron=simple_recv)
+
+        proj = Projection(pre=in_pop, post=out_pop, target="exc")
+        proj.connect_all_to_all(weights=1.0, delays=3.0,
+                                storage_format=cls.storage_format,
+                                storage_order=cls.storage_order)
+
+        # Monitor to record the currents
+        m = Monitor(out_pop, ["g_exc"])
+
+        # build network and store required object
+        # instances
+        net = Network()
+        net.add([in_pop, out_pop, proj, m])
+        cls.test_net = net
+        cls.test_net.compile(silent=True)
+        cls.test_g_exc_m = net.get(m)
+        cls.test_proj = net.get(proj)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        All tests of this class are done. We can destroy the network.
+        """
+        del cls.test_net
+        clear()
+
+    def setUp(self):
+        """
+        basic setUp() method to reset the network after every test
+        """
+        # back to initial values
+        self.test_net.reset(populations=True, projections=True)
+        self.test_proj.delay = 3.0
+        # clear monitors must be done seperate
+        self.test_g_exc_m.get()
+
+    def test_wrap_around(self):
+        """
+        The buffer holds the events of the last 3 steps, the events of all
+        spikes arrive 3 ms after their emission.
+        """
+        self.test_net.simulate(30)
+        g_exc_data = self.test_g_exc_m.get('g_exc')
+
+        expected = numpy.zeros((30, 2))
+        for t in self.spike_times:
+            expected[t+3, :] = 1.0
+        numpy.testing.assert_allclose(g_exc_data, expected)
+
+    def test_increased_delay(self):
+        """
+        The delay is increased to 6 ms at t == 12. The spike emitted at
+        t == 11 is still in the buffer and arrives with the new delay.
+        """
+        self.test_net.simulate(12)
+        self.test_proj.delay = 6.0
+        self.test_net.simulate(20)
+        g_exc_data = self.test_g_exc_m.get('g_exc')
+
+        expected = numpy.zeros((32, 2))
+        for t in range(32):
+            delay = 3 if t < 12 else 6
+            if t - delay in self.spike_times:
+                expected[t, :] = 1.0
+        numpy.testing.assert_allclose(g_exc_data, expected)
+
+class test_SpikeTransmissionThreadLocal():
+    """
+    The pre_to_post CSR format can accumulate the conductances in thread-local
+    buffers. The resulting conductances must be the same as with the inner
+    loop parallelization.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Build up the network
+        """
+        simple_recv = Neuron(
+            equations = """
+                g_exc = 0
+            """,
+            spike = "g_exc>1000"
+        )
+
+        rng = numpy.random.RandomState(42)
+        spike_times = [sorted(set(rng.randint(0, 20, size=5).tolist())) for _ in range(100)]
+        weights = rng.uniform(0.0, 1.0, (40, 100))
+        weights[rng.uniform(0.0, 1.0, (40, 100)) < 0.5] = None
+
+        in_pop = SpikeSourceArray(spike_times=spike_times)
+        out_pops = [Population(40, neuron=simple_recv) for _ in range(2)]
+
+        projs = []
+        for out_pop, pattern in zip(out_pops, ["inner_loop", "thread_local"]):
+            proj = Projection(pre=in_pop, post=out_pop, target="exc")
+            proj.connect_from_matrix(weights, storage_format=cls.storage_format,
+                                     storage_order="pre_to_post")
+            proj._parallel_pattern = pattern
+            projs.append(proj)
+
+        # Monitors to record the currents
+        monitors = [Monitor(out_pop, ["g_exc"]) for out_pop in out_pops]
+
+        # build network and store required object
+        # instances
+        net = Network()
+        net.add([in_pop] + out_pops + projs + monitors)
+        cls.test_net = net
+        cls.test_net.compile(silent=True)
+        cls.test_projs = [net.get(proj) for proj in projs]
+        cls.test_monitors = [net.get(m) for m in monitors]
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        All tests of this class are done. We can destroy the network.
+        """
+        del cls.test_net
+        clear()
+
+    def test_pattern(self):
+        """
+        The explicitly set parallelization is kept by the code generator.
+        """
+        self.assertEqual(self.test_projs[0]._parallel_pattern, "inner_loop")
+        self.assertEqual(self.test_projs[1]._parallel_pattern, "thread_local")
+
+    def test_conductances(self):
+        """
+        Both kernels compute the same conductances, up to the summation order.
+        """
+        self.test_net.simulate(25)
+        inner = self.test_monitors[0].get('g_exc')
+        thread_local = self.test_monitors[1].get('g_exc')
+        self.assertGreater(numpy.sum(inner), 0.0)
+        numpy.testing.assert_allclose(thread_local, inner, rtol=1e-10)
@@ -273,3 +273,157 @@ class test_StructuralPlasticityEnvironment(unittest.TestCase):
         We remove all synapses in a dendrite.
         """
         self.test_proj2.dendrite(5).prune_synapse(5)
+
+
+class test_StructuralPlasticityRewiring():
+    """
+    This class tests the *Structural Plasticity* feature, which can optionally
+    be enabled.
+
+    The creating and pruning conditions are evaluated during the simulation,
+    the resulting connectivity is compared to the expected one. The spiking
+    projection additionally checks that the transmission uses the changed
+    connectivity.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Compile the network for this test
+        """
+        setup(structural_plasticity=True)
+
+        rate_neuron = Neuron(parameters="r = 0.0")
+        spike_neuron = Neuron(parameters="v = 0.0", spike="v > 10.0")
+        recv_neuron = Neuron(equations="v = g_exc", spike="v > 1e9")
+
+        rate_synapse = Synapse(
+            parameters="tag = 2.0",
+            creating="pre.r > 0.5 : proba = 1.0, w = 0.5",
+            pruning="w < 0.2 : proba = 1.0"
+        )
+        spike_synapse = Synapse(
+            pre_spike="g_target += w",
+            creating="pre.v > 0.5 : proba = 1.0, w = 0.5",
+            pruning="w < 0.2 : proba = 1.0"
+        )
+
+        pop1 = Population(10, rate_neuron)
+        pop2 = Population(4, rate_neuron)
+        pop3 = Population(10, spike_neuron)
+        pop4 = Population(4, recv_neuron)
+
+        # w = 0.1 will be pruned, w = 1.0 remains
+        weights = numpy.array([[None] * 10] * 4)
+        for post in range(4):
+            for pre in range(post, 10, 3):
+                weights[post, pre] = 0.1 if pre % 2 == 0 else 1.0
+        cls.weights = weights
+
+        proj1 = Projection(pre=pop1, post=pop2, target="exc", synapse=rate_synapse)
+        proj1.connect_from_matrix(weights, storage_format=cls.storage_format)
+
+        proj2 = Projection(pre=pop3, post=pop4, target="exc", synapse=spike_synapse)
+        proj2.connect_from_matrix(weights, storage_format=cls.storage_format)
+
+        proj3 = Projection(pre=pop1, post=pop2, target="inh", synapse=rate_synapse)
+        proj3.connect_from_matrix(weights, storage_format=cls.storage_format)
+
+        cls.test_net = Network()
+        cls.test_net.add([pop1, pop2, pop3, pop4, proj1, proj2, proj3])
+        cls.test_net.compile(silent=True)
+
+        cls.test_pre_rate = cls.test_net.get(pop1)
+        cls.test_pre_spike = cls.test_net.get(pop3)
+        cls.test_post_spike = cls.test_net.get(pop4)
+        cls.test_projs = [cls.test_net.get(proj) for proj in [proj1, proj2, proj3]]
+
+        # The neurons with an odd rank are active
+        cls.active = numpy.arange(10) % 2 == 1
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Remove the structural_plasticity global flag to not interfere with
+        further tests.
+        """
+        setup(structural_plasticity=False)
+        clear()
+
+    def _expected_dendrite(self, post):
+        """
+        Existing synapses with w >= 0.2 remain, the active pre-synaptic
+        neurons which were not connected get a new synapse with w = 0.5.
+        """
+        pre_ranks = []
+        w = []
+        for pre in range(10):
+            if self.weights[post, pre] is not None:
+                if self.weights[post, pre] >= 0.2:
+                    pre_ranks.append(pre)
+                    w.append(self.weights[post, pre])
+            elif self.active[pre]:
+                pre_ranks.append(pre)
+                w.append(0.5)
+        return pre_ranks, w
+
+    def _rewire(self, proj):
+        proj.start_creating()
+        proj.start_pruning()
+        self.test_net.simulate(1)
+        proj.stop_creating()
+        proj.stop_pruning()
+
+    def test_dendrite(self):
+        """
+        Single synapses created and pruned from Python, the other dendrites
+        are not changed.
+        """
+        proj = self.test_projs[2]
+        proj.dendrite(1).create_synapse(2, 0.7)
+        proj.dendrite(1).prune_synapse(4)
+
+        # removing a missing synapse does not modify the previous row
+        proj.cyInstance.remove_synapse(2, 0)
+
+        self.assertEqual(proj.dendrite(1).pre_ranks, [1, 2, 7])
+        numpy.testing.assert_allclose(proj.dendrite(1).w, [1.0, 0.7, 1.0])
+        numpy.testing.assert_allclose(proj.dendrite(1).tag, 2.0)
+
+        self.assertEqual(proj.dendrite(2).pre_ranks, [2, 5, 8])
+        numpy.testing.assert_allclose(proj.dendrite(2).w, [0.1, 1.0, 0.1])
+
+    def test_rate_coded(self):
+        """
+        Creating and pruning on a rate-coded projection, the additional
+        local parameter is initialized for the new synapses.
+        """
+        self.test_pre_rate.r = numpy.where(self.active, 1.0, 0.0)
+        proj = self.test_projs[0]
+        self._rewire(proj)
+
+        for post in range(4):
+            pre_ranks, w = self._expected_dendrite(post)
+            self.assertEqual(proj.dendrite(post).pre_ranks, pre_ranks)
+            numpy.testing.assert_allclose(proj.dendrite(post).w, w)
+            numpy.testing.assert_allclose(proj.dendrite(post).tag, 2.0)
+
+    def test_spiking(self):
+        """
+        Creating and pruning on a spiking projection. Afterwards, the active
+        pre-synaptic neurons spike at each step, so the post-synaptic neurons
+        receive the sum of the weights of the active synapses.
+        """
+        self.test_pre_spike.v = numpy.where(self.active, 1.0, 0.0)
+        proj = self.test_projs[1]
+        self._rewire(proj)
+
+        expected_sum = []
+        for post in range(4):
+            pre_ranks, w = self._expected_dendrite(post)
+            self.assertEqual(proj.dendrite(post).pre_ranks, pre_ranks)
+            numpy.testing.assert_allclose(proj.dendrite(post).w, w)
+            expected_sum.append(sum([w_syn for pre, w_syn in zip(pre_ranks, w) if self.active[pre]]))
+
+        self.test_pre_spike.v = numpy.where(self.active, 20.0, 0.0)
+        self.test_net.simulate(3)
+        numpy.testing.assert_allclose(self.test_post_spike.v, expected_sum)
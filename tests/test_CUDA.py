@@ -32,6 +32,10 @@ from Interface import *
 from Neuron import *
 from Synapse import *
 
+# streamed inputs are not available on CUDA devices
+del test_TimedArrayStream
+del test_TimedPoissonPopulationStream
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)